@@ -0,0 +1,232 @@
+"""Column-oriented result fetching over the connector's Arrow result batches.
+
+With ``IGLOO_MCP_FETCH_ENGINE=arrow`` ``execute_query`` reads result sets through
+``cursor.fetch_arrow_batches()`` instead of ``fetchmany``. Row counting, the size
+budget and first/last-row truncation operate on whole batches (Arrow slices are
+zero-copy), values are converted to JSON-compatible Python one column at a time,
+and dict rows are only built for the rows that are returned inline or written to
+an export file.
+
+``pyarrow`` is optional. Without it, or when the connector cannot serve a result
+as Arrow (``SHOW``/``DESCRIBE`` output, JSON result format, other providers), the
+row engine is used instead.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from igloo_mcp.env_utils import read_choice_env
+from igloo_mcp.mcp.utils import json_compatible
+from igloo_mcp.query_export import QueryExportWriter
+
+try:
+    import pyarrow
+
+    HAS_PYARROW = True
+except ImportError:
+    pyarrow = None
+    HAS_PYARROW = False
+
+logger = logging.getLogger(__name__)
+
+FETCH_ENGINE_ENV = "IGLOO_MCP_FETCH_ENGINE"
+FETCH_ENGINES = ("rows", "arrow")
+DEFAULT_FETCH_ENGINE = "rows"
+
+# Rows converted from the first batches to estimate the JSON size of the result,
+# matching the sample the row engine takes.
+SIZE_SAMPLE_ROWS = 100
+# Rows converted per export write; bounds the dicts alive at once like fetchmany.
+EXPORT_SLICE_ROWS = 2000
+
+
+def fetch_engine_from_env() -> str:
+    """Resolve ``IGLOO_MCP_FETCH_ENGINE``, falling back to ``rows`` when Arrow is unavailable."""
+    engine = read_choice_env(FETCH_ENGINE_ENV, FETCH_ENGINES, DEFAULT_FETCH_ENGINE)
+    if engine == "arrow" and not HAS_PYARROW:
+        logger.warning("%s=arrow requires pyarrow; using the row fetch engine", FETCH_ENGINE_ENV)
+        return DEFAULT_FETCH_ENGINE
+    return engine
+
+
+def arrow_batches(cursor: Any) -> Iterator[Any] | None:
+    """Return an iterator over the cursor's Arrow tables, or ``None`` to fetch rows instead.
+
+    The connector checks the result format before handing out the generator, so
+    a refusal leaves the cursor untouched for ``fetchmany``.
+    """
+    fetch = getattr(cursor, "fetch_arrow_batches", None)
+    if not callable(fetch):
+        return None
+    try:
+        return iter(fetch())
+    except Exception:  # Broad catch required: NotSupportedError, ProgrammingError, missing pyarrow
+        logger.debug("Result is not available as Arrow batches; fetching rows", exc_info=True)
+        return None
+
+
+def _passes_through(column_type: Any) -> bool:
+    """Whether ``to_pylist()`` values of this Arrow type are already JSON-compatible."""
+    types = pyarrow.types
+    return (
+        types.is_integer(column_type)
+        or types.is_floating(column_type)
+        or types.is_boolean(column_type)
+        or types.is_string(column_type)
+        or types.is_large_string(column_type)
+        or types.is_null(column_type)
+    )
+
+
+def column_values(column: Any) -> list[Any]:
+    """Convert one Arrow column to the values ``json_compatible`` would produce."""
+    if pyarrow is not None:
+        column_type = column.type
+        if _passes_through(column_type):
+            return column.to_pylist()
+        if pyarrow.types.is_decimal(column_type) and column_type.scale == 0:
+            try:
+                return column.cast(pyarrow.int64()).to_pylist()
+            except pyarrow.ArrowInvalid:
+                pass  # wider than int64; json_compatible keeps the exact integer
+    return [json_compatible(value) for value in column.to_pylist()]
+
+
+def table_rows(table: Any, column_names: Sequence[str]) -> list[dict[str, Any]]:
+    """Materialise an Arrow table (or slice) as JSON-compatible dict rows."""
+    if not table.num_columns:
+        return [{} for _ in range(table.num_rows)]
+    names = [column_names[idx] if idx < len(column_names) else f"column_{idx}" for idx in range(table.num_columns)]
+    columns = [column_values(table.column(idx)) for idx in range(table.num_columns)]
+    return [dict(zip(names, values, strict=True)) for values in zip(*columns, strict=True)]
+
+
+def export_arrow_batches(batches: Iterable[Any], export: QueryExportWriter, column_names: Sequence[str]) -> None:
+    """Write every batch to ``export``, converting at most ``EXPORT_SLICE_ROWS`` rows at a time."""
+    for table in batches:
+        for offset in range(0, table.num_rows, EXPORT_SLICE_ROWS):
+            export.write_rows(table_rows(table.slice(offset, EXPORT_SLICE_ROWS), column_names))
+
+
+@dataclass
+class CollectedRows:
+    """Rows kept from an inline result; ``head_rows`` holds every row when not truncated."""
+
+    head_rows: list[dict[str, Any]] = field(default_factory=list)
+    tail_rows: list[dict[str, Any]] = field(default_factory=list)
+    total_rows: int = 0
+    truncated: bool = False
+    estimated_size_bytes: float = 0.0
+    # Average serialized JSON size of one row, from the size sample taken while fetching.
+    row_bytes: float = 0.0
+
+    def rows_bytes(self, count: int) -> int:
+        """Approximate serialized size of a JSON list of ``count`` such rows."""
+        if count <= 0:
+            return 2
+        return round(self.row_bytes * count) + 2 * (count - 1) + 2
+
+
+def _first_rows(tables: Sequence[Any], limit: int) -> tuple[list[Any], int]:
+    kept: list[Any] = []
+    count = 0
+    for table in tables:
+        if count >= limit:
+            break
+        piece = table.slice(0, limit - count)
+        kept.append(piece)
+        count += piece.num_rows
+    return kept, count
+
+
+def _last_rows(tables: Sequence[Any], limit: int) -> list[Any]:
+    kept: list[Any] = []
+    count = 0
+    for table in reversed(tables):
+        if count >= limit:
+            break
+        take = min(limit - count, table.num_rows)
+        kept.append(table.slice(table.num_rows - take, take))
+        count += take
+    kept.reverse()
+    return kept
+
+
+def collect_arrow_batches(
+    batches: Iterable[Any],
+    column_names: Sequence[str],
+    *,
+    truncation_threshold: int,
+    size_limit_bytes: int,
+    keep_first: int,
+    keep_last: int,
+) -> CollectedRows:
+    """Fetch an inline result batch by batch with the row engine's truncation rules.
+
+    Until truncation starts the batches themselves are retained; afterwards only
+    slices covering the first ``keep_first`` and last ``keep_last`` rows are.
+    """
+    kept: list[Any] = []
+    head: list[Any] = []
+    tail: list[Any] = []
+    head_count = 0
+    tail_count = 0
+    total = 0
+    sample_bytes = 0
+    sample_count = 0
+    truncated = False
+
+    def estimated_size_bytes() -> float:
+        return (sample_bytes / sample_count) * total if sample_count else 0.0
+
+    for table in batches:
+        num_rows = table.num_rows
+        if not num_rows:
+            continue
+        if sample_count < SIZE_SAMPLE_ROWS:
+            sample = table_rows(table.slice(0, SIZE_SAMPLE_ROWS - sample_count), column_names)
+            sample_bytes += sum(len(json.dumps(row, ensure_ascii=False, default=str)) for row in sample)
+            sample_count += len(sample)
+        total += num_rows
+
+        if not truncated:
+            kept.append(table)
+            if total > truncation_threshold and estimated_size_bytes() > size_limit_bytes:
+                truncated = True
+                head, head_count = _first_rows(kept, keep_first)
+                tail = _last_rows(kept, min(keep_last, total - head_count))
+                tail_count = sum(piece.num_rows for piece in tail)
+                kept = []
+            continue
+
+        rest = table
+        if head_count < keep_first:
+            piece = table.slice(0, keep_first - head_count)
+            head.append(piece)
+            head_count += piece.num_rows
+            rest = table.slice(piece.num_rows)
+        if keep_last and rest.num_rows:
+            tail.append(rest)
+            tail_count += rest.num_rows
+            while tail_count - tail[0].num_rows >= keep_last:
+                tail_count -= tail.pop(0).num_rows
+            if tail_count > keep_last:
+                tail[0] = tail[0].slice(tail_count - keep_last)
+                tail_count = keep_last
+
+    collection = CollectedRows(
+        total_rows=total,
+        truncated=truncated,
+        estimated_size_bytes=estimated_size_bytes(),
+        row_bytes=sample_bytes / sample_count if sample_count else 0.0,
+    )
+    for table in head if truncated else kept:
+        collection.head_rows.extend(table_rows(table, column_names))
+    for table in tail:
+        collection.tail_rows.extend(table_rows(table, column_names))
+    return collection
@@ -11,9 +11,10 @@ import argparse
 import json
 import os
 import threading
-from collections.abc import Mapping
+import time
+from collections.abc import Callable, Mapping
 from contextlib import asynccontextmanager, contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -22,6 +23,7 @@ from mcp_server_snowflake.server import (  # type: ignore[import-untyped]
 )
 from snowflake.connector import DictCursor, connect
 
+from igloo_mcp.env_utils import read_float_env, read_int_env
 from igloo_mcp.session_utils import ensure_session_lock
 
 try:
@@ -41,6 +43,13 @@ AUTH_MODE_AUTO = "auto"
 SUPPORTED_AUTH_MODES = (AUTH_MODE_SNOWFLAKE_LABS, AUTH_MODE_KEYPAIR, AUTH_MODE_AUTO)
 AUTH_MODE_ENV = "IGLOO_MCP_AUTH_MODE"
 
+POOL_SIZE_ENV = "IGLOO_MCP_POOL_SIZE"
+POOL_ACQUIRE_TIMEOUT_ENV = "IGLOO_MCP_POOL_ACQUIRE_TIMEOUT_SECONDS"
+POOL_HEALTH_CHECK_INTERVAL_ENV = "IGLOO_MCP_POOL_HEALTH_CHECK_INTERVAL_SECONDS"
+DEFAULT_POOL_SIZE = 4
+DEFAULT_POOL_ACQUIRE_TIMEOUT_SECONDS = 30.0
+DEFAULT_POOL_HEALTH_CHECK_INTERVAL_SECONDS = 60.0
+
 DEFAULT_RETRYABLE_ERROR_KEYWORDS = (
     "temporarily unavailable",
     "please retry",
@@ -77,6 +86,8 @@ class AuthProviderCapabilities:
     supports_timeout_cancellation: bool
     supports_retry_handling: bool
     supports_circuit_breaker: bool
+    supports_connection_pool: bool = False
+    supports_session_state_tracking: bool = False
 
 
 @dataclass(frozen=True)
@@ -131,6 +142,8 @@ AUTH_PROVIDER_SPECS: dict[str, AuthProviderSpec] = {
             supports_timeout_cancellation=True,
             supports_retry_handling=True,
             supports_circuit_breaker=True,
+            supports_connection_pool=True,
+            supports_session_state_tracking=True,
         ),
         reliability=AuthProviderReliability(
             retry_attempts=2,
@@ -287,6 +300,278 @@ def _build_keypair_connection_params(args: argparse.Namespace) -> dict[str, Any]
     return params
 
 
+class ConnectionPoolExhaustedError(RuntimeError):
+    """Raised when no pooled connection became available within the acquire timeout."""
+
+
+@dataclass
+class PooledConnection:
+    """A connector session owned by :class:`SnowflakeConnectionPool`."""
+
+    connection: Any
+    generation: int
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+    last_checked_at: float = field(default_factory=time.monotonic)
+    uses: int = 0
+
+
+class SnowflakeConnectionPool:
+    """Bounded, health-checked pool of Snowflake connector sessions.
+
+    Connections are created lazily up to ``max_size``. Idle connections that
+    have not been used for ``health_check_interval`` seconds are probed before
+    being handed out; dead ones are replaced transparently. Callers that cannot
+    get a connection within ``acquire_timeout`` receive
+    :class:`ConnectionPoolExhaustedError`.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        *,
+        max_size: int = DEFAULT_POOL_SIZE,
+        acquire_timeout: float = DEFAULT_POOL_ACQUIRE_TIMEOUT_SECONDS,
+        health_check_interval: float = DEFAULT_POOL_HEALTH_CHECK_INTERVAL_SECONDS,
+        health_probe: Callable[[Any], bool] | None = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("Connection pool max_size must be >= 1")
+        self._factory = factory
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+        self._health_probe = health_probe or _probe_connection
+        self._condition = threading.Condition(threading.Lock())
+        self._idle: list[PooledConnection] = []
+        self._in_use: set[int] = set()
+        self._pending_creates = 0
+        self._generation = 0
+        self._closed = False
+        self._waiting = 0
+        self._stats: dict[str, float] = {
+            "acquired": 0,
+            "created": 0,
+            "discarded": 0,
+            "health_check_failures": 0,
+            "acquire_timeouts": 0,
+            "total_wait_ms": 0.0,
+            "max_wait_ms": 0.0,
+            "max_waiting": 0,
+        }
+
+    @property
+    def size(self) -> int:
+        with self._condition:
+            return len(self._idle) + len(self._in_use) + self._pending_creates
+
+    def _total_locked(self) -> int:
+        return len(self._idle) + len(self._in_use) + self._pending_creates
+
+    def _create(self) -> PooledConnection:
+        with self._condition:
+            generation = self._generation
+        connection = self._factory()
+        return PooledConnection(connection=connection, generation=generation)
+
+    def _is_healthy(self, pooled: PooledConnection) -> bool:
+        if not _connection_open(pooled.connection):
+            return False
+        now = time.monotonic()
+        if now - pooled.last_checked_at < self.health_check_interval:
+            return True
+        try:
+            healthy = bool(self._health_probe(pooled.connection))
+        except Exception:
+            logger.debug("Pooled connection health probe failed", exc_info=True)
+            healthy = False
+        pooled.last_checked_at = now
+        return healthy
+
+    def acquire(self, timeout: float | None = None) -> PooledConnection:
+        """Check out a healthy connection, creating one if the pool has room."""
+        wait_budget = self.acquire_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + wait_budget
+        candidate: PooledConnection | None
+        with self._condition:
+            self._waiting += 1
+            self._stats["max_waiting"] = max(self._stats["max_waiting"], self._waiting)
+            try:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Snowflake connection pool is closed")
+                    if self._idle:
+                        candidate = self._idle.pop()
+                        self._in_use.add(id(candidate))
+                        break
+                    if self._total_locked() < self.max_size:
+                        self._pending_creates += 1
+                        candidate = None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["acquire_timeouts"] += 1
+                        raise ConnectionPoolExhaustedError(
+                            f"Snowflake connection pool exhausted after waiting {wait_budget:.1f}s "
+                            f"for one of {self.max_size} connections; please retry"
+                        )
+                    self._condition.wait(remaining)
+            finally:
+                self._waiting -= 1
+
+        if candidate is None:
+            try:
+                candidate = self._create()
+            except BaseException:
+                with self._condition:
+                    self._pending_creates -= 1
+                    self._condition.notify()
+                raise
+            with self._condition:
+                self._pending_creates -= 1
+                self._in_use.add(id(candidate))
+                self._stats["created"] += 1
+        elif not self._is_healthy(candidate):
+            with self._condition:
+                self._stats["health_check_failures"] += 1
+            self._discard(candidate)
+            remaining = max(0.0, deadline - time.monotonic())
+            return self.acquire(timeout=remaining)
+
+        waited_ms = (time.monotonic() - started) * 1000
+        with self._condition:
+            self._stats["acquired"] += 1
+            self._stats["total_wait_ms"] += waited_ms
+            self._stats["max_wait_ms"] = max(self._stats["max_wait_ms"], waited_ms)
+        candidate.uses += 1
+        candidate.last_used_at = time.monotonic()
+        return candidate
+
+    def acquire_seeded(self, connection: Any) -> PooledConnection:
+        """Adopt an already-open connection as a checked-out pool member."""
+        with self._condition:
+            if self._total_locked() >= self.max_size:
+                raise ConnectionPoolExhaustedError("Cannot seed a full Snowflake connection pool")
+            pooled = PooledConnection(connection=connection, generation=self._generation)
+            self._in_use.add(id(pooled))
+            self._stats["created"] += 1
+        return pooled
+
+    def release(self, pooled: PooledConnection, *, discard: bool = False) -> None:
+        """Return a connection to the pool, or close it when it is no longer usable."""
+        with self._condition:
+            stale = pooled.generation != self._generation or self._closed
+        if discard or stale or not _connection_open(pooled.connection):
+            self._discard(pooled)
+            return
+        pooled.last_used_at = time.monotonic()
+        with self._condition:
+            self._in_use.discard(id(pooled))
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    def _discard(self, pooled: PooledConnection) -> None:
+        with self._condition:
+            self._in_use.discard(id(pooled))
+            self._stats["discarded"] += 1
+            self._condition.notify()
+        _close_quietly(pooled.connection)
+
+    @contextmanager
+    def connection(self):
+        """Context manager yielding a :class:`PooledConnection`.
+
+        The connection is discarded instead of recycled when the block raises
+        ``TimeoutError``: the statement may still be running on that session.
+        """
+        pooled = self.acquire()
+        discard = False
+        try:
+            yield pooled
+        except TimeoutError:
+            discard = True
+            raise
+        finally:
+            self.release(pooled, discard=discard)
+
+    def invalidate(self) -> None:
+        """Close idle connections and retire in-use ones when they are released."""
+        with self._condition:
+            self._generation += 1
+            idle, self._idle = self._idle, []
+            self._stats["discarded"] += len(idle)
+            self._condition.notify_all()
+        for pooled in idle:
+            _close_quietly(pooled.connection)
+
+    def any_connection(self) -> Any | None:
+        """Return an open connection from the pool without checking it out."""
+        with self._condition:
+            for pooled in reversed(self._idle):
+                if _connection_open(pooled.connection):
+                    return pooled.connection
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of pool sizing, queue depth and wait times."""
+        with self._condition:
+            in_use = len(self._in_use)
+            acquired = int(self._stats["acquired"])
+            return {
+                "enabled": True,
+                "max_size": self.max_size,
+                "size": self._total_locked(),
+                "idle": len(self._idle),
+                "in_use": in_use,
+                "queue_depth": self._waiting,
+                "max_queue_depth": int(self._stats["max_waiting"]),
+                "utilization": round(in_use / self.max_size, 3),
+                "acquired": acquired,
+                "created": int(self._stats["created"]),
+                "discarded": int(self._stats["discarded"]),
+                "health_check_failures": int(self._stats["health_check_failures"]),
+                "acquire_timeouts": int(self._stats["acquire_timeouts"]),
+                "avg_wait_ms": round(self._stats["total_wait_ms"] / acquired, 3) if acquired else 0.0,
+                "max_wait_ms": round(self._stats["max_wait_ms"], 3),
+                "acquire_timeout_seconds": self.acquire_timeout,
+            }
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for pooled in idle:
+            _close_quietly(pooled.connection)
+
+
+def _connection_open(connection: Any) -> bool:
+    if connection is None:
+        return False
+    is_closed = getattr(connection, "is_closed", None)
+    if callable(is_closed):
+        try:
+            return not bool(is_closed())
+        except (TypeError, RuntimeError):  # pragma: no cover - connector-specific edge cases
+            return False
+    return True
+
+
+def _probe_connection(connection: Any) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+    return True
+
+
+def _close_quietly(connection: Any) -> None:
+    try:
+        connection.close()
+    except Exception:  # pragma: no cover - best effort cleanup
+        logger.debug("Failed to close pooled Snowflake connection cleanly", exc_info=True)
+
+
 class KeyPairSnowflakeService:
     """Snowflake service compatible with the subset igloo tools use."""
 
@@ -307,6 +592,34 @@ class KeyPairSnowflakeService:
         self.tag_minor_version = 0
         self._lock = threading.RLock()
         self.connection = self._get_persistent_connection()
+        self._pool: SnowflakeConnectionPool | None = None
+        pool_size = read_int_env(POOL_SIZE_ENV, DEFAULT_POOL_SIZE, minimum=1)
+        if pool_size > 1:
+            self._pool = SnowflakeConnectionPool(
+                self._get_persistent_connection,
+                max_size=pool_size,
+                acquire_timeout=read_float_env(
+                    POOL_ACQUIRE_TIMEOUT_ENV, DEFAULT_POOL_ACQUIRE_TIMEOUT_SECONDS, minimum=0.0
+                ),
+                health_check_interval=read_float_env(
+                    POOL_HEALTH_CHECK_INTERVAL_ENV, DEFAULT_POOL_HEALTH_CHECK_INTERVAL_SECONDS, minimum=0.0
+                ),
+            )
+            # Seed the pool with the startup connection so the first query does not reconnect.
+            seeded = self._pool.acquire_seeded(self.connection)
+            self._pool.release(seeded)
+
+    @property
+    def supports_concurrent_sessions(self) -> bool:
+        """True when get_connection() hands out independent pooled sessions."""
+        return getattr(self, "_pool", None) is not None
+
+    def get_pool_stats(self) -> dict[str, Any]:
+        """Connection pool utilisation for health diagnostics."""
+        pool = getattr(self, "_pool", None)
+        if pool is None:
+            return {"enabled": False, "max_size": 1}
+        return pool.stats()
 
     def get_query_tag_param(self) -> dict[str, Any]:
         tag = dict(self.query_tag)
@@ -314,16 +627,7 @@ class KeyPairSnowflakeService:
         return {"QUERY_TAG": json.dumps(tag)}
 
     def _connection_alive(self) -> bool:
-        conn = self.connection
-        if conn is None:
-            return False
-        is_closed = getattr(conn, "is_closed", None)
-        if callable(is_closed):
-            try:
-                return not bool(is_closed())
-            except (TypeError, RuntimeError):  # pragma: no cover - connector-specific edge cases
-                return False
-        return True
+        return _connection_open(self.connection)
 
     def _get_persistent_connection(self, session_parameters: dict[str, Any] | None = None):
         merged_params = dict(self.connection_params)
@@ -354,6 +658,14 @@ class KeyPairSnowflakeService:
 
     def invalidate_connection(self) -> None:
         """Drop the current connector session so the next use reconnects cleanly."""
+        pool = getattr(self, "_pool", None)
+        if pool is not None:
+            # The pool owns every session (including the startup one): idle sessions
+            # close now, checked-out sessions close when their query releases them.
+            pool.invalidate()
+            with self._lock:
+                self.connection = None
+            return
         with self._lock:
             conn = self.connection
             self.connection = None
@@ -370,6 +682,17 @@ class KeyPairSnowflakeService:
         use_dict_cursor: bool = False,
         session_parameters: dict[str, Any] | None = None,
     ):
+        pool = getattr(self, "_pool", None)
+        if pool is not None:
+            with pool.connection() as pooled:
+                connection = pooled.connection
+                cursor = connection.cursor(DictCursor) if use_dict_cursor else connection.cursor()
+                try:
+                    yield connection, cursor
+                finally:
+                    cursor.close()
+            return
+
         session_lock = ensure_session_lock(self)
         with session_lock:
             connection = self._ensure_connection(session_parameters=session_parameters)
@@ -379,8 +702,16 @@ class KeyPairSnowflakeService:
             finally:
                 cursor.close()
 
+    def _api_connection(self) -> Any:
+        if _connection_open(self.connection):
+            return self.connection
+        pool = getattr(self, "_pool", None)
+        if pool is not None:
+            return pool.any_connection()
+        return self.connection
+
     def get_api_headers(self) -> dict[str, str]:
-        token = getattr(getattr(self.connection, "rest", None), "token", None)
+        token = getattr(getattr(self._api_connection(), "rest", None), "token", None)
         if not token:
             raise RuntimeError("Snowflake REST token unavailable on active connection.")
         return {
@@ -390,7 +721,7 @@ class KeyPairSnowflakeService:
         }
 
     def get_api_host(self) -> str:
-        host = getattr(self.connection, "host", None)
+        host = getattr(self._api_connection(), "host", None)
         if host:
             return str(host)
         if configured_host := self.connection_params.get("host"):
@@ -399,6 +730,9 @@ class KeyPairSnowflakeService:
         return f"{account}.snowflakecomputing.com" if account else ""
 
     def close(self) -> None:
+        pool = getattr(self, "_pool", None)
+        if pool is not None:
+            pool.close()
         self.invalidate_connection()
 
 
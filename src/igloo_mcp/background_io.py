@@ -0,0 +1,371 @@
+"""Keep blocking file I/O off the event loop for async tools.
+
+``run_io`` runs a blocking call on a dedicated I/O lane: anyio worker threads
+capped by ``IGLOO_MCP_IO_THREADS``, separate from the default thread limiter the
+Snowflake calls use, so a slow disk delays only the requests doing I/O instead
+of every coroutine on the loop.
+
+``BackgroundWriter`` handles writes whose outcome the response does not need
+(``IGLOO_MCP_BACKGROUND_WRITES``). One daemon thread drains a bounded FIFO
+queue; when the queue is full, ``submit`` waits on the I/O lane for room, so a
+stalled disk slows producers down instead of growing memory without bound.
+Pending writes are flushed at interpreter exit.
+
+``GroupCommitter`` batches appends that share one expensive write (query
+history lines, audit events, fsyncs): items submitted while a commit is in
+flight are committed together by the next one.
+
+``EventLoopLagMonitor`` samples how late the running asyncio loop fires its
+scheduled callbacks; ``health_check`` reports the figures.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import functools
+import logging
+import os
+import queue
+import threading
+import time
+import weakref
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+import anyio
+
+from igloo_mcp.env_utils import read_int_env
+
+logger = logging.getLogger(__name__)
+
+IO_THREADS_ENV = "IGLOO_MCP_IO_THREADS"
+DEFAULT_IO_THREADS = 4
+BACKGROUND_WRITES_ENV = "IGLOO_MCP_BACKGROUND_WRITES"
+BACKGROUND_WRITE_QUEUE_ENV = "IGLOO_MCP_BACKGROUND_WRITE_QUEUE"
+DEFAULT_BACKGROUND_WRITE_QUEUE = 256
+# Upper bound on how long interpreter shutdown waits for queued writes.
+SHUTDOWN_FLUSH_TIMEOUT_SECONDS = 10.0
+# Deferred group commits buffer at most this many flushes' worth of items before submit() waits.
+GROUP_COMMIT_BUFFER_FLUSHES = 8
+GROUP_COMMIT_IDLE_SECONDS = 30.0
+
+LAG_SAMPLE_INTERVAL_SECONDS = 0.5
+LAG_WINDOW_SAMPLES = 120
+# p95 loop lag above this marks the I/O component as lagging in health_check.
+LAG_WARNING_MS = 100.0
+
+_TRUTHY = {"1", "true", "yes", "on"}
+
+
+def background_writes_enabled() -> bool:
+    """Whether cache stores and history appends are queued instead of awaited."""
+    return (os.environ.get(BACKGROUND_WRITES_ENV) or "").strip().lower() in _TRUTHY
+
+
+_limiter: anyio.CapacityLimiter | None = None
+_limiter_lock = threading.Lock()
+
+
+def _io_limiter() -> anyio.CapacityLimiter:
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = anyio.CapacityLimiter(read_int_env(IO_THREADS_ENV, DEFAULT_IO_THREADS))
+        return _limiter
+
+
+async def run_io[T](func: Callable[..., T], *args: Any) -> T:
+    """Run blocking ``func(*args)`` on the I/O lane and return its result."""
+    return await anyio.to_thread.run_sync(func, *args, limiter=_io_limiter())
+
+
+_writers: weakref.WeakSet[BackgroundWriter] = weakref.WeakSet()
+
+
+class BackgroundWriter:
+    """Fire-and-forget writes drained in order by one daemon thread."""
+
+    def __init__(self, name: str, *, max_pending: int | None = None) -> None:
+        self.name = name
+        self.max_pending = max_pending or read_int_env(BACKGROUND_WRITE_QUEUE_ENV, DEFAULT_BACKGROUND_WRITE_QUEUE)
+        self._queue: queue.Queue[Callable[[], Any]] = queue.Queue(maxsize=self.max_pending)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._backpressure_waits = 0
+        self._last_error: str | None = None
+        _writers.add(self)
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._drain, name=f"igloo-{self.name}-writer", daemon=True)
+                self._thread.start()
+
+    def _drain(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                job()
+            except Exception as exc:  # Broad catch required: one failed write must not stop the writer
+                logger.warning("Background %s write failed: %s", self.name, exc, exc_info=True)
+                with self._lock:
+                    self._failed += 1
+                    self._last_error = str(exc)[:200]
+            else:
+                with self._lock:
+                    self._completed += 1
+            finally:
+                self._queue.task_done()
+
+    async def submit(self, job: Callable[[], Any]) -> None:
+        """Queue ``job``; waits (off the loop) only while the queue is full."""
+        self._ensure_worker()
+        with self._lock:
+            self._submitted += 1
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                self._backpressure_waits += 1
+            await run_io(functools.partial(self._queue.put, job))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every queued write has run; False if ``timeout`` elapsed first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                if deadline is None:
+                    self._queue.all_tasks_done.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "pending": self._queue.qsize(),
+                "max_pending": self.max_pending,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "backpressure_waits": self._backpressure_waits,
+                "last_error": self._last_error,
+            }
+
+
+def flush_background_writes(timeout: float | None = None) -> bool:
+    """Flush every live ``BackgroundWriter``; False if any timed out."""
+    flushed = True
+    for writer in list(_writers):
+        flushed = writer.flush(timeout) and flushed
+    return flushed
+
+
+class _CommitBatch[T]:
+    __slots__ = ("done", "error", "items", "opened_at")
+
+    def __init__(self) -> None:
+        self.items: list[T] = []
+        self.opened_at = time.monotonic()
+        self.done = False
+        self.error: Exception | None = None
+
+
+_deferred_committers: weakref.WeakSet[GroupCommitter[Any]] = weakref.WeakSet()
+
+
+class GroupCommitter[T]:
+    """Commits submitted items in batches with one ``commit(items)`` call each.
+
+    Whoever finds no commit in flight commits everyone's pending items, so
+    items submitted during a slow commit share the next one. ``submit`` returns
+    once its batch is committed and re-raises the batch's failure. When
+    ``deferred``, ``submit`` returns right away instead and a daemon thread
+    commits every ``flush_interval_seconds`` or ``flush_size`` items (and on
+    :meth:`flush` and interpreter exit); callers only wait once ``max_buffered``
+    items are pending, so the buffer stays bounded.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        commit: Callable[[list[T]], None],
+        *,
+        deferred: bool = False,
+        flush_interval_seconds: float = 0.2,
+        flush_size: int = 64,
+        max_buffered: int | None = None,
+    ) -> None:
+        self.name = name
+        self.deferred = deferred
+        self.flush_interval_seconds = max(0.0, flush_interval_seconds)
+        self.flush_size = max(1, flush_size)
+        self.max_buffered = max_buffered or self.flush_size * GROUP_COMMIT_BUFFER_FLUSHES
+        self._commit = commit
+        self._cond = threading.Condition()
+        self._pending: _CommitBatch[T] | None = None
+        self._writing = False
+        self._flusher: threading.Thread | None = None
+
+    @property
+    def pending(self) -> int:
+        """Items submitted but not yet handed to ``commit``."""
+        with self._cond:
+            return len(self._pending.items) if self._pending is not None else 0
+
+    def submit(self, item: T) -> None:
+        with self._cond:
+            batch = self._pending
+            if batch is None:
+                batch = self._pending = _CommitBatch()
+            batch.items.append(item)
+            if self.deferred:
+                self._ensure_flusher_locked()
+                self._cond.notify_all()
+                if len(batch.items) < self.max_buffered:
+                    return
+                # Buffer full: wait for the commit instead of growing without bound.
+            self._wait_locked(batch)
+        if batch.error is not None:
+            raise batch.error
+
+    def flush(self) -> None:
+        """Commit every pending item now; failures are left to ``commit`` (or the waiting submitters)."""
+        with self._cond:
+            if self._pending is not None:
+                self._wait_locked(self._pending)
+            while self._writing:
+                self._cond.wait()
+
+    def _wait_locked(self, batch: _CommitBatch[T]) -> None:
+        while not batch.done:
+            if self._writing:
+                self._cond.wait()
+            else:
+                self._commit_locked()
+
+    def _commit_locked(self) -> None:
+        """Commit the pending batch; entered and left holding ``_cond``, released while committing."""
+        batch, self._pending = self._pending, None
+        if batch is None:
+            return
+        self._writing = True
+        self._cond.release()
+        try:
+            self._commit(batch.items)
+        except Exception as exc:  # noqa: BLE001 - re-raised by the batch's waiting submit() calls
+            batch.error = exc
+            if self.deferred:
+                logger.warning("Deferred %s commit of %d item(s) failed: %s", self.name, len(batch.items), exc)
+        finally:
+            self._cond.acquire()
+            self._writing = False
+            batch.done = True
+            self._cond.notify_all()
+
+    def _ensure_flusher_locked(self) -> None:
+        if self._flusher is not None:
+            return
+        self._flusher = threading.Thread(target=self._run_flusher, name=f"igloo-{self.name}-flusher", daemon=True)
+        self._flusher.start()
+        _deferred_committers.add(self)
+
+    def _run_flusher(self) -> None:
+        with self._cond:
+            while True:
+                if self._writing:
+                    self._cond.wait()
+                    continue
+                batch = self._pending
+                if batch is None:
+                    if not self._cond.wait(GROUP_COMMIT_IDLE_SECONDS) and self._pending is None:
+                        # Idle: exit so unused committers can be collected; the next submit restarts it.
+                        self._flusher = None
+                        return
+                    continue
+                if len(batch.items) < self.flush_size:
+                    remaining = batch.opened_at + self.flush_interval_seconds - time.monotonic()
+                    if remaining > 0:
+                        self._cond.wait(remaining)
+                        continue
+                self._commit_locked()
+
+
+def flush_group_commits() -> None:
+    """Commit items still buffered by deferred ``GroupCommitter``s in this process."""
+    for committer in list(_deferred_committers):
+        committer.flush()
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    if not flush_background_writes(SHUTDOWN_FLUSH_TIMEOUT_SECONDS):
+        logger.warning("Exiting with background writes still pending")
+    flush_group_commits()
+
+
+class EventLoopLagMonitor:
+    """Measures how late the running asyncio loop runs a periodic timer callback."""
+
+    def __init__(
+        self,
+        *,
+        interval_seconds: float = LAG_SAMPLE_INTERVAL_SECONDS,
+        window: int = LAG_WINDOW_SAMPLES,
+    ) -> None:
+        self.interval_seconds = interval_seconds
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._max_lag_ms = 0.0
+
+    def ensure_started(self) -> None:
+        """Start sampling the running loop; a no-op when already sampling it or outside asyncio."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        with self._lock:
+            if self._loop is loop:
+                return
+            self._loop = loop
+        self._schedule(loop)
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop) -> None:
+        loop.call_later(self.interval_seconds, self._tick, loop, loop.time() + self.interval_seconds)
+
+    def _tick(self, loop: asyncio.AbstractEventLoop, expected: float) -> None:
+        if loop is not self._loop:
+            return  # superseded by a newer loop
+        lag_ms = max(0.0, loop.time() - expected) * 1000
+        with self._lock:
+            self._samples.append(lag_ms)
+            self._max_lag_ms = max(self._max_lag_ms, lag_ms)
+        self._schedule(loop)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            samples = sorted(self._samples)
+            last = self._samples[-1] if self._samples else None
+            max_lag_ms = self._max_lag_ms
+            sampling = self._loop is not None and not self._loop.is_closed()
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))] if samples else None
+        return {
+            "sampling": sampling,
+            "interval_ms": round(self.interval_seconds * 1000, 1),
+            "samples": len(samples),
+            "last_ms": None if last is None else round(last, 2),
+            "p95_ms": None if p95 is None else round(p95, 2),
+            "max_ms": round(max_lag_ms, 2),
+        }
+
+
+loop_lag_monitor = EventLoopLagMonitor()
@@ -1,5 +1,6 @@
 """Query result caching helpers."""
 
+from .memory_tier import MemoryCacheTier
 from .query_result_cache import CacheHit, QueryResultCache
 
-__all__ = ["CacheHit", "QueryResultCache"]
+__all__ = ["CacheHit", "MemoryCacheTier", "QueryResultCache"]
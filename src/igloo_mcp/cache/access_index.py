@@ -0,0 +1,206 @@
+"""Access-time index for the on-disk query result cache.
+
+Keeps per-entry size, access time, hit count and expiry for every cache key so
+quota enforcement can pick eviction victims without walking the cache root.
+The index is advisory: it is persisted to ``access_index.json`` lazily, and is
+rebuilt from the entry directories whenever the file is missing or unreadable.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "access_index.json"
+INDEX_VERSION = 1
+EVICTION_POLICIES = ("lru", "lfu")
+
+
+@dataclass
+class CacheIndexEntry:
+    """Bookkeeping for one cache entry directory."""
+
+    size_bytes: int
+    created_at: float
+    last_access: float
+    hits: int = 0
+    expires_at: float | None = None
+
+    def expired(self, now: float) -> bool:
+        return self.expires_at is not None and self.expires_at <= now
+
+
+def parse_timestamp(value: Any) -> float | None:
+    """Parse an ISO-8601 manifest timestamp into epoch seconds."""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+
+def entry_size_bytes(key_dir: Path) -> int:
+    total = 0
+    with contextlib.suppress(OSError):
+        for child in key_dir.iterdir():
+            with contextlib.suppress(OSError):
+                if child.is_file():
+                    total += child.stat().st_size
+    return total
+
+
+class CacheAccessIndex:
+    """Thread-safe in-memory index with lazy persistence under the cache root."""
+
+    def __init__(self, root: Path, *, flush_interval_seconds: float = 30.0) -> None:
+        self._root = root
+        self._path = root / INDEX_FILENAME
+        self._flush_interval = flush_interval_seconds
+        self._entries: dict[str, CacheIndexEntry] | None = None
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _loaded(self) -> dict[str, CacheIndexEntry]:
+        if self._entries is None:
+            self._entries = self._read() or self._scan()
+        return self._entries
+
+    def _read(self) -> dict[str, CacheIndexEntry] | None:
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Cache access index %s unreadable (%s); rebuilding", self._path, exc)
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != INDEX_VERSION:
+            return None
+        entries: dict[str, CacheIndexEntry] = {}
+        for key, raw in (payload.get("entries") or {}).items():
+            try:
+                entries[key] = CacheIndexEntry(**raw)
+            except TypeError:
+                continue
+        return entries
+
+    def _scan(self) -> dict[str, CacheIndexEntry]:
+        """Rebuild the index from entry directories (manifest timestamps + file sizes)."""
+        entries: dict[str, CacheIndexEntry] = {}
+        with contextlib.suppress(OSError):
+            for key_dir in self._root.iterdir():
+                manifest_path = key_dir / "manifest.json"
+                if not key_dir.is_dir() or not manifest_path.exists():
+                    continue
+                try:
+                    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+                    mtime = manifest_path.stat().st_mtime
+                except (OSError, ValueError):
+                    continue
+                created = parse_timestamp(manifest.get("created_at")) or mtime
+                entries[key_dir.name] = CacheIndexEntry(
+                    size_bytes=entry_size_bytes(key_dir),
+                    created_at=created,
+                    last_access=mtime,
+                    expires_at=parse_timestamp(manifest.get("expires_at")),
+                )
+        self._dirty = True
+        return entries
+
+    def rebuild(self) -> None:
+        with self._lock:
+            self._entries = self._scan()
+
+    def record_store(self, cache_key: str, *, size_bytes: int, expires_at: float | None, now: float) -> None:
+        with self._lock:
+            self._loaded()[cache_key] = CacheIndexEntry(
+                size_bytes=size_bytes,
+                created_at=now,
+                last_access=now,
+                expires_at=expires_at,
+            )
+            self._dirty = True
+
+    def record_access(self, cache_key: str, *, now: float) -> None:
+        with self._lock:
+            entry = self._loaded().get(cache_key)
+            if entry is None:
+                return
+            entry.last_access = now
+            entry.hits += 1
+            self._dirty = True
+
+    def resize(self, cache_key: str, size_bytes: int) -> None:
+        with self._lock:
+            entry = self._loaded().get(cache_key)
+            if entry is None:
+                return
+            entry.size_bytes = size_bytes
+            self._dirty = True
+
+    def remove(self, cache_key: str) -> None:
+        with self._lock:
+            if self._loaded().pop(cache_key, None) is not None:
+                self._dirty = True
+
+    def get(self, cache_key: str) -> CacheIndexEntry | None:
+        with self._lock:
+            return self._loaded().get(cache_key)
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(entry.size_bytes for entry in self._loaded().values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._loaded())
+
+    def eviction_order(self, policy: str, *, now: float) -> list[str]:
+        """Keys in the order they should be evicted: expired first, then by policy."""
+        with self._lock:
+            items = list(self._loaded().items())
+        if policy == "lfu":
+            items.sort(key=lambda item: (not item[1].expired(now), item[1].hits, item[1].last_access))
+        else:
+            items.sort(key=lambda item: (not item[1].expired(now), item[1].last_access))
+        return [key for key, _ in items]
+
+    def maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self._flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Persist the index atomically if it changed."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            payload = {
+                "version": INDEX_VERSION,
+                "entries": {key: asdict(entry) for key, entry in self._entries.items()},
+            }
+            tmp_path = self._path.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+                os.replace(tmp_path, self._path)
+            except OSError as exc:
+                logger.debug("Failed to persist cache access index: %s", exc)
+                with contextlib.suppress(OSError):
+                    tmp_path.unlink()
+                return
+            self._dirty = False
+            self._last_flush = time.monotonic()
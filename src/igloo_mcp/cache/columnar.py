@@ -0,0 +1,305 @@
+"""Compact columnar container for cached result sets.
+
+Rows are split into row groups; within a group every column is stored as its own
+zlib-compressed JSON array. A JSON footer at the end of the file records the
+column names, row count and the byte range of every column chunk, so a reader
+can memory-map the file and decode only the row groups and columns it needs.
+Serving the first five rows of a 100k-row result touches one row group instead
+of re-parsing the whole result, and a page at any offset is located from the
+footer's per-group row counts. ``ColumnarWriter`` appends row groups as rows
+arrive, so a result can be spilled without holding it in memory.
+
+Layout::
+
+    MAGIC | chunk ... chunk | footer (JSON) | footer length (u64 LE) | MAGIC
+
+Rows whose keys differ from the column set are preserved exactly: a group lists
+the (column, row) positions where a key was absent, which is rare for Snowflake
+cursors and costs nothing when rows are uniform.
+"""
+
+from __future__ import annotations
+
+import bisect
+import csv
+import itertools
+import json
+import mmap
+import struct
+import zlib
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+MAGIC = b"IGCOL1"
+FORMAT_NAME = "igloo-columnar-v1"
+DEFAULT_ROW_GROUP_SIZE = 1024
+COMPRESSION_LEVEL = 1
+_FOOTER_LENGTH = struct.Struct("<Q")
+
+
+class ColumnarFormatError(ValueError):
+    """Raised when a columnar cache file is truncated or malformed."""
+
+
+@dataclass(frozen=True)
+class ColumnarStats:
+    """Sizes reported by :func:`write_columnar`."""
+
+    row_count: int
+    file_bytes: int
+    json_bytes: int  # approximate size of the same rows serialized as JSON objects
+
+
+def _ordered_columns(rows: list[dict[str, Any]]) -> list[str]:
+    columns: dict[str, None] = {}
+    for row in rows:
+        for key in row:
+            if key not in columns:
+                columns[key] = None
+    return list(columns)
+
+
+class ColumnarWriter:
+    """Append rows to a columnar file one row group at a time.
+
+    ``columns`` is fixed up front (e.g. from the cursor description); keys a row
+    lacks are recorded as missing and keys outside ``columns`` are dropped.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        columns: list[str],
+        *,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ) -> None:
+        self.path = path
+        self.columns = list(columns)
+        self.row_group_size = max(1, row_group_size)
+        self.row_count = 0
+        self._groups: list[dict[str, Any]] = []
+        self._buffer: list[dict[str, Any]] = []
+        self._raw_bytes = 0
+        self._fh = path.open("wb")
+        self._fh.write(MAGIC)
+        self._offset = len(MAGIC)
+
+    def write_rows(self, rows: Iterable[dict[str, Any]]) -> None:
+        for row in rows:
+            self._buffer.append(row)
+            if len(self._buffer) >= self.row_group_size:
+                self._flush_group()
+
+    def _flush_group(self) -> None:
+        batch, self._buffer = self._buffer, []
+        if not batch:
+            return
+        chunks: list[list[int]] = []
+        missing: dict[str, list[int]] = {}
+        for col_idx, column in enumerate(self.columns):
+            values: list[Any] = []
+            for row_idx, row in enumerate(batch):
+                if column in row:
+                    values.append(row[column])
+                else:
+                    values.append(None)
+                    missing.setdefault(str(col_idx), []).append(row_idx)
+            raw = json.dumps(values, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            self._raw_bytes += len(raw)
+            packed = zlib.compress(raw, COMPRESSION_LEVEL)
+            self._fh.write(packed)
+            chunks.append([self._offset, len(packed)])
+            self._offset += len(packed)
+        group: dict[str, Any] = {"rows": len(batch), "chunks": chunks}
+        if missing:
+            group["missing"] = missing
+        self._groups.append(group)
+        self.row_count += len(batch)
+
+    def close(self) -> ColumnarStats:
+        """Write the last row group and the footer; returns size statistics."""
+        try:
+            self._flush_group()
+            footer = json.dumps(
+                {
+                    "format": FORMAT_NAME,
+                    "columns": self.columns,
+                    "row_count": self.row_count,
+                    "row_groups": self._groups,
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+            self._fh.write(footer)
+            self._fh.write(_FOOTER_LENGTH.pack(len(footer)))
+            self._fh.write(MAGIC)
+        finally:
+            self._fh.close()
+        file_bytes = self._offset + len(footer) + _FOOTER_LENGTH.size + len(MAGIC)
+
+        # Per-row object overhead: braces, commas, quoted keys and colons.
+        key_overhead = sum(len(json.dumps(column, ensure_ascii=False)) + 2 for column in self.columns) + 1
+        return ColumnarStats(
+            row_count=self.row_count,
+            file_bytes=file_bytes,
+            json_bytes=self._raw_bytes + self.row_count * key_overhead,
+        )
+
+    def abort(self) -> None:
+        """Close the file without a footer; the caller removes it."""
+        self._buffer = []
+        self._fh.close()
+
+
+def write_columnar(
+    path: Path,
+    rows: list[dict[str, Any]],
+    *,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> ColumnarStats:
+    """Write ``rows`` to ``path`` and return size statistics.
+
+    Values must be JSON-serializable; ``TypeError`` propagates otherwise.
+    """
+    writer = ColumnarWriter(path, _ordered_columns(rows), row_group_size=row_group_size)
+    try:
+        writer.write_rows(rows)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close()
+
+
+class ColumnarReader:
+    """Memory-mapped reader that decodes row groups and columns on demand."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._fh = path.open("rb")
+        try:
+            self._map = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:  # zero-length file
+            self._fh.close()
+            raise ColumnarFormatError(f"Empty columnar file: {path}") from exc
+        try:
+            self._footer = self._read_footer()
+        except Exception:
+            self.close()
+            raise
+        self._columns: list[str] = list(self._footer["columns"])
+        self._groups: list[dict[str, Any]] = list(self._footer["row_groups"])
+        # First row index of every group, so an offset maps straight to its group.
+        self._group_starts: list[int] = list(itertools.accumulate((group["rows"] for group in self._groups), initial=0))
+
+    def _read_footer(self) -> dict[str, Any]:
+        data = self._map
+        trailer = len(MAGIC) + _FOOTER_LENGTH.size
+        if len(data) < len(MAGIC) + trailer or data[: len(MAGIC)] != MAGIC or data[-len(MAGIC) :] != MAGIC:
+            raise ColumnarFormatError(f"Not a columnar cache file: {self._path}")
+        (footer_len,) = _FOOTER_LENGTH.unpack(data[-trailer : -len(MAGIC)])
+        footer_start = len(data) - trailer - footer_len
+        if footer_start < len(MAGIC):
+            raise ColumnarFormatError(f"Corrupt columnar footer: {self._path}")
+        try:
+            footer = json.loads(data[footer_start : len(data) - trailer].decode("utf-8"))
+        except ValueError as exc:
+            raise ColumnarFormatError(f"Corrupt columnar footer: {self._path}") from exc
+        if not isinstance(footer, dict) or footer.get("format") != FORMAT_NAME:
+            raise ColumnarFormatError(f"Unsupported columnar format in {self._path}")
+        return footer
+
+    def __enter__(self) -> ColumnarReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+        self._fh.close()
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._columns)
+
+    @property
+    def row_count(self) -> int:
+        return int(self._footer.get("row_count", 0))
+
+    def _decode_chunk(self, group: dict[str, Any], col_idx: int) -> list[Any]:
+        offset, length = group["chunks"][col_idx]
+        try:
+            values = json.loads(zlib.decompress(self._map[offset : offset + length]))
+        except (zlib.error, ValueError) as exc:
+            raise ColumnarFormatError(f"Corrupt column chunk in {self._path}") from exc
+        if not isinstance(values, list) or len(values) != group["rows"]:
+            raise ColumnarFormatError(f"Corrupt column chunk in {self._path}")
+        return values
+
+    def iter_rows(
+        self,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield rows in stored order from ``offset``, decoding only the groups/columns needed."""
+        if columns is None:
+            selected = list(enumerate(self._columns))
+        else:
+            wanted = set(columns)
+            selected = [(idx, name) for idx, name in enumerate(self._columns) if name in wanted]
+        offset = max(0, offset)
+        remaining = self.row_count if limit is None else max(0, limit)
+        first_group = max(0, bisect.bisect_right(self._group_starts, offset) - 1)
+        skip = offset - self._group_starts[first_group] if self._groups else 0
+
+        for group in self._groups[first_group:]:
+            if remaining <= 0:
+                return
+            take = min(group["rows"] - skip, remaining)
+            decoded = [(name, self._decode_chunk(group, idx)) for idx, name in selected]
+            missing = group.get("missing") or {}
+            absent = {
+                (self._columns[int(col_idx)], row_idx) for col_idx, row_idxs in missing.items() for row_idx in row_idxs
+            }
+            for row_idx in range(skip, skip + take):
+                if absent:
+                    yield {name: values[row_idx] for name, values in decoded if (name, row_idx) not in absent}
+                else:
+                    yield {name: values[row_idx] for name, values in decoded}
+            remaining -= take
+            skip = 0
+
+    def read_rows(
+        self,
+        *,
+        offset: int = 0,
+        limit: int | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        return list(self.iter_rows(offset=offset, limit=limit, columns=columns))
+
+    def write_csv(self, destination: Path, *, columns: list[str] | None = None) -> Path:
+        """Stream the stored rows to ``destination`` as CSV, one row group at a time."""
+        fieldnames = columns or self._columns
+        with destination.open("w", encoding="utf-8", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=fieldnames, extrasaction="ignore")
+            writer.writeheader()
+            for row in self.iter_rows(columns=fieldnames):
+                writer.writerow({column: row.get(column) for column in fieldnames})
+        return destination
+
+
+def read_columnar(
+    path: Path,
+    *,
+    limit: int | None = None,
+    columns: Iterable[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Convenience wrapper returning up to ``limit`` rows from ``path``."""
+    with ColumnarReader(path) as reader:
+        return reader.read_rows(limit=limit, columns=columns)
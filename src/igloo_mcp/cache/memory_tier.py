@@ -0,0 +1,116 @@
+"""In-process LRU tier for parsed query results.
+
+Sits in front of the filesystem cache so repeated lookups of the same cache key
+skip reading ``manifest.json`` and decoding the rows file. The tier is bounded
+by the approximate size of its entries (their serialized JSON size), not by entry
+count, so a handful of wide results cannot crowd out memory unnoticed.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class MemoryCacheEntry:
+    """Parsed rows and hit metadata for one cache key."""
+
+    rows: list[dict[str, Any]]
+    metadata: dict[str, Any]
+    manifest_path: Path
+    result_path: Path
+    result_csv_path: Path | None
+    size_bytes: int
+
+
+class MemoryCacheTier:
+    """Thread-safe, byte-bounded LRU keyed by cache key."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max(0, int(max_bytes))
+        self._entries: OrderedDict[str, MemoryCacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.rejected = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def get(self, cache_key: str) -> MemoryCacheEntry | None:
+        """Return a copy of the entry for ``cache_key`` and mark it most recently used."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+        # Callers mutate hit rows/metadata freely; hand out copies so the tier stays pristine.
+        return MemoryCacheEntry(
+            rows=[dict(row) for row in entry.rows],
+            metadata=copy.deepcopy(entry.metadata),
+            manifest_path=entry.manifest_path,
+            result_path=entry.result_path,
+            result_csv_path=entry.result_csv_path,
+            size_bytes=entry.size_bytes,
+        )
+
+    def put(self, cache_key: str, entry: MemoryCacheEntry) -> bool:
+        """Insert or replace ``cache_key``; returns False when the entry exceeds the budget."""
+        if not self.enabled:
+            return False
+        with self._lock:
+            previous = self._entries.pop(cache_key, None)
+            if previous is not None:
+                self._bytes -= previous.size_bytes
+            if entry.size_bytes > self._max_bytes:
+                self.rejected += 1
+                return False
+            self._entries[cache_key] = entry
+            self._bytes += entry.size_bytes
+            while self._bytes > self._max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size_bytes
+                self.evictions += 1
+            return True
+
+    def discard(self, cache_key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(cache_key, None)
+            if entry is not None:
+                self._bytes -= entry.size_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "rejected": self.rejected,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
@@ -1,8 +1,8 @@
-"""Query result caching with SHA-256 indexing and CSV/JSON storage.
+"""Query result caching with SHA-256 indexing and columnar storage.
 
 Provides transparent caching of Snowflake query results to reduce warehouse
 costs and improve response times. Uses SHA-256 hashing of SQL + session context
-for deduplication. Stores results as CSV/JSON with manifest metadata.
+for deduplication. Stores results in a compact columnar file with manifest metadata.
 
 Key Classes:
 - QueryResultCache: Main cache interface with get/set/invalidate operations
@@ -12,9 +12,12 @@ Key Classes:
 Features:
 - Automatic cache key generation from SQL + session context
 - Configurable modes: enabled, read_only, force_refresh, disabled
-- TTL support for cache expiration
-- CSV storage for efficient large result sets
+- Per-entry TTL (defaults per statement class, overridable per call)
+- Global byte quota enforced by LRU/LFU eviction via an access-time index
+- Columnar row storage; prefix lookups decode only the row groups they need
+- CSV generated on demand via export_csv
 - Manifest files for metadata (execution_id, rowcount, columns)
+- In-memory LRU tier (bounded by bytes) in front of the filesystem for hot keys
 
 Usage:
     cache = QueryResultCache.from_env()
@@ -32,23 +35,30 @@ Usage:
 from __future__ import annotations
 
 import contextlib
-import csv
+import copy
 import hashlib
 import json
 import logging
 import os
+import shutil
+import threading
 from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, ClassVar
 
+from igloo_mcp.env_utils import read_choice_env, read_float_env
 from igloo_mcp.path_utils import (
     DEFAULT_ARTIFACT_ROOT,
     DEFAULT_CACHE_SUBDIR,
     resolve_cache_root,
 )
 
+from .access_index import EVICTION_POLICIES, INDEX_FILENAME, CacheAccessIndex, entry_size_bytes, parse_timestamp
+from .columnar import FORMAT_NAME, ColumnarReader, write_columnar
+from .memory_tier import MemoryCacheEntry, MemoryCacheTier
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,8 +70,9 @@ class CacheHit:
     rows: list[dict[str, Any]]
     metadata: dict[str, Any]
     manifest_path: Path
-    result_json_path: Path
+    result_path: Path
     result_csv_path: Path | None
+    partial: bool = False  # rows is a prefix of the cached result (see lookup(row_limit=...))
 
 
 class QueryResultCache:
@@ -70,7 +81,21 @@ class QueryResultCache:
     DEFAULT_MODE = "enabled"
     VALID_MODES: ClassVar[set[str]] = {"enabled", "disabled", "read_only", "refresh"}
     DISABLE_SENTINELS: ClassVar[set[str]] = {"disabled", "off", "false", "0"}
-    DEFAULT_MAX_ROWS = 5_000
+    DEFAULT_MAX_ROWS = 100_000
+    MANIFEST_VERSION = 2
+    ROWS_FILENAME = "rows.col"
+    CSV_FILENAME = "rows.csv"
+    # Row files written by manifest version 1; removed when a key is re-stored.
+    LEGACY_ROW_FILES: ClassVar[tuple[str, ...]] = ("rows.jsonl", "rows.csv")
+    DEFAULT_MEMORY_MAX_MB = 64
+    DEFAULT_TTL_HOURS = 24.0
+    DEFAULT_METADATA_TTL_HOURS = 1.0
+    DEFAULT_MAX_MB = 1024
+    DEFAULT_EVICTION_POLICY = "lru"
+    # SHOW/DESCRIBE/LIST output tracks DDL and goes stale much faster than data.
+    METADATA_STATEMENT_TYPES: ClassVar[set[str]] = {"show", "describe", "desc", "list", "ls"}
+    # Directories without a manifest younger than this may still be mid-write.
+    GC_INCOMPLETE_GRACE_SECONDS = 300
 
     def __init__(
         self,
@@ -79,11 +104,30 @@ class QueryResultCache:
         root: Path | None,
         max_rows: int = DEFAULT_MAX_ROWS,
         fallbacks: Iterable[Path] | None = None,
+        memory_max_bytes: int = DEFAULT_MEMORY_MAX_MB * 1024 * 1024,
+        ttl_seconds: float = DEFAULT_TTL_HOURS * 3600,
+        metadata_ttl_seconds: float = DEFAULT_METADATA_TTL_HOURS * 3600,
+        max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+        eviction_policy: str = DEFAULT_EVICTION_POLICY,
     ) -> None:
         self._mode = mode if mode in self.VALID_MODES else self.DEFAULT_MODE
         self._root: Path | None = None
         self._max_rows = max_rows
         self._warnings: list[str] = []
+        self._memory = MemoryCacheTier(memory_max_bytes if self._mode != "disabled" else 0)
+        self._disk_hits = 0
+        self._disk_misses = 0
+        self._ttl_seconds = ttl_seconds
+        self._metadata_ttl_seconds = metadata_ttl_seconds
+        self._max_bytes = max(0, max_bytes)
+        self._eviction_policy = (
+            eviction_policy if eviction_policy in EVICTION_POLICIES else self.DEFAULT_EVICTION_POLICY
+        )
+        self._index: CacheAccessIndex | None = None
+        self._expired = 0
+        self._evictions = 0
+        # Stores run on worker threads; two writers must not interleave in one entry directory.
+        self._store_lock = threading.Lock()
 
         if self._mode == "disabled":
             return
@@ -115,6 +159,9 @@ class QueryResultCache:
             self._warnings.append(warning)
             logger.warning(warning)
             self._mode = "disabled"
+            return
+
+        self._index = CacheAccessIndex(self._root)
 
     @classmethod
     def from_env(
@@ -173,6 +220,12 @@ class QueryResultCache:
                     max_rows,
                 )
 
+        memory_mb = read_float_env("IGLOO_MCP_CACHE_MEMORY_MAX_MB", cls.DEFAULT_MEMORY_MAX_MB)
+        ttl_hours = read_float_env("IGLOO_MCP_CACHE_TTL_HOURS", cls.DEFAULT_TTL_HOURS)
+        metadata_ttl_hours = read_float_env("IGLOO_MCP_CACHE_METADATA_TTL_HOURS", cls.DEFAULT_METADATA_TTL_HOURS)
+        max_mb = read_float_env("IGLOO_MCP_CACHE_MAX_MB", cls.DEFAULT_MAX_MB)
+        policy = read_choice_env("IGLOO_MCP_CACHE_EVICTION_POLICY", EVICTION_POLICIES, cls.DEFAULT_EVICTION_POLICY)
+
         fallbacks: list[Path] = []
         if resolved_root is None or resolved_root != fallback_root:
             fallbacks.append(fallback_root)
@@ -182,6 +235,11 @@ class QueryResultCache:
             root=resolved_root,
             max_rows=max_rows,
             fallbacks=fallbacks,
+            memory_max_bytes=int(memory_mb * 1024 * 1024),
+            ttl_seconds=ttl_hours * 3600,
+            metadata_ttl_seconds=metadata_ttl_hours * 3600,
+            max_bytes=int(max_mb * 1024 * 1024),
+            eviction_policy=policy,
         )
 
     @property
@@ -200,6 +258,44 @@ class QueryResultCache:
     def max_rows(self) -> int:
         return self._max_rows
 
+    @property
+    def memory_tier(self) -> MemoryCacheTier:
+        return self._memory
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def eviction_policy(self) -> str:
+        return self._eviction_policy
+
+    def ttl_for_statement(self, statement_type: str | None) -> float:
+        """Default TTL in seconds for results of ``statement_type`` (sqlglot class name)."""
+        if (statement_type or "").strip().lower() in self.METADATA_STATEMENT_TYPES:
+            return self._metadata_ttl_seconds
+        return self._ttl_seconds
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for the memory and disk tiers."""
+        disk: dict[str, Any] = {
+            "hits": self._disk_hits,
+            "misses": self._disk_misses,
+            "expired": self._expired,
+            "evictions": self._evictions,
+            "max_bytes": self._max_bytes,
+            "eviction_policy": self._eviction_policy,
+        }
+        if self._index is not None:
+            disk["entries"] = len(self._index)
+            disk["bytes"] = self._index.total_bytes()
+        return {
+            "mode": self._mode,
+            "enabled": self.enabled,
+            "memory": self._memory.stats(),
+            "disk": disk,
+        }
+
     def pop_warnings(self) -> list[str]:
         warnings = list(self._warnings)
         self._warnings.clear()
@@ -209,6 +305,10 @@ class QueryResultCache:
     def _iso_now() -> str:
         return datetime.now(UTC).isoformat()
 
+    @staticmethod
+    def _now() -> float:
+        return datetime.now(UTC).timestamp()
+
     def compute_cache_key(
         self,
         *,
@@ -233,10 +333,139 @@ class QueryResultCache:
             return None
         return self._root / cache_key
 
-    def lookup(self, cache_key: str) -> CacheHit | None:
+    def lookup(
+        self,
+        cache_key: str,
+        *,
+        max_age_seconds: float | None = None,
+        row_limit: int | None = None,
+    ) -> CacheHit | None:
+        """Return the cached result for ``cache_key`` unless missing or expired.
+
+        ``max_age_seconds`` additionally rejects entries created longer ago than
+        that (a per-call freshness bound on top of the entry's own TTL).
+        ``row_limit`` returns at most that many rows; callers that only need a
+        prefix (summary/sample/schema_only responses) then skip decoding the rest
+        and receive a hit marked ``partial``.
+        """
         if not self.enabled or self._mode == "refresh":
             return None
 
+        now = self._now()
+        cached = self._memory.get(cache_key)
+        if cached is not None:
+            if self._is_stale(cached.metadata, now=now, max_age_seconds=max_age_seconds):
+                self._expired += 1
+                self._memory.discard(cache_key)
+                return None
+            # The filesystem stays authoritative: entries removed on disk are gone.
+            if cached.manifest_path.exists():
+                self._record_access(cache_key, now)
+                rows = cached.rows
+                partial = row_limit is not None and len(rows) > row_limit
+                return CacheHit(
+                    cache_key=cache_key,
+                    rows=rows[:row_limit] if partial else rows,
+                    metadata=cached.metadata,
+                    manifest_path=cached.manifest_path,
+                    result_path=cached.result_path,
+                    result_csv_path=cached.result_csv_path,
+                    partial=partial,
+                )
+            self._memory.discard(cache_key)
+
+        hit = self._lookup_disk(cache_key, row_limit=row_limit)
+        if hit is None:
+            self._disk_misses += 1
+            return None
+        if self._is_stale(hit.metadata, now=now, max_age_seconds=max_age_seconds):
+            self._expired += 1
+            return None
+        self._disk_hits += 1
+        if not hit.partial:
+            size_bytes = int(hit.metadata.get("rows_bytes") or 0)
+            with contextlib.suppress(OSError):
+                size_bytes = (size_bytes or hit.result_path.stat().st_size) + hit.manifest_path.stat().st_size
+            self._remember(hit, size_bytes)
+        self._record_access(cache_key, now)
+        return hit
+
+    def _is_stale(self, metadata: dict[str, Any], *, now: float, max_age_seconds: float | None) -> bool:
+        created_at = parse_timestamp(metadata.get("created_at"))
+        expires_at = parse_timestamp(metadata.get("expires_at"))
+        if expires_at is None and created_at is not None:
+            # Manifests written before TTLs existed expire on the default schedule.
+            expires_at = created_at + self._ttl_seconds
+        if expires_at is not None and expires_at <= now:
+            return True
+        return max_age_seconds is not None and created_at is not None and created_at + max_age_seconds <= now
+
+    def _record_access(self, cache_key: str, now: float) -> None:
+        if self._index is None:
+            return
+        self._index.record_access(cache_key, now=now)
+        if self._mode != "read_only":
+            self._index.maybe_flush()
+
+    def _remember(self, hit: CacheHit, size_bytes: int) -> None:
+        self._memory.put(
+            hit.cache_key,
+            MemoryCacheEntry(
+                rows=[dict(row) for row in hit.rows],
+                metadata=copy.deepcopy(hit.metadata),
+                manifest_path=hit.manifest_path,
+                result_path=hit.result_path,
+                result_csv_path=hit.result_csv_path,
+                size_bytes=size_bytes,
+            ),
+        )
+
+    @staticmethod
+    def _hit_metadata(manifest_data: dict[str, Any]) -> dict[str, Any]:
+        metadata = {
+            key: manifest_data.get(key)
+            for key in (
+                "created_at",
+                "profile",
+                "context",
+                "rowcount",
+                "duration_ms",
+                "statement_sha256",
+                "truncated",
+                "post_query_insight",
+                "reason",
+                "objects",
+                "expires_at",
+                "rows_bytes",
+            )
+        }
+        metadata["cache_hit"] = True
+        metadata["manifest_version"] = manifest_data.get("version")
+        if "columns" in manifest_data:
+            metadata["columns"] = manifest_data.get("columns")
+        if "key_metrics" in manifest_data:
+            metadata["key_metrics"] = manifest_data.get("key_metrics")
+        if "insights" in manifest_data:
+            metadata["insights"] = manifest_data.get("insights")
+        return metadata
+
+    @staticmethod
+    def _rows_file_name(manifest_data: dict[str, Any]) -> str | None:
+        # Version 1 manifests point at rows.jsonl through ``result_json``.
+        return manifest_data.get("result_rows") or manifest_data.get("result_json")
+
+    @staticmethod
+    def _read_legacy_rows(path: Path) -> list[dict[str, Any]]:
+        rows: list[dict[str, Any]] = []
+        with path.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                rows.append(json.loads(line))
+        return rows
+
+    def _lookup_disk(self, cache_key: str, *, row_limit: int | None = None) -> CacheHit | None:
         key_dir = self._directory_for_key(cache_key)
         if key_dir is None:
             return None
@@ -258,25 +487,25 @@ class QueryResultCache:
             logger.warning(warning)
             return None
 
-        result_json_rel = manifest_data.get("result_json")
-        if not result_json_rel:
+        rows_rel = self._rows_file_name(manifest_data)
+        if not rows_rel:
             return None
 
-        result_json_path = key_dir / result_json_rel
-        if not result_json_path.exists():
+        result_path = key_dir / rows_rel
+        if not result_path.exists():
             warning = f"Cache rows file missing for {cache_key}"
             self._warnings.append(warning)
             logger.warning(warning)
             return None
 
-        rows: list[dict[str, Any]] = []
+        partial = False
         try:
-            with result_json_path.open("r", encoding="utf-8") as fh:
-                for line in fh:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    rows.append(json.loads(line))
+            if manifest_data.get("result_format") == FORMAT_NAME:
+                with ColumnarReader(result_path) as reader:
+                    rows = reader.read_rows(limit=row_limit)
+                    partial = reader.row_count > len(rows)
+            else:
+                rows = self._read_legacy_rows(result_path)
         except Exception as exc:
             warning = f"Failed to load cached rows for {cache_key}: {exc}"
             self._warnings.append(warning)
@@ -290,36 +519,14 @@ class QueryResultCache:
             if not result_csv_path.exists():
                 result_csv_path = None
 
-        metadata = {
-            key: manifest_data.get(key)
-            for key in (
-                "created_at",
-                "profile",
-                "context",
-                "rowcount",
-                "duration_ms",
-                "statement_sha256",
-                "truncated",
-                "post_query_insight",
-                "reason",
-                "objects",
-            )
-        }
-        metadata["cache_hit"] = True
-        metadata["manifest_version"] = manifest_data.get("version")
-        if "columns" in manifest_data:
-            metadata["columns"] = manifest_data.get("columns")
-        if "key_metrics" in manifest_data:
-            metadata["key_metrics"] = manifest_data.get("key_metrics")
-        if "insights" in manifest_data:
-            metadata["insights"] = manifest_data.get("insights")
         return CacheHit(
             cache_key=cache_key,
             rows=rows,
-            metadata=metadata,
+            metadata=self._hit_metadata(manifest_data),
             manifest_path=manifest_path,
-            result_json_path=result_json_path,
+            result_path=result_path,
             result_csv_path=result_csv_path,
+            partial=partial,
         )
 
     def store(
@@ -328,11 +535,44 @@ class QueryResultCache:
         *,
         rows: list[dict[str, Any]],
         metadata: dict[str, Any],
+        ttl_seconds: float | None = None,
+    ) -> Path | None:
+        """Persist ``rows`` under ``cache_key``; ``ttl_seconds`` defaults to the SELECT TTL.
+
+        A non-positive ``ttl_seconds`` means the result must not be cached.
+        """
+        with self._store_lock:
+            return self._store_entry(cache_key, rows=rows, metadata=metadata, ttl_seconds=ttl_seconds)
+
+    def manifest_path_for(self, cache_key: str, *, row_count: int, ttl_seconds: float | None = None) -> Path | None:
+        """Manifest path ``store`` will write for this entry, or None when it would skip the store.
+
+        Lets callers that queue ``store`` in the background record the manifest
+        location before it exists.
+        """
+        if not self.enabled or self._mode == "read_only":
+            return None
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0 or row_count > self._max_rows:
+            return None
+        key_dir = self._directory_for_key(cache_key)
+        return key_dir / "manifest.json" if key_dir is not None else None
+
+    def _store_entry(
+        self,
+        cache_key: str,
+        *,
+        rows: list[dict[str, Any]],
+        metadata: dict[str, Any],
+        ttl_seconds: float | None,
     ) -> Path | None:
         if not self.enabled:
             return None
         if self._mode == "read_only":
             return None
+        ttl = self._ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            return None
         if len(rows) > self._max_rows:
             warning = f"Skipping cache store for {cache_key} (rows={len(rows)} exceeds limit {self._max_rows})"
             self._warnings.append(warning)
@@ -351,19 +591,19 @@ class QueryResultCache:
             logger.warning(warning)
             return None
 
-        result_json_path = key_dir / "rows.jsonl"
+        result_path = key_dir / self.ROWS_FILENAME
         try:
-            with result_json_path.open("w", encoding="utf-8") as fh:
-                for row in rows:
-                    fh.write(json.dumps(row, ensure_ascii=False))
-                    fh.write("\n")
+            stats = write_columnar(result_path, rows)
         except Exception as exc:
             warning = f"Failed to persist cached rows for {cache_key}: {exc}"
             self._warnings.append(warning)
             logger.warning(warning)
             return None
+        # A refreshed key must not keep serving a CSV/JSONL copy of the old result.
+        for stale_name in self.LEGACY_ROW_FILES:
+            with contextlib.suppress(OSError):
+                (key_dir / stale_name).unlink(missing_ok=True)
 
-        result_csv_path: Path | None = None
         columns = metadata.get("columns")
         if not columns:
             # Derive columns from ALL rows to prevent data loss
@@ -386,32 +626,25 @@ class QueryResultCache:
                             break  # Only log once
             else:
                 metadata["columns"] = []
-        try:
-            if rows:
-                result_csv_path = key_dir / "rows.csv"
-                with result_csv_path.open("w", encoding="utf-8", newline="") as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=metadata["columns"])
-                    writer.writeheader()
-                    for row in rows:
-                        writer.writerow({col: row.get(col) for col in metadata["columns"]})
-        except Exception as exc:
-            warning = f"Failed to persist cached CSV for {cache_key}: {exc}"
-            # CSV is optional; keep going but record warning.
-            self._warnings.append(warning)
-            logger.warning(warning)
-            result_csv_path = None
 
+        created_at = self._iso_now()
+        created_ts = parse_timestamp(created_at) or self._now()
+        expires_ts = created_ts + ttl
         manifest = {
-            "version": 1,
+            "version": self.MANIFEST_VERSION,
             "cache_key": cache_key,
-            "created_at": self._iso_now(),
+            "created_at": created_at,
+            "ttl_seconds": int(ttl) if float(ttl).is_integer() else ttl,
+            "expires_at": datetime.fromtimestamp(expires_ts, UTC).isoformat(),
             "profile": metadata.get("profile"),
             "context": metadata.get("context"),
             "rowcount": metadata.get("rowcount"),
             "duration_ms": metadata.get("duration_ms"),
             "statement_sha256": metadata.get("statement_sha256"),
-            "result_json": result_json_path.name,
-            "result_csv": result_csv_path.name if result_csv_path else None,
+            "result_format": FORMAT_NAME,
+            "result_rows": result_path.name,
+            "result_csv": None,
+            "rows_bytes": stats.json_bytes,
             "columns": metadata.get("columns"),
             "truncated": metadata.get("truncated"),
             "post_query_insight": metadata.get("post_query_insight"),
@@ -422,15 +655,192 @@ class QueryResultCache:
         }
 
         manifest_path = key_dir / "manifest.json"
+        manifest_text = json.dumps(manifest, ensure_ascii=False, indent=2) + "\n"
         try:
-            manifest_path.write_text(
-                json.dumps(manifest, ensure_ascii=False, indent=2) + "\n",
-                encoding="utf-8",
-            )
+            manifest_path.write_text(manifest_text, encoding="utf-8")
         except Exception as exc:
             warning = f"Failed to write cache manifest for {cache_key}: {exc}"
             self._warnings.append(warning)
             logger.warning(warning)
+            self._memory.discard(cache_key)
             return None
 
+        if self._index is not None:
+            self._index.record_store(
+                cache_key,
+                size_bytes=entry_size_bytes(key_dir),
+                expires_at=expires_ts,
+                now=created_ts,
+            )
+            self._enforce_quota(protect=cache_key, now=created_ts)
+            self._index.flush()
+
+        # Write-through: the next lookup for this key is served without touching disk.
+        self._remember(
+            CacheHit(
+                cache_key=cache_key,
+                rows=rows,
+                metadata=self._hit_metadata(manifest),
+                manifest_path=manifest_path,
+                result_path=result_path,
+                result_csv_path=None,
+            ),
+            stats.json_bytes + len(manifest_text),
+        )
         return manifest_path
+
+    def export_csv(self, cache_key: str) -> Path | None:
+        """Materialize ``rows.csv`` for a cached entry and return its path.
+
+        CSV is no longer written on every store; it is generated from the columnar
+        rows the first time it is requested and recorded in the manifest.
+        """
+        if not self.enabled or self._mode == "read_only":
+            return None
+        key_dir = self._directory_for_key(cache_key)
+        if key_dir is None:
+            return None
+        manifest_path = key_dir / "manifest.json"
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or manifest.get("cache_key") != cache_key:
+            return None
+
+        existing = manifest.get("result_csv")
+        if existing and (key_dir / existing).exists():
+            return key_dir / existing
+        rows_name = self._rows_file_name(manifest)
+        if manifest.get("result_format") != FORMAT_NAME or not rows_name:
+            return None
+
+        csv_path = key_dir / self.CSV_FILENAME
+        try:
+            with ColumnarReader(key_dir / rows_name) as reader:
+                reader.write_csv(csv_path, columns=manifest.get("columns") or None)
+            manifest["result_csv"] = csv_path.name
+            manifest_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        except Exception as exc:
+            warning = f"Failed to export cached CSV for {cache_key}: {exc}"
+            self._warnings.append(warning)
+            logger.warning(warning)
+            with contextlib.suppress(OSError):
+                csv_path.unlink(missing_ok=True)
+            return None
+
+        # The memory tier still describes the entry without a CSV path.
+        self._memory.discard(cache_key)
+        if self._index is not None:
+            self._index.resize(cache_key, entry_size_bytes(key_dir))
+            self._index.maybe_flush()
+        return csv_path
+
+    def _remove_entry(self, cache_key: str) -> None:
+        self._memory.discard(cache_key)
+        if self._index is not None:
+            self._index.remove(cache_key)
+        key_dir = self._directory_for_key(cache_key)
+        if key_dir is not None:
+            shutil.rmtree(key_dir, ignore_errors=True)
+
+    def _enforce_quota(self, *, protect: str | None, now: float) -> int:
+        """Evict entries (expired first, then by policy) until the root fits ``max_bytes``."""
+        if self._index is None or self._max_bytes <= 0:
+            return 0
+        total = self._index.total_bytes()
+        if total <= self._max_bytes:
+            return 0
+        evicted = 0
+        for cache_key in self._index.eviction_order(self._eviction_policy, now=now):
+            if total <= self._max_bytes:
+                break
+            if cache_key == protect:
+                continue
+            entry = self._index.get(cache_key)
+            self._remove_entry(cache_key)
+            total -= entry.size_bytes if entry is not None else 0
+            evicted += 1
+        self._evictions += evicted
+        if evicted:
+            logger.info("Evicted %d query cache entries to stay under %d bytes", evicted, self._max_bytes)
+        return evicted
+
+    def collect_garbage(self, *, dry_run: bool = False) -> dict[str, Any]:
+        """Compact the cache root offline.
+
+        Removes expired entries and incomplete/corrupt entry directories, rebuilds
+        the access-time index from what remains and enforces the byte quota.
+        """
+        summary: dict[str, Any] = {
+            "root": str(self._root) if self._root else None,
+            "dry_run": dry_run,
+            "scanned": 0,
+            "removed_expired": 0,
+            "removed_invalid": 0,
+            "evicted": 0,
+            "bytes_before": 0,
+            "bytes_after": 0,
+        }
+        if self._root is None or self._index is None:
+            return summary
+
+        now = self._now()
+        survivors_bytes = 0
+        try:
+            key_dirs = [path for path in self._root.iterdir() if path.is_dir()]
+        except OSError as exc:
+            summary["error"] = str(exc)
+            return summary
+
+        for key_dir in key_dirs:
+            summary["scanned"] += 1
+            size = entry_size_bytes(key_dir)
+            summary["bytes_before"] += size
+            reason = self._gc_reason(key_dir, now=now)
+            if reason is None:
+                survivors_bytes += size
+                continue
+            summary[f"removed_{reason}"] += 1
+            if not dry_run:
+                self._memory.discard(key_dir.name)
+                shutil.rmtree(key_dir, ignore_errors=True)
+
+        with contextlib.suppress(OSError):
+            for stray in self._root.glob(f"{Path(INDEX_FILENAME).stem}.*.tmp"):
+                if not dry_run:
+                    stray.unlink()
+
+        if dry_run:
+            summary["bytes_after"] = survivors_bytes
+            if self._max_bytes and survivors_bytes > self._max_bytes:
+                summary["would_evict_bytes"] = survivors_bytes - self._max_bytes
+            return summary
+
+        self._index.rebuild()
+        summary["evicted"] = self._enforce_quota(protect=None, now=now)
+        self._index.flush()
+        summary["bytes_after"] = self._index.total_bytes()
+        summary["entries_after"] = len(self._index)
+        return summary
+
+    def _gc_reason(self, key_dir: Path, *, now: float) -> str | None:
+        manifest_path = key_dir / "manifest.json"
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            try:
+                age = now - key_dir.stat().st_mtime
+            except OSError:
+                return None
+            return "invalid" if age > self.GC_INCOMPLETE_GRACE_SECONDS else None
+        except (OSError, ValueError):
+            return "invalid"
+        if not isinstance(manifest, dict) or manifest.get("cache_key") != key_dir.name:
+            return "invalid"
+        rows_name = self._rows_file_name(manifest)
+        if not rows_name or not (key_dir / rows_name).exists():
+            return "invalid"
+        if self._is_stale(manifest, now=now, max_age_seconds=None):
+            return "expired"
+        return None
@@ -2,11 +2,13 @@
 
 from .catalog_service import CatalogResult, CatalogService, CatalogTotals, build_catalog
 from .index import CatalogIndex, CatalogObject
+from .search_index import CatalogSearchIndex
 
 __all__ = [
     "CatalogIndex",
     "CatalogObject",
     "CatalogResult",
+    "CatalogSearchIndex",
     "CatalogService",
     "CatalogTotals",
     "build_catalog",
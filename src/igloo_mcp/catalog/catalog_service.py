@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -12,6 +15,23 @@ from typing import Any
 from igloo_mcp.path_utils import resolve_catalog_path, resolve_catalog_root
 from igloo_mcp.snow_cli import SnowCLI
 
+from .incremental import (
+    BUILD_MODES,
+    METADATA_FILENAME,
+    RELATION_TYPES,
+    CatalogDelta,
+    changed_columns_query,
+    compute_delta,
+    full_refresh_reason,
+    inventory_query,
+    load_previous_build,
+    merge_columns,
+    merge_relations,
+    parse_build_timestamp,
+    schema_listing_query,
+)
+from .index import CatalogIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,6 +59,125 @@ class CatalogResult:
     output_dir: str
     success: bool = True
     error: str | None = None
+    errors: dict[str, str] = field(default_factory=dict)  # object type -> query error
+    refresh_mode: str = "full"  # "full" or "incremental"
+    refresh_reason: str | None = None  # why an incremental request fell back to full
+    changed_objects: int = 0
+    dropped_objects: int = 0
+
+
+@dataclass
+class CatalogQueryStat:
+    """Timing and outcome of one catalog metadata query."""
+
+    object_type: str
+    duration_ms: float
+    rows: int = 0
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "status": "error" if self.error else "success",
+            "duration_ms": self.duration_ms,
+            "rows": self.rows,
+        }
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+@dataclass(frozen=True)
+class CatalogQuery:
+    """A metadata query; ``object_type`` names both the catalog key and the CatalogTotals field."""
+
+    object_type: str
+    sql: str
+
+
+_SHOW_OBJECT_TYPES = (
+    ("databases", "DATABASES"),
+    ("schemas", "SCHEMAS"),
+    ("tables", "TABLES"),
+    ("views", "VIEWS"),
+    ("materialized_views", "MATERIALIZED VIEWS"),
+    ("dynamic_tables", "DYNAMIC TABLES"),
+    ("tasks", "TASKS"),
+)
+
+
+# Object types re-listed in full on every incremental refresh.
+_RELISTED_TYPES = ("databases", "schemas", "tasks", "functions", "procedures")
+
+
+def _catalog_totals(catalog_data: dict[str, Any]) -> CatalogTotals:
+    totals = CatalogTotals()
+    for object_type in vars(totals):
+        setattr(totals, object_type, len(catalog_data.get(object_type) or []))
+    return totals
+
+
+def _catalog_queries(database: str | None, account_scope: bool) -> list[CatalogQuery]:
+    """Metadata queries for a catalog build, in catalog order."""
+    queries: list[CatalogQuery] = []
+    for object_type, keyword in _SHOW_OBJECT_TYPES:
+        if account_scope or not database:
+            sql = f"SHOW {keyword}"
+        elif object_type == "databases":
+            sql = f"SHOW DATABASES LIKE '{database}'"
+        else:
+            sql = f"SHOW {keyword} IN DATABASE {database}"
+        queries.append(CatalogQuery(object_type, sql))
+
+    # Query user-defined functions only
+    # Note: INFORMATION_SCHEMA.FUNCTIONS automatically excludes built-in Snowflake functions
+    # This prevents including 1000+ built-in operators (!=, %, *, +, -) and system functions
+    # Only returns actual user-defined functions created by users
+    function_filter = f"WHERE FUNCTION_CATALOG = '{database}'" if database and not account_scope else ""
+    queries.append(
+        CatalogQuery(
+            "functions",
+            f"""
+            SELECT
+                FUNCTION_CATALOG as database_name,
+                FUNCTION_SCHEMA as schema_name,
+                FUNCTION_NAME as function_name,
+                DATA_TYPE as return_type,
+                FUNCTION_LANGUAGE as language,
+                COMMENT as comment,
+                CREATED as created,
+                LAST_ALTERED as last_altered
+            FROM INFORMATION_SCHEMA.FUNCTIONS
+            {function_filter}
+            ORDER BY FUNCTION_CATALOG, FUNCTION_SCHEMA, FUNCTION_NAME
+            """,  # noqa: S608 - database param from validated Snowflake config
+        )
+    )
+
+    proc_sql = f"SHOW PROCEDURES IN DATABASE {database}" if database and not account_scope else "SHOW PROCEDURES"
+    queries.append(CatalogQuery("procedures", proc_sql))
+
+    # Query columns from INFORMATION_SCHEMA
+    column_filter = f"WHERE TABLE_CATALOG = '{database}'" if database and not account_scope else ""
+    queries.append(
+        CatalogQuery(
+            "columns",
+            f"""
+            SELECT
+                TABLE_CATALOG as database_name,
+                TABLE_SCHEMA as schema_name,
+                TABLE_NAME as table_name,
+                COLUMN_NAME as column_name,
+                DATA_TYPE as data_type,
+                IS_NULLABLE as is_nullable,
+                COLUMN_DEFAULT as column_default,
+                COMMENT as comment
+            FROM INFORMATION_SCHEMA.COLUMNS
+            {column_filter}
+            ORDER BY TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION
+            """,  # noqa: S608 - database param from validated Snowflake config
+        )
+    )
+    return queries
 
 
 class CatalogService:
@@ -81,9 +220,17 @@ class CatalogService:
         catalog_concurrency: int = 16,
         export_sql: bool = False,
         use_unified_storage: bool = True,
+        mode: str = "full",
     ) -> CatalogResult:
         """Build catalog metadata.
 
+        With ``mode="incremental"`` a per-database catalog in unified storage is
+        refreshed from the previous build: only relations whose LAST_ALTERED or
+        LAST_DDL is newer than ``last_build`` in ``_catalog_metadata.json`` (plus
+        new and dropped ones) are re-fetched and merged. It falls back to a full
+        build, reporting ``refresh_reason``, when there is no usable previous
+        build, the last full refresh is over 7 days old, or the delta is large.
+
         Args:
             output_dir: Output directory for catalog files (default: ./data_catalogue)
             database: Specific database to catalog (None for current)
@@ -91,14 +238,18 @@ class CatalogService:
             output_format: Output format ('json' or 'jsonl')
             include_ddl: Whether to include DDL statements
             max_ddl_concurrency: Maximum DDL concurrency
-            catalog_concurrency: Maximum catalog concurrency
+            catalog_concurrency: Maximum number of metadata queries run concurrently
             export_sql: Whether to export SQL files
             use_unified_storage: If True and output_dir is default, use unified storage
+            mode: 'full' (default) or 'incremental'
 
         Returns:
             Catalog build result with totals
         """
         try:
+            if mode not in BUILD_MODES:
+                raise ValueError(f"Invalid catalog build mode {mode!r}; expected one of {', '.join(BUILD_MODES)}")
+
             # Determine output directory
             # If using unified storage and output_dir is the default, resolve to unified storage
             if use_unified_storage and output_dir == "./data_catalogue":
@@ -113,42 +264,88 @@ class CatalogService:
             # Create output directory
             output_path.mkdir(parents=True, exist_ok=True)
 
-            # Build basic catalog structure
-            build_timestamp = datetime.now(UTC).isoformat()
-            catalog_data = {
-                "metadata": {
-                    "database": database or "current",
-                    "account_scope": account_scope,
-                    "format": output_format,
-                    "timestamp": build_timestamp,
-                },
-                "databases": [],
-                "schemas": [],
-                "tables": [],
-                "views": [],
-                "columns": [],
-            }
+            build_time = datetime.now(UTC)
+            build_timestamp = build_time.isoformat()
+            catalog_file = output_path / ("catalog.json" if output_format == "json" else "catalog.jsonl")
+            last_full_refresh = build_timestamp
+            refresh_reason: str | None = None
+            delta: CatalogDelta | None = None
+
+            if mode == "incremental":
+                if account_scope:
+                    refresh_reason = "account-scope catalogs are always rebuilt in full"
+                else:
+                    previous = load_previous_build(output_path, catalog_file.name)
+                    refresh_reason = full_refresh_reason(previous, database=database, now=build_time)
+                    if previous is not None and refresh_reason is None:
+                        metadata, previous_catalog = previous
+                        since = parse_build_timestamp(metadata["last_build"])
+                        assert since is not None
+                        outcome = self._refresh_incremental(
+                            previous_catalog, database, since, concurrency=catalog_concurrency
+                        )
+                        if isinstance(outcome, str):
+                            refresh_reason = outcome
+                        else:
+                            catalog_data, query_stats, delta = outcome
+                            totals = _catalog_totals(catalog_data)
+                            last_full_refresh = str(metadata["last_full_refresh"])
+                if refresh_reason:
+                    logger.info("Incremental catalog refresh not possible (%s); running a full build", refresh_reason)
+
+            if delta is None:
+                # Build basic catalog structure
+                catalog_data = {
+                    "metadata": {},
+                    "databases": [],
+                    "schemas": [],
+                    "tables": [],
+                    "views": [],
+                    "columns": [],
+                }
 
-            # Query Snowflake INFORMATION_SCHEMA to build real catalog
-            totals = self._build_real_catalog(catalog_data, database, account_scope)
+                # Query Snowflake INFORMATION_SCHEMA to build real catalog
+                totals, query_stats = self._build_real_catalog(
+                    catalog_data, database, account_scope, concurrency=catalog_concurrency
+                )
+            refresh_mode = "full" if delta is None else "incremental"
+            catalog_data["metadata"] = {
+                "database": database or "current",
+                "account_scope": account_scope,
+                "format": output_format,
+                "timestamp": build_timestamp,
+                "refresh_mode": refresh_mode,
+            }
+            errors = {stat.object_type: stat.error for stat in query_stats if stat.error}
+            refresh_info: dict[str, Any] = {
+                "mode": refresh_mode,
+                "reason": refresh_reason,
+                "changed_objects": len(delta.changed) if delta else 0,
+                "dropped_objects": len(delta.dropped) if delta else 0,
+            }
 
             # Hotfix safety: if we appear to be connected but got an empty catalog,
             # surface it as an error to avoid silently writing empty artifacts.
             if totals.databases == 0 and (database is not None or account_scope is False):
+                detail = f" (databases query failed: {errors['databases']})" if "databases" in errors else ""
                 raise RuntimeError(
                     "Catalog build returned zero objects; this usually indicates a Snowflake CLI execution issue"
+                    + detail
                 )
 
             # Write catalog file
-            if output_format == "json":
-                catalog_file = output_path / "catalog.json"
-                with open(catalog_file, "w") as f:
+            with open(catalog_file, "w") as f:
+                if output_format == "json":
                     json.dump(catalog_data, f, indent=2)
-            else:  # jsonl
-                catalog_file = output_path / "catalog.jsonl"
-                with open(catalog_file, "w") as f:
+                else:  # jsonl
                     json.dump(catalog_data, f)
 
+            try:
+                CatalogIndex(output_path).write_search_index(catalog_data, source=catalog_file)
+            except (sqlite3.Error, OSError) as exc:
+                # search_catalog rebuilds a missing index on first use.
+                logger.warning("Failed to write catalog search index: %s", exc)
+
             # Write summary
             summary_data = {
                 "totals": {
@@ -165,6 +362,10 @@ class CatalogService:
                 },
                 "output_dir": output_dir,
                 "format": output_format,
+                "concurrency": max(1, min(catalog_concurrency, len(query_stats))),
+                "queries": {stat.object_type: stat.to_dict() for stat in query_stats},
+                "errors": errors,
+                "refresh": refresh_info,
             }
 
             summary_file = output_path / "catalog_summary.json"
@@ -181,7 +382,7 @@ class CatalogService:
                 is_unified_storage_path = use_unified_storage
 
             if is_unified_storage_path and not account_scope:
-                metadata_file = output_path / "_catalog_metadata.json"
+                metadata_file = output_path / METADATA_FILENAME
                 total_objects = (
                     totals.tables
                     + totals.views
@@ -193,7 +394,8 @@ class CatalogService:
                 )
                 metadata_data = {
                     "last_build": build_timestamp,
-                    "last_full_refresh": build_timestamp,
+                    "last_full_refresh": last_full_refresh,
+                    "last_refresh_mode": refresh_mode,
                     "database": database or "current",
                     "total_objects": total_objects,
                     "schema_count": totals.schemas,
@@ -209,7 +411,16 @@ class CatalogService:
                 with open(metadata_file, "w") as f:
                     json.dump(metadata_data, f, indent=2)
 
-            return CatalogResult(totals=totals, output_dir=output_dir, success=True)
+            return CatalogResult(
+                totals=totals,
+                output_dir=output_dir,
+                success=True,
+                errors=errors,
+                refresh_mode=refresh_mode,
+                refresh_reason=refresh_reason,
+                changed_objects=refresh_info["changed_objects"],
+                dropped_objects=refresh_info["dropped_objects"],
+            )
 
         except Exception as e:
             logger.error(f"Catalog build failed: {e}")
@@ -225,7 +436,8 @@ class CatalogService:
         catalog_data: dict[str, Any],
         database: str | None,
         account_scope: bool,
-    ) -> CatalogTotals:
+        concurrency: int = 1,
+    ) -> tuple[CatalogTotals, list[CatalogQueryStat]]:
         """Build real catalog by querying Snowflake INFORMATION_SCHEMA.
 
         This method queries actual Snowflake metadata instead of returning mock data.
@@ -237,229 +449,134 @@ class CatalogService:
         - Uses INFORMATION_SCHEMA.FUNCTIONS to get only user-defined functions
         - Uses INFORMATION_SCHEMA.COLUMNS for detailed column metadata
         - Filters out built-in functions (operators like !=, %, *, +, -)
-        - Returns structured data with proper ordering and metadata
+        - Runs the independent queries on up to ``concurrency`` worker threads
+        - A failing query only leaves its own object type empty; the error is
+          reported in the returned stats
 
         Args:
             catalog_data: Dictionary to populate with catalog data
             database: Specific database to query (None for current, account_scope=True for all)
             account_scope: Whether to query entire account or specific database
+            concurrency: Maximum number of metadata queries in flight at once
 
         Returns:
-            CatalogTotals with counts of each object type found
+            CatalogTotals with counts of each object type found, plus one
+            CatalogQueryStat per query in submission order
         """
         totals = CatalogTotals()
-
-        try:
-            # Always pass through the selected database for IN DATABASE queries;
-            # otherwise SnowCLI will override context to cfg.snowflake.database.
-            ctx_db_overrides: dict[str, str | None] = {"database": database} if database else {}
-
-            # Query databases
-            if account_scope:
-                db_query = "SHOW DATABASES"
-            else:
-                db_query = f"SHOW DATABASES LIKE '{database}'" if database else "SHOW DATABASES"
-
-            db_result = self.cli.run_query(db_query, output_format="json", ctx_overrides=ctx_db_overrides)
-            if db_result.rows:
-                catalog_data["databases"] = db_result.rows
-                totals.databases = len(db_result.rows)
-
-            # Query schemas
-            if account_scope:
-                schema_query = "SHOW SCHEMAS"
-            else:
-                schema_query = f"SHOW SCHEMAS IN DATABASE {database}" if database else "SHOW SCHEMAS"
-
-            schema_result = self.cli.run_query(schema_query, output_format="json", ctx_overrides=ctx_db_overrides)
-            if schema_result.rows:
-                catalog_data["schemas"] = schema_result.rows
-                totals.schemas = len(schema_result.rows)
-
-            # Query tables
-            if account_scope:
-                table_query = "SHOW TABLES"
-            else:
-                table_query = f"SHOW TABLES IN DATABASE {database}" if database else "SHOW TABLES"
-
-            table_result = self.cli.run_query(table_query, output_format="json", ctx_overrides=ctx_db_overrides)
-            if table_result.rows:
-                catalog_data["tables"] = table_result.rows
-                totals.tables = len(table_result.rows)
-
-            # Query views
-            if account_scope:
-                view_query = "SHOW VIEWS"
-            else:
-                view_query = f"SHOW VIEWS IN DATABASE {database}" if database else "SHOW VIEWS"
-
-            view_result = self.cli.run_query(view_query, output_format="json", ctx_overrides=ctx_db_overrides)
-            if view_result.rows:
-                catalog_data["views"] = view_result.rows
-                totals.views = len(view_result.rows)
-
-            # Query materialized views
-            if account_scope:
-                mv_query = "SHOW MATERIALIZED VIEWS"
-            else:
-                mv_query = f"SHOW MATERIALIZED VIEWS IN DATABASE {database}" if database else "SHOW MATERIALIZED VIEWS"
-
-            mv_result = self.cli.run_query(mv_query, output_format="json", ctx_overrides=ctx_db_overrides)
-            if mv_result.rows:
-                catalog_data["materialized_views"] = mv_result.rows
-                totals.materialized_views = len(mv_result.rows)
-
-            # Query dynamic tables
-            if account_scope:
-                dt_query = "SHOW DYNAMIC TABLES"
-            else:
-                dt_query = f"SHOW DYNAMIC TABLES IN DATABASE {database}" if database else "SHOW DYNAMIC TABLES"
-
-            dt_result = self.cli.run_query(dt_query, output_format="json", ctx_overrides=ctx_db_overrides)
-            if dt_result.rows:
-                catalog_data["dynamic_tables"] = dt_result.rows
-                totals.dynamic_tables = len(dt_result.rows)
-
-            # Query tasks
-            if account_scope:
-                task_query = "SHOW TASKS"
-            else:
-                task_query = f"SHOW TASKS IN DATABASE {database}" if database else "SHOW TASKS"
-
-            task_result = self.cli.run_query(task_query, output_format="json", ctx_overrides=ctx_db_overrides)
-            if task_result.rows:
-                catalog_data["tasks"] = task_result.rows
-                totals.tasks = len(task_result.rows)
-
-            # Query user-defined functions only
-            # Note: INFORMATION_SCHEMA.FUNCTIONS automatically excludes built-in Snowflake functions
-            # This prevents including 1000+ built-in operators (!=, %, *, +, -) and system functions
-            # Only returns actual user-defined functions created by users
-            if account_scope:
-                func_query = """
-                SELECT
-                    FUNCTION_CATALOG as database_name,
-                    FUNCTION_SCHEMA as schema_name,
-                    FUNCTION_NAME as function_name,
-                    DATA_TYPE as return_type,
-                    FUNCTION_LANGUAGE as language,
-                    COMMENT as comment,
-                    CREATED as created,
-                    LAST_ALTERED as last_altered
-                FROM INFORMATION_SCHEMA.FUNCTIONS
-                ORDER BY FUNCTION_CATALOG, FUNCTION_SCHEMA, FUNCTION_NAME
-                """
-            elif database:
-                func_query = f"""
-                    SELECT
-                        FUNCTION_CATALOG as database_name,
-                        FUNCTION_SCHEMA as schema_name,
-                        FUNCTION_NAME as function_name,
-                        DATA_TYPE as return_type,
-                        FUNCTION_LANGUAGE as language,
-                        COMMENT as comment,
-                        CREATED as created,
-                        LAST_ALTERED as last_altered
-                    FROM INFORMATION_SCHEMA.FUNCTIONS
-                    WHERE FUNCTION_CATALOG = '{database}'
-                    ORDER BY FUNCTION_CATALOG, FUNCTION_SCHEMA, FUNCTION_NAME
-                    """  # noqa: S608 - database param from validated Snowflake config
-            else:
-                func_query = """
-                    SELECT
-                        FUNCTION_CATALOG as database_name,
-                        FUNCTION_SCHEMA as schema_name,
-                        FUNCTION_NAME as function_name,
-                        DATA_TYPE as return_type,
-                        FUNCTION_LANGUAGE as language,
-                        COMMENT as comment,
-                        CREATED as created,
-                        LAST_ALTERED as last_altered
-                    FROM INFORMATION_SCHEMA.FUNCTIONS
-                    ORDER BY FUNCTION_CATALOG, FUNCTION_SCHEMA, FUNCTION_NAME
-                    """
-
-            func_result = self.cli.run_query(func_query, output_format="json", ctx_overrides=ctx_db_overrides)
-            if func_result.rows:
-                catalog_data["functions"] = func_result.rows
-                totals.functions = len(func_result.rows)
-
-            # Query procedures
-            if account_scope:
-                proc_query = "SHOW PROCEDURES"
-            else:
-                proc_query = f"SHOW PROCEDURES IN DATABASE {database}" if database else "SHOW PROCEDURES"
-
-            proc_result = self.cli.run_query(proc_query, output_format="json", ctx_overrides=ctx_db_overrides)
-            if proc_result.rows:
-                catalog_data["procedures"] = proc_result.rows
-                totals.procedures = len(proc_result.rows)
-
-            # Query columns from INFORMATION_SCHEMA
-            if account_scope:
-                col_query = """
-                SELECT
-                    TABLE_CATALOG as database_name,
-                    TABLE_SCHEMA as schema_name,
-                    TABLE_NAME as table_name,
-                    COLUMN_NAME as column_name,
-                    DATA_TYPE as data_type,
-                    IS_NULLABLE as is_nullable,
-                    COLUMN_DEFAULT as column_default,
-                    COMMENT as comment
-                FROM INFORMATION_SCHEMA.COLUMNS
-                ORDER BY TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION
-                """
-            elif database:
-                col_query = f"""
-                    SELECT
-                        TABLE_CATALOG as database_name,
-                        TABLE_SCHEMA as schema_name,
-                        TABLE_NAME as table_name,
-                        COLUMN_NAME as column_name,
-                        DATA_TYPE as data_type,
-                        IS_NULLABLE as is_nullable,
-                        COLUMN_DEFAULT as column_default,
-                        COMMENT as comment
-                    FROM INFORMATION_SCHEMA.COLUMNS
-                    WHERE TABLE_CATALOG = '{database}'
-                    ORDER BY TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION
-                    """  # noqa: S608 - database param from validated Snowflake config
-            else:
-                col_query = """
-                    SELECT
-                        TABLE_CATALOG as database_name,
-                        TABLE_SCHEMA as schema_name,
-                        TABLE_NAME as table_name,
-                        COLUMN_NAME as column_name,
-                        DATA_TYPE as data_type,
-                        IS_NULLABLE as is_nullable,
-                        COLUMN_DEFAULT as column_default,
-                        COMMENT as comment
-                    FROM INFORMATION_SCHEMA.COLUMNS
-                    ORDER BY TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION
-                    """
-
-            col_result = self.cli.run_query(col_query, output_format="json", ctx_overrides=ctx_db_overrides)
-            if col_result.rows:
-                catalog_data["columns"] = col_result.rows
-                totals.columns = len(col_result.rows)
-
-            logger.info(
-                ("Catalog built successfully: %s databases, %s schemas, %s tables, %s views, %s columns"),
-                totals.databases,
-                totals.schemas,
-                totals.tables,
-                totals.views,
-                totals.columns,
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to build real catalog: {e}")
-            # Return empty totals on error
-            totals = CatalogTotals()
-
-        return totals
+        queries = _catalog_queries(database, account_scope)
+        outcomes = self._run_queries(queries, database, concurrency)
+
+        stats: list[CatalogQueryStat] = []
+        for query, (rows, stat) in zip(queries, outcomes, strict=True):
+            stats.append(stat)
+            if rows:
+                catalog_data[query.object_type] = rows
+                setattr(totals, query.object_type, len(rows))
+
+        logger.info(
+            ("Catalog built: %s databases, %s schemas, %s tables, %s views, %s columns (%s failed queries)"),
+            totals.databases,
+            totals.schemas,
+            totals.tables,
+            totals.views,
+            totals.columns,
+            sum(1 for stat in stats if stat.error),
+        )
+        return totals, stats
+
+    def _run_queries(
+        self,
+        queries: list[CatalogQuery],
+        database: str | None,
+        concurrency: int,
+    ) -> list[tuple[list[dict[str, Any]], CatalogQueryStat]]:
+        """Run ``queries`` on up to ``concurrency`` threads; results keep submission order."""
+        # Always pass through the selected database for IN DATABASE queries;
+        # otherwise SnowCLI will override context to cfg.snowflake.database.
+        ctx_db_overrides: dict[str, str | None] = {"database": database} if database else {}
+
+        def run(query: CatalogQuery) -> tuple[list[dict[str, Any]], CatalogQueryStat]:
+            started = time.perf_counter()
+            try:
+                result = self.cli.run_query(query.sql, output_format="json", ctx_overrides=ctx_db_overrides)
+            except Exception as e:
+                duration_ms = (time.perf_counter() - started) * 1000
+                logger.error("Catalog %s query failed: %s", query.object_type, e)
+                return [], CatalogQueryStat(query.object_type, round(duration_ms, 2), error=str(e))
+            duration_ms = (time.perf_counter() - started) * 1000
+            rows = result.rows or []
+            return rows, CatalogQueryStat(query.object_type, round(duration_ms, 2), rows=len(rows))
+
+        if not queries:
+            return []
+        workers = max(1, min(concurrency, len(queries)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="igloo-catalog") as pool:
+            return list(pool.map(run, queries))
+
+    def _refresh_incremental(
+        self,
+        previous_catalog: dict[str, Any],
+        database: str | None,
+        since: datetime,
+        *,
+        concurrency: int,
+    ) -> tuple[dict[str, Any], list[CatalogQueryStat], CatalogDelta] | str:
+        """Refresh ``previous_catalog`` with objects changed since ``since``.
+
+        Small object types are re-listed in full alongside one inventory query
+        over INFORMATION_SCHEMA.TABLES. Relations that changed, appeared or were
+        dropped are then re-listed per affected schema, and only the changed
+        relations' columns are fetched. Returns the merged catalog, query stats
+        and delta, or the reason a full build is needed instead.
+        """
+        relisted = [query for query in _catalog_queries(database, False) if query.object_type in _RELISTED_TYPES]
+        inventory = CatalogQuery("inventory", inventory_query(database, since))
+        outcomes = self._run_queries([*relisted, inventory], database, concurrency)
+        stats = [stat for _, stat in outcomes]
+
+        inventory_rows, inventory_stat = outcomes[-1]
+        if inventory_stat.error:
+            return f"change detection query failed: {inventory_stat.error}"
+        delta = compute_delta(previous_catalog, inventory_rows)
+        if delta.too_large():
+            return f"{delta.size} of {delta.known} relations changed or were dropped"
+
+        catalog = {key: list(value) if isinstance(value, list) else value for key, value in previous_catalog.items()}
+        for query, (rows, stat) in zip(relisted, outcomes[:-1], strict=True):
+            if not stat.error:  # keep the previous listing when a re-list fails
+                catalog[query.object_type] = rows
+
+        if delta.size:
+            followups = [
+                CatalogQuery(f"{object_type}:{schema}", schema_listing_query(keyword, database, schema))
+                for schema in delta.schemas_to_list
+                for object_type, keyword in RELATION_TYPES
+            ]
+            if delta.changed:
+                followups.append(CatalogQuery("columns", changed_columns_query(database, delta.changed)))
+            followup_outcomes = self._run_queries(followups, database, concurrency)
+            stats.extend(stat for _, stat in followup_outcomes)
+            failed = next((stat for _, stat in followup_outcomes if stat.error), None)
+            if failed is not None:
+                return f"delta query for {failed.object_type} failed: {failed.error}"
+
+            refreshed: dict[str, list[dict[str, Any]]] = {}
+            for query, (rows, _) in zip(followups, followup_outcomes, strict=True):
+                refreshed.setdefault(query.object_type.split(":", 1)[0], []).extend(rows)
+            for object_type, _ in RELATION_TYPES:
+                merged = merge_relations(catalog.get(object_type) or [], refreshed.get(object_type, []), delta.schemas)
+                if merged or object_type in catalog:
+                    catalog[object_type] = merged
+            catalog["columns"] = merge_columns(catalog.get("columns") or [], refreshed.get("columns", []), delta)
+
+        logger.info(
+            "Incremental catalog refresh: %s changed, %s dropped relations across %s schemas",
+            len(delta.changed),
+            len(delta.dropped),
+            len(delta.schemas),
+        )
+        return catalog, stats, delta
 
     def load_summary(self, catalog_dir: str) -> dict[str, Any]:
         """Load catalog summary from directory.
@@ -490,6 +607,7 @@ def build_catalog(
     output_dir: str = "./data_catalogue",
     database: str | None = None,
     profile: str | None = None,
+    mode: str = "full",
 ) -> CatalogResult:
     """Build catalog with default settings.
 
@@ -497,10 +615,11 @@ def build_catalog(
         output_dir: Output directory for catalog files
         database: Specific database to catalog
         profile: Snowflake profile to use
+        mode: 'full' or 'incremental' (refresh from the previous build's deltas)
 
     Returns:
         Catalog build result
     """
     context = {"profile": profile} if profile else {}
     service = CatalogService(context)
-    return service.build(output_dir=output_dir, database=database)
+    return service.build(output_dir=output_dir, database=database, mode=mode)
@@ -0,0 +1,243 @@
+"""Delta detection and merging for incremental catalog refreshes.
+
+An incremental refresh starts from the catalog and ``_catalog_metadata.json``
+written by the previous build. One ``INFORMATION_SCHEMA.TABLES`` query lists every
+relation with a flag telling whether its ``LAST_ALTERED`` or ``LAST_DDL`` is newer
+than the previous build. Comparing that inventory with the stored catalog yields
+changed, new and dropped relations. Only the schemas containing them are
+re-listed and only the changed relations' columns are fetched; everything else
+is carried over from the stored catalog.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+METADATA_FILENAME = "_catalog_metadata.json"
+BUILD_MODES = ("full", "incremental")
+# Relations are listed by SHOW per affected schema; the other object types are
+# small enough to re-list in full on every refresh.
+RELATION_TYPES = (
+    ("tables", "TABLES"),
+    ("views", "VIEWS"),
+    ("materialized_views", "MATERIALIZED VIEWS"),
+    ("dynamic_tables", "DYNAMIC TABLES"),
+)
+FULL_REFRESH_MAX_AGE = timedelta(days=7)
+# Above this share of changed + dropped relations a full rebuild is cheaper.
+MAX_CHANGE_RATIO = 0.25
+# Compare against a slightly earlier instant to absorb client/server clock skew.
+CLOCK_SKEW_MARGIN = timedelta(minutes=5)
+
+RelationKey = tuple[str, str]  # (schema, name)
+
+
+def row_value(row: dict[str, Any], *keys: str) -> Any:
+    """First non-empty value for ``keys``, matching SHOW (lowercase) or alias (uppercase) columns."""
+    for key in keys:
+        for candidate in (key, key.upper()):
+            value = row.get(candidate)
+            if value not in (None, ""):
+                return value
+    return None
+
+
+def relation_key(row: dict[str, Any]) -> RelationKey | None:
+    schema = row_value(row, "schema_name", "table_schema")
+    name = row_value(row, "name", "table_name")
+    if not isinstance(schema, str) or not isinstance(name, str):
+        return None
+    return schema, name
+
+
+def quote_identifier(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def quote_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def load_previous_build(output_path: Path, catalog_filename: str) -> tuple[dict[str, Any], dict[str, Any]] | None:
+    """Return ``(metadata, catalog)`` from the previous build, or None when unusable."""
+    try:
+        metadata = json.loads((output_path / METADATA_FILENAME).read_text(encoding="utf-8"))
+        catalog = json.loads((output_path / catalog_filename).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(metadata, dict) or not isinstance(catalog, dict):
+        return None
+    return metadata, catalog
+
+
+def parse_build_timestamp(value: Any) -> datetime | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
+def full_refresh_reason(
+    previous: tuple[dict[str, Any], dict[str, Any]] | None,
+    *,
+    database: str | None,
+    now: datetime,
+) -> str | None:
+    """Why an incremental refresh cannot start from ``previous``; None when it can."""
+    if previous is None:
+        return "no previous catalog or metadata"
+    metadata, _ = previous
+    if metadata.get("database") != (database or "current"):
+        return "previous catalog was built for a different database"
+    if parse_build_timestamp(metadata.get("last_build")) is None:
+        return "previous build timestamp missing"
+    last_full = parse_build_timestamp(metadata.get("last_full_refresh"))
+    if last_full is None or now - last_full > FULL_REFRESH_MAX_AGE:
+        return "last full refresh is older than 7 days"
+    return None
+
+
+def inventory_query(database: str | None, since: datetime) -> str:
+    """List every relation with a flag for LAST_ALTERED / LAST_DDL newer than ``since``."""
+    cutoff = quote_literal((since - CLOCK_SKEW_MARGIN).isoformat())
+    catalog_filter = f"AND TABLE_CATALOG = {quote_literal(database)}" if database else ""
+    return f"""
+            SELECT
+                TABLE_SCHEMA as schema_name,
+                TABLE_NAME as table_name,
+                TABLE_TYPE as table_type,
+                (LAST_ALTERED > {cutoff}::TIMESTAMP_TZ
+                    OR COALESCE(LAST_DDL > {cutoff}::TIMESTAMP_TZ, FALSE)) as changed
+            FROM INFORMATION_SCHEMA.TABLES
+            WHERE TABLE_SCHEMA <> 'INFORMATION_SCHEMA'
+            {catalog_filter}
+            """  # noqa: S608 - identifiers and timestamps are quoted literals
+
+
+@dataclass
+class CatalogDelta:
+    """Relations that changed or disappeared since the previous build."""
+
+    changed: set[RelationKey] = field(default_factory=set)
+    dropped: set[RelationKey] = field(default_factory=set)
+    live_schemas: set[str] = field(default_factory=set)
+    known: int = 0
+
+    @property
+    def size(self) -> int:
+        return len(self.changed) + len(self.dropped)
+
+    @property
+    def schemas(self) -> list[str]:
+        """Schemas whose relation listings are stale."""
+        return sorted({schema for schema, _ in self.changed | self.dropped})
+
+    @property
+    def schemas_to_list(self) -> list[str]:
+        """Stale schemas that still exist (dropped schemas are only purged)."""
+        return [schema for schema in self.schemas if schema in self.live_schemas]
+
+    def too_large(self) -> bool:
+        return self.size > MAX_CHANGE_RATIO * max(self.known, 1)
+
+
+def _truthy(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in {"true", "1", "yes"}
+    return bool(value)
+
+
+def compute_delta(catalog: dict[str, Any], inventory: Iterable[dict[str, Any]]) -> CatalogDelta:
+    """Diff the stored catalog's relations against the live inventory."""
+    known: set[RelationKey] = set()
+    for object_type, _ in RELATION_TYPES:
+        for row in catalog.get(object_type) or []:
+            key = relation_key(row)
+            if key is not None:
+                known.add(key)
+
+    live: set[RelationKey] = set()
+    changed: set[RelationKey] = set()
+    for row in inventory:
+        key = relation_key(row)
+        if key is None:
+            continue
+        live.add(key)
+        if key not in known or _truthy(row_value(row, "changed")):
+            changed.add(key)
+    return CatalogDelta(
+        changed=changed,
+        dropped=known - live,
+        live_schemas={schema for schema, _ in live},
+        known=len(known),
+    )
+
+
+def schema_listing_query(keyword: str, database: str | None, schema: str) -> str:
+    target = f"{database}.{quote_identifier(schema)}" if database else quote_identifier(schema)
+    return f"SHOW {keyword} IN SCHEMA {target}"
+
+
+def changed_columns_query(database: str | None, relations: Iterable[RelationKey]) -> str:
+    """Columns of ``relations`` only, in the same shape and order as the full build."""
+    by_schema: dict[str, list[str]] = {}
+    for schema, name in sorted(relations):
+        by_schema.setdefault(schema, []).append(name)
+    predicates = " OR ".join(
+        f"(TABLE_SCHEMA = {quote_literal(schema)} AND TABLE_NAME IN ({', '.join(map(quote_literal, names))}))"
+        for schema, names in by_schema.items()
+    )
+    catalog_filter = f"TABLE_CATALOG = {quote_literal(database)} AND " if database else ""
+    return f"""
+            SELECT
+                TABLE_CATALOG as database_name,
+                TABLE_SCHEMA as schema_name,
+                TABLE_NAME as table_name,
+                COLUMN_NAME as column_name,
+                DATA_TYPE as data_type,
+                IS_NULLABLE as is_nullable,
+                COLUMN_DEFAULT as column_default,
+                COMMENT as comment
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE {catalog_filter}({predicates})
+            ORDER BY TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION
+            """  # noqa: S608 - identifiers are quoted literals
+
+
+def merge_relations(
+    existing: list[dict[str, Any]],
+    refreshed: list[dict[str, Any]],
+    schemas: Iterable[str],
+) -> list[dict[str, Any]]:
+    """Replace every row of the re-listed ``schemas`` with their fresh listing."""
+    replaced = set(schemas)
+    kept = [row for row in existing if (relation_key(row) or ("", ""))[0] not in replaced]
+    return kept + refreshed
+
+
+def merge_columns(
+    existing: list[dict[str, Any]],
+    refreshed: list[dict[str, Any]],
+    delta: CatalogDelta,
+) -> list[dict[str, Any]]:
+    """Drop columns of changed/dropped relations, add the fresh ones, keep catalog order."""
+    stale = delta.changed | delta.dropped
+
+    def sort_key(row: dict[str, Any]) -> tuple[str, str, str]:
+        return (
+            str(row_value(row, "database_name") or ""),
+            str(row_value(row, "schema_name") or ""),
+            str(row_value(row, "table_name") or ""),
+        )
+
+    kept = [row for row in existing if relation_key(row) not in stale]
+    # sorted() is stable, so ordinal order within each table is preserved.
+    return sorted(kept + refreshed, key=sort_key)
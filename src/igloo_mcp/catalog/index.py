@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Iterable, Sequence
+import logging
+import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
 
+from .search_index import SEARCH_INDEX_FILENAME, CatalogSearchIndex, IndexedObject, cached_search_index
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class CatalogObject:
@@ -44,81 +50,88 @@ class CatalogIndex:
         Returns a tuple of ``(results, total_matches, metadata)`` where results
         are capped by ``limit`` but total matches reflect the number of objects
         that satisfied the filters.
+
+        Searches run against the pre-built ``catalog_search.sqlite`` index, which
+        is cached per process and rebuilt from the catalog when missing or stale.
         """
 
-        catalog = self._load_catalog()
-        meta = cast("dict[str, Any]", catalog.get("metadata", {}))
-        raw_columns = cast("Iterable[dict[str, Any]]", catalog.get("columns") or [])
-        column_index = self._build_column_index(raw_columns)
+        index = self._search_index()
+        normalized_object_types = sorted({obj.lower() for obj in object_types}) if object_types else None
+        rows, total_matches = index.search(
+            object_types=normalized_object_types,
+            database=database,
+            schema=schema,
+            name_contains=name_contains,
+            column_contains=column_contains,
+            limit=limit,
+        )
+        return [CatalogObject(*row) for row in rows], total_matches, index.metadata
+
+    def write_search_index(
+        self,
+        catalog: dict[str, Any] | None = None,
+        *,
+        source: Path | None = None,
+    ) -> CatalogSearchIndex:
+        """(Re)build ``catalog_search.sqlite`` from ``catalog`` (default: the catalog on disk).
 
-        normalized_object_types = {obj.lower() for obj in object_types} if object_types else None
+        ``source`` is the catalog file ``catalog`` was written to; the index is
+        only reused while that file is unchanged.
+        """
+        source = source or self._catalog_source()
+        if catalog is None:
+            catalog = self._load_catalog()
+        return CatalogSearchIndex.write(
+            self.catalog_dir / SEARCH_INDEX_FILENAME,
+            self._indexed_objects(catalog),
+            metadata=cast("dict[str, Any]", catalog.get("metadata", {})),
+            source=source,
+        )
 
-        db_filter = database.lower() if database else None
-        schema_filter = schema.lower() if schema else None
-        name_filter = name_contains.lower() if name_contains else None
-        column_filter = column_contains.lower() if column_contains else None
+    def _search_index(self) -> CatalogSearchIndex:
+        source = self._catalog_source()
+
+        def rebuild() -> CatalogSearchIndex:
+            catalog = self._load_catalog()
+            try:
+                return self.write_search_index(catalog, source=source)
+            except (sqlite3.Error, OSError) as exc:
+                logger.warning("Cannot write catalog search index in %s: %s", self.catalog_dir, exc)
+                return CatalogSearchIndex.in_memory(
+                    self._indexed_objects(catalog),
+                    metadata=cast("dict[str, Any]", catalog.get("metadata", {})),
+                    source=source,
+                )
 
-        results: list[CatalogObject] = []
-        total_matches = 0
+        return cached_search_index(self.catalog_dir / SEARCH_INDEX_FILENAME, source, rebuild)
 
-        for object_type, source_key in self._object_sources().items():
-            if normalized_object_types and object_type not in normalized_object_types:
-                continue
+    def _indexed_objects(self, catalog: dict[str, Any]) -> Iterator[IndexedObject]:
+        """Normalized objects with their columns, in search result order."""
+        raw_columns = cast("Iterable[dict[str, Any]]", catalog.get("columns") or [])
+        column_index = self._build_column_index(raw_columns)
 
+        for object_type, source_key in self._object_sources().items():
             raw_entries = cast("Iterable[dict[str, Any]]", catalog.get(source_key, []) or [])
             for raw in raw_entries:
                 entry = self._normalize_object(object_type, raw)
                 if entry is None:
                     continue
-
-                if db_filter and (entry.database or "").lower() != db_filter:
-                    continue
-                if schema_filter:
-                    schema_value = entry.schema or ""
-                    if schema_value.lower() != schema_filter:
-                        continue
-                if name_filter and name_filter not in entry.name.lower():
-                    continue
-
                 columns = column_index.get((entry.database or "", entry.schema or "", entry.name))
-
-                if column_filter and (
-                    not columns or not any(column_filter in (col.get("name") or "").lower() for col in columns)
-                ):
-                    continue
-
-                total_matches += 1
-                if len(results) >= limit:
-                    continue
-
-                results.append(
-                    CatalogObject(
-                        object_type=object_type,
-                        database=entry.database,
-                        schema=entry.schema,
-                        name=entry.name,
-                        comment=entry.comment,
-                        columns=columns or [],
-                        raw=raw,
-                    )
-                )
-
-        return results, total_matches, meta
+                yield (object_type, entry.database, entry.schema, entry.name, entry.comment, columns or [], raw)
 
     # ------------------------------------------------------------------
-    def _load_catalog(self) -> dict[str, Any]:
-        catalog_json = self.catalog_dir / "catalog.json"
-        catalog_jsonl = self.catalog_dir / "catalog.jsonl"
-
-        if catalog_json.exists():
-            with catalog_json.open("r", encoding="utf-8") as handle:
-                return cast("dict[str, Any]", json.load(handle))
-        if catalog_jsonl.exists():
-            with catalog_jsonl.open("r", encoding="utf-8") as handle:
-                return cast("dict[str, Any]", json.loads(handle.read()))
+    def _catalog_source(self) -> Path:
+        for filename in ("catalog.json", "catalog.jsonl"):
+            candidate = self.catalog_dir / filename
+            if candidate.exists():
+                return candidate
 
         raise FileNotFoundError(f"Catalog not found in {self.catalog_dir}. Run build_catalog first.")
 
+    def _load_catalog(self) -> dict[str, Any]:
+        with self._catalog_source().open("r", encoding="utf-8") as handle:
+            return cast("dict[str, Any]", json.load(handle))
+
     @staticmethod
     def _object_sources() -> dict[str, str]:
         return {
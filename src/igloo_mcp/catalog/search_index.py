@@ -0,0 +1,343 @@
+"""Pre-built SQLite search index for catalog artifacts.
+
+``build_catalog`` writes ``catalog_search.sqlite`` next to ``catalog.json``. It
+holds one row per searchable object plus three lookup structures, so
+``search_catalog`` no longer parses the whole catalog and scans every object on
+each call:
+
+* db/schema partitions: an index on the lower-cased database and schema names;
+* a name trigram index: ``name_contains`` only verifies objects whose names
+  contain every trigram of the needle;
+* a column-name inverted index: distinct column names (with their own trigrams)
+  mapped to the objects that have them.
+
+Matching is still case-insensitive substring matching; the trigram postings
+only narrow the candidates. The index records the size and mtime of the catalog
+file it was built from. Opened indexes are cached per process and reused until
+that file or the index itself changes; a missing or stale index is rebuilt from
+the catalog on first use.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from igloo_mcp.text_utils import trigrams
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX_FILENAME = "catalog_search.sqlite"
+SCHEMA_VERSION = 1
+_CACHE_SIZE = 32
+
+# (object_type, database, schema, name, comment, columns, raw) - the CatalogObject fields.
+IndexedObject = tuple[str, str | None, str | None, str, str | None, list[dict[str, Any]], dict[str, Any]]
+FileSignature = tuple[int, int]  # (st_size, st_mtime_ns)
+
+_SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE objects (
+    id INTEGER PRIMARY KEY,
+    object_type TEXT NOT NULL,
+    database_key TEXT NOT NULL,
+    schema_key TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE TABLE name_trigrams (
+    trigram TEXT NOT NULL,
+    object_id INTEGER NOT NULL,
+    PRIMARY KEY (trigram, object_id)
+) WITHOUT ROWID;
+CREATE TABLE column_terms (
+    term_id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL UNIQUE
+);
+CREATE TABLE column_trigrams (
+    trigram TEXT NOT NULL,
+    term_id INTEGER NOT NULL,
+    PRIMARY KEY (trigram, term_id)
+) WITHOUT ROWID;
+CREATE TABLE column_postings (
+    term_id INTEGER NOT NULL,
+    object_id INTEGER NOT NULL,
+    PRIMARY KEY (term_id, object_id)
+) WITHOUT ROWID;
+CREATE INDEX idx_objects_partition ON objects (database_key, schema_key, object_type);
+CREATE INDEX idx_objects_type ON objects (object_type);
+"""
+
+
+def file_signature(path: Path) -> FileSignature:
+    stat = path.stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _placeholders(values: Sequence[Any]) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def _trigram_filter(table: str, key: str, needle: str) -> tuple[str, list[Any]] | None:
+    """Subquery selecting ``key`` values posted under every trigram of ``needle``."""
+    grams = sorted(trigrams(needle))
+    if not grams:
+        return None
+    sql = (
+        f"SELECT {key} FROM {table} WHERE trigram IN ({_placeholders(grams)}) "  # noqa: S608 - fixed table/column names
+        f"GROUP BY {key} HAVING COUNT(*) = ?"
+    )
+    return sql, [*grams, len(grams)]
+
+
+class CatalogSearchIndex:
+    """Read access to one catalog search index (on disk or in memory)."""
+
+    def __init__(self, conn: sqlite3.Connection, path: Path | None = None) -> None:
+        self._conn = conn
+        self._path = path
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, conn.close)
+        self._file_signature = file_signature(path) if path is not None else None
+        meta = dict(conn.execute("SELECT key, value FROM meta"))
+        if int(meta.get("schema_version", 0)) != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported catalog search index version {meta.get('schema_version')!r}")
+        self.metadata: dict[str, Any] = json.loads(meta.get("catalog_metadata", "{}"))
+        self.source_name: str = meta.get("source_name", "")
+        self.source_signature: FileSignature = (int(meta.get("source_size", -1)), int(meta.get("source_mtime_ns", -1)))
+
+    @classmethod
+    def open(cls, path: Path) -> CatalogSearchIndex | None:
+        """Open an index file read-only; None when it is missing, corrupt or outdated."""
+        if not path.exists():
+            return None
+        try:
+            conn = sqlite3.connect(path.resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False)
+        except sqlite3.Error as exc:
+            logger.debug("Cannot open catalog search index %s: %s", path, exc)
+            return None
+        try:
+            return cls(conn, path)
+        except (sqlite3.Error, OSError, ValueError) as exc:
+            conn.close()
+            logger.debug("Ignoring unusable catalog search index %s: %s", path, exc)
+            return None
+
+    @classmethod
+    def write(
+        cls,
+        path: Path,
+        objects: Iterable[IndexedObject],
+        *,
+        metadata: dict[str, Any],
+        source: Path,
+    ) -> CatalogSearchIndex:
+        """Build the index into a temporary file and atomically move it to ``path``."""
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            conn = sqlite3.connect(str(tmp_path))
+            try:
+                _populate(conn, objects, metadata=metadata, source=source)
+            finally:
+                conn.close()
+            tmp_path.replace(path)
+        finally:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+        index = cls.open(path)
+        if index is None:
+            raise sqlite3.DatabaseError(f"Catalog search index {path} could not be reopened")
+        return index
+
+    @classmethod
+    def in_memory(
+        cls, objects: Iterable[IndexedObject], *, metadata: dict[str, Any], source: Path
+    ) -> CatalogSearchIndex:
+        """Build a process-local index when the catalog directory is not writable."""
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        _populate(conn, objects, metadata=metadata, source=source)
+        return cls(conn)
+
+    def close(self) -> None:
+        self._finalizer()
+
+    def is_current(self, source: Path, signature: FileSignature) -> bool:
+        """True when built from ``source`` as it is now and, if on disk, not replaced since opened."""
+        if source.name != self.source_name or signature != self.source_signature:
+            return False
+        if self._path is None:
+            return True
+        try:
+            return file_signature(self._path) == self._file_signature
+        except OSError:
+            return False
+
+    def search(
+        self,
+        *,
+        object_types: Sequence[str] | None = None,
+        database: str | None = None,
+        schema: str | None = None,
+        name_contains: str | None = None,
+        column_contains: str | None = None,
+        limit: int = 20,
+    ) -> tuple[list[IndexedObject], int]:
+        """Return ``(objects, total_matches)`` in catalog order, objects capped by ``limit``."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if object_types:
+            clauses.append(f"object_type IN ({_placeholders(object_types)})")
+            params.extend(object_types)
+        if database:
+            clauses.append("database_key = ?")
+            params.append(database.lower())
+        if schema:
+            clauses.append("schema_key = ?")
+            params.append(schema.lower())
+        if name_contains:
+            needle = name_contains.lower()
+            candidates = _trigram_filter("name_trigrams", "object_id", needle)
+            if candidates:
+                clauses.append(f"id IN ({candidates[0]})")
+                params.extend(candidates[1])
+            clauses.append("instr(name_key, ?) > 0")
+            params.append(needle)
+        if column_contains:
+            needle = column_contains.lower()
+            term_clauses = ["instr(term, ?) > 0"]
+            term_params: list[Any] = [needle]
+            candidates = _trigram_filter("column_trigrams", "term_id", needle)
+            if candidates:
+                term_clauses.append(f"term_id IN ({candidates[0]})")
+                term_params.extend(candidates[1])
+            terms = f"SELECT term_id FROM column_terms WHERE {' AND '.join(term_clauses)}"  # noqa: S608 - "?" only
+            postings = f"SELECT object_id FROM column_postings WHERE term_id IN ({terms})"  # noqa: S608 - "?" only
+            clauses.append(f"id IN ({postings})")
+            params.extend(term_params)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            count_sql = f"SELECT COUNT(*) FROM objects{where}"  # noqa: S608 - clauses use "?" placeholders
+            total = int(self._conn.execute(count_sql, params).fetchone()[0])
+            rows = self._conn.execute(
+                f"SELECT payload FROM objects{where} ORDER BY id LIMIT ?",  # noqa: S608 - clauses use "?" placeholders
+                [*params, max(limit, 0)],
+            ).fetchall()
+        return [tuple(json.loads(payload)) for (payload,) in rows], total  # type: ignore[misc]
+
+
+def _populate(
+    conn: sqlite3.Connection,
+    objects: Iterable[IndexedObject],
+    *,
+    metadata: dict[str, Any],
+    source: Path,
+) -> None:
+    size, mtime_ns = file_signature(source)
+    conn.executescript(_SCHEMA)
+    with conn:
+        conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?)",
+            [
+                ("schema_version", str(SCHEMA_VERSION)),
+                ("catalog_metadata", json.dumps(metadata)),
+                ("source_name", source.name),
+                ("source_size", str(size)),
+                ("source_mtime_ns", str(mtime_ns)),
+            ],
+        )
+        term_ids: dict[str, int] = {}
+        for object_id, obj in enumerate(objects, start=1):
+            object_type, database, schema, name, _, columns, _ = obj
+            conn.execute(
+                "INSERT INTO objects (id, object_type, database_key, schema_key, name_key, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    object_id,
+                    object_type,
+                    (database or "").lower(),
+                    (schema or "").lower(),
+                    name.lower(),
+                    json.dumps(obj),
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO name_trigrams (trigram, object_id) VALUES (?, ?)",
+                ((gram, object_id) for gram in trigrams(name.lower())),
+            )
+            postings: set[int] = set()
+            for column in columns:
+                term = (column.get("name") or "").lower()
+                if not term:
+                    continue
+                term_id = term_ids.get(term)
+                if term_id is None:
+                    term_id = term_ids[term] = len(term_ids) + 1
+                    conn.execute("INSERT INTO column_terms (term_id, term) VALUES (?, ?)", (term_id, term))
+                    conn.executemany(
+                        "INSERT INTO column_trigrams (trigram, term_id) VALUES (?, ?)",
+                        ((gram, term_id) for gram in trigrams(term)),
+                    )
+                postings.add(term_id)
+            conn.executemany(
+                "INSERT INTO column_postings (term_id, object_id) VALUES (?, ?)",
+                ((term_id, object_id) for term_id in postings),
+            )
+    conn.execute("ANALYZE")
+
+
+_cache: OrderedDict[Path, CatalogSearchIndex] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def cached_search_index(
+    index_path: Path,
+    source: Path,
+    rebuild: Callable[[], CatalogSearchIndex],
+) -> CatalogSearchIndex:
+    """Return the process-cached index for ``index_path``, reopening or rebuilding it when stale.
+
+    Validation costs two ``stat`` calls; ``rebuild`` only runs when neither the
+    cached nor the on-disk index matches the current ``source`` catalog file.
+    """
+    signature = file_signature(source)
+    key = index_path.resolve()
+    with _cache_lock:
+        index = _cache.get(key)
+        if index is not None and index.is_current(source, signature):
+            _cache.move_to_end(key)
+            return index
+
+    index = CatalogSearchIndex.open(index_path)
+    if index is None or not index.is_current(source, signature):
+        if index is not None:
+            index.close()
+        index = rebuild()
+
+    with _cache_lock:
+        # Replaced entries are closed when their last in-flight search drops them.
+        _cache[key] = index
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return index
+
+
+def clear_search_index_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
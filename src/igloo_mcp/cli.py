@@ -3,7 +3,9 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from pathlib import Path
 
+from .cache import QueryResultCache
 from .config import get_config
 from .living_reports.service import ReportService
 from .mcp.tools.create_report import VALID_TEMPLATES as REPORT_TEMPLATES
@@ -53,6 +55,46 @@ def _command_query_optimize(args: argparse.Namespace) -> int:
     return 0
 
 
+def _command_cache_gc(args: argparse.Namespace) -> int:
+    """Remove expired/corrupt cache entries and enforce the byte quota."""
+    try:
+        from .path_utils import resolve_artifact_root
+
+        env_cache = QueryResultCache.from_env(artifact_root=resolve_artifact_root())
+        root = Path(args.root).expanduser() if args.root else env_cache.root
+        if root is None:
+            print("Query result cache is disabled; pass --root to compact a cache directory.", file=sys.stderr)
+            return 1
+        cache = QueryResultCache(
+            mode="enabled",
+            root=root,
+            memory_max_bytes=0,
+            ttl_seconds=env_cache.ttl_for_statement("select"),
+            metadata_ttl_seconds=env_cache.ttl_for_statement("show"),
+            max_bytes=int(args.max_mb * 1024 * 1024) if args.max_mb is not None else env_cache.max_bytes,
+            eviction_policy=args.policy or env_cache.eviction_policy,
+        )
+        summary = cache.collect_garbage(dry_run=args.dry_run)
+    except Exception as exc:  # pragma: no cover - CLI surface
+        print(f"cache gc failed: {exc}", file=sys.stderr)
+        return 1
+
+    if args.format == "json":
+        print(json.dumps(summary, indent=2))
+        return 0
+
+    prefix = "[dry run] " if summary["dry_run"] else ""
+    print(f"{prefix}Cache root: {summary['root']}")
+    print(f"  Entries scanned: {summary['scanned']}")
+    print(f"  Removed expired: {summary['removed_expired']}")
+    print(f"  Removed invalid: {summary['removed_invalid']}")
+    print(f"  Evicted for quota: {summary['evicted']}")
+    print(
+        f"  Size: {summary['bytes_before'] / (1024 * 1024):.2f} MB -> {summary['bytes_after'] / (1024 * 1024):.2f} MB"
+    )
+    return 0
+
+
 # Report command handlers
 
 
@@ -316,6 +358,40 @@ def _command_report_synthesize(args: argparse.Namespace) -> int:
         return 1
 
 
+def _command_report_compact_backups(args: argparse.Namespace) -> int:
+    """Convert full-copy backups to version manifests and apply retention."""
+    try:
+        service = ReportService()
+        if args.selector:
+            report_ids = [service.resolve_report_selector(args.selector)]
+        else:
+            report_ids = [entry.report_id for entry in service.index.list_entries()]
+        totals = {"converted": 0, "pruned": 0, "blobs_removed": 0, "bytes_before": 0, "bytes_after": 0}
+        for report_id in report_ids:
+            stats = service.compact_report_versions(report_id, keep=args.keep)
+            for key in totals:
+                totals[key] += stats[key]
+        print(f"✓ Compacted backups of {len(report_ids)} report(s)")
+        print(f"  Converted: {totals['converted']}  Pruned: {totals['pruned']}")
+        print(f"  Size: {totals['bytes_before']:,} -> {totals['bytes_after']:,} bytes")
+        return 0
+    except Exception as e:
+        print(f"❌ Failed to compact backups: {e}", file=sys.stderr)
+        return 1
+
+
+def _command_report_reindex(args: argparse.Namespace) -> int:
+    """Rebuild the report index from every outline on disk."""
+    try:
+        service = ReportService()
+        service.index.rebuild_from_filesystem()
+        print(f"✓ Rebuilt report index: {len(service.index.list_entries())} reports")
+        return 0
+    except Exception as e:
+        print(f"❌ Failed to rebuild report index: {e}", file=sys.stderr)
+        return 1
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="igloo administrative CLI utilities for power users and system administrators"
@@ -345,6 +421,45 @@ def build_parser() -> argparse.ArgumentParser:
     )
     optimize_parser.set_defaults(func=_command_query_optimize)
 
+    # Cache subcommand
+    cache_parser = subparsers.add_parser("cache", help="Query result cache maintenance")
+    cache_sub = cache_parser.add_subparsers(dest="cache_command", required=True)
+
+    gc_parser = cache_sub.add_parser(
+        "gc",
+        help="Remove expired and corrupt cache entries and enforce the size quota",
+    )
+    gc_parser.add_argument(
+        "--root",
+        default=None,
+        help="Cache directory to compact (defaults to the resolved IGLOO_MCP_CACHE_ROOT)",
+    )
+    gc_parser.add_argument(
+        "--max-mb",
+        dest="max_mb",
+        type=float,
+        default=None,
+        help="Size quota in MB (defaults to IGLOO_MCP_CACHE_MAX_MB; 0 disables the quota)",
+    )
+    gc_parser.add_argument(
+        "--policy",
+        choices=["lru", "lfu"],
+        default=None,
+        help="Eviction policy when over quota (defaults to IGLOO_MCP_CACHE_EVICTION_POLICY)",
+    )
+    gc_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be removed without deleting anything",
+    )
+    gc_parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format",
+    )
+    gc_parser.set_defaults(func=_command_cache_gc)
+
     # Report subcommand
     report_parser = subparsers.add_parser(
         "report",
@@ -486,6 +601,27 @@ def build_parser() -> argparse.ArgumentParser:
     )
     synthesize_parser.set_defaults(func=_command_report_synthesize)
 
+    # report rebuild-index
+    reindex_parser = report_sub.add_parser(
+        "rebuild-index",
+        help="Rebuild the report index from all outlines (repair; searches update it incrementally)",
+    )
+    reindex_parser.set_defaults(func=_command_report_reindex)
+
+    # report compact-backups
+    compact_parser = report_sub.add_parser(
+        "compact-backups",
+        help="Deduplicate report backups into the version store and apply retention",
+    )
+    compact_parser.add_argument("selector", nargs="?", help="Report ID or title (default: all reports)")
+    compact_parser.add_argument(
+        "--keep",
+        type=int,
+        default=None,
+        help="Keep only the newest N versions per report (default: IGLOO_MCP_REPORT_MAX_VERSIONS, 0 = all)",
+    )
+    compact_parser.set_defaults(func=_command_report_compact_backups)
+
     return parser
 
 
@@ -4,18 +4,12 @@ All constants can be overridden via environment variables with the prefix IGLOO_
 For example, CATALOG_CONCURRENCY can be set via IGLOO_MCP_CATALOG_CONCURRENCY.
 """
 
-import os
+from igloo_mcp.env_utils import read_int_env
 
 
 def _get_int_env(key: str, default: int) -> int:
     """Get integer value from environment variable with default."""
-    value = os.environ.get(key)
-    if value is None:
-        return default
-    try:
-        return int(value)
-    except ValueError:
-        return default
+    return read_int_env(key, default, minimum=None)
 
 
 # Catalog building concurrency limits
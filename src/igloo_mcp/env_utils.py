@@ -0,0 +1,63 @@
+"""Helpers for reading validated settings from environment variables."""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+from collections.abc import Sequence
+
+logger = logging.getLogger(__name__)
+
+
+def read_int_env(name: str, default: int, *, minimum: int | None = 1) -> int:
+    """Integer value of ``name``, or ``default`` when unset, blank or invalid.
+
+    Values that do not parse or fall below ``minimum`` (no bound when None) are
+    logged and replaced by ``default``.
+    """
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning("Invalid integer value for %s: %r. Using default %d.", name, raw, default)
+        return default
+    if minimum is not None and value < minimum:
+        logger.warning("%s must be >= %d; got %d. Using default %d.", name, minimum, value, default)
+        return default
+    return value
+
+
+def read_float_env(name: str, default: float, *, minimum: float | None = 0.0) -> float:
+    """Float value of ``name``; same fallback rules as :func:`read_int_env`."""
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = math.nan
+    if not math.isfinite(value):
+        logger.warning("Invalid number for %s: %r. Using default %s.", name, raw, default)
+        return default
+    if minimum is not None and value < minimum:
+        logger.warning("%s must be >= %s; got %s. Using default %s.", name, minimum, value, default)
+        return default
+    return value
+
+
+def read_choice_env(name: str, choices: Sequence[str], default: str) -> str:
+    """Lower-cased value of ``name`` if it is one of ``choices``, else ``default`` (logged when set)."""
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    value = raw.strip().lower()
+    if value not in choices:
+        logger.warning("Unknown %s=%r; defaulting to %s", name, raw, default)
+        return default
+    return value
+
+
+__all__ = ["read_choice_env", "read_float_env", "read_int_env"]
@@ -7,7 +7,9 @@ traceability back to source data.
 Key components:
 - models.py: Pydantic models for report structure and validation
 - storage.py: File system operations with locking and atomic writes
+- audit_log.py: Group-committed O_APPEND writer for audit.jsonl
 - index.py: Global report registry and title resolution
+- citation_index.py: SQLite citation index behind search_citations
 - service.py: High-level orchestration for CLI and MCP integration
 """
 
@@ -0,0 +1,186 @@
+"""Group-committed O_APPEND writer for ``audit.jsonl``.
+
+``ReportStorage.append_audit_event`` used to write each event to a temp file,
+fsync it, read it back, append it to ``audit.jsonl``, fsync again and then fsync
+the directory: three fsyncs and two extra file opens per audited action. An
+event is now one ``os.write`` to a file descriptor opened with ``O_APPEND``, so
+the line lands at the end of the file even when another process appends at the
+same time.
+
+``IGLOO_MCP_AUDIT_DURABILITY`` decides when ``append`` returns:
+
+* ``fsync`` (default): once the line is written and fsync'd. Lines appended
+  while another thread is committing to the same file are written and fsync'd
+  together (group commit).
+* ``group``: once the line is written. A background thread fsyncs every audit
+  file written since its last pass every ``IGLOO_MCP_AUDIT_FSYNC_INTERVAL_MS``
+  (and at interpreter exit), so events from many actions share one fsync per
+  file. A crash of the process loses nothing; a power loss can lose the last
+  interval.
+* ``buffered``: once the line is written; the operating system decides when it
+  reaches disk.
+
+The parent directory is fsync'd only when an append creates the file. Both the
+appends and the background fsyncs are batched by
+:class:`igloo_mcp.background_io.GroupCommitter`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import threading
+import weakref
+from collections.abc import Iterable
+from pathlib import Path
+
+from igloo_mcp.background_io import GroupCommitter
+from igloo_mcp.env_utils import read_choice_env, read_int_env
+
+logger = logging.getLogger(__name__)
+
+AUDIT_DURABILITY_ENV = "IGLOO_MCP_AUDIT_DURABILITY"
+AUDIT_FSYNC_INTERVAL_ENV = "IGLOO_MCP_AUDIT_FSYNC_INTERVAL_MS"
+# fsync: fsync'd before append() returns; group: fsync'd in the background; buffered: never fsync'd explicitly.
+AUDIT_DURABILITY_LEVELS = ("fsync", "group", "buffered")
+DEFAULT_AUDIT_DURABILITY = "fsync"
+DEFAULT_AUDIT_FSYNC_INTERVAL_MS = 200
+# Descriptors the group syncer holds before fsyncing early, and before append() waits for it.
+AUDIT_SYNC_BATCH = 64
+AUDIT_SYNC_MAX_PENDING = 256
+
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
+def _fsync_dir(path: Path) -> None:
+    # Best-effort; directories cannot be opened for fsync on every platform.
+    try:
+        dir_fd = os.open(str(path), os.O_RDONLY)
+    except (OSError, AttributeError):
+        return
+    try:
+        with contextlib.suppress(OSError):
+            os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _sync_descriptors(handles: Iterable[tuple[Path, int]]) -> None:
+    """fsync each file once (any descriptor of it will do) and close every descriptor."""
+    synced: set[Path] = set()
+    for path, fd in handles:
+        try:
+            if path not in synced:
+                synced.add(path)
+                os.fsync(fd)
+        except OSError as exc:
+            logger.warning("Failed to fsync audit log %s: %s", path, exc)
+        finally:
+            os.close(fd)
+
+
+_syncers: dict[float, GroupCommitter[tuple[Path, int]]] = {}
+_syncers_lock = threading.Lock()
+
+
+def _group_syncer(interval_seconds: float) -> GroupCommitter[tuple[Path, int]]:
+    with _syncers_lock:
+        syncer = _syncers.get(interval_seconds)
+        if syncer is None:
+            syncer = GroupCommitter(
+                "audit-sync",
+                _sync_descriptors,
+                deferred=True,
+                flush_interval_seconds=interval_seconds,
+                flush_size=AUDIT_SYNC_BATCH,
+                max_buffered=AUDIT_SYNC_MAX_PENDING,
+            )
+            _syncers[interval_seconds] = syncer
+        return syncer
+
+
+class AuditLogWriter:
+    """Thread-safe appender for one JSONL file; see the module docstring for durability levels.
+
+    Use :func:`audit_log_writer` so every storage object for the same file
+    shares one writer (and therefore one group commit).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        durability: str = DEFAULT_AUDIT_DURABILITY,
+        fsync_interval_seconds: float = DEFAULT_AUDIT_FSYNC_INTERVAL_MS / 1000,
+    ) -> None:
+        self.path = path
+        self.durability = durability if durability in AUDIT_DURABILITY_LEVELS else DEFAULT_AUDIT_DURABILITY
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self._committer: GroupCommitter[bytes] = GroupCommitter("audit", self._commit_lines)
+
+    def append(self, line: str) -> None:
+        """Append ``line`` (which must end with a newline) with this writer's durability.
+
+        Raises:
+            OSError: If the batch holding the line could not be written or fsync'd
+        """
+        self._committer.submit(line.encode("utf-8"))
+
+    def _commit_lines(self, lines: list[bytes]) -> None:
+        self._write(b"".join(lines))
+
+    def _write(self, payload: bytes) -> None:
+        created = not self.path.exists()
+        fd = os.open(str(self.path), _OPEN_FLAGS, 0o644)
+        handed_over = False
+        try:
+            view = memoryview(payload)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            if self.durability == "fsync":
+                os.fsync(fd)
+            elif self.durability == "group":
+                # The syncer fsyncs and closes the descriptor, so a renamed report still gets synced.
+                _group_syncer(self.fsync_interval_seconds).submit((self.path, fd))
+                handed_over = True
+        finally:
+            if not handed_over:
+                os.close(fd)
+        if created and self.durability != "buffered":
+            _fsync_dir(self.path.parent)
+
+
+_writers: weakref.WeakValueDictionary[tuple[Path, str, float], AuditLogWriter] = weakref.WeakValueDictionary()
+_writers_lock = threading.Lock()
+
+
+def audit_log_writer(path: Path) -> AuditLogWriter:
+    """Shared writer for ``path`` configured from the environment."""
+    durability = read_choice_env(AUDIT_DURABILITY_ENV, AUDIT_DURABILITY_LEVELS, DEFAULT_AUDIT_DURABILITY)
+    interval = read_int_env(AUDIT_FSYNC_INTERVAL_ENV, DEFAULT_AUDIT_FSYNC_INTERVAL_MS) / 1000
+    key = (path, durability, interval)
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = AuditLogWriter(path, durability=durability, fsync_interval_seconds=interval)
+            _writers[key] = writer
+        return writer
+
+
+def sync_audit_logs() -> None:
+    """fsync audit files that ``group`` writers have written but not yet synced."""
+    with _syncers_lock:
+        syncers = list(_syncers.values())
+    for syncer in syncers:
+        syncer.flush()
+
+
+__all__ = [
+    "AUDIT_DURABILITY_ENV",
+    "AUDIT_FSYNC_INTERVAL_ENV",
+    "AuditLogWriter",
+    "audit_log_writer",
+    "sync_audit_logs",
+]
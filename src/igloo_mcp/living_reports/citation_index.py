@@ -0,0 +1,298 @@
+"""Persistent cross-report citation index.
+
+``search_citations`` used to load and validate every active outline and filter
+each citation in Python. This module keeps a SQLite database (WAL mode) next to
+``index.jsonl`` with one row per citation - its report, insight context and the
+serialized citation - so searches never parse an outline:
+
+* ``source``, ``provider`` and ``execution_id`` are indexed columns;
+* ``url`` and ``description`` are posted under their trigrams, so the
+  case-insensitive substring filters only verify citations that contain every
+  trigram of the needle (the approach ``catalog_search.sqlite`` uses for names).
+
+``ReportService`` re-indexes a report whenever it saves that report's outline.
+Each report row also stores the mtime, size and inode of the ``outline.json`` it
+was built from, and ``ReportService.sync_citation_index`` re-reads only outlines
+whose signature no longer matches, so edits made by another process (or by
+hand) are picked up before a search. Like the history store, the database is an
+index rather than a source of truth: deleting it just triggers a re-index.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from igloo_mcp.text_utils import trigrams
+
+from .models import Outline
+
+logger = logging.getLogger(__name__)
+
+CITATION_INDEX_FILENAME = "citations.sqlite"
+SCHEMA_VERSION = 1
+_MAX_SQL_PARAMS = 500
+_MATCH_SELECT = (
+    "SELECT c.id, c.payload, c.insight_id, c.insight_summary, c.importance, c.report_id, r.title "
+    "FROM citations c JOIN reports r ON r.report_id = c.report_id"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS reports (
+    report_id TEXT PRIMARY KEY,
+    signature TEXT NOT NULL,
+    title TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS citations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    report_id TEXT NOT NULL,
+    insight_pos INTEGER NOT NULL,
+    citation_pos INTEGER NOT NULL,
+    insight_id TEXT NOT NULL,
+    insight_summary TEXT NOT NULL,
+    importance INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    provider TEXT,
+    execution_id TEXT,
+    url_key TEXT,
+    description_key TEXT,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS citation_trigrams (
+    field TEXT NOT NULL,
+    trigram TEXT NOT NULL,
+    citation_id INTEGER NOT NULL,
+    PRIMARY KEY (field, trigram, citation_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_citations_report ON citations (report_id);
+CREATE INDEX IF NOT EXISTS idx_citations_source ON citations (source);
+CREATE INDEX IF NOT EXISTS idx_citations_provider ON citations (provider);
+CREATE INDEX IF NOT EXISTS idx_citations_execution_id ON citations (execution_id);
+CREATE INDEX IF NOT EXISTS idx_citation_trigrams_citation ON citation_trigrams (citation_id);
+"""
+
+
+def outline_signature(outline_path: Path) -> str | None:
+    """``mtime_ns:size:inode`` of an outline file, or None when it is missing."""
+    try:
+        stat = outline_path.stat()
+    except OSError:
+        return None
+    return f"{stat.st_mtime_ns}:{stat.st_size}:{stat.st_ino}"
+
+
+def _substring_filter(field: str, column: str, needle: str) -> tuple[str, list[Any]]:
+    """Clause matching ``needle`` inside ``column``, narrowed by its trigram postings."""
+    clause = f"instr({column}, ?) > 0"
+    params: list[Any] = [needle]
+    grams = sorted(trigrams(needle))
+    if grams:
+        placeholders = ", ".join("?" for _ in grams)
+        clause += (
+            " AND id IN (SELECT citation_id FROM citation_trigrams "  # noqa: S608 - "?" placeholders only
+            f"WHERE field = ? AND trigram IN ({placeholders}) GROUP BY citation_id HAVING COUNT(*) = ?)"
+        )
+        params.extend([field, *grams, len(grams)])
+    return clause, params
+
+
+class CitationIndex:
+    """Thread-safe SQLite index of every citation in every report."""
+
+    def __init__(self, db_path: Path) -> None:
+        self._db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(db_path),
+            timeout=10.0,
+            check_same_thread=False,
+            isolation_level=None,  # explicit BEGIN/COMMIT below
+        )
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is not None and int(row[0]) != SCHEMA_VERSION:
+                self._conn.executescript("DELETE FROM citation_trigrams; DELETE FROM citations; DELETE FROM reports;")
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('schema_version', ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (str(SCHEMA_VERSION),),
+            )
+        except Exception:
+            self._conn.close()
+            raise
+
+    @classmethod
+    def open(cls, db_path: Path) -> CitationIndex | None:
+        """Open the index, or return None when SQLite is unusable at that location."""
+        try:
+            return cls(db_path)
+        except (sqlite3.Error, OSError, ValueError) as exc:
+            logger.warning("Citation index unavailable for %s: %s", db_path, exc)
+            return None
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def signatures(self) -> dict[str, str]:
+        """Outline signature each indexed report was built from."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT report_id, signature FROM reports"))
+
+    def index_report(self, report_id: str, outline: Outline, signature: str) -> None:
+        """Replace every citation row of ``report_id`` with those in ``outline``."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._delete(report_id)
+                self._conn.execute(
+                    "INSERT INTO reports (report_id, signature, title) VALUES (?, ?, ?)",
+                    (report_id, signature, outline.title),
+                )
+                for insight_pos, insight in enumerate(outline.insights):
+                    for citation_pos, citation in enumerate(insight.citations or []):
+                        url_key = citation.url.lower() if citation.url else None
+                        description_key = citation.description.lower() if citation.description else None
+                        cursor = self._conn.execute(
+                            "INSERT INTO citations (report_id, insight_pos, citation_pos, insight_id, "
+                            "insight_summary, importance, source, provider, execution_id, url_key, "
+                            "description_key, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (
+                                report_id,
+                                insight_pos,
+                                citation_pos,
+                                insight.insight_id,
+                                insight.summary,
+                                insight.importance,
+                                citation.source,
+                                citation.provider,
+                                citation.execution_id,
+                                url_key,
+                                description_key,
+                                json.dumps(citation.model_dump(), ensure_ascii=False),
+                            ),
+                        )
+                        citation_id = cursor.lastrowid
+                        self._conn.executemany(
+                            "INSERT OR IGNORE INTO citation_trigrams (field, trigram, citation_id) VALUES (?, ?, ?)",
+                            [
+                                *(("url", gram, citation_id) for gram in trigrams(url_key or "")),
+                                *(("description", gram, citation_id) for gram in trigrams(description_key or "")),
+                            ],
+                        )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def remove_reports(self, report_ids: Iterable[str]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for report_id in report_ids:
+                    self._delete(report_id)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _delete(self, report_id: str) -> None:
+        self._conn.execute(
+            "DELETE FROM citation_trigrams WHERE citation_id IN (SELECT id FROM citations WHERE report_id = ?)",
+            (report_id,),
+        )
+        self._conn.execute("DELETE FROM citations WHERE report_id = ?", (report_id,))
+        self._conn.execute("DELETE FROM reports WHERE report_id = ?", (report_id,))
+
+    def search(
+        self,
+        report_ids: Sequence[str],
+        *,
+        source_type: str | None = None,
+        provider: str | None = None,
+        url_contains: str | None = None,
+        description_contains: str | None = None,
+        execution_id: str | None = None,
+        limit: int = 50,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """Return ``(matches, total_matches)`` among ``report_ids``.
+
+        Matches follow the order of ``report_ids``, then insight and citation
+        order within each outline, and are capped by ``limit``.
+        """
+        clauses: list[str] = []
+        params: list[Any] = []
+        if source_type:
+            clauses.append("source = ?")
+            params.append(source_type)
+        if provider:
+            clauses.append("provider = ?")
+            params.append(provider)
+        if execution_id:
+            clauses.append("execution_id = ?")
+            params.append(execution_id)
+        for field, column, needle in (
+            ("url", "url_key", url_contains),
+            ("description", "description_key", description_contains),
+        ):
+            if needle:
+                clause, clause_params = _substring_filter(field, column, needle.lower())
+                clauses.append(clause)
+                params.extend(clause_params)
+
+        rank = {report_id: position for position, report_id in enumerate(report_ids)}
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            keys = self._conn.execute(
+                f"SELECT id, report_id, insight_pos, citation_pos FROM citations{where}",  # noqa: S608 - "?" only
+                params,
+            ).fetchall()
+            keys = sorted(
+                (key for key in keys if key[1] in rank),
+                key=lambda key: (rank[key[1]], key[2], key[3]),
+            )
+            selected = [key[0] for key in keys[: max(limit, 0)]]
+            rows: dict[int, tuple[Any, ...]] = {}
+            for start in range(0, len(selected), _MAX_SQL_PARAMS):
+                chunk = selected[start : start + _MAX_SQL_PARAMS]
+                placeholders = ", ".join("?" for _ in chunk)
+                sql = f"{_MATCH_SELECT} WHERE c.id IN ({placeholders})"
+                rows.update((row[0], row) for row in self._conn.execute(sql, chunk))
+
+        matches = []
+        for citation_id in selected:
+            _, payload, insight_id, summary, importance, report_id, title = rows[citation_id]
+            matches.append(
+                {
+                    "citation": json.loads(payload),
+                    "insight": {
+                        "insight_id": insight_id,
+                        "summary": summary,
+                        "importance": importance,
+                    },
+                    "report": {
+                        "report_id": report_id,
+                        "title": title,
+                    },
+                }
+            )
+        return matches, len(keys)
+
+
+__all__ = ["CITATION_INDEX_FILENAME", "CitationIndex", "outline_signature"]
@@ -6,14 +6,22 @@ This module provides the HistoryIndex class for resolving datasets from query hi
 from __future__ import annotations
 
 import json
+import logging
+import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from igloo_mcp.cache.columnar import FORMAT_NAME as COLUMNAR_FORMAT
+from igloo_mcp.cache.columnar import read_columnar
+from igloo_mcp.logging.history_store import HistoryStore, TailPosition, parse_record, read_appended_lines
+from igloo_mcp.logging.query_history import flush_query_histories
 from igloo_mcp.path_utils import find_repo_root
 
 from .models import DatasetSource, ResolvedDataset
 
+logger = logging.getLogger(__name__)
+
 
 def _load_jsonl(path: Path) -> list[dict[str, Any]]:
     """Load JSON objects from a JSONL file."""
@@ -43,33 +51,108 @@ class DatasetResolutionError(RuntimeError):
 class HistoryIndex:
     """Index over query history used for report dataset resolution.
 
-    The index is intentionally simple: it keeps the raw history records plus
-    lookups by execution_id and sql_sha256. Cache manifests are resolved lazily
-    when datasets are bound.
+    Lookups by execution_id and sql_sha256 are served by the SQLite history
+    store kept next to the JSONL file. When SQLite is unavailable the records
+    are held in memory instead. Either way every access first consumes only the
+    lines appended since the previous one (tracking byte offset and inode, and
+    starting over after rotation or truncation), so a long-running server sees
+    new executions without rebuilding the index. Cache manifests are resolved
+    lazily when datasets are bound.
     """
 
     def __init__(self, history_path: Path) -> None:
         self.history_path = history_path
-        self._records: list[dict[str, Any]] = list(_load_jsonl(history_path))
+        self._store: HistoryStore | None = None
+        self._in_memory = False
+        self._position = TailPosition()
+        self._records: list[dict[str, Any]] = []
         self._by_execution_id: dict[str, dict[str, Any]] = {}
         self._by_sql_sha: dict[str, dict[str, Any]] = {}
-        for record in self._records:
-            exec_id = record.get("execution_id")
-            if isinstance(exec_id, str) and exec_id not in self._by_execution_id:
-                self._by_execution_id[exec_id] = record
-            sha = record.get("sql_sha256")
-            if isinstance(sha, str) and sha not in self._by_sql_sha:
-                self._by_sql_sha[sha] = record
+        self._history_store()
+
+    def _history_store(self) -> HistoryStore | None:
+        """Return the SQLite store, or None once the in-memory index is up to date."""
+        # Commit lines a batched QueryHistory in this process is still buffering.
+        flush_query_histories()
+        if self._store is None and not self._in_memory and self.history_path.exists():
+            self._store = HistoryStore.open(self.history_path)
+            self._in_memory = self._store is None
+        if self._in_memory:
+            self._tail()
+        return self._store
+
+    def _fall_back_to_memory(self, exc: sqlite3.Error) -> None:
+        logger.warning("History index lookup failed, loading history into memory: %s", exc)
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+        self._in_memory = True
+        self._tail()
+
+    def _tail(self) -> None:
+        """Index lines appended since the last call; start over if the file was replaced."""
+        try:
+            stat = self.history_path.stat()
+            size, inode = stat.st_size, stat.st_ino
+        except FileNotFoundError:
+            size, inode = 0, None
+        except OSError as exc:
+            logger.debug("Cannot stat history file %s: %s", self.history_path, exc)
+            return
+
+        if self._position.is_current(size, inode):
+            return
+        if self._position.was_replaced(size, inode):
+            self._records.clear()
+            self._by_execution_id.clear()
+            self._by_sql_sha.clear()
+            self._position = TailPosition(inode=inode)
+        if not size:
+            return
+        try:
+            for lines, offset in read_appended_lines(self.history_path, self._position.offset):
+                for line in lines:
+                    record = parse_record(line)
+                    if record is not None:
+                        self._add(record)
+                self._position = TailPosition(inode=inode, offset=offset)
+        except OSError as exc:
+            logger.debug("Cannot read history file %s: %s", self.history_path, exc)
+
+    def _add(self, record: dict[str, Any]) -> None:
+        self._records.append(record)
+        exec_id = record.get("execution_id")
+        if isinstance(exec_id, str) and exec_id not in self._by_execution_id:
+            self._by_execution_id[exec_id] = record
+        sha = record.get("sql_sha256")
+        if isinstance(sha, str) and sha not in self._by_sql_sha:
+            self._by_sql_sha[sha] = record
+
+    def _first(self, field: str, value: str) -> dict[str, Any] | None:
+        store = self._history_store()
+        if store is not None:
+            try:
+                return store.first(**{field: value})
+            except sqlite3.Error as exc:
+                self._fall_back_to_memory(exc)
+        lookup = self._by_execution_id if field == "execution_id" else self._by_sql_sha
+        return lookup.get(value)
 
     @property
     def records(self) -> list[dict[str, Any]]:
+        store = self._history_store()
+        if store is not None:
+            try:
+                return store.find(newest_first=False)
+            except sqlite3.Error as exc:
+                self._fall_back_to_memory(exc)
         return list(self._records)
 
     def _resolve_history_record(self, source: DatasetSource) -> dict[str, Any] | None:
-        if source.execution_id and source.execution_id in self._by_execution_id:
-            return self._by_execution_id[source.execution_id]
-        if source.sql_sha256 and source.sql_sha256 in self._by_sql_sha:
-            return self._by_sql_sha[source.sql_sha256]
+        if source.execution_id and (record := self._first("execution_id", source.execution_id)) is not None:
+            return record
+        if source.sql_sha256:
+            return self._first("sql_sha256", source.sql_sha256)
         return None
 
     def get_record_by_execution_id(self, execution_id: str) -> dict[str, Any] | None:
@@ -84,13 +167,13 @@ class HistoryIndex:
         Returns:
             The history record if found, None otherwise
         """
-        return self._by_execution_id.get(execution_id)
+        return self._first("execution_id", execution_id)
 
     def get_records_batch(self, execution_ids: list[str]) -> dict[str, dict[str, Any]]:
         """Batch lookup of history records by execution_id.
 
         More efficient than calling get_record_by_execution_id in a loop
-        when you need multiple records, as it returns a single dict.
+        when you need multiple records, as it resolves all ids in one query.
 
         Args:
             execution_ids: List of execution IDs to look up
@@ -98,6 +181,13 @@ class HistoryIndex:
         Returns:
             Dictionary mapping execution_id to history record (only found records)
         """
+        store = self._history_store()
+        if store is not None:
+            try:
+                found = store.first_by_execution_id(execution_ids)
+                return {exec_id: found[exec_id] for exec_id in execution_ids if exec_id in found}
+            except sqlite3.Error as exc:
+                self._fall_back_to_memory(exc)
         return {
             exec_id: record for exec_id in execution_ids if (record := self._by_execution_id.get(exec_id)) is not None
         }
@@ -120,10 +210,11 @@ class HistoryIndex:
         data = json.loads(raw)
         if not isinstance(data, dict):
             raise DatasetResolutionError(f"Expected mapping in cache manifest {manifest_path}, got {type(data)!r}")
-        result_json = data.get("result_json")
-        if not result_json:
-            raise DatasetResolutionError(f"Cache manifest missing result_json field: {manifest_path}")
-        rows_path = manifest_path.parent / result_json
+        # result_rows (columnar) replaced result_json (rows.jsonl) in manifest version 2.
+        rows_name = data.get("result_rows") or data.get("result_json")
+        if not rows_name:
+            raise DatasetResolutionError(f"Cache manifest missing result_rows field: {manifest_path}")
+        rows_path = manifest_path.parent / rows_name
         if not rows_path.exists():
             raise DatasetResolutionError(f"Cache rows file declared in manifest not found: {rows_path}")
         result_csv_rel = data.get("result_csv")
@@ -135,7 +226,9 @@ class HistoryIndex:
         return data, rows_path, result_csv_path
 
     @staticmethod
-    def _load_rows(rows_path: Path) -> list[dict[str, Any]]:
+    def _load_rows(rows_path: Path, result_format: str | None = None) -> list[dict[str, Any]]:
+        if result_format == COLUMNAR_FORMAT:
+            return read_columnar(rows_path)
         rows: list[dict[str, Any]] = []
         for entry in _load_jsonl(rows_path):
             rows.append(entry)
@@ -175,7 +268,7 @@ class HistoryIndex:
 
         assert manifest_path is not None
         manifest_data, rows_path, _ = self._load_cache_manifest(manifest_path)
-        rows = self._load_rows(rows_path)
+        rows = self._load_rows(rows_path, manifest_data.get("result_format"))
 
         columns: list[str] = []
         raw_columns = manifest_data.get("columns")
@@ -3,6 +3,27 @@
 This module provides the global index that tracks all reports in the system,
 enabling fast lookup by ID or title, and maintaining consistency across
 the file system storage.
+
+``refresh()`` keeps the index in sync with ``by_id/`` incrementally: a
+manifest next to ``index.jsonl`` records each outline's mtime, size and inode
+(plus its ``outline_version``), so only outlines whose signature changed are
+re-read and validated, and ``index.jsonl`` is rewritten only when an entry
+actually changed. ``rebuild_from_filesystem()`` remains the full repair scan.
+
+Mutations are log-structured: ``index.jsonl`` is a compact snapshot and every
+add, update or removal is appended to ``index.log.jsonl`` as one ``put`` or
+``del`` record, so a single-report change costs one small append rather than a
+rewrite of every entry. Loading replays the log over the snapshot (last writer
+wins). Once the log holds at least as many records as there are entries (and
+no fewer than ``COMPACT_MIN_RECORDS``), a background thread folds it into a
+fresh snapshot and truncates it. Replaying records already in the snapshot is
+idempotent, so a crash between those two steps loses nothing.
+
+Several processes may share one index, so appends and compaction also hold an
+advisory lock on ``index.lock``, and compaction reloads the snapshot and log
+from disk under that lock before writing. Records another process appended
+after this one loaded are folded into the new snapshot instead of being
+discarded with the log.
 """
 
 from __future__ import annotations
@@ -12,12 +33,32 @@ import json
 import logging
 import os
 import shutil
+import threading
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
+
+try:
+    import portalocker
+
+    HAS_PORTALOCKER = True
+except ImportError:
+    HAS_PORTALOCKER = False
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows without portalocker
+    fcntl = None  # type: ignore[assignment]
 
 from pydantic import ValidationError
 
 from .models import IndexEntry, Outline
 
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+COMPACT_MIN_RECORDS = 256
+
 
 class IndexError(RuntimeError):
     """Base exception for index-related errors."""
@@ -34,19 +75,42 @@ class ReportIndex:
     fast lookup and title resolution.
     """
 
-    def __init__(self, index_path: Path) -> None:
+    def __init__(
+        self,
+        index_path: Path,
+        *,
+        compact_min_records: int = COMPACT_MIN_RECORDS,
+        background_compaction: bool = True,
+    ) -> None:
         """Initialize report index.
 
         Args:
-            index_path: Path to the index.jsonl file
+            index_path: Path to the index.jsonl snapshot
+            compact_min_records: Smallest change log that triggers compaction
+            background_compaction: Compact on a daemon thread instead of inline
         """
         self.index_path = index_path
+        self.log_path = index_path.with_suffix(".log.jsonl")
+        self.manifest_path = index_path.with_suffix(".manifest.json")
+        self.lock_path = index_path.with_suffix(".lock")
+        self.compact_min_records = compact_min_records
+        self.background_compaction = background_compaction
         self._entries: dict[str, IndexEntry] = {}
         self._title_to_id: dict[str, str] = {}
+        # Report directory name -> outline signature and the entry it produced.
+        self._manifest: dict[str, dict[str, Any]] = {}
+        # Records in index.log.jsonl not yet folded into the snapshot.
+        self._log_records = 0
+        self._lock = threading.RLock()
+        # Nesting depth of the cross-process lock held by this instance.
+        self._file_lock_depth = 0
+        self._compaction_thread: threading.Thread | None = None
         self._load_index()
+        self._replay_log()
+        self._load_manifest()
 
     def _load_index(self) -> None:
-        """Load index from disk."""
+        """Load the index snapshot from disk."""
         if not self.index_path.exists():
             return
 
@@ -122,55 +186,22 @@ class ReportIndex:
 
         new_entries: dict[str, IndexEntry] = {}
         title_to_id: dict[str, str] = {}
+        manifest: dict[str, dict[str, Any]] = {}
 
         for report_dir in by_id_dir.iterdir():
             if not report_dir.is_dir():
                 continue
 
-            outline_path = report_dir / "outline.json"
-            if not outline_path.exists():
+            signature = self._outline_signature(report_dir)
+            if signature is None:
                 # Skip directories without an outline; may be incomplete reports
                 continue
 
-            try:
-                raw = outline_path.read_text(encoding="utf-8")
-                data = json.loads(raw)
-                outline = Outline(**data)
-            except ValidationError as e:
-                # Log validation errors but continue indexing other reports
-                logger = logging.getLogger(__name__)
-                logger.warning(
-                    f"Skipping report {report_dir.name} due to validation error: {e}",
-                    extra={
-                        "report_id": report_dir.name,
-                        "error_type": type(e).__name__,
-                        "error_message": str(e),
-                    },
-                )
-                continue
-            except Exception as e:
-                # Log unexpected errors
-                logger = logging.getLogger(__name__)
-                logger.warning(
-                    f"Skipping report {report_dir.name} due to unexpected error: {e}",
-                    extra={
-                        "report_id": report_dir.name,
-                        "error_type": type(e).__name__,
-                    },
-                )
+            parsed = self._parse_report_dir(report_dir)
+            manifest[report_dir.name] = self._manifest_record(signature, parsed)
+            if parsed is None:
                 continue
-
-            report_id = report_dir.name
-            entry = IndexEntry(
-                report_id=outline.report_id,
-                current_title=outline.title,
-                created_at=outline.created_at,
-                updated_at=outline.updated_at,
-                tags=outline.metadata.get("tags", []),
-                status=outline.metadata.get("status", "active"),
-                path=f"by_id/{report_id}",
-            )
-
+            entry, _ = parsed
             new_entries[entry.report_id] = entry
             title_to_id[entry.current_title.lower()] = entry.report_id
 
@@ -181,6 +212,8 @@ class ReportIndex:
 
         try:
             self._save_index_internal(entries=new_entries, title_map=title_to_id)
+            self._manifest = manifest
+            self._save_manifest()
             with contextlib.suppress(Exception):
                 if backup_path.exists():
                     backup_path.unlink()
@@ -193,42 +226,322 @@ class ReportIndex:
                     backup_path.replace(self.index_path)
             raise
 
-    def _save_index(self) -> None:
-        """Save current index to disk."""
-        self._save_index_internal(entries=None, title_map=None)
+    def refresh(self) -> int:
+        """Sync the index with ``by_id/``, re-parsing only outlines that changed.
 
-    def _save_index_internal(self, entries=None, title_map=None) -> None:
-        """Save provided entries to disk atomically and update in-memory cache."""
-        temp_path = self.index_path.with_suffix(".tmp")
-        entries = self._entries if entries is None else entries
-        title_map = self._title_to_id if title_map is None else title_map
+        Each outline is stat()ed and compared with the manifest; new or modified
+        outlines are validated and turned into entries, and entries whose report
+        directory disappeared are dropped. Only added, changed or removed entries
+        are appended to the change log.
+
+        Returns:
+            Number of index entries added, changed or removed
+        """
+        by_id_dir = self.index_path.parent / "by_id"
+        entries = dict(self._entries)
+        manifest: dict[str, dict[str, Any]] = {}
+        manifest_changed = False
+
+        report_dirs = [path for path in by_id_dir.iterdir() if path.is_dir()] if by_id_dir.exists() else []
+        for report_dir in report_dirs:
+            signature = self._outline_signature(report_dir)
+            if signature is None:
+                continue
+            known = self._manifest.get(report_dir.name)
+            if (
+                known is not None
+                and known["signature"] == signature
+                and (known.get("report_id") is None or known["report_id"] in entries)
+            ):
+                manifest[report_dir.name] = known
+                continue
 
+            parsed = self._parse_report_dir(report_dir)
+            manifest[report_dir.name] = self._manifest_record(signature, parsed)
+            manifest_changed = True
+            if parsed is not None:
+                entry, _ = parsed
+                entries[entry.report_id] = entry
+
+        # Drop entries whose directory is gone or no longer yields that report.
+        for report_id, entry in list(entries.items()):
+            record = manifest.get(Path(entry.path).name)
+            if record is None or record["report_id"] != report_id:
+                del entries[report_id]
+        if self._manifest.keys() - manifest.keys():
+            manifest_changed = True
+
+        records: list[dict[str, Any]] = []
+        for report_id in entries.keys() | self._entries.keys():
+            refreshed: IndexEntry | None = entries.get(report_id)
+            if refreshed == self._entries.get(report_id):
+                continue
+            if refreshed is None:
+                records.append({"op": "del", "report_id": report_id})
+            else:
+                records.append({"op": "put", "entry": refreshed.model_dump()})
+        if records:
+            self._append_log(records)
+        self._manifest = manifest
+        if manifest_changed:
+            self._save_manifest()
+        return len(records)
+
+    @staticmethod
+    def _outline_signature(report_dir: Path) -> list[int] | None:
+        try:
+            stat = (report_dir / "outline.json").stat()
+        except OSError:
+            return None
+        return [stat.st_mtime_ns, stat.st_size, stat.st_ino]
+
+    @staticmethod
+    def _manifest_record(signature: list[int], parsed: tuple[IndexEntry, int] | None) -> dict[str, Any]:
+        if parsed is None:
+            # Remember unreadable outlines too, so they are not re-parsed until they change.
+            return {"signature": signature, "report_id": None, "outline_version": None}
+        entry, outline_version = parsed
+        return {"signature": signature, "report_id": entry.report_id, "outline_version": outline_version}
+
+    @staticmethod
+    def _parse_report_dir(report_dir: Path) -> tuple[IndexEntry, int] | None:
+        """Build the index entry for one report directory, or None if its outline is invalid."""
+        try:
+            raw = (report_dir / "outline.json").read_text(encoding="utf-8")
+            data = json.loads(raw)
+            outline = Outline(**data)
+        except ValidationError as e:
+            # Log validation errors but continue indexing other reports
+            logger.warning(
+                f"Skipping report {report_dir.name} due to validation error: {e}",
+                extra={
+                    "report_id": report_dir.name,
+                    "error_type": type(e).__name__,
+                    "error_message": str(e),
+                },
+            )
+            return None
+        except Exception as e:
+            # Log unexpected errors
+            logger.warning(
+                f"Skipping report {report_dir.name} due to unexpected error: {e}",
+                extra={
+                    "report_id": report_dir.name,
+                    "error_type": type(e).__name__,
+                },
+            )
+            return None
+
+        entry = IndexEntry(
+            report_id=outline.report_id,
+            current_title=outline.title,
+            created_at=outline.created_at,
+            updated_at=outline.updated_at,
+            tags=outline.metadata.get("tags", []),
+            status=outline.metadata.get("status", "active"),
+            path=f"by_id/{report_dir.name}",
+        )
+        return entry, outline.outline_version
+
+    def _load_manifest(self) -> None:
+        """Load outline signatures; a missing or unreadable manifest just means a full re-parse."""
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return
+        reports = data.get("reports")
+        if isinstance(reports, dict):
+            self._manifest = {
+                name: record
+                for name, record in reports.items()
+                if isinstance(record, dict) and isinstance(record.get("signature"), list)
+            }
+
+    def _save_manifest(self) -> None:
+        """Write the manifest atomically. It is a cache, so failures are only logged."""
+        temp_path = self.manifest_path.with_suffix(".tmp")
         try:
-            with temp_path.open("w", encoding="utf-8") as f:
-                for entry in entries.values():
-                    data = entry.model_dump()
-                    line = json.dumps(data, ensure_ascii=False) + "\n"
-                    f.write(line)
-                f.flush()
-                os.fsync(f.fileno())
-
-            temp_path.replace(self.index_path)
-            self._entries = entries
-            self._title_to_id = title_map
-            # Best-effort directory sync for index durability
+            temp_path.write_text(
+                json.dumps({"version": MANIFEST_VERSION, "reports": self._manifest}, separators=(",", ":")),
+                encoding="utf-8",
+            )
+            temp_path.replace(self.manifest_path)
+        except OSError as e:
+            logger.warning(f"Failed to save report index manifest: {e}")
+            with contextlib.suppress(OSError):
+                temp_path.unlink(missing_ok=True)
+
+    def _replay_log(self) -> None:
+        """Apply index.log.jsonl on top of the loaded snapshot, last writer wins."""
+        try:
+            with self.log_path.open("r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            raise IndexCorruptionError(f"Failed to load index log: {e}") from e
+
+        skipped = 0
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                self._apply_record(json.loads(line))
+            except (ValueError, TypeError, KeyError):
+                # A torn final append after a crash; the outline on disk is still authoritative.
+                skipped += 1
+                continue
+            self._log_records += 1
+        if skipped:
+            logger.warning(f"Skipped {skipped} unreadable record(s) in {self.log_path.name}")
+
+    def _apply_record(self, record: dict[str, Any]) -> None:
+        if record["op"] == "put":
+            entry = IndexEntry(**record["entry"])
+            previous = self._entries.get(entry.report_id)
+            if previous is not None and self._title_to_id.get(previous.current_title.lower()) == entry.report_id:
+                del self._title_to_id[previous.current_title.lower()]
+            self._entries[entry.report_id] = entry
+            self._title_to_id[entry.current_title.lower()] = entry.report_id
+        elif record["op"] == "del":
+            removed: IndexEntry | None = self._entries.pop(record["report_id"], None)
+            # Remove title mapping if it points to this report
+            if removed is not None and self._title_to_id.get(removed.current_title.lower()) == removed.report_id:
+                del self._title_to_id[removed.current_title.lower()]
+        else:
+            raise ValueError(f"Unknown index log op: {record['op']!r}")
+
+    def _append_log(self, records: list[dict[str, Any]]) -> None:
+        """Durably append change records, apply them in memory and schedule compaction."""
+        payload = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        with self._lock, self._file_lock():
+            created = not self.log_path.exists()
+            try:
+                with self.log_path.open("a", encoding="utf-8") as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                raise IndexError(f"Failed to append to index log: {e}") from e
+            if created:
+                self._fsync_dir()
+            for record in records:
+                self._apply_record(record)
+            self._log_records += len(records)
+            if self._needs_compaction():
+                self._schedule_compaction()
+
+    def _needs_compaction(self) -> bool:
+        return self._log_records >= max(self.compact_min_records, len(self._entries))
+
+    def _schedule_compaction(self) -> None:
+        if not self.background_compaction:
+            self.compact()
+            return
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+        self._compaction_thread = threading.Thread(
+            target=self._compact_in_background, name="igloo-report-index-compactor", daemon=True
+        )
+        self._compaction_thread.start()
+
+    def _compact_in_background(self) -> None:
+        try:
+            with self._lock:
+                if self._needs_compaction():
+                    self.compact()
+        except IndexError as e:
+            # The log is still intact, so the next append simply retries.
+            logger.warning(f"Background report index compaction failed: {e}")
+
+    @contextlib.contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Hold the advisory ``index.lock`` shared with other processes (reentrant per instance)."""
+        with self._lock:
+            if self._file_lock_depth:
+                self._file_lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._file_lock_depth -= 1
+                return
+            try:
+                lock_file = self.lock_path.open("a")
+            except OSError as e:
+                raise IndexError(f"Failed to open index lock: {e}") from e
             try:
-                dir_fd = os.open(str(self.index_path.parent), os.O_RDONLY)
+                if HAS_PORTALOCKER:
+                    portalocker.lock(lock_file, portalocker.LOCK_EX)
+                elif fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                self._file_lock_depth = 1
                 try:
-                    os.fsync(dir_fd)
+                    yield
                 finally:
-                    os.close(dir_fd)
-            except (OSError, AttributeError):
-                pass
+                    self._file_lock_depth = 0
+            finally:
+                # Closing the file releases the lock.
+                lock_file.close()
 
-        except Exception as e:
-            with contextlib.suppress(Exception):
-                temp_path.unlink(missing_ok=True)
-            raise IndexError(f"Failed to save index: {e}") from e
+    def compact(self) -> None:
+        """Fold the change log into a fresh ``index.jsonl`` snapshot and truncate it.
+
+        The snapshot and log are re-read under the index lock first, so records
+        appended by other processes since this index was loaded are kept.
+        """
+        with self._lock, self._file_lock():
+            entries, title_map, log_records = self._entries, self._title_to_id, self._log_records
+            self._entries, self._title_to_id, self._log_records = {}, {}, 0
+            try:
+                self._load_index()
+                self._replay_log()
+            except IndexError:
+                self._entries, self._title_to_id, self._log_records = entries, title_map, log_records
+                raise
+            self._save_index_internal(entries=None, title_map=None)
+
+    def _save_index_internal(self, entries=None, title_map=None) -> None:
+        """Write a snapshot of the entries atomically, reset the change log and update in-memory cache."""
+        temp_path = self.index_path.with_suffix(".tmp")
+
+        with self._lock, self._file_lock():
+            entries = self._entries if entries is None else entries
+            title_map = self._title_to_id if title_map is None else title_map
+            try:
+                with temp_path.open("w", encoding="utf-8") as f:
+                    for entry in entries.values():
+                        data = entry.model_dump()
+                        line = json.dumps(data, ensure_ascii=False) + "\n"
+                        f.write(line)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                temp_path.replace(self.index_path)
+                self._entries = entries
+                self._title_to_id = title_map
+                self._fsync_dir()
+                # Only after the snapshot is durable; replaying a stale log over it is harmless.
+                self.log_path.unlink(missing_ok=True)
+                self._log_records = 0
+
+            except Exception as e:
+                with contextlib.suppress(Exception):
+                    temp_path.unlink(missing_ok=True)
+                raise IndexError(f"Failed to save index: {e}") from e
+
+    def _fsync_dir(self) -> None:
+        # Best-effort directory sync for index durability
+        try:
+            dir_fd = os.open(str(self.index_path.parent), os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except (OSError, AttributeError):
+            pass
 
     def add_entry(self, entry: IndexEntry) -> None:
         """Add or update an index entry.
@@ -236,9 +549,7 @@ class ReportIndex:
         Args:
             entry: Index entry to add/update
         """
-        self._entries[entry.report_id] = entry
-        self._title_to_id[entry.current_title.lower()] = entry.report_id
-        self._save_index()
+        self._append_log([{"op": "put", "entry": entry.model_dump()}])
 
     def remove_entry(self, report_id: str) -> None:
         """Remove an index entry.
@@ -247,14 +558,7 @@ class ReportIndex:
             report_id: Report ID to remove
         """
         if report_id in self._entries:
-            entry = self._entries[report_id]
-            del self._entries[report_id]
-
-            # Remove title mapping if it points to this report
-            if self._title_to_id.get(entry.current_title.lower()) == report_id:
-                del self._title_to_id[entry.current_title.lower()]
-
-        self._save_index()
+            self._append_log([{"op": "del", "report_id": report_id}])
 
     def get_entry(self, report_id: str) -> IndexEntry | None:
         """Get index entry by report ID.
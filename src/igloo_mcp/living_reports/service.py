@@ -11,6 +11,7 @@ import datetime
 import hashlib
 import json
 import logging
+import sqlite3
 import uuid
 import webbrowser
 from pathlib import Path
@@ -19,6 +20,7 @@ from typing import Any
 from igloo_mcp.path_utils import resolve_history_path
 
 from . import models as living_reports_models
+from .citation_index import CITATION_INDEX_FILENAME, CitationIndex, outline_signature
 from .history_index import HistoryIndex, ResolvedDataset
 from .index import ReportIndex
 from .models import AuditEvent, IndexEntry, Insight, Outline, ReportId, Section
@@ -46,8 +48,10 @@ class ReportService:
         self.global_storage = GlobalStorage(reports_root)
         self.index = ReportIndex(reports_root / "index.jsonl")
 
-        # Initialize HistoryIndex lazily
+        # Initialize HistoryIndex and CitationIndex lazily
         self._history_index: HistoryIndex | None = None
+        self._citation_index: CitationIndex | None = None
+        self._citation_index_opened = False
 
     @property
     def history_index(self) -> HistoryIndex:
@@ -57,6 +61,75 @@ class ReportService:
             self._history_index = HistoryIndex(history_path)
         return self._history_index
 
+    @property
+    def citation_index(self) -> CitationIndex | None:
+        """Get the citation index, or None when SQLite is unusable under reports_root."""
+        if not self._citation_index_opened:
+            self._citation_index = CitationIndex.open(self.reports_root / CITATION_INDEX_FILENAME)
+            self._citation_index_opened = True
+        return self._citation_index
+
+    def _index_citations(self, report_id: str, outline: Outline) -> None:
+        """Re-index a report's citations after its outline was saved (best effort)."""
+        citation_index = self.citation_index
+        if citation_index is None:
+            return
+        storage = self.global_storage.get_report_storage(report_id)
+        signature = outline_signature(storage.outline_path)
+        if signature is None:
+            return
+        try:
+            citation_index.index_report(report_id, outline, signature)
+        except sqlite3.Error as e:
+            # sync_citation_index() re-reads the outline once its signature mismatches.
+            logger.warning(f"Failed to index citations for report {report_id}: {e}")
+
+    def _unindex_citations(self, report_id: str) -> None:
+        citation_index = self.citation_index
+        if citation_index is None:
+            return
+        try:
+            citation_index.remove_reports([report_id])
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to drop citations for report {report_id}: {e}")
+
+    def sync_citation_index(self) -> CitationIndex | None:
+        """Bring the citation index in line with every indexed report.
+
+        Only outlines whose mtime, size or inode changed since they were indexed
+        (for example, edited by another process) are loaded; reports no longer in
+        the report index are dropped.
+
+        Returns:
+            The citation index, or None when it is unavailable (including when
+            SQLite fails during the sync, e.g. a locked or corrupt database)
+        """
+        citation_index = self.citation_index
+        if citation_index is None:
+            return None
+        try:
+            known = citation_index.signatures()
+            report_ids = {entry.report_id for entry in self.index.list_entries()}
+            for report_id in sorted(report_ids):
+                storage = self.global_storage.get_report_storage(report_id)
+                signature = outline_signature(storage.outline_path)
+                if signature is not None and signature == known.get(report_id):
+                    continue
+                try:
+                    outline = storage.load_outline()
+                except Exception as e:  # Broad catch required: one unreadable outline must not block the others
+                    logger.warning(f"Skipping citations of report {report_id}: {e}")
+                    report_ids.discard(report_id)
+                    continue
+                citation_index.index_report(report_id, outline, signature or "")
+            stale = known.keys() - report_ids
+            if stale:
+                citation_index.remove_reports(stale)
+        except sqlite3.Error as e:
+            logger.warning(f"Citation index unavailable, falling back to outline scans: {e}")
+            return None
+        return citation_index
+
     def _prepare_outline_for_render(self, outline: Outline) -> Outline:
         """Return a normalized copy of the outline with prose fields de-duplicated."""
         normalized = outline.model_copy(deep=True)
@@ -236,6 +309,7 @@ class ReportService:
             path=f"by_id/{report_id}",
         )
         self.index.add_entry(index_entry)
+        self._index_citations(index_entry.report_id, outline)
 
         return str(report_id)
 
@@ -389,6 +463,7 @@ class ReportService:
             path=f"by_id/{report_id}",
         )
         self.index.add_entry(index_entry)
+        self._index_citations(index_entry.report_id, outline)
 
     def resolve_report_selector(self, selector: str) -> str:
         """Resolve a report selector (ID or title) to a report ID.
@@ -488,28 +563,18 @@ class ReportService:
                     f"Only 'evolve' and 'update' actions can be reverted."
                 )
 
-            backup_path = storage.backups_dir / backup_filename
-            if not backup_path.exists():
+            try:
+                restored = storage.load_backup(backup_filename)
+            except FileNotFoundError as e:
                 raise ValueError(
                     f"Backup file missing: {backup_filename}. "
                     f"It may have been deleted or filesystem corruption occurred."
-                )
-
-            # Load backup to verify it's valid
-            try:
-                backup_data = json.loads(backup_path.read_text(encoding="utf-8"))
-                # Validate backup file structure
-                Outline(**backup_data)
+                ) from e
             except Exception as e:
                 raise ValueError(f"Backup file is corrupted: {e}") from e
 
-            # Create backup of current state before reverting
-            current_backup_filename = storage._create_backup()
-
-            # Restore backup atomically
-            import shutil
-
-            shutil.copy2(backup_path, storage.outline_path)
+            # Restore atomically; the current state is recorded as a new version first
+            current_backup_filename = storage._save_outline_atomic(restored)
 
             # Log revert audit event
             now = datetime.datetime.now(datetime.UTC).isoformat()
@@ -541,6 +606,7 @@ class ReportService:
                 path=f"by_id/{report_id}",
             )
             self.index.add_entry(index_entry)
+            self._index_citations(index_entry.report_id, outline)
 
         return {
             "success": True,
@@ -549,6 +615,22 @@ class ReportService:
             "backup_filename": backup_filename,
         }
 
+    def compact_report_versions(self, report_id: str, keep: int | None = None) -> dict[str, int]:
+        """Rewrite a report's full-copy backups as version manifests and apply retention.
+
+        Args:
+            report_id: Report identifier
+            keep: Newest versions to keep (default: IGLOO_MCP_REPORT_MAX_VERSIONS; 0 keeps all)
+
+        Returns:
+            Counts of converted and pruned versions, removed blobs, and bytes before/after
+        """
+        storage = self.global_storage.get_report_storage(report_id)
+        if keep is not None:
+            storage.versions.max_versions = max(keep, 0)
+        with storage.lock():
+            return storage.versions.compact()
+
     def validate_report(self, report_id: str) -> list[str]:
         """Validate a report's consistency.
 
@@ -652,6 +734,7 @@ class ReportService:
                 path=f"by_id/{report_id}",
             )
             self.index.add_entry(index_entry)
+            self._index_citations(index_entry.report_id, outline)
 
     def delete_report(self, report_id: str, actor: str = "cli") -> str:
         """Soft delete - move report to .trash directory.
@@ -687,6 +770,7 @@ class ReportService:
 
         # Remove from index
         self.index.remove_entry(report_id)
+        self._unindex_citations(report_id)
 
         # Log delete event in trash location
         trash_storage = ReportStorage(trash_location)
@@ -763,6 +847,7 @@ class ReportService:
                 path=f"by_id/{report_id}",
             )
             self.index.add_entry(index_entry)
+            self._index_citations(index_entry.report_id, outline)
 
     def fork_report(self, source_id: str, new_title: str, actor: str = "cli") -> str:
         """Fork an existing report to new ID.
@@ -840,6 +925,7 @@ class ReportService:
             path=f"by_id/{new_id}",
         )
         self.index.add_entry(index_entry)
+        self._index_citations(index_entry.report_id, outline)
 
         return str(new_id)
 
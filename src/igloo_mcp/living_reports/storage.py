@@ -27,6 +27,16 @@ If index.jsonl becomes inconsistent:
 2. Scans by_id/* directories
 3. Reconstructs index from outline.json files
 4. Audit logs remain intact for full history
+
+AUDIT LOG:
+audit.jsonl is append-only: each event is a single O_APPEND write through a
+shared AuditLogWriter (see audit_log.py), fsync'd according to
+IGLOO_MCP_AUDIT_DURABILITY instead of going through a temp file.
+
+BACKUPS:
+Each save records the previous outline in backups/ through OutlineVersionStore
+(see versions.py): a small manifest per version over content-addressed
+section/insight blobs shared between versions.
 """
 
 from __future__ import annotations
@@ -50,7 +60,9 @@ except ImportError:
 
 import logging
 
+from .audit_log import audit_log_writer
 from .models import AuditEvent, Outline
+from .versions import OutlineVersionStore
 
 logger = logging.getLogger(__name__)
 
@@ -160,6 +172,8 @@ class ReportStorage:
         self.audit_path = report_dir / "audit.jsonl"
         self.backups_dir = report_dir / "backups"
         self.lock_path = report_dir / ".lock"
+        self.versions = OutlineVersionStore(self.backups_dir)
+        self.audit_log = audit_log_writer(self.audit_path)
 
         # Create directories if they don't exist
         # Ensure report_dir exists first, then create backups subdirectory
@@ -285,7 +299,7 @@ class ReportStorage:
                 pass
 
     def _create_backup(self) -> str | None:
-        """Create timestamped backup of current outline.
+        """Record the current outline as a new version in the version store.
 
         Returns:
             Backup filename (e.g., 'outline.json.20231023T143022_123456.bak')
@@ -300,17 +314,35 @@ class ReportStorage:
         # Include microseconds to avoid filename collisions within the same second
         timestamp_clean = now.strftime("%Y%m%dT%H%M%S") + f"_{now.microsecond:06d}"
         backup_filename = f"outline.json.{timestamp_clean}.bak"
-        backup_path = self.backups_dir / backup_filename
 
         try:
-            import shutil
+            data = json.loads(self.outline_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+
+        try:
+            if isinstance(data, dict):
+                self.versions.write(backup_filename, data)
+            else:
+                # Not valid JSON (e.g. a broken manual edit): keep a verbatim copy.
+                import shutil
 
-            shutil.copy2(self.outline_path, backup_path)
+                shutil.copy2(self.outline_path, self.backups_dir / backup_filename)
             return backup_filename
         except Exception:
             # Best-effort backup - don't fail writes if backup fails
             return None
 
+    def load_backup(self, backup_filename: str) -> Outline:
+        """Rebuild the outline saved as ``backup_filename``.
+
+        Raises:
+            FileNotFoundError: If the backup does not exist
+            ValueError: If the backup is corrupted or not a valid outline
+        """
+        data = self.versions.read(backup_filename)
+        return Outline(**data)
+
     def append_audit_event(self, event: AuditEvent) -> None:
         """Append audit event to audit log.
 
@@ -320,43 +352,10 @@ class ReportStorage:
         Raises:
             StorageError: If append operation fails
         """
-        temp_path = self.audit_path.with_suffix(".tmp")
         try:
-            # Serialize event
-            data = event.model_dump()
-            line = json.dumps(data, ensure_ascii=False) + "\n"
-
-            # Write to temp file
-            with temp_path.open("a", encoding="utf-8") as f:
-                f.write(line)
-                f.flush()
-                os.fsync(f.fileno())
-
-            # Atomic rename
-            if self.audit_path.exists():
-                # Append to existing file
-                with temp_path.open("rb") as src, self.audit_path.open("ab") as dst:
-                    src.seek(0)
-                    dst.write(src.read())
-                    dst.flush()
-                    os.fsync(dst.fileno())
-                temp_path.unlink()
-            else:
-                temp_path.replace(self.audit_path)
-
-            # Best-effort directory sync; may not be available on all platforms
-            try:
-                dir_fd = os.open(str(self.report_dir), os.O_RDONLY)
-                try:
-                    os.fsync(dir_fd)
-                finally:
-                    os.close(dir_fd)
-            except (OSError, AttributeError):
-                pass
-
+            line = json.dumps(event.model_dump(), ensure_ascii=False) + "\n"
+            self.audit_log.append(line)
         except Exception as e:
-            with suppress(Exception):
-                temp_path.unlink(missing_ok=True)
             raise StorageError(f"Failed to append audit event: {e}") from e
 
     def load_audit_events(self) -> list[AuditEvent]:
@@ -439,38 +438,10 @@ class GlobalStorage:
         Args:
             entry: Index entry data
         """
-        temp_path = self.index_path.with_suffix(".tmp")
         try:
             line = json.dumps(entry, ensure_ascii=False) + "\n"
-
-            with temp_path.open("a", encoding="utf-8") as f:
-                f.write(line)
-                f.flush()
-                os.fsync(f.fileno())
-
-            if self.index_path.exists():
-                with temp_path.open("rb") as src, self.index_path.open("ab") as dst:
-                    src.seek(0)
-                    dst.write(src.read())
-                    dst.flush()
-                    os.fsync(dst.fileno())
-                temp_path.unlink()
-            else:
-                temp_path.replace(self.index_path)
-
-            # Best-effort directory sync for index durability
-            try:
-                dir_fd = os.open(str(self.index_path.parent), os.O_RDONLY)
-                try:
-                    os.fsync(dir_fd)
-                finally:
-                    os.close(dir_fd)
-            except (OSError, AttributeError):
-                pass
-
+            audit_log_writer(self.index_path).append(line)
         except Exception as e:
-            with suppress(Exception):
-                temp_path.unlink(missing_ok=True)
             raise StorageError(f"Failed to save index entry: {e}") from e
 
 
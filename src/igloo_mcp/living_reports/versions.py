@@ -0,0 +1,200 @@
+"""Content-addressed outline version store for report backups.
+
+Every outline save used to copy the whole ``outline.json`` into ``backups/``, so
+a report evolved hundreds of times kept hundreds of near-identical copies. A
+backup is now a small manifest (still ``backups/outline.json.<timestamp>.bak``,
+the name audit events reference) holding the outline with each section and
+insight replaced by the SHA-256 of its JSON. The section and insight bodies are
+stored once under ``backups/blobs/<xx>/<sha256>.json`` and shared by every
+version that contains them, so a save writes only the items that changed.
+
+Any version is rebuilt by reading its manifest and the blobs it names; blobs are
+verified against their hash on read. Older full-copy ``.bak`` files remain
+readable as-is, and ``compact()`` rewrites them as manifests. Retention is
+configurable: ``IGLOO_MCP_REPORT_MAX_VERSIONS`` keeps only the newest N
+versions per report (0, the default, keeps all), after which blobs no manifest
+references are deleted.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from igloo_mcp.env_utils import read_int_env
+
+FORMAT_KEY = "igloo_outline_version_format"
+FORMAT_VERSION = 1
+BLOBS_DIRNAME = "blobs"
+BACKUP_GLOB = "outline.json.*.bak"
+MAX_VERSIONS_ENV = "IGLOO_MCP_REPORT_MAX_VERSIONS"
+_BLOB_FIELDS = ("sections", "insights")
+
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(payload)
+        Path(tmp_name).replace(path)
+    finally:
+        with contextlib.suppress(OSError):
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+def is_manifest(data: Any) -> bool:
+    return isinstance(data, dict) and data.get(FORMAT_KEY) == FORMAT_VERSION
+
+
+class OutlineVersionStore:
+    """Outline versions of one report, stored as manifests over shared blobs."""
+
+    def __init__(self, backups_dir: Path, *, max_versions: int | None = None) -> None:
+        self.backups_dir = backups_dir
+        self.blobs_dir = backups_dir / BLOBS_DIRNAME
+        self.max_versions = read_int_env(MAX_VERSIONS_ENV, 0, minimum=0) if max_versions is None else max_versions
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blobs_dir / digest[:2] / f"{digest}.json"
+
+    def _put_blob(self, item: Any) -> str:
+        payload = json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self._blob_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(path, payload)
+        return digest
+
+    def _get_blob(self, digest: str) -> Any:
+        if not isinstance(digest, str) or len(digest) != 64:
+            raise ValueError(f"Invalid blob reference: {digest!r}")
+        try:
+            payload = self._blob_path(digest).read_bytes()
+        except FileNotFoundError as e:
+            raise ValueError(f"Missing outline blob {digest}") from e
+        if hashlib.sha256(payload).hexdigest() != digest:
+            raise ValueError(f"Outline blob {digest} does not match its hash")
+        return json.loads(payload)
+
+    def _manifest_bytes(self, data: dict[str, Any]) -> bytes:
+        skeleton = dict(data)
+        for field in _BLOB_FIELDS:
+            items = data.get(field)
+            if isinstance(items, list):
+                skeleton[field] = [self._put_blob(item) for item in items]
+        manifest = {FORMAT_KEY: FORMAT_VERSION, "outline": skeleton}
+        return json.dumps(manifest, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def write(self, filename: str, data: dict[str, Any]) -> None:
+        """Store outline ``data`` as version ``filename``, then apply retention."""
+        _atomic_write(self.backups_dir / filename, self._manifest_bytes(data))
+        if self.max_versions:
+            self.prune(keep=self.max_versions)
+
+    def read(self, filename: str) -> dict[str, Any]:
+        """Rebuild the outline data of version ``filename``.
+
+        Raises:
+            FileNotFoundError: If the version does not exist
+            ValueError: If the manifest or one of its blobs is unreadable
+        """
+        if Path(filename).name != filename:
+            raise FileNotFoundError(f"Invalid backup name: {filename}")
+        data = json.loads((self.backups_dir / filename).read_text(encoding="utf-8"))
+        if not is_manifest(data):
+            # Full-copy backup written before the version store.
+            if not isinstance(data, dict):
+                raise ValueError("Backup is not a JSON object")
+            return data
+        if not isinstance(data.get("outline"), dict):
+            raise ValueError("Backup manifest has no outline")
+        outline = dict(data["outline"])
+        for field in _BLOB_FIELDS:
+            digests = outline.get(field)
+            if isinstance(digests, list):
+                outline[field] = [self._get_blob(digest) for digest in digests]
+        return outline
+
+    def versions(self) -> list[Path]:
+        """Version files, oldest first (their names embed a sortable UTC timestamp)."""
+        if not self.backups_dir.exists():
+            return []
+        return sorted(path for path in self.backups_dir.glob(BACKUP_GLOB) if path.is_file())
+
+    def prune(self, keep: int) -> int:
+        """Delete all but the newest ``keep`` versions and any blobs left unreferenced."""
+        versions = self.versions()
+        expired = versions[: max(len(versions) - keep, 0)]
+        for path in expired:
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+        if expired:
+            self.collect_garbage()
+        return len(expired)
+
+    def collect_garbage(self) -> int:
+        """Delete blobs that no remaining manifest references."""
+        if not self.blobs_dir.exists():
+            return 0
+        referenced: set[str] = set()
+        for path in self.versions():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if is_manifest(data):
+                outline = data.get("outline") or {}
+                for field in _BLOB_FIELDS:
+                    referenced.update(digest for digest in outline.get(field) or [] if isinstance(digest, str))
+        removed = 0
+        for blob in self.blobs_dir.glob("*/*.json"):
+            if blob.stem not in referenced:
+                with contextlib.suppress(FileNotFoundError):
+                    blob.unlink()
+                    removed += 1
+        return removed
+
+    def size_bytes(self) -> int:
+        """Bytes used by all versions and blobs."""
+        files = [*self.versions(), *(self.blobs_dir.glob("*/*.json") if self.blobs_dir.exists() else [])]
+        total = 0
+        for path in files:
+            with contextlib.suppress(OSError):
+                total += path.stat().st_size
+        return total
+
+    def compact(self) -> dict[str, int]:
+        """Rewrite full-copy backups as manifests, apply retention and drop unused blobs."""
+        bytes_before = self.size_bytes()
+        converted = 0
+        for path in self.versions():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                stat = path.stat()
+            except (OSError, ValueError):
+                # Unreadable backups are kept untouched for manual inspection.
+                continue
+            if is_manifest(data) or not isinstance(data, dict):
+                continue
+            _atomic_write(path, self._manifest_bytes(data))
+            # Keep the backup's age so age-based health warnings stay meaningful.
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            converted += 1
+        pruned = self.prune(keep=self.max_versions) if self.max_versions else 0
+        blobs_removed = self.collect_garbage()
+        return {
+            "converted": converted,
+            "pruned": pruned,
+            "blobs_removed": blobs_removed,
+            "bytes_before": bytes_before,
+            "bytes_after": self.size_bytes(),
+        }
+
+
+__all__ = ["MAX_VERSIONS_ENV", "OutlineVersionStore"]
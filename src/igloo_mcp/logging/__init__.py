@@ -1,3 +1,4 @@
+from .history_store import HistoryStore
 from .query_history import (
     Insight,
     QueryHistory,
@@ -7,6 +8,7 @@ from .query_history import (
 )
 
 __all__ = [
+    "HistoryStore",
     "Insight",
     "QueryHistory",
     "normalize_insight",
@@ -0,0 +1,344 @@
+"""Indexed SQLite store over the query history JSONL log.
+
+``QueryHistory.record`` keeps appending one JSON object per line to the history
+file, which stays the compatibility format other tools read. This module
+maintains a SQLite database (WAL mode) next to it with indexes on
+``execution_id``, ``sql_sha256``, ``ts`` and ``status`` so lookups no longer scan
+the whole log.
+
+The database is an index, not a second source of truth: it records how many
+bytes of the JSONL file it has ingested (and the file's inode) and, before every
+read, imports only the lines appended since then. A rotated, truncated or
+removed log is re-imported from the start. The first open of an existing history
+imports it in full; deleting the database simply triggers a re-import.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+DB_SUFFIX = ".sqlite"
+_READ_CHUNK_BYTES = 4 * 1024 * 1024
+_MAX_SQL_PARAMS = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    execution_id TEXT,
+    sql_sha256 TEXT,
+    status TEXT,
+    ts REAL,
+    content_sha256 TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_history_execution_id ON history (execution_id);
+CREATE INDEX IF NOT EXISTS idx_history_sql_sha256 ON history (sql_sha256);
+CREATE INDEX IF NOT EXISTS idx_history_ts ON history (ts);
+CREATE INDEX IF NOT EXISTS idx_history_status ON history (status);
+"""
+
+
+def default_db_path(history_path: Path) -> Path:
+    """Database location for ``history_path`` (``doc.jsonl`` -> ``doc.sqlite``)."""
+    return history_path.with_suffix(DB_SUFFIX)
+
+
+def _text(value: Any) -> str | None:
+    return value if isinstance(value, str) and value else None
+
+
+def _number(value: Any) -> float | None:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def parse_record(line: bytes) -> dict[str, Any] | None:
+    """Decode one history line; blank, malformed and non-object lines yield None."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        payload = json.loads(line.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def read_appended_lines(path: Path, offset: int) -> Iterator[tuple[list[bytes], int]]:
+    """Yield batches of complete lines after byte ``offset`` with the offset just past them.
+
+    A final line without a newline is only consumed when it already parses as a
+    record; otherwise it may still be mid-write and is left for the next read.
+    """
+    pending = b""
+    with path.open("rb") as fh:
+        fh.seek(offset)
+        while True:
+            chunk = fh.read(_READ_CHUNK_BYTES)
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            offset += sum(len(line) + 1 for line in lines)
+            if not chunk and pending and parse_record(pending) is not None:
+                lines.append(pending)
+                offset += len(pending)
+            yield lines, offset
+            if not chunk:
+                return
+
+
+@dataclass(frozen=True)
+class TailPosition:
+    """How far a reader has consumed a history file, and which file (inode) it was."""
+
+    inode: int | None = None
+    offset: int = 0
+
+    def is_current(self, size: int, inode: int | None) -> bool:
+        return size == self.offset and (self.inode is None or inode == self.inode)
+
+    def was_replaced(self, size: int, inode: int | None) -> bool:
+        """True when the file shrank or a different file now lives at the path."""
+        return size < self.offset or (self.inode is not None and inode != self.inode)
+
+
+class HistoryStore:
+    """Thread-safe SQLite index over one history JSONL file."""
+
+    def __init__(self, history_path: Path, *, db_path: Path | None = None) -> None:
+        self._history_path = history_path
+        self._db_path = db_path or default_db_path(history_path)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(self._db_path),
+            timeout=10.0,
+            check_same_thread=False,
+            isolation_level=None,  # explicit BEGIN/COMMIT below
+        )
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            version = self._meta("schema_version")
+            if version is not None and int(version) != SCHEMA_VERSION:
+                self._reset()
+            self._set_meta("schema_version", str(SCHEMA_VERSION))
+        except Exception:
+            self._conn.close()
+            raise
+
+    @classmethod
+    def open(cls, history_path: Path, *, db_path: Path | None = None) -> HistoryStore | None:
+        """Open the store, or return None when SQLite is unusable at that location."""
+        try:
+            return cls(history_path, db_path=db_path)
+        except (sqlite3.Error, OSError, ValueError) as exc:
+            logger.warning("Query history index unavailable for %s: %s", history_path, exc)
+            return None
+
+    @property
+    def history_path(self) -> Path:
+        return self._history_path
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _meta(self, key: str) -> str | None:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def _reset(self) -> None:
+        self._conn.execute("DELETE FROM history")
+        self._conn.execute("DELETE FROM meta WHERE key IN ('jsonl_offset', 'jsonl_inode')")
+
+    def _position(self) -> TailPosition:
+        inode = self._meta("jsonl_inode")
+        return TailPosition(
+            inode=int(inode) if inode is not None else None,
+            offset=int(self._meta("jsonl_offset") or 0),
+        )
+
+    def sync(self) -> int:
+        """Import lines appended to the JSONL file since the last sync; returns the count."""
+        with self._lock:
+            try:
+                stat = self._history_path.stat()
+                size, inode = stat.st_size, stat.st_ino
+            except FileNotFoundError:
+                size, inode = 0, None
+            except OSError as exc:
+                logger.debug("Cannot stat history file %s: %s", self._history_path, exc)
+                return 0
+
+            if self._position().is_current(size, inode):
+                return 0
+
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Re-read inside the write transaction: another process may have synced.
+                position = self._position()
+                if position.is_current(size, inode):
+                    self._conn.execute("COMMIT")
+                    return 0
+                if position.was_replaced(size, inode):
+                    # The log was rotated, truncated or removed; rebuild from the start.
+                    self._reset()
+                    position = TailPosition(inode=inode, offset=0)
+                imported, offset = self._ingest_from(position.offset) if size else (0, 0)
+                self._set_meta("jsonl_offset", str(offset))
+                if inode is not None:
+                    self._set_meta("jsonl_inode", str(inode))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return imported
+
+    def _ingest_from(self, start: int) -> tuple[int, int]:
+        """Insert complete records starting at byte ``start``; returns (count, new offset)."""
+        imported, offset = 0, start
+        for lines, offset in read_appended_lines(self._history_path, start):  # noqa: B007
+            rows = [row for row in map(self._row, lines) if row is not None]
+            self._conn.executemany(
+                "INSERT INTO history (execution_id, sql_sha256, status, ts, content_sha256, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            imported += len(rows)
+        return imported, offset
+
+    @staticmethod
+    def _row(line: bytes) -> tuple[Any, ...] | None:
+        record = parse_record(line)
+        if record is None:
+            return None
+        return (
+            _text(record.get("execution_id")),
+            _text(record.get("sql_sha256")),
+            _text(record.get("status")),
+            _number(record.get("ts")),
+            _text(record.get("content_sha256")),
+            line.decode("utf-8").strip(),
+        )
+
+    def find(
+        self,
+        *,
+        execution_id: str | None = None,
+        sql_sha256: str | None = None,
+        status: str | Iterable[str] | None = None,
+        content_sha256: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        newest_first: bool = True,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return matching records (after syncing), newest first by default."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in (
+            ("execution_id", execution_id),
+            ("sql_sha256", sql_sha256),
+            ("content_sha256", content_sha256),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if status is not None:
+            statuses = [status] if isinstance(status, str) else list(status)
+            clauses.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            params.extend(statuses)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(until)
+
+        sql = "SELECT payload FROM history"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY id DESC" if newest_first else " ORDER BY id ASC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        self.sync()
+        with self._lock:
+            payloads = [row[0] for row in self._conn.execute(sql, params)]
+        return [json.loads(payload) for payload in payloads]
+
+    def first(self, **filters: Any) -> dict[str, Any] | None:
+        records = self.find(newest_first=False, limit=1, **filters)
+        return records[0] if records else None
+
+    def latest(self, **filters: Any) -> dict[str, Any] | None:
+        records = self.find(newest_first=True, limit=1, **filters)
+        return records[0] if records else None
+
+    def first_by_execution_id(self, execution_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Map each known id in ``execution_ids`` to its earliest record in one pass."""
+        ids = list(dict.fromkeys(execution_ids))
+        found: dict[str, dict[str, Any]] = {}
+        self.sync()
+        with self._lock:
+            for start in range(0, len(ids), _MAX_SQL_PARAMS):
+                batch = ids[start : start + _MAX_SQL_PARAMS]
+                placeholders = ", ".join("?" for _ in batch)
+                query = f"""
+                    SELECT execution_id, payload FROM history WHERE id IN (
+                        SELECT MIN(id) FROM history WHERE execution_id IN ({placeholders}) GROUP BY execution_id
+                    )
+                """  # noqa: S608 - only "?" placeholders are interpolated
+                rows = self._conn.execute(query, batch)
+                for execution_id, payload in rows:
+                    found[execution_id] = json.loads(payload)
+        return found
+
+    def count(self) -> int:
+        self.sync()
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM history").fetchone()[0])
+
+    def export_jsonl(self, destination: Path) -> int:
+        """Write every indexed record to ``destination`` as JSONL; returns the count."""
+        self.sync()
+        written = 0
+        tmp_path = destination.with_name(destination.name + ".tmp")
+        try:
+            with self._lock, tmp_path.open("w", encoding="utf-8") as fh:
+                for (payload,) in self._conn.execute("SELECT payload FROM history ORDER BY id ASC"):
+                    fh.write(payload)
+                    fh.write("\n")
+                    written += 1
+            tmp_path.replace(destination)
+        finally:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+        return written
@@ -5,12 +5,16 @@ import hashlib
 import json
 import logging
 import os
+import sqlite3
+from collections import OrderedDict
 from collections.abc import Iterable
 from datetime import UTC
 from pathlib import Path
 from threading import Lock
 from typing import Any, ClassVar, TypedDict, cast
 
+from igloo_mcp.background_io import GroupCommitter, flush_group_commits
+from igloo_mcp.env_utils import read_choice_env, read_int_env
 from igloo_mcp.path_utils import (
     DEFAULT_HISTORY_PATH,
     apply_namespacing,
@@ -19,8 +23,21 @@ from igloo_mcp.path_utils import (
     resolve_history_path,
 )
 
+from .history_store import HistoryStore
+
 logger = logging.getLogger(__name__)
 
+HISTORY_DURABILITY_ENV = "IGLOO_MCP_HISTORY_DURABILITY"
+HISTORY_FLUSH_INTERVAL_ENV = "IGLOO_MCP_HISTORY_FLUSH_INTERVAL_MS"
+HISTORY_FLUSH_SIZE_ENV = "IGLOO_MCP_HISTORY_FLUSH_SIZE"
+# immediate: written before record() returns; fsync: also fsync'd; batched: group-committed in the background.
+HISTORY_DURABILITY_LEVELS = ("immediate", "fsync", "batched")
+DEFAULT_HISTORY_DURABILITY = "immediate"
+DEFAULT_HISTORY_FLUSH_INTERVAL_MS = 200
+DEFAULT_HISTORY_FLUSH_SIZE = 64
+# (execution_id, content_sha256) pairs remembered for insight dedupe.
+INSIGHT_DEDUPE_CACHE_SIZE = 10_000
+
 
 class Insight(TypedDict, total=False):
     """Normalized insight structure for post-query analysis."""
@@ -90,7 +107,16 @@ class QueryHistory:
     """Lightweight JSONL history writer for queries.
 
     Enabled when IGLOO_MCP_QUERY_HISTORY is set to a writable file path.
-    Writes one JSON object per line with minimal fields for auditing.
+    Writes one JSON object per line with minimal fields for auditing. Lookups
+    (``get``/``find`` and insight dedupe) go through a SQLite index kept next to
+    the file (see :mod:`igloo_mcp.logging.history_store`).
+
+    Appends are group-committed: lines recorded while another thread is writing
+    are buffered and written together with one open/write. ``durability``
+    decides when ``record`` returns: ``immediate`` once the line is written,
+    ``fsync`` once it is also fsync'd, and ``batched`` right away, leaving a
+    background thread to commit every ``flush_interval_seconds`` or
+    ``flush_size`` lines (and on :meth:`flush`, lookups and interpreter exit).
     """
 
     _DISABLE_SENTINELS: ClassVar[set[str]] = {"", "disabled", "off", "false", "0"}
@@ -101,12 +127,28 @@ class QueryHistory:
         *,
         fallbacks: Iterable[Path] | None = None,
         disabled: bool = False,
+        durability: str = DEFAULT_HISTORY_DURABILITY,
+        flush_interval_seconds: float = DEFAULT_HISTORY_FLUSH_INTERVAL_MS / 1000,
+        flush_size: int = DEFAULT_HISTORY_FLUSH_SIZE,
     ) -> None:
         self._path: Path | None = None
         self._lock = Lock()
         self._enabled = False
         self._disabled = disabled
         self._warnings: list[str] = []
+        self._store: HistoryStore | None = None
+        self._store_unavailable = False
+        self._durability = durability if durability in HISTORY_DURABILITY_LEVELS else DEFAULT_HISTORY_DURABILITY
+        self._flush_interval_seconds = max(0.0, flush_interval_seconds)
+        self._flush_size = max(1, flush_size)
+        self._committer: GroupCommitter[str] = GroupCommitter(
+            "history",
+            self._write_lines,
+            deferred=self._durability == "batched",
+            flush_interval_seconds=self._flush_interval_seconds,
+            flush_size=self._flush_size,
+        )
+        self._insights_seen: OrderedDict[tuple[str, str], None] = OrderedDict()
 
         if self._disabled:
             return
@@ -160,6 +202,15 @@ class QueryHistory:
         if disabled:
             return cls(None, disabled=True)
 
+        commit_settings: dict[str, Any] = {
+            "durability": read_choice_env(
+                HISTORY_DURABILITY_ENV, HISTORY_DURABILITY_LEVELS, DEFAULT_HISTORY_DURABILITY
+            ),
+            "flush_interval_seconds": read_int_env(HISTORY_FLUSH_INTERVAL_ENV, DEFAULT_HISTORY_FLUSH_INTERVAL_MS)
+            / 1000,
+            "flush_size": read_int_env(HISTORY_FLUSH_SIZE_ENV, DEFAULT_HISTORY_FLUSH_SIZE),
+        }
+
         def _fallback_candidates() -> list[Path]:
             candidates: list[Path] = []
             try:
@@ -189,11 +240,11 @@ class QueryHistory:
                 return cls(None, disabled=False)
             primary = fallbacks[0]
             remaining = [candidate for candidate in fallbacks[1:] if candidate != primary]
-            return cls(primary, fallbacks=remaining or None)
+            return cls(primary, fallbacks=remaining or None, **commit_settings)
 
         path = path.resolve()
         remaining_fallbacks = [candidate for candidate in fallbacks if candidate != path]
-        return cls(path, fallbacks=remaining_fallbacks or None)
+        return cls(path, fallbacks=remaining_fallbacks or None, **commit_settings)
 
     @property
     def enabled(self) -> bool:
@@ -207,11 +258,90 @@ class QueryHistory:
     def disabled(self) -> bool:
         return self._disabled
 
+    @property
+    def durability(self) -> str:
+        return self._durability
+
     def pop_warnings(self) -> list[str]:
         warnings = list(self._warnings)
         self._warnings.clear()
         return warnings
 
+    def _history_store(self) -> HistoryStore | None:
+        if self._path is None or self._disabled or self._store_unavailable:
+            return None
+        with self._lock:
+            if self._store is None:
+                self._store = HistoryStore.open(self._path)
+                self._store_unavailable = self._store is None
+            return self._store
+
+    def find(self, **filters: Any) -> list[dict[str, Any]]:
+        """Query the history index; see :meth:`HistoryStore.find` for filters.
+
+        Returns an empty list when history is disabled or the index is unavailable.
+        """
+        store = self._history_store()
+        if store is None:
+            return []
+        self.flush()
+        try:
+            return store.find(**filters)
+        except sqlite3.Error as exc:
+            logger.warning("Query history index lookup failed: %s", exc)
+            return []
+
+    def get(self, execution_id: str) -> dict[str, Any] | None:
+        """Return the most recent history record for ``execution_id``."""
+        records = self.find(execution_id=execution_id, limit=1)
+        return records[0] if records else None
+
+    def _insight_recorded(self, execution_id: str, content_sha256: str) -> bool | None:
+        """Indexed dedupe check; None means the caller must scan the file instead."""
+        store = self._history_store()
+        if store is None:
+            return None
+        self.flush()
+        try:
+            match = store.first(
+                execution_id=execution_id,
+                status="insight_recorded",
+                content_sha256=content_sha256,
+            )
+        except sqlite3.Error as exc:
+            logger.debug("Query history index lookup failed during dedup check: %s", exc)
+            return None
+        return match is not None
+
+    def export_jsonl(self, destination: Path) -> int:
+        """Write all indexed history records to ``destination`` as JSONL."""
+        store = self._history_store()
+        if store is None:
+            return 0
+        self.flush()
+        return store.export_jsonl(destination)
+
+    def _write_lines(self, lines: list[str]) -> None:
+        if self._path is None:
+            return
+        try:
+            with self._path.open("a", encoding="utf-8") as fh:
+                fh.write("".join(f"{line}\n" for line in lines))
+                if self._durability == "fsync":
+                    fh.flush()
+                    os.fsync(fh.fileno())
+        except Exception:
+            warning = f"Failed to append {len(lines)} query history entries to {self._path}"
+            self._warnings.append(warning)
+            logger.warning(warning, exc_info=True)
+
+    def _append_line(self, line: str) -> None:
+        self._committer.submit(line)
+
+    def flush(self) -> None:
+        """Write any buffered history lines now."""
+        self._committer.flush()
+
     def record(self, payload: dict[str, Any]) -> None:
         """Record a query execution to the JSONL history file.
 
@@ -240,15 +370,7 @@ class QueryHistory:
                 ensure_ascii=False,
             )
 
-        with self._lock:
-            try:
-                with self._path.open("a", encoding="utf-8") as fh:
-                    fh.write(line)
-                    fh.write("\n")
-            except Exception:
-                warning = f"Failed to append query history entry to {self._path}"
-                self._warnings.append(warning)
-                logger.warning(warning, exc_info=True)
+        self._append_line(line)
 
     def record_insight(
         self,
@@ -283,8 +405,14 @@ class QueryHistory:
         content_sha256 = hashlib.sha256(content_json.encode("utf-8")).hexdigest()
 
         # Check for duplicate (execution_id, content_sha256)
-        deduped = False
-        if self._path.exists():
+        dedupe_key = (execution_id, content_sha256)
+        with self._lock:
+            deduped: bool | None = True if dedupe_key in self._insights_seen else None
+        if deduped is None:
+            deduped = self._insight_recorded(execution_id, content_sha256)
+        if deduped is None and self._path.exists():
+            # Index unavailable: fall back to scanning the JSONL file.
+            deduped = False
             try:
                 with self._path.open("r", encoding="utf-8") as fh:
                     for line in fh:
@@ -307,6 +435,8 @@ class QueryHistory:
             except (OSError, ValueError) as e:
                 # Best effort - if history file is corrupt, continue anyway
                 logger.debug(f"Error reading history during dedup check: {e}")
+        deduped = bool(deduped)
+        self._remember_insight(dedupe_key)
 
         if not deduped:
             # Append new history entry
@@ -335,15 +465,7 @@ class QueryHistory:
                 }
                 line = json.dumps(payload_fallback, ensure_ascii=False)
 
-            with self._lock:
-                try:
-                    with self._path.open("a", encoding="utf-8") as fh:
-                        fh.write(line)
-                        fh.write("\n")
-                except Exception:
-                    warning = f"Failed to append insight record to {self._path}"
-                    self._warnings.append(warning)
-                    logger.warning(warning, exc_info=True)
+            self._append_line(line)
 
         return {
             "execution_id": execution_id,
@@ -351,6 +473,18 @@ class QueryHistory:
             "content_sha256": content_sha256,
         }
 
+    def _remember_insight(self, key: tuple[str, str]) -> None:
+        with self._lock:
+            self._insights_seen[key] = None
+            self._insights_seen.move_to_end(key)
+            while len(self._insights_seen) > INSIGHT_DEDUPE_CACHE_SIZE:
+                self._insights_seen.popitem(last=False)
+
+
+def flush_query_histories() -> None:
+    """Commit lines still buffered by ``batched`` histories in this process."""
+    flush_group_commits()
+
 
 def update_cache_manifest_insight(manifest_path: Path, post_query_insight: str | dict[str, Any]) -> bool:
     """Atomically update cache manifest with post_query_insight.
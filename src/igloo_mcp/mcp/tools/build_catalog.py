@@ -92,6 +92,7 @@ class BuildCatalogTool(MCPTool):
         account: bool = False,
         format: str = "json",
         include_ddl: bool = True,
+        mode: str = "full",
         timeout_seconds: int | str | None = None,
         request_id: str | None = None,
         **kwargs: Any,
@@ -117,6 +118,7 @@ class BuildCatalogTool(MCPTool):
             account: Include entire account (default: False)
             format: Output format - 'json' or 'jsonl' (default: json)
             include_ddl: Include object DDL in catalog (default: True)
+            mode: 'full' rebuild (default) or 'incremental' refresh of objects changed since the last build
             timeout_seconds: Optional timeout for catalog build. Uses env/default fallback when omitted.
             request_id: Optional request correlation ID for tracing (auto-generated if not provided)
 
@@ -134,6 +136,12 @@ class BuildCatalogTool(MCPTool):
                 validation_errors=[f"Invalid format: {format}"],
                 hints=["Use format='json' or format='jsonl'"],
             )
+        if mode not in ("full", "incremental"):
+            raise MCPValidationError(
+                f"Invalid mode '{mode}'. Must be 'full' or 'incremental'",
+                validation_errors=[f"Invalid mode: {mode}"],
+                hints=["Use mode='incremental' to refresh only objects changed since the last build"],
+            )
 
         # Timing and request correlation
         start_time = time.time()
@@ -222,6 +230,7 @@ class BuildCatalogTool(MCPTool):
                         account_scope=account,
                         output_format=format,
                         include_ddl=include_ddl,
+                        mode=mode,
                         max_ddl_concurrency=MAX_DDL_CONCURRENCY,
                         catalog_concurrency=CATALOG_CONCURRENCY,
                         export_sql=False,
@@ -247,6 +256,18 @@ class BuildCatalogTool(MCPTool):
         # Log the actual resolved path for unified storage
         resolved_output_dir = result.output_dir
 
+        query_errors = getattr(result, "errors", None)
+        if isinstance(query_errors, dict):
+            for object_type, message in query_errors.items():
+                warnings.append(
+                    {
+                        "code": "CATALOG_QUERY_FAILED",
+                        "severity": "warning",
+                        "message": f"Catalog {object_type} query failed; {object_type} are missing: {message}",
+                        "object_type": object_type,
+                    }
+                )
+
         # Calculate total duration
         total_duration = (time.time() - start_time) * 1000
 
@@ -281,6 +302,7 @@ class BuildCatalogTool(MCPTool):
             "database": database or "current",
             "account_scope": account,
             "format": format,
+            "refresh": _refresh_details(result),
             "timeout": {
                 "seconds": effective_timeout_seconds,
                 "source": timeout_source,
@@ -334,6 +356,18 @@ class BuildCatalogTool(MCPTool):
                     ),
                     "title": "Output Format",
                 },
+                "mode": {
+                    **enum_schema(
+                        "'full' rebuilds the catalog. 'incremental' refreshes a per-database catalog from its "
+                        "previous build, re-fetching only objects whose LAST_ALTERED/LAST_DDL changed (plus new "
+                        "and dropped ones); it falls back to a full build when no usable previous build exists "
+                        "or the delta is large.",
+                        values=["full", "incremental"],
+                        default="full",
+                        examples=["incremental"],
+                    ),
+                    "title": "Build Mode",
+                },
                 "include_ddl": boolean_schema(
                     "Include object DDL (CREATE statements) in catalog artifacts.",
                     default=True,
@@ -385,6 +419,21 @@ class BuildCatalogTool(MCPTool):
         }
 
 
+def _refresh_details(result: Any) -> dict[str, Any]:
+    """Summarize how the catalog was refreshed (full rebuild or incremental merge)."""
+    mode = getattr(result, "refresh_mode", "full")
+    if not isinstance(mode, str):
+        return {"mode": "full"}
+    details: dict[str, Any] = {"mode": mode}
+    reason = getattr(result, "refresh_reason", None)
+    if isinstance(reason, str):
+        details["fallback_reason"] = reason
+    if mode == "incremental":
+        details["changed_objects"] = result.changed_objects
+        details["dropped_objects"] = result.dropped_objects
+    return details
+
+
 def _coerce_positive_timeout(value: int | str) -> int:
     if isinstance(value, bool):
         raise MCPValidationError(
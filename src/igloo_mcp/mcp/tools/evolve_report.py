@@ -570,7 +570,7 @@ class EvolveReportTool(MCPTool):
 
             # Auto-refresh index after successful changes to ensure consistency
             if getattr(self.report_service, "index", None):
-                self.report_service.index.rebuild_from_filesystem()
+                self.report_service.index.refresh()
 
             storage_duration = (time.time() - storage_start) * 1000
             total_duration = (time.time() - start_time) * 1000
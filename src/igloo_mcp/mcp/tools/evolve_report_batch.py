@@ -377,7 +377,7 @@ class EvolveReportBatchTool(MCPTool):
         # Resolve report selector
         try:
             if getattr(self.report_service, "index", None):
-                self.report_service.index.rebuild_from_filesystem()
+                self.report_service.index.refresh()
 
             if hasattr(self.report_service, "resolve_report_selector"):
                 report_id = self.report_service.resolve_report_selector(report_selector)
@@ -5,7 +5,7 @@ Part of v1.8.0 Phase 2.2 - extracted from mcp_server.py.
 
 from __future__ import annotations
 
-import csv
+import functools
 import hashlib
 import json
 import os
@@ -19,10 +19,18 @@ from typing import Any
 
 import anyio
 
+from igloo_mcp.arrow_fetch import (
+    CollectedRows,
+    arrow_batches,
+    collect_arrow_batches,
+    export_arrow_batches,
+    fetch_engine_from_env,
+)
 from igloo_mcp.auth import (
     AuthProviderReliability,
     get_service_provider_spec,
 )
+from igloo_mcp.background_io import BackgroundWriter, background_writes_enabled, loop_lag_monitor, run_io
 from igloo_mcp.cache import QueryResultCache
 from igloo_mcp.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 from igloo_mcp.config import Config
@@ -38,6 +46,7 @@ from igloo_mcp.constants import (
     RESULT_TRUNCATION_THRESHOLD,
     STATEMENT_PREVIEW_LENGTH,
 )
+from igloo_mcp.env_utils import read_int_env
 from igloo_mcp.logging import (
     Insight,
     QueryHistory,
@@ -56,15 +65,20 @@ from igloo_mcp.path_utils import (
     resolve_artifact_root,
 )
 from igloo_mcp.post_query_insights import build_default_insights
+from igloo_mcp.query_export import QueryExportError, QueryExportWriter, infer_export_columns
+from igloo_mcp.result_store import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, PAGED_FORMAT, ResultStore, encode_token
 from igloo_mcp.service_layer import QueryService
 from igloo_mcp.session_utils import (
+    SessionStateRegistry,
     apply_session_context,
-    ensure_session_lock,
+    get_session_registry,
     restore_session_context,
+    session_guard,
     snapshot_session,
+    statement_may_change_session,
 )
-from igloo_mcp.sql_objects import extract_query_objects
-from igloo_mcp.sql_validation import validate_sql_statement
+from igloo_mcp.single_flight import FlightOutcome, SingleFlight
+from igloo_mcp.sql_analysis import analyze_statement
 
 from .base import MCPTool, tool_error_handler
 from .schema_utils import (
@@ -150,16 +164,25 @@ RESULT_MODE_SCHEMA_ONLY = "schema_only"
 RESULT_MODE_SAMPLE = "sample"
 RESULT_MODE_SAMPLE_SIZE = 10  # Default sample size for 'sample' mode
 RESULT_MODE_SUMMARY_SAMPLE_SIZE = 5  # Sample size for 'summary' mode
+# Rows an inline response can show per mode; cache hits only decode this many.
+RESULT_MODE_ROW_LIMITS = {
+    RESULT_MODE_MINIMAL: 0,
+    RESULT_MODE_SCHEMA_ONLY: 0,
+    RESULT_MODE_SUMMARY: RESULT_MODE_SUMMARY_SAMPLE_SIZE,
+    RESULT_MODE_SAMPLE: RESULT_MODE_SAMPLE_SIZE,
+}
 
 OUTPUT_FORMAT_INLINE = "inline"
 OUTPUT_FORMAT_CSV = "csv"
 OUTPUT_FORMAT_JSON = "json"
 OUTPUT_FORMAT_JSONL = "jsonl"
+OUTPUT_FORMAT_PAGED = PAGED_FORMAT
 SUPPORTED_OUTPUT_FORMATS = (
     OUTPUT_FORMAT_INLINE,
     OUTPUT_FORMAT_CSV,
     OUTPUT_FORMAT_JSON,
     OUTPUT_FORMAT_JSONL,
+    OUTPUT_FORMAT_PAGED,
 )
 
 QUERY_CIRCUIT_BREAKER_ENABLED_ENV = "IGLOO_MCP_CIRCUIT_BREAKER_ENABLED"
@@ -171,10 +194,12 @@ QUERY_RETRY_INITIAL_BACKOFF_ENV = "IGLOO_MCP_QUERY_RETRY_INITIAL_BACKOFF_SECONDS
 QUERY_RETRY_BACKOFF_MULTIPLIER_ENV = "IGLOO_MCP_QUERY_RETRY_BACKOFF_MULTIPLIER"
 QUERY_RETRY_MAX_BACKOFF_ENV = "IGLOO_MCP_QUERY_RETRY_MAX_BACKOFF_SECONDS"
 QUERY_CANCEL_GRACE_SECONDS_ENV = "IGLOO_MCP_QUERY_CANCEL_GRACE_SECONDS"
+QUERY_COALESCING_ENV = "IGLOO_MCP_QUERY_COALESCING"
 
 DEFAULT_QUERY_CIRCUIT_BREAKER_ENABLED = True
 DEFAULT_QUERY_CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
 DEFAULT_QUERY_CIRCUIT_BREAKER_RECOVERY_TIMEOUT_SECONDS = 60.0
+DEFAULT_QUERY_COALESCING_ENABLED = True
 
 CONNECTIVITY_ERROR_CLASS_NAMES = {"connectionerror", "interfaceerror", "operationalerror"}
 CONNECTIVITY_ERROR_KEYWORDS = (
@@ -208,6 +233,8 @@ NON_CONNECTIVITY_ERROR_KEYWORDS = (
     "invalid argument",
 )
 RETRY_SAFE_STATEMENT_TYPES = frozenset({"select", "show", "describe", "use"})
+# USE changes the session it runs on, so every caller has to issue its own.
+COALESCIBLE_STATEMENT_TYPES = frozenset({"select", "show", "describe"})
 
 
 @dataclass(frozen=True)
@@ -236,12 +263,35 @@ def _build_hint(rowcount: int, sample_size: int) -> str | None:
     return f"Showing first {sample_size} of {rowcount} rows. Use response_mode='full' to retrieve all rows"
 
 
-def _estimate_response_tokens(payload: Any) -> int:
+def _export_failed_error(output_format: str, exc: Exception) -> MCPExecutionError:
+    return MCPExecutionError(
+        f"Failed to export query results as {output_format}",
+        error_code="EXPORT_FAILED",
+        operation="execute_query",
+        original_error=exc,
+        hints=[
+            "Verify artifact root permissions and disk space",
+            "Use output_format='inline' to avoid file output",
+        ],
+    )
+
+
+def _estimate_response_tokens(payload: Any, *, rows_bytes: int | None = None) -> int:
+    """Approximate tokens (~4 bytes each) of ``payload`` serialized as JSON.
+
+    ``rows_bytes`` is the serialized size of ``payload["rows"]`` when it is already
+    known (sampled while fetching, recorded in the cache manifest, or the size of a
+    streamed export); the rows are then accounted for without serializing them.
+    """
+    extra_bytes = 0
+    if rows_bytes is not None and isinstance(payload, dict) and "rows" in payload:
+        payload = {key: value for key, value in payload.items() if key != "rows"}
+        extra_bytes = len(', "rows": ') + max(0, rows_bytes)
     try:
         body = json.dumps(payload, ensure_ascii=False, default=str)
     except (TypeError, ValueError):
         body = str(payload)
-    return max(1, (len(body) + 3) // 4)
+    return max(1, (len(body) + extra_bytes + 3) // 4)
 
 
 def _compact_cache_metadata(result: dict[str, Any]) -> None:
@@ -285,21 +335,6 @@ def _read_bool_env(name: str, default: bool) -> bool:
     return default
 
 
-def _read_int_env(name: str, default: int, *, minimum: int = 1) -> int:
-    raw = os.environ.get(name)
-    if raw is None:
-        return default
-    try:
-        parsed = int(raw)
-    except (TypeError, ValueError):
-        logger.warning(f"Invalid integer value for {name}: {raw!r}. Using default {default}.")
-        return default
-    if parsed < minimum:
-        logger.warning(f"{name} must be >= {minimum}; got {parsed}. Using default {default}.")
-        return default
-    return parsed
-
-
 def _read_float_env(name: str, default: float, *, minimum: float = 0.0) -> float:
     raw = os.environ.get(name)
     if raw is None:
@@ -540,6 +575,8 @@ class ExecuteQueryTool(MCPTool):
         self._cache_enabled = self.cache.enabled
         self._cache_mode = self.cache.mode
         self._static_audit_warnings.extend(self.cache.pop_warnings())
+        # Spilled results for output_format='paged', read back by fetch_query_page.
+        self.result_store = ResultStore.from_env(artifact_root=self._artifact_root)
         # Avoid global cache bleed-through when no explicit cache settings are provided
         if not os.environ.get("IGLOO_MCP_CACHE_MODE") and not os.environ.get("IGLOO_MCP_CACHE_ROOT"):
             self._cache_enabled = False
@@ -551,6 +588,14 @@ class ExecuteQueryTool(MCPTool):
             minimum=0.0,
         )
         self._query_circuit_breaker = self._init_query_circuit_breaker()
+        self._fetch_engine = fetch_engine_from_env()
+        # Opt-in: cache stores and history appends are queued instead of awaited.
+        self._background_writes = background_writes_enabled()
+        self._history_writer = BackgroundWriter("history")
+        self._cache_writer = BackgroundWriter("cache")
+        # Identical concurrent read-only queries share one Snowflake execution.
+        self._coalescing_enabled = _read_bool_env(QUERY_COALESCING_ENV, DEFAULT_QUERY_COALESCING_ENABLED)
+        self._query_flights: SingleFlight[str, dict[str, Any]] = SingleFlight()
 
     @property
     def name(self) -> str:
@@ -592,7 +637,7 @@ class ExecuteQueryTool(MCPTool):
         if not enabled:
             return None
 
-        failure_threshold = _read_int_env(
+        failure_threshold = read_int_env(
             QUERY_CIRCUIT_BREAKER_FAILURE_THRESHOLD_ENV,
             self._provider_reliability.circuit_breaker_failure_threshold
             or DEFAULT_QUERY_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
@@ -618,7 +663,7 @@ class ExecuteQueryTool(MCPTool):
         default_max_attempts = max(1, int(provider_reliability.retry_attempts))
         default_retry_enabled = capabilities.supports_retry_handling and default_max_attempts > 1
         retry_enabled = _read_bool_env(QUERY_RETRY_ENABLED_ENV, default_retry_enabled)
-        max_attempts = _read_int_env(
+        max_attempts = read_int_env(
             QUERY_RETRY_MAX_ATTEMPTS_ENV,
             default_max_attempts,
             minimum=1,
@@ -667,6 +712,23 @@ class ExecuteQueryTool(MCPTool):
         delay = base * (self._retry_policy.backoff_multiplier**exponent)
         return min(self._retry_policy.max_backoff_seconds, delay)
 
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Expose query result cache and in-flight coalescing counters for diagnostics."""
+        stats = self.cache.stats()
+        stats["coalescing"] = {"enabled": self._coalescing_enabled, **self._query_flights.stats()}
+        return stats
+
+    def get_io_stats(self) -> dict[str, Any]:
+        """Expose event-loop lag and background write queues for diagnostics."""
+        return {
+            "background_writes": self._background_writes,
+            "event_loop_lag": loop_lag_monitor.stats(),
+            "writers": {
+                "history": self._history_writer.stats(),
+                "cache": self._cache_writer.stats(),
+            },
+        }
+
     def get_circuit_breaker_status(self) -> dict[str, Any]:
         """Expose execute_query circuit breaker status for diagnostics."""
         if self._query_circuit_breaker is None:
@@ -797,6 +859,19 @@ class ExecuteQueryTool(MCPTool):
         canonical = (statement_type or "").replace("_", "").strip().lower()
         return canonical in RETRY_SAFE_STATEMENT_TYPES
 
+    @staticmethod
+    def _is_coalescible_statement_type(statement_type: str | None) -> bool:
+        canonical = (statement_type or "").replace("_", "").strip().lower()
+        return canonical in COALESCIBLE_STATEMENT_TYPES
+
+    @staticmethod
+    def _share_query_result(result: dict[str, Any]) -> dict[str, Any]:
+        # Callers pop keys from and truncate their result; rows themselves are never mutated.
+        shared = dict(result)
+        if isinstance(shared.get("rows"), list):
+            shared["rows"] = list(shared["rows"])
+        return shared
+
     def _should_retry_failure(
         self,
         *,
@@ -889,24 +964,11 @@ class ExecuteQueryTool(MCPTool):
                 hints=[
                     "Use output_format='inline' for standard responses",
                     "Use output_format='csv' or 'jsonl' for token-efficient large exports",
+                    "Use output_format='paged' to page through large results with fetch_query_page",
                 ],
             )
         return normalized
 
-    @staticmethod
-    def _infer_export_columns(rows: list[Any]) -> list[str]:
-        columns: list[str] = []
-        seen: set[str] = set()
-        for row in rows:
-            if not isinstance(row, dict):
-                continue
-            for key in row:
-                key_str = str(key)
-                if key_str not in seen:
-                    columns.append(key_str)
-                    seen.add(key_str)
-        return columns
-
     def _resolve_query_output_dir(self) -> Path:
         if self._artifact_root is not None:
             output_dir = (self._artifact_root / "scratchpad" / "query_results").resolve()
@@ -915,6 +977,25 @@ class ExecuteQueryTool(MCPTool):
         output_dir.mkdir(parents=True, exist_ok=True)
         return output_dir
 
+    def _query_output_path(self, output_format: str, execution_id: str) -> Path:
+        output_dir = self._resolve_query_output_dir()
+        filename = f"query_{execution_id[:8]}_{int(time.time())}.{output_format}"
+        return (output_dir / filename).resolve()
+
+    def _open_query_export(self, output_format: str, execution_id: str, *, retain_limit: int = 0) -> QueryExportWriter:
+        """Writer that live executions stream rows into, chunk by chunk.
+
+        Results of up to ``retain_limit`` rows are also kept in memory for the result cache.
+        """
+        try:
+            if output_format == OUTPUT_FORMAT_PAGED:
+                return self.result_store.open_writer(retain_limit=retain_limit)
+            return QueryExportWriter(
+                self._query_output_path(output_format, execution_id), output_format, retain_limit=retain_limit
+            )
+        except OSError as exc:
+            raise _export_failed_error(output_format, exc) from exc
+
     def _write_query_output_file(
         self,
         *,
@@ -923,49 +1004,20 @@ class ExecuteQueryTool(MCPTool):
         output_format: str,
         execution_id: str,
     ) -> Path:
-        output_dir = self._resolve_query_output_dir()
-        filename = f"query_{execution_id[:8]}_{int(time.time())}.{output_format}"
-        output_path = (output_dir / filename).resolve()
-
-        if output_format == OUTPUT_FORMAT_JSON:
-            output_path.write_text(
-                json.dumps(rows, ensure_ascii=False, default=str),
-                encoding="utf-8",
-            )
-            return output_path
-
-        if output_format == OUTPUT_FORMAT_JSONL:
-            with output_path.open("w", encoding="utf-8") as handle:
-                for row in rows:
-                    handle.write(json.dumps(row, ensure_ascii=False, default=str))
-                    handle.write("\n")
-            return output_path
-
-        # CSV output
-        csv_columns = columns or self._infer_export_columns(rows)
-        if not csv_columns and rows:
+        """Write already materialized rows (cache hits) to an export file."""
+        csv_columns = columns or infer_export_columns(rows)
+        if output_format == OUTPUT_FORMAT_CSV and not csv_columns and rows:
             first = rows[0]
             if isinstance(first, (list, tuple)):
                 csv_columns = [f"column_{idx}" for idx in range(len(first))]
             else:
                 csv_columns = ["value"]
 
-        with output_path.open("w", encoding="utf-8", newline="") as handle:
-            writer = csv.DictWriter(handle, fieldnames=csv_columns)
-            if csv_columns:
-                writer.writeheader()
-            for row in rows:
-                if isinstance(row, dict):
-                    normalized = {column: row.get(column) for column in csv_columns}
-                elif isinstance(row, (list, tuple)):
-                    normalized = {
-                        csv_columns[idx] if idx < len(csv_columns) else f"column_{idx}": value
-                        for idx, value in enumerate(row)
-                    }
-                else:
-                    normalized = {"value": row}
-                writer.writerow(json_compatible(normalized))
-        return output_path
+        writer = QueryExportWriter(self._query_output_path(output_format, execution_id), output_format)
+        writer.open(csv_columns)
+        writer.write_rows(rows)
+        writer.close()
+        return writer.path
 
     def _build_file_output_response(
         self,
@@ -975,29 +1027,35 @@ class ExecuteQueryTool(MCPTool):
         execution_id: str,
         result_mode: str,
         full_token_estimate: int,
+        page_size: int = DEFAULT_PAGE_SIZE,
     ) -> dict[str, Any]:
-        rows = result.get("rows") or []
-        columns = result.get("columns") or self._infer_export_columns(rows)
-
-        try:
-            output_path = self._write_query_output_file(
-                rows=rows,
-                columns=columns,
-                output_format=output_format,
+        if output_format == OUTPUT_FORMAT_PAGED:
+            return self._build_paged_response(
+                result=result,
                 execution_id=execution_id,
+                result_mode=result_mode,
+                full_token_estimate=full_token_estimate,
+                page_size=page_size,
             )
-            file_size = output_path.stat().st_size
-        except (OSError, PermissionError, ValueError, TypeError) as exc:
-            raise MCPExecutionError(
-                f"Failed to export query results as {output_format}",
-                error_code="EXPORT_FAILED",
-                operation="execute_query",
-                original_error=exc,
-                hints=[
-                    "Verify artifact root permissions and disk space",
-                    "Use output_format='inline' to avoid file output",
-                ],
-            ) from exc
+        rows = result.get("rows") or []
+        columns = result.get("columns") or infer_export_columns(rows)
+        streamed = result.get("export")
+
+        if isinstance(streamed, dict):
+            # Live execution already streamed every row to disk; rows holds only a sample.
+            output_path = Path(streamed["path"])
+            file_size = int(streamed["size_bytes"])
+        else:
+            try:
+                output_path = self._write_query_output_file(
+                    rows=rows,
+                    columns=columns,
+                    output_format=output_format,
+                    execution_id=execution_id,
+                )
+                file_size = output_path.stat().st_size
+            except (OSError, PermissionError, ValueError, TypeError) as exc:
+                raise _export_failed_error(output_format, exc) from exc
 
         rowcount = int(result.get("rowcount") or len(rows))
         response: dict[str, Any] = {
@@ -1014,9 +1072,99 @@ class ExecuteQueryTool(MCPTool):
             "result_mode_info": {
                 "mode": "file_export",
                 "inline_rows_returned": 0,
+                "streamed": isinstance(streamed, dict),
                 "hint": "Read the output_file path for full query results",
             },
         }
+        if result.get("key_metrics") and result_mode != RESULT_MODE_MINIMAL:
+            response["key_metrics"] = result["key_metrics"]
+        _sync_response_mode_aliases(response)
+        if isinstance(result.get("cache"), dict):
+            response["cache"] = {"hit": bool(result["cache"].get("hit"))}
+        if result.get("audit_info"):
+            response["audit_info"] = result["audit_info"]
+        if result.get("session_context"):
+            response["session_context"] = result["session_context"]
+
+        response_tokens = _estimate_response_tokens(response)
+        response["token_estimate"] = {
+            "mode": result_mode,
+            "response_tokens": response_tokens,
+            "savings_vs_full": max(0, full_token_estimate - response_tokens),
+        }
+        return response
+
+    def _build_paged_response(
+        self,
+        *,
+        result: dict[str, Any],
+        execution_id: str,
+        result_mode: str,
+        full_token_estimate: int,
+        page_size: int,
+    ) -> dict[str, Any]:
+        rows = result.get("rows") or []
+        columns = result.get("columns") or infer_export_columns(rows)
+        streamed = result.get("export")
+        metadata = {"execution_id": execution_id, "query_id": result.get("query_id")}
+        try:
+            if isinstance(streamed, dict):
+                # Live execution already spilled every row; publish the handle it wrote.
+                meta = self.result_store.commit(
+                    Path(streamed["path"]).parent.name,
+                    rowcount=int(streamed.get("rows_written") or 0),
+                    columns=columns,
+                    size_bytes=int(streamed["size_bytes"]),
+                    metadata=metadata,
+                )
+            else:
+                meta = self.result_store.spill(rows, columns, metadata=metadata)
+            handle = meta["handle"]
+            if result_mode in (RESULT_MODE_MINIMAL, RESULT_MODE_SCHEMA_ONLY):
+                total = int(meta["rowcount"])
+                page = {
+                    "rows": [],
+                    "offset": 0,
+                    "limit": 0,
+                    "returned": 0,
+                    "has_more": total > 0,
+                    "next_token": encode_token(handle, 0, page_size) if total else None,
+                    "expires_at": self._iso_timestamp(meta["expires_at"]),
+                }
+            else:
+                page = self.result_store.read_page(handle, offset=0, limit=page_size)
+        except (OSError, ValueError, TypeError, LookupError) as exc:
+            raise _export_failed_error(OUTPUT_FORMAT_PAGED, exc) from exc
+
+        rowcount = int(result.get("rowcount") or len(rows))
+        response: dict[str, Any] = {
+            "status": "success",
+            "rowcount": rowcount,
+            "row_count": rowcount,
+            "duration_ms": result.get("duration_ms"),
+            "query_id": result.get("query_id"),
+            "output_format": OUTPUT_FORMAT_PAGED,
+            "result_handle": handle,
+            "columns": columns,
+            "rows": page["rows"],
+            "page": {
+                "offset": page["offset"],
+                "limit": page["limit"],
+                "returned": page["returned"],
+                "has_more": page["has_more"],
+                "next_token": page["next_token"],
+            },
+            "expires_at": page["expires_at"],
+            "result_mode": result_mode,
+            "result_mode_info": {
+                "mode": "paged",
+                "inline_rows_returned": page["returned"],
+                "streamed": isinstance(streamed, dict),
+                "hint": "Call fetch_query_page with result_handle or page.next_token for more rows",
+            },
+        }
+        if result.get("key_metrics") and result_mode != RESULT_MODE_MINIMAL:
+            response["key_metrics"] = result["key_metrics"]
         _sync_response_mode_aliases(response)
         if isinstance(result.get("cache"), dict):
             response["cache"] = {"hit": bool(result["cache"].get("hit"))}
@@ -1043,16 +1191,23 @@ class ExecuteQueryTool(MCPTool):
         """
         snapshot_values: dict[str, str | None] = {}
         success = False
+        registry = self._session_registry()
 
         try:
-            lock = ensure_session_lock(self.snowflake_service)
-            with (
-                lock,
-                self.snowflake_service.get_connection(
-                    use_dict_cursor=True,
-                ) as (_, cursor),
-            ):
-                snapshot = snapshot_session(cursor)
+            if registry is not None and registry.home is not None:
+                # Session defaults are already known from an earlier query; no round trip needed.
+                snapshot = registry.home
+            else:
+                lock = session_guard(self.snowflake_service)
+                with (
+                    lock,
+                    self.snowflake_service.get_connection(
+                        use_dict_cursor=True,
+                    ) as (_, cursor),
+                ):
+                    snapshot = snapshot_session(cursor)
+                if registry is not None:
+                    registry.record_home(snapshot)
             snapshot_values = {
                 "warehouse": snapshot.warehouse,
                 "database": snapshot.database,
@@ -1077,6 +1232,15 @@ class ExecuteQueryTool(MCPTool):
 
         return effective, success
 
+    def _session_registry(self) -> SessionStateRegistry | None:
+        """Session-state registry for providers whose sessions igloo owns exclusively."""
+        if not self._provider_spec.capabilities.supports_session_state_tracking:
+            return None
+        try:
+            return get_session_registry(self.snowflake_service)
+        except (AttributeError, TypeError):
+            return None
+
     def _collect_audit_warnings(self) -> list[str]:
         warnings: list[str] = []
         if self._static_audit_warnings:
@@ -1133,13 +1297,22 @@ class ExecuteQueryTool(MCPTool):
             payload.update(extra)
         return payload
 
-    def _record_history(self, payload: dict[str, Any], *, label: str = "query") -> None:
+    def _append_history(self, payload: dict[str, Any], label: str) -> None:
         """Best-effort write to JSONL history."""
         try:
             self.history.record(payload)
         except (OSError, PermissionError, ValueError) as e:
             logger.debug(f"Failed to record {label} in history: {e}", exc_info=True)
 
+    async def _record_history(self, payload: dict[str, Any], *, label: str = "query") -> None:
+        """Append to history off the event loop, queued when background writes are enabled."""
+        # Shielded so a cancelled request still leaves its audit record behind.
+        with anyio.CancelScope(shield=True):
+            if self._background_writes:
+                await self._history_writer.submit(functools.partial(self._append_history, payload, label))
+            else:
+                await run_io(self._append_history, payload, label)
+
     async def _ensure_profile_health(self) -> None:
         if not self._provider_spec.capabilities.supports_profile_validation:
             return
@@ -1176,7 +1349,7 @@ class ExecuteQueryTool(MCPTool):
         allow_list = self.config.sql_permissions.get_allow_list()
         disallow_list = self.config.sql_permissions.get_disallow_list()
 
-        stmt_type, is_valid, error_msg = validate_sql_statement(statement, allow_list, disallow_list)
+        stmt_type, is_valid, error_msg = analyze_statement(statement).permission(allow_list, disallow_list)
 
         if not is_valid and error_msg:
             if self.health_monitor:
@@ -1229,11 +1402,14 @@ class ExecuteQueryTool(MCPTool):
         cache_hit_metadata: dict[str, Any] | None = None,
         session_context: dict[str, str | None] | None = None,
         columns: list[str] | None = None,
+        session_round_trips: dict[str, int] | None = None,
+        coalesced: FlightOutcome[Any] | None = None,
         include_full: bool = False,
     ) -> dict[str, Any]:
         """Build audit info with optional full details.
 
         Args:
+            coalesced: Single-flight outcome when the execution was shared.
             include_full: If True, include all details. If False, only essentials.
         """
         # Essential fields (always included)
@@ -1246,6 +1422,11 @@ class ExecuteQueryTool(MCPTool):
 
         # Cache hit status (always minimal)
         info["cache_hit"] = cache_hit_metadata is not None
+        if coalesced is not None and coalesced.coalesced:
+            info["coalesced"] = {
+                "role": "leader" if coalesced.leader else "follower",
+                "shared_with": coalesced.followers,
+            }
 
         # Full details only when requested
         if include_full:
@@ -1266,6 +1447,8 @@ class ExecuteQueryTool(MCPTool):
 
             if session_context:
                 info["session_context"] = dict(session_context)
+            if session_round_trips:
+                info["session_round_trips"] = dict(session_round_trips)
             if columns:
                 info["columns"] = list(columns)
             if cache_hit_metadata:
@@ -1381,14 +1564,17 @@ class ExecuteQueryTool(MCPTool):
         output_format: str = OUTPUT_FORMAT_INLINE,
         ctx: Context | None = None,
         *,
+        page_size: int = DEFAULT_PAGE_SIZE,
         execution_id_override: str | None = None,
         sql_sha_override: str | None = None,
         validate_profile: bool = True,
         validate_statement: bool = True,
         statement_type_override: str | None = None,
+        cache_ttl_seconds: int | None = None,
     ) -> dict[str, Any]:
         """Internal execute_query implementation shared by sync + async flows."""
 
+        loop_lag_monitor.ensure_started()
         if validate_profile:
             await self._ensure_profile_health()
 
@@ -1439,9 +1625,9 @@ class ExecuteQueryTool(MCPTool):
         execution_id = execution_id_override or uuid.uuid4().hex
         requested_ts = time.time()
         sql_sha256 = sql_sha_override or hashlib.sha256(statement.encode("utf-8")).hexdigest()
-        referenced_objects = extract_query_objects(statement)
+        referenced_objects = analyze_statement(statement).referenced_objects
         history_artifacts: dict[str, str] = {}
-        artifact_path = self._persist_sql_artifact(sql_sha256, statement)
+        artifact_path = await run_io(self._persist_sql_artifact, sql_sha256, statement)
         if artifact_path is not None:
             sql_rel = _relative_sql_path(self._repo_root, artifact_path)
             if sql_rel:
@@ -1452,6 +1638,8 @@ class ExecuteQueryTool(MCPTool):
         cache_key: str | None = None
         cache_hit_metadata: dict[str, Any] | None = None
         cache_rows: list[dict[str, Any]] | None = None
+        # File exports need every row; inline responses only render a prefix.
+        cache_row_limit = RESULT_MODE_ROW_LIMITS.get(result_mode) if output_format == OUTPUT_FORMAT_INLINE else None
         if self._cache_enabled and cache_context_ready:
             try:
                 cache_key = self.cache.compute_cache_key(
@@ -1459,7 +1647,19 @@ class ExecuteQueryTool(MCPTool):
                     profile=self.config.snowflake.profile,
                     effective_context=effective_context,
                 )
-                cache_hit = self.cache.lookup(cache_key)
+                # cache_ttl_seconds doubles as a freshness bound; 0 bypasses the cache for this call.
+                cache_hit = (
+                    None
+                    if cache_ttl_seconds == 0
+                    else await run_io(
+                        functools.partial(
+                            self.cache.lookup,
+                            cache_key,
+                            max_age_seconds=cache_ttl_seconds,
+                            row_limit=cache_row_limit,
+                        )
+                    )
+                )
             except (OSError, PermissionError, ValueError, KeyError) as e:
                 cache_hit = None
                 logger.debug(f"Query cache lookup failed: {e}", exc_info=True)
@@ -1470,13 +1670,13 @@ class ExecuteQueryTool(MCPTool):
                 cache_rows = cache_hit.rows
                 cache_hit_metadata = dict(cache_hit.metadata)
                 cache_hit_metadata["manifest_path"] = cache_hit.manifest_path
-                cache_hit_metadata["result_json_path"] = cache_hit.result_json_path
+                cache_hit_metadata["result_path"] = cache_hit.result_path
                 if cache_hit.result_csv_path:
                     cache_hit_metadata["result_csv_path"] = cache_hit.result_csv_path
                 manifest_rel = _relative_sql_path(self._repo_root, cache_hit.manifest_path)
                 if manifest_rel:
                     history_artifacts["cache_manifest"] = manifest_rel
-                rows_rel = _relative_sql_path(self._repo_root, cache_hit.result_json_path)
+                rows_rel = _relative_sql_path(self._repo_root, cache_hit.result_path)
                 if rows_rel:
                     history_artifacts["cache_rows"] = rows_rel
 
@@ -1534,7 +1734,11 @@ class ExecuteQueryTool(MCPTool):
             if cached_objects:
                 result["objects"] = cached_objects
 
-            key_metrics, derived_insights = self._ensure_default_insights(result)
+            if "key_metrics" in cache_hit_metadata:
+                # Profiled when the entry was stored (possibly to nothing); never recompute on a hit.
+                key_metrics, derived_insights = cached_metrics or None, cached_insights or []
+            else:
+                key_metrics, derived_insights = self._ensure_default_insights(result)
 
             payload: dict[str, Any] = {
                 "ts": requested_ts,
@@ -1579,10 +1783,7 @@ class ExecuteQueryTool(MCPTool):
             if derived_insights:
                 payload["insights"] = derived_insights
             self._enrich_payload_with_objects(payload, referenced_objects)
-            try:
-                self.history.record(payload)
-            except (OSError, PermissionError, ValueError) as e:
-                logger.debug(f"Failed to record cache hit in history: {e}", exc_info=True)
+            await self._record_history(payload, label="cache hit")
 
             result["audit_info"] = self._build_audit_info(
                 execution_id=execution_id,
@@ -1594,14 +1795,24 @@ class ExecuteQueryTool(MCPTool):
                 columns=cache_hit_metadata.get("columns"),
                 include_full=(result_mode == "full"),
             )
-            full_token_estimate = _estimate_response_tokens(result)
+            # rows_bytes covers every cached row, including those a partial hit never decoded.
+            cached_rows_bytes = cache_hit_metadata.get("rows_bytes")
+            full_token_estimate = _estimate_response_tokens(
+                result,
+                rows_bytes=int(cached_rows_bytes) if isinstance(cached_rows_bytes, int) else None,
+            )
             if output_format != OUTPUT_FORMAT_INLINE:
-                return self._build_file_output_response(
-                    result=result,
-                    output_format=output_format,
-                    execution_id=execution_id,
-                    result_mode=result_mode,
-                    full_token_estimate=full_token_estimate,
+                # Cached rows are written to the export file here, so keep it off the loop.
+                return await run_io(
+                    functools.partial(
+                        self._build_file_output_response,
+                        result=result,
+                        output_format=output_format,
+                        execution_id=execution_id,
+                        result_mode=result_mode,
+                        full_token_estimate=full_token_estimate,
+                        page_size=page_size,
+                    )
                 )
 
             # Apply result_mode filtering before returning
@@ -1610,22 +1821,56 @@ class ExecuteQueryTool(MCPTool):
         # Execute query with session context management
         retry_attempts_used = 0
         retry_categories: list[str] = []
+        # File exports stream rows from the cursor to disk instead of materializing them.
+        export: QueryExportWriter | None = None
+        if output_format != OUTPUT_FORMAT_INLINE:
+            # Exports small enough for the result cache keep their rows so a repeat export is a cache hit.
+            cacheable = self._cache_enabled and cache_key and cache_context_ready and self.cache.mode != "read_only"
+            export = await run_io(
+                functools.partial(
+                    self._open_query_export,
+                    output_format,
+                    execution_id,
+                    retain_limit=self.cache.max_rows if cacheable else 0,
+                )
+            )
+
+        run_query = functools.partial(
+            anyio.to_thread.run_sync,
+            functools.partial(self._execute_query_sync, statement, overrides, timeout, reason, export=export),
+        )
+        # Streamed exports write to this call's own file, so only inline reads are shared.
+        # The timeout is part of the key: a leader's timeout error is only fair to share with
+        # callers that would have given up at the same point.
+        flight_key: str | None = None
+        if self._coalescing_enabled and export is None and self._is_coalescible_statement_type(statement_type):
+            context_key = cache_key or self.cache.compute_cache_key(
+                sql_sha256=sql_sha256,
+                profile=self.config.snowflake.profile,
+                effective_context=effective_context,
+            )
+            flight_key = f"{context_key}:timeout={timeout}"
+        flight: FlightOutcome[dict[str, Any]] | None = None
 
         try:
             for attempt_number in range(1, retry_max_attempts + 1):
                 retry_attempts_used = max(0, attempt_number - 1)
                 self._ensure_circuit_allows_query(timeout=timeout, overrides=overrides)
                 try:
-                    result = await anyio.to_thread.run_sync(  # type: ignore[arg-type]
-                        self._execute_query_sync,
-                        statement,
-                        overrides,
-                        timeout,
-                        reason,
-                    )
+                    if flight_key is None:
+                        result = await run_query()
+                    else:
+                        # A follower waits no longer than its own timeout for the leader.
+                        flight = await self._query_flights.run(
+                            flight_key, run_query, share=self._share_query_result, wait_timeout=timeout
+                        )
+                        result = flight.value
+                        if not flight.leader:
+                            # The leader's session work was not repeated for this call.
+                            result.pop("session_round_trips", None)
                     break
-                except TimeoutError:
-                    # Do not retry local timeout cancellations to avoid duplicate work.
+                except (TimeoutError, QueryExportError):
+                    # Do not retry local timeout cancellations (duplicate work) or local disk failures.
                     raise
                 except Exception as exc:
                     classification = self._classify_failure(exc)
@@ -1661,6 +1906,9 @@ class ExecuteQueryTool(MCPTool):
             if self._query_circuit_breaker is not None:
                 self._query_circuit_breaker.record_success()
 
+            # Sampled serialized size of the returned rows, for the token estimate below.
+            rows_bytes: int | None = result.pop("rows_bytes", None)
+
             result["retry"] = {
                 "enabled": retry_enabled,
                 "max_attempts": retry_max_attempts,
@@ -1677,7 +1925,10 @@ class ExecuteQueryTool(MCPTool):
             # Persist success history (lightweight JSONL)
             session_context = result.get("session_context") or effective_context
             manifest_path: Path | None = None
-            if self._cache_enabled and cache_key and cache_context_ready:
+            pending_manifest_path: Path | None = None
+            # A streamed export only kept its rows when the result fits in the cache.
+            rows_to_cache: list[Any] | None = list(result.get("rows") or []) if export is None else export.retained
+            if self._cache_enabled and cache_key and cache_context_ready and rows_to_cache is not None:
                 try:
                     # Store truncated insight in cache manifest
                     cache_insight = None
@@ -1698,21 +1949,38 @@ class ExecuteQueryTool(MCPTool):
                         "insights": derived_insights,
                         "objects": referenced_objects,
                     }
-                    manifest_path = self.cache.store(
+                    store_ttl = (
+                        cache_ttl_seconds
+                        if cache_ttl_seconds is not None
+                        else self.cache.ttl_for_statement(statement_type)
+                    )
+                    store_entry = functools.partial(
+                        self.cache.store,
                         cache_key,
-                        rows=result.get("rows") or [],
+                        rows=rows_to_cache,
                         metadata=cache_metadata,
+                        ttl_seconds=store_ttl,
                     )
+                    if self._background_writes:
+                        await self._cache_writer.submit(store_entry)
+                        # History still records where the queued store writes the manifest, so
+                        # datasets can be bound to this execution; the response omits it below.
+                        pending_manifest_path = self.cache.manifest_path_for(
+                            cache_key, row_count=len(rows_to_cache), ttl_seconds=store_ttl
+                        )
+                    else:
+                        manifest_path = await run_io(store_entry)
                 except (OSError, PermissionError, ValueError) as e:
                     logger.debug(f"Failed to persist query cache: {e}", exc_info=True)
                     with self._warnings_lock:
                         self._transient_audit_warnings.append("Failed to persist query cache entry.")
 
-            if manifest_path is not None:
-                manifest_rel = _relative_sql_path(self._repo_root, manifest_path)
+            history_manifest_path = manifest_path or pending_manifest_path
+            if history_manifest_path is not None:
+                manifest_rel = _relative_sql_path(self._repo_root, history_manifest_path)
                 if manifest_rel:
                     history_artifacts["cache_manifest"] = manifest_rel
-                rows_file = manifest_path.parent / "rows.jsonl"
+                rows_file = history_manifest_path.parent / QueryResultCache.ROWS_FILENAME
                 rows_rel = _relative_sql_path(self._repo_root, rows_file)
                 if rows_rel:
                     history_artifacts.setdefault("cache_rows", rows_rel)
@@ -1724,8 +1992,10 @@ class ExecuteQueryTool(MCPTool):
                 "session_context": session_context,
                 "response_mode_requested": result_mode,
             }
-            if manifest_path is not None:
-                success_extra["cache_manifest"] = str(manifest_path)
+            if history_manifest_path is not None:
+                success_extra["cache_manifest"] = str(history_manifest_path)
+            if flight is not None and not flight.leader:
+                success_extra["coalesced"] = True
             if result.get("columns"):
                 success_extra["columns"] = result.get("columns")
             if key_metrics:
@@ -1746,7 +2016,7 @@ class ExecuteQueryTool(MCPTool):
                 referenced_objects=referenced_objects,
                 extra=success_extra,
             )
-            self._record_history(payload, label="query success")
+            await self._record_history(payload, label="query success")
 
             result.setdefault(
                 "cache",
@@ -1774,22 +2044,38 @@ class ExecuteQueryTool(MCPTool):
                 cache_hit_metadata=None,
                 session_context=session_context,
                 columns=result.get("columns"),
+                session_round_trips=result.pop("session_round_trips", None),
+                coalesced=flight,
                 include_full=(result_mode == "full"),
             )
-            full_token_estimate = _estimate_response_tokens(result)
+            if isinstance(result.get("export"), dict):
+                rows_bytes = int(result["export"]["size_bytes"])
+            full_token_estimate = _estimate_response_tokens(result, rows_bytes=rows_bytes)
             if output_format != OUTPUT_FORMAT_INLINE:
-                return self._build_file_output_response(
-                    result=result,
-                    output_format=output_format,
-                    execution_id=execution_id,
-                    result_mode=result_mode,
-                    full_token_estimate=full_token_estimate,
+                # Publishing a paged handle reads its first page back from disk.
+                return await run_io(
+                    functools.partial(
+                        self._build_file_output_response,
+                        result=result,
+                        output_format=output_format,
+                        execution_id=execution_id,
+                        result_mode=result_mode,
+                        full_token_estimate=full_token_estimate,
+                        page_size=page_size,
+                    )
                 )
 
             # Apply result_mode filtering before returning
             return _apply_result_mode(result, result_mode, full_token_estimate=full_token_estimate)
 
+        except QueryExportError as e:
+            if export is not None:
+                export.abort()
+            self._collect_audit_warnings()
+            raise _export_failed_error(output_format, e) from e
         except TimeoutError as e:
+            if export is not None:
+                export.abort()
             # Persist timeout history
             payload = self._build_history_payload(
                 status="timeout",
@@ -1805,7 +2091,7 @@ class ExecuteQueryTool(MCPTool):
                 referenced_objects=referenced_objects,
                 extra={"error": str(e)},
             )
-            self._record_history(payload, label="timeout")
+            await self._record_history(payload, label="timeout")
 
             # Use standardized timeout error wrapper
             context: dict[str, Any] = {
@@ -1833,11 +2119,15 @@ class ExecuteQueryTool(MCPTool):
             self._collect_audit_warnings()
             raise timeout_error
         except MCPExecutionError as e:
+            if export is not None:
+                export.abort()
             if self.health_monitor:
                 self.health_monitor.record_error(f"Query execution failed: {str(e)[:200]}")
             self._collect_audit_warnings()
             raise
         except Exception as e:  # Broad catch-all for any query execution failure
+            if export is not None:
+                export.abort()
             error_message = str(e)
             failure_classification = self._classify_failure(e)
             connectivity_failure = bool(failure_classification.get("connectivity"))
@@ -1865,7 +2155,7 @@ class ExecuteQueryTool(MCPTool):
                 referenced_objects=referenced_objects,
                 extra={"error": error_message},
             )
-            self._record_history(payload, label="query error")
+            await self._record_history(payload, label="query error")
 
             # Use standardized execution error wrapper
             context = {
@@ -1946,6 +2236,8 @@ class ExecuteQueryTool(MCPTool):
         result_mode: str | None = None,
         response_mode: str | None = None,
         dry_run: bool = False,
+        cache_ttl_seconds: int | None = None,
+        page_size: int | None = None,
         ctx: Context | None = None,
         **kwargs: Any,
     ) -> dict[str, Any]:
@@ -1970,6 +2262,8 @@ class ExecuteQueryTool(MCPTool):
             output_format: Delivery format for results.
                           "inline" (default): return rows in MCP response.
                           "csv"/"json"/"jsonl": write rows to file and return path + metadata.
+                          "paged": spill rows server-side and return the first page plus a
+                          result_handle for fetch_query_page.
             verbose_errors: Include all error hints (default: False for compact errors)
             reason: Required. Short description for audit trail (min 5 chars).
                    Stored in Snowflake QUERY_TAG and local history.
@@ -1984,6 +2278,12 @@ class ExecuteQueryTool(MCPTool):
             dry_run: If True, run EXPLAIN on the statement instead of executing it.
                     Returns the query plan without reading/writing any data. Useful for
                     validating SQL, estimating cost, and inspecting execution strategy.
+            cache_ttl_seconds: Optional per-call cache TTL. Cached results older than
+                    this are ignored and the fresh result is cached for this long.
+                    0 bypasses the result cache. Defaults to the per-statement-class
+                    TTL (IGLOO_MCP_CACHE_TTL_HOURS / IGLOO_MCP_CACHE_METADATA_TTL_HOURS).
+            page_size: Rows in the first page when output_format="paged" (1-1000,
+                    default 100); later pages come from fetch_query_page.
             result_mode: DEPRECATED - use response_mode instead
             ctx: Optional MCP context for request correlation
             **kwargs: Additional arguments (for backward compatibility)
@@ -2044,6 +2344,29 @@ class ExecuteQueryTool(MCPTool):
                     ],
                 )
 
+        if cache_ttl_seconds is not None and (
+            isinstance(cache_ttl_seconds, bool) or not isinstance(cache_ttl_seconds, int) or cache_ttl_seconds < 0
+        ):
+            raise MCPValidationError(
+                "cache_ttl_seconds must be a non-negative integer",
+                error_code="INVALID_PARAMETER",
+                validation_errors=[f"Invalid cache_ttl_seconds: {cache_ttl_seconds!r}"],
+                hints=["Use 0 to bypass the result cache, or a positive number of seconds"],
+            )
+
+        effective_page_size = DEFAULT_PAGE_SIZE if page_size is None else page_size
+        if (
+            isinstance(effective_page_size, bool)
+            or not isinstance(effective_page_size, int)
+            or not 1 <= effective_page_size <= MAX_PAGE_SIZE
+        ):
+            raise MCPValidationError(
+                f"page_size must be between 1 and {MAX_PAGE_SIZE}",
+                error_code="INVALID_PARAMETER",
+                validation_errors=[f"Invalid page_size: {page_size!r}"],
+                hints=[f"Use a page_size between 1 and {MAX_PAGE_SIZE}, or omit it for {DEFAULT_PAGE_SIZE}"],
+            )
+
         # Validate SQL statement length
         if len(statement) > MAX_SQL_STATEMENT_LENGTH:
             raise MCPValidationError(
@@ -2142,6 +2465,8 @@ class ExecuteQueryTool(MCPTool):
             validate_profile=False,
             validate_statement=False,
             statement_type_override=validated_statement_type,
+            cache_ttl_seconds=cache_ttl_seconds,
+            page_size=effective_page_size,
         )
 
     def _execute_query_sync(
@@ -2150,12 +2475,17 @@ class ExecuteQueryTool(MCPTool):
         overrides: dict[str, Any],
         timeout: int,
         reason: str | None = None,
+        *,
+        export: QueryExportWriter | None = None,
     ) -> dict[str, Any]:
         """Execute query synchronously using Snowflake service with robust timeout/cancel.
 
         This path uses the official MCP Snowflake service to obtain a connector
         cursor so we can cancel server-side statements on timeout and capture
         the Snowflake query ID when available.
+
+        With ``export`` every fetched chunk is written to the export file as it
+        arrives and never truncated; ``rows`` then only holds the writer's sample.
         """
         params = {}
         # Include igloo query tag from the upstream service if available
@@ -2198,16 +2528,30 @@ class ExecuteQueryTool(MCPTool):
             # Enforce server-side statement timeout as an additional safeguard
             params["STATEMENT_TIMEOUT_IN_SECONDS"] = int(timeout)
 
-        lock = ensure_session_lock(self.snowflake_service)
+        lock = session_guard(self.snowflake_service)
         started = time.time()
 
         with (
             lock,
             self.snowflake_service.get_connection(
                 use_dict_cursor=True,
-            ) as (_, cursor),
+            ) as (connection, cursor),
         ):
-            original = snapshot_session(cursor)
+            # With a tracked session we only issue the USE/ALTER statements that change
+            # something and leave the session as-is afterwards; otherwise snapshot and
+            # restore around every query.
+            registry = self._session_registry()
+            session_state = registry.state_for(connection) if registry is not None else None
+            round_trips = {"issued": 0, "skipped": 0}
+            original = None
+            if session_state is None:
+                original = snapshot_session(cursor)
+            elif not session_state.context_known:
+                snapshot = snapshot_session(cursor)
+                session_state.record_snapshot(snapshot)
+                if registry is not None:
+                    registry.record_home(snapshot)
+                round_trips["issued"] += 1
 
             result_box: dict[str, Any] = {
                 "rows": None,
@@ -2250,13 +2594,16 @@ class ExecuteQueryTool(MCPTool):
                     logger.debug(f"Failed to get session parameter {name}", exc_info=True)
                     return None
 
-            def _set_session_parameter(name: str, value: Any) -> None:
-                """Set session parameter with SQL injection protection."""
+            def _set_session_parameter(name: str, value: Any) -> bool:
+                """Set session parameter with SQL injection protection.
+
+                Returns True when the ALTER SESSION statement was issued.
+                """
                 try:
                     # Validate parameter name against whitelist
                     if not _validate_session_parameter_name(name):
                         logger.warning(f"Attempted to set invalid session parameter: {name}")
-                        return
+                        return False
 
                     name_upper = name.upper()
                     if name_upper == "QUERY_TAG":
@@ -2272,13 +2619,35 @@ class ExecuteQueryTool(MCPTool):
                             cursor.execute(f"ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS = {timeout_value}")
                         except (ValueError, TypeError):
                             logger.warning(f"Invalid timeout value for STATEMENT_TIMEOUT_IN_SECONDS: {value}")
+                            return False
                     else:
                         # For other parameters, escape both name and value
                         escaped_value = _escape_sql_value(value)
                         cursor.execute(f"ALTER SESSION SET {name_upper} = {escaped_value}")
+                    return True
                 except (AttributeError, TypeError, ValueError):
                     # Session parameter adjustments are best-effort; ignore failures.
                     logger.debug(f"Failed to set session parameter {name}", exc_info=True)
+                    return False
+
+            def _prepare_tracked_session() -> None:
+                """Bring a tracked session to home context + overrides, skipping no-op statements."""
+                assert session_state is not None
+                assert registry is not None
+                issued, skipped = session_state.apply_context(cursor, registry.desired_context(overrides))
+                for name in ("QUERY_TAG", "STATEMENT_TIMEOUT_IN_SECONDS"):
+                    if name not in params:
+                        continue
+                    if session_state.parameter_matches(name, params[name]):
+                        skipped += 1
+                        continue
+                    if _set_session_parameter(name, params[name]):
+                        session_state.record_parameter(name, params[name])
+                        issued += 1
+                    else:
+                        session_state.parameters.pop(name, None)
+                round_trips["issued"] += issued
+                round_trips["skipped"] += skipped
 
             def _restore_session_parameters(
                 previous: dict[str, str | None],
@@ -2308,23 +2677,30 @@ class ExecuteQueryTool(MCPTool):
                 except (AttributeError, TypeError, ValueError) as e:
                     logger.warning(f"Failed to restore STATEMENT_TIMEOUT_IN_SECONDS: {e}", exc_info=True)
 
+            def _prepare_untracked_session(previous_parameters: dict[str, str | None]) -> None:
+                """Apply overrides and parameters, remembering previous values for restore."""
+                # Apply session overrides (warehouse/database/schema/role)
+                if overrides:
+                    apply_session_context(cursor, overrides)
+                if "QUERY_TAG" in params:
+                    previous_parameters["QUERY_TAG"] = _get_session_parameter("QUERY_TAG")
+                    _set_session_parameter("QUERY_TAG", params["QUERY_TAG"])
+                if "STATEMENT_TIMEOUT_IN_SECONDS" in params:
+                    previous_parameters["STATEMENT_TIMEOUT_IN_SECONDS"] = _get_session_parameter(
+                        "STATEMENT_TIMEOUT_IN_SECONDS"
+                    )
+                    _set_session_parameter(
+                        "STATEMENT_TIMEOUT_IN_SECONDS",
+                        params["STATEMENT_TIMEOUT_IN_SECONDS"],
+                    )
+
             def run_query() -> None:
+                previous_parameters: dict[str, str | None] = {}
                 try:
-                    # Apply session overrides (warehouse/database/schema/role)
-                    if overrides:
-                        apply_session_context(cursor, overrides)
-                    previous_parameters: dict[str, str | None] = {}
-                    if "QUERY_TAG" in params:
-                        previous_parameters["QUERY_TAG"] = _get_session_parameter("QUERY_TAG")
-                        _set_session_parameter("QUERY_TAG", params["QUERY_TAG"])
-                    if "STATEMENT_TIMEOUT_IN_SECONDS" in params:
-                        previous_parameters["STATEMENT_TIMEOUT_IN_SECONDS"] = _get_session_parameter(
-                            "STATEMENT_TIMEOUT_IN_SECONDS"
-                        )
-                        _set_session_parameter(
-                            "STATEMENT_TIMEOUT_IN_SECONDS",
-                            params["STATEMENT_TIMEOUT_IN_SECONDS"],
-                        )
+                    if session_state is not None:
+                        _prepare_tracked_session()
+                    else:
+                        _prepare_untracked_session(previous_parameters)
                     cursor.execute(statement)
                     # Capture Snowflake query id when available
                     try:
@@ -2361,27 +2737,7 @@ class ExecuteQueryTool(MCPTool):
                                 record = {"value": raw}
                             return json_compatible(record)
 
-                        # Chunked fetch: keep full results for ordinary-sized payloads,
-                        # but switch to first/last row truncation when the result both
-                        # exceeds the row threshold and would overflow the size budget.
-                        from collections import deque
-
-                        keep_first = RESULT_KEEP_FIRST_ROWS
-                        keep_last = RESULT_KEEP_LAST_ROWS
-                        size_limit_bytes = RESULT_SIZE_LIMIT_MB * 1024 * 1024
                         chunk_size = 2000
-                        full_rows: list[dict[str, Any]] = []
-                        head_rows: list[dict[str, Any]] = []
-                        tail_buffer: deque[dict[str, Any]] = deque(maxlen=keep_last)
-                        total_fetched = 0
-                        size_sample_bytes = 0
-                        size_sample_count = 0
-                        needs_truncation = False
-
-                        def _estimated_total_size_bytes() -> float:
-                            if size_sample_count == 0:
-                                return 0.0
-                            return (size_sample_bytes / size_sample_count) * total_fetched
 
                         def _iter_chunks() -> Any:
                             fetchmany = getattr(cursor, "fetchmany", None)
@@ -2398,51 +2754,113 @@ class ExecuteQueryTool(MCPTool):
                                 raise AttributeError("Cursor does not support fetchmany() or fetchall()")
                             yield fetchall()
 
-                        for chunk in _iter_chunks():
-                            for raw in chunk:
-                                row = _process_raw_row(raw)
-                                total_fetched += 1
-                                if size_sample_count < 100:
-                                    size_sample_bytes += len(json.dumps(row, ensure_ascii=False, default=str))
-                                    size_sample_count += 1
-
-                                if needs_truncation:
-                                    if len(head_rows) < keep_first:
-                                        head_rows.append(row)
-                                    else:
-                                        tail_buffer.append(row)
-                                    continue
-
-                                full_rows.append(row)
-                                if (
-                                    total_fetched > RESULT_TRUNCATION_THRESHOLD
-                                    and _estimated_total_size_bytes() > size_limit_bytes
-                                ):
-                                    needs_truncation = True
-                                    head_rows = full_rows[:keep_first]
-                                    if keep_last > 0:
-                                        tail_start = max(len(head_rows), len(full_rows) - keep_last)
-                                        tail_buffer.extend(full_rows[tail_start:])
-                                    full_rows = []
+                        def _collect_rows(keep_first: int, keep_last: int, size_limit_bytes: int) -> CollectedRows:
+                            from collections import deque
+
+                            full_rows: list[dict[str, Any]] = []
+                            head_rows: list[dict[str, Any]] = []
+                            tail_buffer: deque[dict[str, Any]] = deque(maxlen=keep_last)
+                            total_fetched = 0
+                            size_sample_bytes = 0
+                            size_sample_count = 0
+                            needs_truncation = False
+
+                            def _estimated_total_size_bytes() -> float:
+                                if size_sample_count == 0:
+                                    return 0.0
+                                return (size_sample_bytes / size_sample_count) * total_fetched
+
+                            for chunk in _iter_chunks():
+                                for raw in chunk:
+                                    row = _process_raw_row(raw)
+                                    total_fetched += 1
+                                    if size_sample_count < 100:
+                                        size_sample_bytes += len(json.dumps(row, ensure_ascii=False, default=str))
+                                        size_sample_count += 1
+
+                                    if needs_truncation:
+                                        if len(head_rows) < keep_first:
+                                            head_rows.append(row)
+                                        else:
+                                            tail_buffer.append(row)
+                                        continue
+
+                                    full_rows.append(row)
+                                    if (
+                                        total_fetched > RESULT_TRUNCATION_THRESHOLD
+                                        and _estimated_total_size_bytes() > size_limit_bytes
+                                    ):
+                                        needs_truncation = True
+                                        head_rows = full_rows[:keep_first]
+                                        if keep_last > 0:
+                                            tail_start = max(len(head_rows), len(full_rows) - keep_last)
+                                            tail_buffer.extend(full_rows[tail_start:])
+                                        full_rows = []
+
+                            return CollectedRows(
+                                head_rows=head_rows if needs_truncation else full_rows,
+                                tail_rows=list(tail_buffer),
+                                total_rows=total_fetched,
+                                truncated=needs_truncation,
+                                estimated_size_bytes=_estimated_total_size_bytes(),
+                                row_bytes=size_sample_bytes / size_sample_count if size_sample_count else 0.0,
+                            )
+
+                        batches = arrow_batches(cursor) if self._fetch_engine == "arrow" else None
+
+                        if export is not None:
+                            export.open(column_names)
+                            if batches is not None:
+                                export_arrow_batches(batches, export, column_names)
+                            else:
+                                for chunk in _iter_chunks():
+                                    export.write_rows([_process_raw_row(raw) for raw in chunk])
+                            result_box["columns"] = column_names
+                            result_box["rows"] = export.sample
+                            result_box["rowcount"] = export.rowcount
+                            result_box["export"] = {
+                                "path": str(export.path),
+                                "size_bytes": export.close(),
+                                "rows_written": export.rowcount,
+                            }
+                            return
+
+                        # Chunked fetch: keep full results for ordinary-sized payloads,
+                        # but switch to first/last row truncation when the result both
+                        # exceeds the row threshold and would overflow the size budget.
+                        keep_first = RESULT_KEEP_FIRST_ROWS
+                        keep_last = RESULT_KEEP_LAST_ROWS
+                        size_limit_bytes = RESULT_SIZE_LIMIT_MB * 1024 * 1024
+                        if batches is not None:
+                            collected = collect_arrow_batches(
+                                batches,
+                                column_names,
+                                truncation_threshold=RESULT_TRUNCATION_THRESHOLD,
+                                size_limit_bytes=size_limit_bytes,
+                                keep_first=keep_first,
+                                keep_last=keep_last,
+                            )
+                        else:
+                            collected = _collect_rows(keep_first, keep_last, size_limit_bytes)
 
                         result_box["columns"] = column_names
+                        result_box["rowcount"] = collected.total_rows
 
-                        if not needs_truncation:
-                            result_box["rows"] = full_rows
-                            result_box["rowcount"] = total_fetched
+                        if not collected.truncated:
+                            result_box["rows"] = collected.head_rows
                         else:
-                            tail_rows = list(tail_buffer)
+                            head_rows = collected.head_rows
+                            tail_rows = collected.tail_rows
                             result_box["rows"] = [
                                 *head_rows,
                                 {"__truncated__": True, "__message__": "Large result set truncated"},
                                 *tail_rows,
                             ]
-                            result_box["rowcount"] = total_fetched
                             result_box["truncated"] = True
-                            result_box["original_rowcount"] = total_fetched
+                            result_box["original_rowcount"] = collected.total_rows
                             result_box["returned_rowcount"] = len(result_box["rows"])
                             result_box["truncation_info"] = {
-                                "original_size_mb": round(_estimated_total_size_bytes() / (1024 * 1024), 2),
+                                "original_size_mb": round(collected.estimated_size_bytes / (1024 * 1024), 2),
                                 "truncated_for_context_window": True,
                                 "rows_kept": f"first {len(head_rows)} + last {len(tail_rows)}",
                                 "export_suggestions": [
@@ -2451,6 +2869,7 @@ class ExecuteQueryTool(MCPTool):
                                     "Add WHERE clause to filter data early",
                                 ],
                             }
+                        result_box["rows_bytes"] = collected.rows_bytes(len(result_box["rows"]))
                     else:
                         # DML/DDL: no result set, use rowcount from cursor if available
                         rc = getattr(cursor, "rowcount", 0)
@@ -2461,29 +2880,60 @@ class ExecuteQueryTool(MCPTool):
                             rc = 0
                         result_box["rows"] = []
                         result_box["rowcount"] = rc
+                        if export is not None:
+                            result_box["export"] = {
+                                "path": str(export.path),
+                                "size_bytes": export.close(),
+                                "rows_written": export.rowcount,
+                            }
                 except Exception as exc:  # Broad catch required: thread error propagation to main thread
                     result_box["error"] = exc
                 finally:
+                    if session_state is not None:
+                        _finish_tracked_session()
+                    else:
+                        _finish_untracked_session(previous_parameters)
+                    done.set()
+
+            def _finish_tracked_session() -> None:
+                assert session_state is not None
+                if statement_may_change_session(statement):
+                    # USE/ALTER/CALL may have moved the session; re-read instead of guessing.
+                    session_state.parameters.clear()
                     try:
-                        session_snapshot = snapshot_session(cursor)
-                        result_box["session"] = session_snapshot.to_mapping()
-                    except (AttributeError, TypeError):
-                        result_box["session"] = None
-                    try:
-                        _restore_session_parameters(previous_parameters)
+                        session_state.record_snapshot(snapshot_session(cursor))
+                        round_trips["issued"] += 1
                     except Exception:
-                        logger.debug("Failed to restore session parameters", exc_info=True)
-                    try:
+                        session_state.invalidate()
+                        logger.debug("Failed to snapshot session after statement", exc_info=True)
+                result_box["session"] = session_state.to_mapping() or None
+
+            def _finish_untracked_session(previous_parameters: dict[str, str | None]) -> None:
+                try:
+                    session_snapshot = snapshot_session(cursor)
+                    result_box["session"] = session_snapshot.to_mapping()
+                except (AttributeError, TypeError):
+                    result_box["session"] = None
+                try:
+                    _restore_session_parameters(previous_parameters)
+                except Exception:
+                    logger.debug("Failed to restore session parameters", exc_info=True)
+                try:
+                    if original is not None:
                         restore_session_context(cursor, original)
-                    except Exception:
-                        logger.debug("Failed to restore session context", exc_info=True)
-                    done.set()
+                except Exception:
+                    logger.debug("Failed to restore session context", exc_info=True)
 
             worker = threading.Thread(target=run_query, daemon=True)
             worker.start()
 
             finished = done.wait(timeout)
             if not finished:
+                if export is not None:
+                    # Stops the worker's next write and removes the partial file.
+                    export.abort()
+                if session_state is not None:
+                    session_state.invalidate()
                 cancel_supported = self._provider_spec.capabilities.supports_timeout_cancellation
                 # Local timeout: cancel the running statement server-side when supported.
                 if cancel_supported:
@@ -2510,7 +2960,7 @@ class ExecuteQueryTool(MCPTool):
             if rowcount is None:
                 rowcount = len(rows)
             duration_ms = int((time.time() - started) * 1000)
-            return {
+            result: dict[str, Any] = {
                 "statement": statement,
                 "rowcount": rowcount,
                 "rows": rows,
@@ -2523,6 +2973,15 @@ class ExecuteQueryTool(MCPTool):
                 "returned_rowcount": result_box.get("returned_rowcount"),
                 "truncation_info": result_box.get("truncation_info"),
             }
+            if result_box.get("export"):
+                result["export"] = result_box["export"]
+            if result_box.get("rows_bytes") is not None:
+                result["rows_bytes"] = result_box["rows_bytes"]
+            if session_state is not None:
+                if registry is not None:
+                    registry.record_round_trips(round_trips["issued"], round_trips["skipped"])
+                result["session_round_trips"] = dict(round_trips)
+            return result
 
     def get_parameter_schema(self) -> dict[str, Any]:
         """Get JSON schema for tool parameters."""
@@ -2690,9 +3149,11 @@ class ExecuteQueryTool(MCPTool):
                     "description": (
                         "Control query result delivery mode. "
                         "'inline' (default): include rows in the MCP response. "
-                        "'csv'/'json'/'jsonl': write rows to a scratchpad file and return path + metadata only."
+                        "'csv'/'json'/'jsonl': write rows to a scratchpad file and return path + metadata only. "
+                        "'paged': keep rows server-side and return the first page plus a result_handle "
+                        "for fetch_query_page."
                     ),
-                    "examples": ["inline", "csv", "jsonl"],
+                    "examples": ["inline", "csv", "jsonl", "paged"],
                 },
                 "response_mode": {
                     "title": "Response Mode",
@@ -2716,5 +3177,19 @@ class ExecuteQueryTool(MCPTool):
                     default=False,
                     examples=[True, False],
                 ),
+                "cache_ttl_seconds": integer_schema(
+                    "Per-call result cache TTL in seconds. Cached results older than this are "
+                    "ignored and the fresh result is cached for this long. 0 bypasses the cache. "
+                    "Defaults to 24h for data queries and 1h for SHOW/DESCRIBE.",
+                    minimum=0,
+                    examples=[0, 300, 3600],
+                ),
+                "page_size": integer_schema(
+                    "Rows in the first page when output_format='paged'. Later pages come from fetch_query_page.",
+                    minimum=1,
+                    maximum=MAX_PAGE_SIZE,
+                    default=DEFAULT_PAGE_SIZE,
+                    examples=[100, 500],
+                ),
             },
         }
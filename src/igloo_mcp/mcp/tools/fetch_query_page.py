@@ -0,0 +1,228 @@
+"""Fetch Query Page MCP Tool - Page through a result spilled by execute_query.
+
+``execute_query`` with ``output_format="paged"`` keeps the full result on the
+server and returns a ``result_handle``. This tool serves any page of that
+result by offset/limit or by the ``next_token`` of the previous page, decoding
+only the row groups the page touches.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+from typing import Any
+
+from igloo_mcp.background_io import run_io
+from igloo_mcp.config import Config
+from igloo_mcp.mcp.compat import get_logger
+from igloo_mcp.mcp.exceptions import MCPSelectorError, MCPValidationError
+from igloo_mcp.mcp.tools.base import MCPTool, ensure_request_id, tool_error_handler
+from igloo_mcp.result_store import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    ResultHandleError,
+    ResultStore,
+    decode_token,
+)
+
+logger = get_logger(__name__)
+
+
+class FetchQueryPageTool(MCPTool):
+    """MCP tool for reading pages of a server-side query result."""
+
+    def __init__(self, config: Config, result_store: ResultStore):
+        """Initialize fetch query page tool.
+
+        Args:
+            config: Application configuration
+            result_store: Store that execute_query spills paged results into
+        """
+        self.config = config
+        self.result_store = result_store
+
+    @property
+    def name(self) -> str:
+        return "fetch_query_page"
+
+    @property
+    def description(self) -> str:
+        return "Fetch a page of rows from a paged execute_query result."
+
+    @property
+    def category(self) -> str:
+        return "query"
+
+    @property
+    def tags(self) -> list[str]:
+        return ["query", "pagination", "results"]
+
+    @property
+    def usage_examples(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "description": "Continue from the previous page",
+                "parameters": {"continuation_token": "eyJoIjoiNGY..."},
+            },
+            {
+                "description": "Jump to rows 5000-5499, two columns only",
+                "parameters": {
+                    "result_handle": "4f1c2b9e8d7a6f5e4d3c2b1a09f8e7d6",
+                    "offset": 5000,
+                    "limit": 500,
+                    "columns": ["REGION", "REVENUE"],
+                },
+            },
+        ]
+
+    @tool_error_handler("fetch_query_page")
+    async def execute(
+        self,
+        result_handle: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        continuation_token: str | None = None,
+        columns: list[str] | None = None,
+        request_id: str | None = None,
+    ) -> dict[str, Any]:
+        """Return one page of a paged query result.
+
+        Args:
+            result_handle: Handle returned by execute_query(output_format="paged")
+            offset: First row of the page (ignored with continuation_token)
+            limit: Rows per page (1-1000; defaults to the token's page size or 100)
+            continuation_token: next_token from a previous page
+            columns: Optional subset of columns to return
+            request_id: Optional request correlation ID for tracing
+
+        Returns:
+            Dictionary with rows, columns, offset, returned, total_rows,
+            has_more and next_token (None on the last page).
+
+        Raises:
+            MCPValidationError: If the token, offset or limit is invalid
+            MCPSelectorError: If the handle is unknown or has expired
+        """
+        start_time = time.time()
+        request_id = ensure_request_id(request_id)
+
+        if continuation_token:
+            try:
+                token_handle, offset, token_limit = decode_token(continuation_token)
+            except ValueError as exc:
+                raise MCPValidationError(
+                    "Invalid continuation_token",
+                    validation_errors=[str(exc)],
+                    hints=["Pass page.next_token / next_token exactly as returned"],
+                    context={"request_id": request_id},
+                ) from exc
+            if result_handle and result_handle != token_handle:
+                raise MCPValidationError(
+                    "continuation_token belongs to a different result_handle",
+                    validation_errors=[f"Token handle {token_handle!r} != {result_handle!r}"],
+                    context={"request_id": request_id},
+                )
+            result_handle = token_handle
+            if limit is None:
+                limit = token_limit
+        if not result_handle:
+            raise MCPValidationError(
+                "result_handle or continuation_token is required",
+                validation_errors=["Missing result_handle"],
+                hints=["Run execute_query with output_format='paged' to obtain a result_handle"],
+                context={"request_id": request_id},
+            )
+
+        page_limit = DEFAULT_PAGE_SIZE if limit is None else limit
+        if not 1 <= page_limit <= MAX_PAGE_SIZE:
+            raise MCPValidationError(
+                f"limit must be between 1 and {MAX_PAGE_SIZE}",
+                validation_errors=[f"Invalid limit: {page_limit}"],
+                context={"request_id": request_id},
+            )
+        if offset < 0:
+            raise MCPValidationError(
+                "offset must be non-negative",
+                validation_errors=[f"Invalid offset: {offset}"],
+                context={"request_id": request_id},
+            )
+
+        try:
+            page = await run_io(
+                functools.partial(
+                    self.result_store.read_page,
+                    result_handle,
+                    offset=offset,
+                    limit=page_limit,
+                    columns=columns,
+                )
+            )
+        except ResultHandleError as exc:
+            raise MCPSelectorError(
+                str(exc),
+                selector=result_handle,
+                error=exc.reason,
+                hints=[
+                    "Result handles expire (IGLOO_MCP_RESULT_PAGE_TTL_SECONDS); re-run execute_query "
+                    "with output_format='paged' for a fresh handle",
+                ],
+                context={"request_id": request_id},
+            ) from exc
+
+        total_duration = (time.time() - start_time) * 1000
+        logger.info(
+            "fetch_query_page_completed",
+            extra={
+                "result_handle": result_handle,
+                "offset": offset,
+                "returned": page["returned"],
+                "total_duration_ms": total_duration,
+                "request_id": request_id,
+            },
+        )
+
+        return {
+            "status": "success",
+            **page,
+            "request_id": request_id,
+            "timing": {
+                "total_duration_ms": round(total_duration, 2),
+            },
+        }
+
+    def get_parameter_schema(self) -> dict[str, Any]:
+        """Get JSON schema for tool parameters."""
+        return {
+            "type": "object",
+            "properties": {
+                "result_handle": {
+                    "type": "string",
+                    "description": "Handle returned by execute_query with output_format='paged'",
+                },
+                "offset": {
+                    "type": "integer",
+                    "default": 0,
+                    "minimum": 0,
+                    "description": "First row of the page (ignored with continuation_token)",
+                },
+                "limit": {
+                    "type": "integer",
+                    "default": DEFAULT_PAGE_SIZE,
+                    "minimum": 1,
+                    "maximum": MAX_PAGE_SIZE,
+                    "description": "Rows per page",
+                },
+                "continuation_token": {
+                    "type": "string",
+                    "description": "next_token from a previous page",
+                },
+                "columns": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional subset of columns to return",
+                },
+            },
+        }
+
+
+__all__ = ["FetchQueryPageTool"]
@@ -178,7 +178,7 @@ class GetReportTool(MCPTool):
         # Resolve selector
         selector_start = time.time()
         try:
-            self.report_service.index.rebuild_from_filesystem()
+            self.report_service.index.refresh()
             selector = ReportSelector(self.report_service.index)
             report_id = selector.resolve(report_selector, strict=False)
             selector_duration = (time.time() - selector_start) * 1000
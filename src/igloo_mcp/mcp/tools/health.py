@@ -15,6 +15,7 @@ from typing import Any
 import anyio
 
 from igloo_mcp.auth import get_service_provider_spec
+from igloo_mcp.background_io import LAG_WARNING_MS
 from igloo_mcp.config import Config, get_config
 from igloo_mcp.mcp.compat import get_logger
 from igloo_mcp.mcp.validation_helpers import validate_response_mode
@@ -50,6 +51,8 @@ class HealthCheckTool(MCPTool):
         health_monitor: Any | None = None,
         resource_manager: Any | None = None,
         query_circuit_breaker_status_provider: Callable[[], dict[str, Any]] | None = None,
+        query_cache_stats_provider: Callable[[], dict[str, Any]] | None = None,
+        io_stats_provider: Callable[[], dict[str, Any]] | None = None,
     ):
         """Initialize health check tool.
 
@@ -60,6 +63,10 @@ class HealthCheckTool(MCPTool):
             resource_manager: Optional resource manager instance
             query_circuit_breaker_status_provider: Optional callback returning
                 execute_query circuit breaker status.
+            query_cache_stats_provider: Optional callback returning query
+                result cache hit/miss/eviction counters.
+            io_stats_provider: Optional callback returning event-loop lag and
+                background write queue counters.
         """
         self.config = config
         self.snowflake_service = snowflake_service
@@ -67,6 +74,8 @@ class HealthCheckTool(MCPTool):
         self.health_monitor = health_monitor
         self.resource_manager = resource_manager
         self.query_circuit_breaker_status_provider = query_circuit_breaker_status_provider
+        self.query_cache_stats_provider = query_cache_stats_provider
+        self.io_stats_provider = io_stats_provider
 
     @property
     def name(self) -> str:
@@ -185,6 +194,16 @@ class HealthCheckTool(MCPTool):
         if self.query_circuit_breaker_status_provider:
             results["query_circuit_breaker"] = self._get_query_circuit_breaker_status()
 
+        pool_status = self._get_connection_pool_status()
+        if pool_status is not None:
+            results["connection_pool"] = pool_status
+
+        if self.query_cache_stats_provider:
+            results["query_cache"] = self._get_query_cache_status()
+
+        if self.io_stats_provider:
+            results["io"] = self._get_io_status()
+
         # Overall status
         has_critical_failures = (
             not results["connection"].get("connected", False)
@@ -226,6 +245,9 @@ class HealthCheckTool(MCPTool):
                     "profile": profile_health,
                     "reports": reports_health,
                     "query_circuit_breaker": results.get("query_circuit_breaker", {}).get("state", "unavailable"),
+                    "connection_pool": results.get("connection_pool", {}).get("state", "unavailable"),
+                    "query_cache": results.get("query_cache", {}).get("state", "unavailable"),
+                    "io": results.get("io", {}).get("state", "unavailable"),
                 },
             }
 
@@ -296,6 +318,24 @@ class HealthCheckTool(MCPTool):
                         "execute_query circuit breaker is open. Resolve Snowflake connectivity issues and retry."
                     )
 
+            if results.get("connection_pool", {}).get("state") == "saturated":
+                remediation["connection_pool"] = (
+                    "All pooled Snowflake connections are busy and queries are queueing. "
+                    "Raise IGLOO_MCP_POOL_SIZE if the warehouse has spare capacity."
+                )
+
+            io_state = results.get("io", {}).get("state")
+            if io_state == "lagging":
+                remediation["io"] = (
+                    f"The event loop is running timers more than {LAG_WARNING_MS:.0f}ms late (p95). "
+                    "Check for slow disks under the artifact, cache and history paths."
+                )
+            elif io_state == "backlogged":
+                remediation["io"] = (
+                    "Background write queues are full and requests are waiting on disk writes. "
+                    "Check disk health or raise IGLOO_MCP_BACKGROUND_WRITE_QUEUE."
+                )
+
             if remediation:
                 response["remediation"] = remediation
                 response["next_steps"] = "Address remediation items to improve system health"
@@ -322,6 +362,12 @@ class HealthCheckTool(MCPTool):
             diagnostics["storage_paths"] = self._get_storage_paths()
             if "query_circuit_breaker" in results:
                 diagnostics["query_circuit_breaker"] = results["query_circuit_breaker"]
+            if "connection_pool" in results:
+                diagnostics["connection_pool"] = results["connection_pool"]
+            if "query_cache" in results:
+                diagnostics["query_cache"] = results["query_cache"]
+            if "io" in results:
+                diagnostics["io"] = results["io"]
 
             if diagnostics:
                 response["diagnostics"] = diagnostics
@@ -581,6 +627,29 @@ class HealthCheckTool(MCPTool):
             except OSError as exc:
                 corrupted_index_lines.append({"line": 0, "error": str(exc)})
 
+        # Mutations since the last compaction live in the append-only change log.
+        index_log_path = index_path.with_suffix(".log.jsonl")
+        index_log_records = 0
+        unreadable_index_log_records = 0
+        if index_log_path.exists():
+            try:
+                with index_log_path.open("r", encoding="utf-8") as handle:
+                    for raw_line in handle:
+                        try:
+                            record = json.loads(raw_line)
+                            if record["op"] == "put":
+                                entry = IndexEntry(**record["entry"])
+                                parsed_index_entries[entry.report_id] = entry
+                            elif record["op"] == "del":
+                                parsed_index_entries.pop(record["report_id"], None)
+                        except (ValueError, TypeError, KeyError):
+                            # A torn final append; ReportIndex skips it on load too.
+                            unreadable_index_log_records += 1
+                        else:
+                            index_log_records += 1
+            except OSError as exc:
+                corrupted_index_lines.append({"line": 0, "error": str(exc)})
+
         indexed_report_ids = set(parsed_index_entries)
         orphaned_index_entries = sorted(indexed_report_ids - report_ids)
         missing_index_entries = sorted(report_ids - indexed_report_ids)
@@ -689,6 +758,8 @@ class HealthCheckTool(MCPTool):
             "total_reports": total_reports,
             "index_exists": index_path.exists(),
             "index_entries": len(parsed_index_entries),
+            "index_log_records": index_log_records,
+            "unreadable_index_log_records": unreadable_index_log_records,
             "corrupted_index_lines": corrupted_index_lines,
             "orphaned_index_entries": orphaned_index_entries,
             "missing_index_entries": missing_index_entries,
@@ -780,6 +851,62 @@ class HealthCheckTool(MCPTool):
                 "error": str(e),
             }
 
+    def _get_connection_pool_status(self) -> dict[str, Any] | None:
+        """Get connection pool queue depth, wait times and utilisation when the provider pools sessions."""
+        get_stats = getattr(self.snowflake_service, "get_pool_stats", None)
+        if not callable(get_stats):
+            return None
+        try:
+            stats = get_stats()
+        except Exception as e:
+            return {"enabled": False, "state": "error", "error": str(e)}
+        if not isinstance(stats, dict):
+            return None
+
+        status = dict(stats)
+        if not status.get("enabled"):
+            status["state"] = "disabled"
+        elif status.get("queue_depth", 0) > 0:
+            status["state"] = "saturated"
+        else:
+            status["state"] = "ok"
+        return status
+
+    def _get_query_cache_status(self) -> dict[str, Any]:
+        """Get query result cache counters from provider callback."""
+        if not self.query_cache_stats_provider:
+            return {"enabled": False, "state": "unavailable"}
+        try:
+            stats = self.query_cache_stats_provider()
+        except Exception as e:
+            return {"enabled": False, "state": "error", "error": str(e)}
+        if not isinstance(stats, dict):
+            return {"enabled": False, "state": "error", "error": "Invalid query cache stats payload"}
+        status = dict(stats)
+        status["state"] = "ok" if status.get("enabled") else "disabled"
+        return status
+
+    def _get_io_status(self) -> dict[str, Any]:
+        """Get event-loop lag and background write queue depth from provider callback."""
+        if not self.io_stats_provider:
+            return {"state": "unavailable"}
+        try:
+            stats = self.io_stats_provider()
+        except Exception as e:
+            return {"state": "error", "error": str(e)}
+        if not isinstance(stats, dict):
+            return {"state": "error", "error": "Invalid I/O stats payload"}
+        status = dict(stats)
+        p95_ms = (status.get("event_loop_lag") or {}).get("p95_ms")
+        writers = (status.get("writers") or {}).values()
+        if any(writer.get("pending", 0) >= writer.get("max_pending", float("inf")) for writer in writers):
+            status["state"] = "backlogged"
+        elif isinstance(p95_ms, int | float) and p95_ms > LAG_WARNING_MS:
+            status["state"] = "lagging"
+        else:
+            status["state"] = "ok"
+        return status
+
     def _get_storage_paths(self) -> dict[str, Any]:
         """Get unified storage location information.
 
@@ -145,7 +145,7 @@ class RenderReportTool(MCPTool):
         selector_start = time.time()
         try:
             # Auto-refresh index before operations to sync with CLI-created reports
-            self.report_service.index.rebuild_from_filesystem()
+            self.report_service.index.refresh()
             selector = ReportSelector(self.report_service.index)
             resolved_report_id = selector.resolve(report_selector, strict=False)
         except SelectorResolutionError as e:
@@ -42,7 +42,7 @@ class SearchCatalogTool(MCPTool):
     """MCP tool for searching catalog artifacts generated by build_catalog."""
 
     def __init__(self) -> None:
-        # No shared state required; catalog files are read per invocation
+        # No shared state required; CatalogIndex caches opened search indexes per process
         pass
 
     @property
@@ -1,11 +1,14 @@
 """Search Citations MCP Tool - Search citations across all reports.
 
 This tool enables powerful citation discovery and audit workflows by searching
-across all reports to find insights backed by specific sources.
+across all reports to find insights backed by specific sources. Searches are
+answered from the persistent citation index (``citations.sqlite``) rather than
+by loading every outline.
 """
 
 from __future__ import annotations
 
+import sqlite3
 import time
 from typing import Any
 
@@ -149,70 +152,40 @@ class SearchCitationsTool(MCPTool):
             },
         )
 
-        # Collect all citations from all reports
-        all_citations: list[dict[str, Any]] = []
+        filters = {
+            "source_type": source_type,
+            "provider": provider,
+            "url_contains": url_contains,
+            "description_contains": description_contains,
+            "execution_id": execution_id,
+        }
 
         try:
-            # Rebuild index to get latest reports
+            # Pick up reports created or changed since the last call
             if getattr(self.report_service, "index", None):
-                self.report_service.index.rebuild_from_filesystem()
+                self.report_service.index.refresh()
 
             # Get all active reports
             index = self.report_service.index
             all_entries = index.list_entries(status="active", sort_by="updated_at", reverse=True)
+            report_ids = [entry.report_id for entry in all_entries]
 
-            for entry in all_entries:
-                report_id = entry.report_id
+            citation_index = self.report_service.sync_citation_index()
+            indexed: tuple[list[dict[str, Any]], int] | None = None
+            if citation_index is not None:
                 try:
-                    outline = self.report_service.get_report_outline(report_id)
-
-                    # Search citations in each insight
-                    for insight in outline.insights:
-                        if not insight.citations:
-                            continue
-
-                        for citation in insight.citations:
-                            # Apply filters
-                            if source_type and citation.source != source_type:
-                                continue
-                            if provider and citation.provider != provider:
-                                continue
-                            if url_contains and (not citation.url or url_contains.lower() not in citation.url.lower()):
-                                continue
-                            if description_contains and (
-                                not citation.description
-                                or description_contains.lower() not in citation.description.lower()
-                            ):
-                                continue
-                            if execution_id and citation.execution_id != execution_id:
-                                continue
-
-                            # Match found - add to results
-                            all_citations.append(
-                                {
-                                    "citation": citation.model_dump(),
-                                    "insight": {
-                                        "insight_id": insight.insight_id,
-                                        "summary": insight.summary,
-                                        "importance": insight.importance,
-                                    },
-                                    "report": {
-                                        "report_id": report_id,
-                                        "title": outline.title,
-                                    },
-                                }
-                            )
-
-                except Exception as e:
+                    indexed = citation_index.search(report_ids, limit=limit, **filters)
+                except sqlite3.Error as e:
                     logger.warning(
-                        "search_citations_report_error",
-                        extra={
-                            "report_id": report_id,
-                            "error": str(e),
-                            "request_id": request_id,
-                        },
+                        "search_citations_index_failed",
+                        extra={"error": str(e), "request_id": request_id},
                     )
-                    continue
+            if indexed is not None:
+                limited_citations, total_matches = indexed
+            else:
+                all_citations = self._scan_outlines(report_ids, filters, request_id)
+                total_matches = len(all_citations)
+                limited_citations = all_citations[:limit]
 
         except Exception as e:
             logger.error(
@@ -224,10 +197,6 @@ class SearchCitationsTool(MCPTool):
             )
             raise
 
-        # Apply limit
-        total_matches = len(all_citations)
-        limited_citations = all_citations[:limit]
-
         # Group results if requested
         grouped_results = None
         if group_by:
@@ -257,6 +226,73 @@ class SearchCitationsTool(MCPTool):
             },
         }
 
+    def _scan_outlines(
+        self,
+        report_ids: list[str],
+        filters: dict[str, str | None],
+        request_id: str,
+    ) -> list[dict[str, Any]]:
+        """Filter citations by loading every outline (used when the citation index is unavailable)."""
+        source_type = filters["source_type"]
+        provider = filters["provider"]
+        url_contains = filters["url_contains"]
+        description_contains = filters["description_contains"]
+        execution_id = filters["execution_id"]
+        all_citations: list[dict[str, Any]] = []
+
+        for report_id in report_ids:
+            try:
+                outline = self.report_service.get_report_outline(report_id)
+
+                # Search citations in each insight
+                for insight in outline.insights:
+                    if not insight.citations:
+                        continue
+
+                    for citation in insight.citations:
+                        # Apply filters
+                        if source_type and citation.source != source_type:
+                            continue
+                        if provider and citation.provider != provider:
+                            continue
+                        if url_contains and (not citation.url or url_contains.lower() not in citation.url.lower()):
+                            continue
+                        if description_contains and (
+                            not citation.description or description_contains.lower() not in citation.description.lower()
+                        ):
+                            continue
+                        if execution_id and citation.execution_id != execution_id:
+                            continue
+
+                        # Match found - add to results
+                        all_citations.append(
+                            {
+                                "citation": citation.model_dump(),
+                                "insight": {
+                                    "insight_id": insight.insight_id,
+                                    "summary": insight.summary,
+                                    "importance": insight.importance,
+                                },
+                                "report": {
+                                    "report_id": report_id,
+                                    "title": outline.title,
+                                },
+                            }
+                        )
+
+            except Exception as e:
+                logger.warning(
+                    "search_citations_report_error",
+                    extra={
+                        "report_id": report_id,
+                        "error": str(e),
+                        "request_id": request_id,
+                    },
+                )
+                continue
+
+        return all_citations
+
     def _group_citations(
         self,
         citations: list[dict[str, Any]],
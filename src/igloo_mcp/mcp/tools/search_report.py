@@ -151,9 +151,9 @@ class SearchReportTool(MCPTool):
         )
 
         try:
-            # Rebuild index from filesystem to sync with CLI-created reports
+            # Sync index with reports created or changed outside this process (e.g. CLI)
             index_start = time.time()
-            self.report_service.index.rebuild_from_filesystem()
+            self.report_service.index.refresh()
             index_duration = (time.time() - index_start) * 1000
 
             index = self.report_service.index
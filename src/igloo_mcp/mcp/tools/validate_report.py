@@ -232,7 +232,7 @@ class ValidateReportTool(MCPTool):
 
         # Resolve selector
         try:
-            self.report_service.index.rebuild_from_filesystem()
+            self.report_service.index.refresh()
             selector = ReportSelector(self.report_service.index)
             report_id = selector.resolve(report_selector, strict=False)
         except SelectorResolutionError as e:
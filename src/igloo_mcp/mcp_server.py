@@ -65,6 +65,7 @@ from .mcp.tools import (
     EvolveReportBatchTool,
     EvolveReportTool,
     ExecuteQueryTool,
+    FetchQueryPageTool,
     GetCatalogSummaryTool,
     GetReportSchemaTool,
     GetReportTool,
@@ -91,6 +92,7 @@ from .profile_utils import (
     validate_and_resolve_profile,
     validate_profile,
 )
+from .result_store import ResultStore
 from .service_layer import CatalogService, DependencyService
 from .session_utils import (
     SessionContext,
@@ -353,7 +355,11 @@ def register_igloo_mcp(
         _health_monitor,
         resource_manager=_resource_manager,
         query_circuit_breaker_status_provider=circuit_breaker_provider,
+        query_cache_stats_provider=getattr(execute_query_inst, "get_cache_stats", None),
+        io_stats_provider=getattr(execute_query_inst, "get_io_stats", None),
     )
+    result_store = getattr(execute_query_inst, "result_store", None) or ResultStore.from_env(artifact_root=None)
+    fetch_query_page_inst = FetchQueryPageTool(config, result_store)
     get_catalog_summary_inst = GetCatalogSummaryTool(catalog_service)
     search_catalog_inst = SearchCatalogTool()
 
@@ -400,7 +406,7 @@ def register_igloo_mcp(
         output_format: Annotated[
             str | None,
             Field(
-                description="Output: inline (default), csv, json, or jsonl",
+                description="Output: inline (default), csv, json, jsonl, or paged",
                 default=None,
             ),
         ] = None,
@@ -425,6 +431,23 @@ def register_igloo_mcp(
                 default=None,
             ),
         ] = None,
+        cache_ttl_seconds: Annotated[
+            int | None,
+            Field(
+                description="Result cache TTL/max age in seconds (0 bypasses the cache)",
+                default=None,
+                ge=0,
+            ),
+        ] = None,
+        page_size: Annotated[
+            int | None,
+            Field(
+                description="First-page rows for output_format=paged (1-1000, default: 100)",
+                default=None,
+                ge=1,
+                le=1000,
+            ),
+        ] = None,
         ctx: Context | None = None,
     ) -> dict[str, Any]:
         """Execute a SQL query against Snowflake - delegates to ExecuteQueryTool."""
@@ -455,6 +478,8 @@ def register_igloo_mcp(
                 post_query_insight=post_query_insight,
                 response_mode=response_mode,
                 result_mode=result_mode,
+                cache_ttl_seconds=cache_ttl_seconds,
+                page_size=page_size,
                 ctx=ctx,
             )
         except (MCPValidationError, MCPExecutionError, MCPToolError):
@@ -468,6 +493,32 @@ def register_igloo_mcp(
             # This catch-all is a safety net for unexpected errors
             raise
 
+    @server.tool(name="fetch_query_page", description="Fetch a page of rows from a paged execute_query result")
+    async def fetch_query_page_tool(
+        result_handle: Annotated[
+            str | None,
+            Field(description="Handle from execute_query output_format=paged", default=None),
+        ] = None,
+        offset: Annotated[int, Field(description="First row of the page", default=0, ge=0)] = 0,
+        limit: Annotated[
+            int | None,
+            Field(description="Rows per page (1-1000, default: 100)", default=None, ge=1, le=1000),
+        ] = None,
+        continuation_token: Annotated[
+            str | None,
+            Field(description="next_token from a previous page", default=None),
+        ] = None,
+        columns: Annotated[list[str] | None, Field(description="Columns to return", default=None)] = None,
+    ) -> dict[str, Any]:
+        """Fetch a result page - delegates to FetchQueryPageTool."""
+        return await fetch_query_page_inst.execute(
+            result_handle=result_handle,
+            offset=offset,
+            limit=limit,
+            continuation_token=continuation_token,
+            columns=columns,
+        )
+
     @server.tool(name="evolve_report", description="Add insights or sections to a living report")
     async def evolve_report_tool(
         report_selector: Annotated[str, Field(description="Report ID or title")],
@@ -782,6 +833,10 @@ def register_igloo_mcp(
         account: Annotated[bool, Field(description="Include entire account", default=False)] = False,
         format: Annotated[str, Field(description="json or jsonl", default="json")] = "json",
         include_ddl: Annotated[bool, Field(description="Include DDL", default=True)] = True,
+        mode: Annotated[
+            str,
+            Field(description="full rebuild or incremental refresh from the last build", default="full"),
+        ] = "full",
         timeout_seconds: Annotated[
             int | str | None,
             Field(description="Timeout in seconds", default=None),
@@ -794,6 +849,7 @@ def register_igloo_mcp(
             account=account,
             format=format,
             include_ddl=include_ddl,
+            mode=mode,
             timeout_seconds=timeout_seconds,
         )
 
@@ -1,17 +1,35 @@
-"""Lightweight heuristics for deriving post-query insights from returned rows."""
+"""Lightweight heuristics for deriving post-query insights from returned rows.
+
+Each column of the sample is profiled once: its type is inferred from the set of
+value types and min/max/avg run as one vectorized NumPy pass (plain Python when
+NumPy is not installed). ``execute_query`` stores the resulting ``key_metrics``
+and ``insights`` in the cache manifest, so cache hits reuse them.
+"""
 
 from __future__ import annotations
 
 from collections import Counter
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Any
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
 MAX_SAMPLE_ROWS = 2_000
 TOP_VALUES_LIMIT = 5
 TIME_HINT_KEYWORDS = ("timestamp", "_ts", "_time", "time", "date", "_dt", "at_ts")
 
+# Exact value types that need no per-value coercion (bool is deliberately excluded).
+_NUMERIC_TYPES = frozenset({int, float, Decimal})
+_TIME_TYPES = frozenset({datetime, date})
+
 
 def _normalize_row(row: Any, existing_columns: Sequence[str] | None) -> tuple[dict[str, Any], list[str] | None]:
     """Return a mapping representation of a row and inferred column names."""
@@ -69,102 +87,102 @@ def _stringify(value: Any) -> str:
     return str(value)
 
 
-def _summarize_column(
-    column: str,
-    rows: list[dict[str, Any]],
-    sample_size: int,
-) -> dict[str, Any] | None:
-    if sample_size == 0:
-        return None
+def _numeric_stats(values: list[Any]) -> tuple[float, float, float]:
+    """Min, max and mean of ``values`` in one vectorized pass when NumPy is available."""
+    if np is not None:
+        array = np.fromiter(values, dtype=np.float64, count=len(values))
+        return float(array.min()), float(array.max()), float(array.mean())
+    numbers = [float(value) for value in values]
+    return min(numbers), max(numbers), sum(numbers) / len(numbers)
+
+
+def _numeric_summary(column: str, values: list[Any], non_null_ratio: float) -> dict[str, Any]:
+    low, high, avg = _numeric_stats(values)
+    return {
+        "name": column,
+        "kind": "numeric",
+        "non_null_ratio": non_null_ratio,
+        "min": round(low, 6),
+        "max": round(high, 6),
+        "avg": round(avg, 6),
+    }
 
-    non_null = 0
-    numeric_count = 0
-    numeric_sum = 0.0
-    numeric_min: float | None = None
-    numeric_max: float | None = None
-    time_count = 0
-    time_min: datetime | None = None
-    time_max: datetime | None = None
-    categorical_counter: Counter[str] = Counter()
-
-    for row in rows:
-        value = row.get(column)
-        if value is None:
-            continue
-        non_null += 1
 
-        number = _coerce_numeric(value)
-        if number is not None:
-            numeric_count += 1
-            numeric_sum += number
-            numeric_min = number if numeric_min is None else min(numeric_min, number)
-            numeric_max = number if numeric_max is None else max(numeric_max, number)
+def _time_summary(column: str, moments: list[datetime], non_null_ratio: float) -> dict[str, Any]:
+    time_min = min(moments)
+    time_max = max(moments)
+    span = (time_max - time_min).total_seconds() * 1000
+    return {
+        "name": column,
+        "kind": "time",
+        "non_null_ratio": non_null_ratio,
+        "min_ts": time_min.isoformat(),
+        "max_ts": time_max.isoformat(),
+        "span_ms": int(span),
+    }
 
-        moment = _coerce_datetime(value)
-        if moment is not None:
-            time_count += 1
-            time_min = moment if time_min is None else min(time_min, moment)
-            time_max = moment if time_max is None else max(time_max, moment)
 
-        categorical_counter[_stringify(value)] += 1
+def _categorical_summary(column: str, labels: Iterable[str], non_null_ratio: float) -> dict[str, Any]:
+    counter = Counter(labels)
+    total = counter.total() or 1
+    top_values = [
+        {"value": value[:120], "count": count, "ratio": round(count / total, 3)}
+        for value, count in counter.most_common(TOP_VALUES_LIMIT)
+    ]
+    return {
+        "name": column,
+        "kind": "categorical",
+        "non_null_ratio": non_null_ratio,
+        "top_values": top_values,
+        "distinct_values": len(counter),
+    }
+
 
-    if non_null == 0:
+def _profile_column(column: str, values: Sequence[Any], sample_size: int) -> dict[str, Any] | None:
+    """Summarise one column's sampled values.
+
+    The column's type is inferred once from the set of value types, so the common
+    homogeneous cases go straight to a single numeric, time or categorical pass.
+    Only columns mixing types fall back to classifying every value.
+    """
+    if sample_size == 0:
+        return None
+    present = [value for value in values if value is not None]
+    if not present:
         return None
 
-    non_null_ratio = round(non_null / sample_size, 3)
-    preferred_kind = "categorical"
-    kind_score = sum(categorical_counter.values())
-
-    if numeric_count >= max(time_count, kind_score) and numeric_count >= 2:
-        preferred_kind = "numeric"
-        kind_score = numeric_count
-
-    if (_is_time_hint(column) and time_count > 0) or (time_count >= max(numeric_count, kind_score) and time_count >= 2):
-        preferred_kind = "time"
-        kind_score = time_count
-
-    if preferred_kind == "numeric" and numeric_min is not None and numeric_max is not None:
-        avg = numeric_sum / max(numeric_count, 1)
-        return {
-            "name": column,
-            "kind": "numeric",
-            "non_null_ratio": non_null_ratio,
-            "min": round(numeric_min, 6),
-            "max": round(numeric_max, 6),
-            "avg": round(avg, 6),
-        }
-
-    if preferred_kind == "time" and time_min is not None and time_max is not None:
-        span = (time_max - time_min).total_seconds() * 1000
-        return {
-            "name": column,
-            "kind": "time",
-            "non_null_ratio": non_null_ratio,
-            "min_ts": time_min.isoformat(),
-            "max_ts": time_max.isoformat(),
-            "span_ms": int(span),
-        }
-
-    if categorical_counter:
-        total = sum(categorical_counter.values()) or 1
-        top_values = []
-        for value, count in categorical_counter.most_common(TOP_VALUES_LIMIT):
-            top_values.append(
-                {
-                    "value": value[:120],
-                    "count": count,
-                    "ratio": round(count / total, 3),
-                }
-            )
-        return {
-            "name": column,
-            "kind": "categorical",
-            "non_null_ratio": non_null_ratio,
-            "top_values": top_values,
-            "distinct_values": len(categorical_counter),
-        }
+    non_null_ratio = round(len(present) / sample_size, 3)
+    value_types = {type(value) for value in present}
+
+    if value_types <= _NUMERIC_TYPES:
+        if len(present) >= 2:
+            try:
+                return _numeric_summary(column, present, non_null_ratio)
+            except (OverflowError, ValueError):
+                pass  # beyond float range; profile as categorical
+    elif value_types <= _TIME_TYPES:
+        if len(present) >= 2 or _is_time_hint(column):
+            # Every value is a date or datetime here, so none coerces to None.
+            timestamps = [moment for moment in map(_coerce_datetime, present) if moment is not None]
+            return _time_summary(column, timestamps, non_null_ratio)
+    elif value_types != {str}:
+        numbers = [number for number in map(_coerce_numeric, present) if number is not None]
+        moments = [moment for moment in map(_coerce_datetime, present) if moment is not None]
+        if len(numbers) == len(present) and len(numbers) >= 2:
+            return _numeric_summary(column, numbers, non_null_ratio)
+        if moments and (_is_time_hint(column) or (len(moments) == len(present) and len(moments) >= 2)):
+            return _time_summary(column, moments, non_null_ratio)
+
+    labels = present if value_types == {str} else map(_stringify, present)
+    return _categorical_summary(column, labels, non_null_ratio)
 
-    return None
+
+def _summarize_column(
+    column: str,
+    rows: list[dict[str, Any]],
+    sample_size: int,
+) -> dict[str, Any] | None:
+    return _profile_column(column, [row.get(column) for row in rows], sample_size)
 
 
 def _compose_insights(key_metrics: dict[str, Any]) -> list[str]:
@@ -217,6 +235,12 @@ def build_default_insights(
     sampled_rows: list[dict[str, Any]] = []
     column_names = list(columns) if columns else []
     for entry in rows[:MAX_SAMPLE_ROWS]:
+        if isinstance(entry, dict):
+            # Profiling only reads the row, so dict rows are used as-is.
+            sampled_rows.append(entry)
+            if not column_names:
+                column_names = list(entry)
+            continue
         normalized, inferred = _normalize_row(entry, column_names or None)
         sampled_rows.append(normalized)
         if not column_names and inferred:
@@ -0,0 +1,178 @@
+"""Incremental CSV / JSON / JSONL writers for ``execute_query`` file exports.
+
+``QueryExportWriter`` receives rows in chunks straight from the cursor, so an
+export of any size holds one fetch chunk in memory instead of the whole result.
+It counts rows as they pass and keeps only the first ``sample_limit`` of them,
+which is what the default ``key_metrics`` are computed from. When given a
+``retain_limit`` it also keeps every row of results up to that size, so they
+can still go into the query result cache; larger exports drop them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import json
+import threading
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import IO, Any
+
+from igloo_mcp.mcp.utils import json_compatible
+from igloo_mcp.post_query_insights import MAX_SAMPLE_ROWS
+
+EXPORT_FORMATS = ("csv", "json", "jsonl")
+
+
+class QueryExportError(OSError):
+    """Writing an export file failed (or the export was aborted)."""
+
+
+class QueryExportWriter:
+    """Stream rows into one export file; thread-safe so a timeout can abort a running writer."""
+
+    formats: tuple[str, ...] = EXPORT_FORMATS
+
+    def __init__(
+        self,
+        path: Path,
+        output_format: str,
+        *,
+        sample_limit: int = MAX_SAMPLE_ROWS,
+        retain_limit: int = 0,
+    ) -> None:
+        if output_format not in self.formats:
+            raise ValueError(f"Unsupported export format {output_format!r}")
+        self.path = path
+        self.output_format = output_format
+        self.sample_limit = sample_limit
+        self.retain_limit = retain_limit
+        self.columns: list[str] = []
+        self.rowcount = 0
+        self.sample: list[Any] = []
+        # Every row written so far, or None once the export outgrew retain_limit.
+        self.retained: list[Any] | None = [] if retain_limit > 0 else None
+        self._lock = threading.Lock()
+        self._handle: IO[str] | None = None
+        self._csv: csv.DictWriter[str] | None = None
+        self._aborted = False
+
+    def open(self, columns: Sequence[str]) -> None:
+        """Start (or, on a retried attempt, restart) the file with ``columns``."""
+        with self._lock:
+            self._check_not_aborted()
+            self._close_handle()
+            self.columns = list(columns)
+            self._reset_rows()
+            try:
+                self._open_file()
+            except OSError as exc:
+                raise QueryExportError(f"Cannot write export file {self.path}: {exc}") from exc
+
+    def write_rows(self, rows: Iterable[Any]) -> None:
+        with self._lock:
+            self._check_not_aborted()
+            if self._handle is None:
+                raise QueryExportError("Export file is not open")
+            batch = list(rows)
+            try:
+                for row in batch:
+                    self._write_row(self._handle, row)
+                    if len(self.sample) < self.sample_limit:
+                        self.sample.append(row)
+                    self.rowcount += 1
+            except OSError as exc:
+                raise QueryExportError(f"Cannot write export file {self.path}: {exc}") from exc
+            self._retain(batch)
+
+    def close(self) -> int:
+        """Finish the file and return its size in bytes."""
+        with self._lock:
+            self._check_not_aborted()
+            try:
+                if self._handle is None:
+                    # A statement without a result set still produces an (empty) file.
+                    self._open_file()
+                if self.output_format == "json":
+                    self._handle.write("]")  # type: ignore[union-attr]
+                self._close_handle()
+                return self.path.stat().st_size
+            except OSError as exc:
+                raise QueryExportError(f"Cannot write export file {self.path}: {exc}") from exc
+
+    def abort(self) -> None:
+        """Stop writing and remove the partial file."""
+        with self._lock:
+            self._aborted = True
+            with contextlib.suppress(OSError):
+                self._close_handle()
+            with contextlib.suppress(OSError):
+                self.path.unlink(missing_ok=True)
+
+    def _reset_rows(self) -> None:
+        self.rowcount = 0
+        self.sample = []
+        self.retained = [] if self.retain_limit > 0 else None
+
+    def _retain(self, batch: list[Any]) -> None:
+        if self.retained is None:
+            return
+        if len(self.retained) + len(batch) > self.retain_limit:
+            self.retained = None
+        else:
+            self.retained.extend(batch)
+
+    def _check_not_aborted(self) -> None:
+        if self._aborted:
+            raise QueryExportError(f"Export to {self.path} was aborted")
+
+    def _close_handle(self) -> None:
+        handle, self._handle, self._csv = self._handle, None, None
+        if handle is not None:
+            handle.close()
+
+    def _open_file(self) -> None:
+        self._handle = self.path.open("w", encoding="utf-8", newline="" if self.output_format == "csv" else None)
+        if self.output_format == "csv":
+            self._csv = csv.DictWriter(self._handle, fieldnames=self.columns)
+            if self.columns:
+                self._csv.writeheader()
+        elif self.output_format == "json":
+            self._handle.write("[")
+
+    def _write_row(self, handle: IO[str], row: Any) -> None:
+        if self.output_format == "jsonl":
+            handle.write(json.dumps(row, ensure_ascii=False, default=str))
+            handle.write("\n")
+        elif self.output_format == "json":
+            if self.rowcount:
+                handle.write(", ")
+            handle.write(json.dumps(row, ensure_ascii=False, default=str))
+        else:
+            assert self._csv is not None
+            self._csv.writerow(json_compatible(self._csv_record(row)))
+
+    def _csv_record(self, row: Any) -> dict[str, Any]:
+        if isinstance(row, dict):
+            return {column: row.get(column) for column in self.columns}
+        if isinstance(row, (list, tuple)):
+            return {
+                self.columns[idx] if idx < len(self.columns) else f"column_{idx}": value
+                for idx, value in enumerate(row)
+            }
+        return {"value": row}
+
+
+def infer_export_columns(rows: Sequence[Any]) -> list[str]:
+    """Union of the dict rows' keys in first-seen order."""
+    columns: list[str] = []
+    seen: set[str] = set()
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        for key in row:
+            key_str = str(key)
+            if key_str not in seen:
+                columns.append(key_str)
+                seen.add(key_str)
+    return columns
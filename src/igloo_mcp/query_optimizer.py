@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from .logging.history_store import HistoryStore
 from .path_utils import find_repo_root, resolve_history_path
 
 
@@ -49,6 +51,27 @@ def _select_entry(entries: list[dict[str, Any]], execution_id: str | None) -> di
     raise ValueError("history file is empty")
 
 
+def _select_indexed_entry(history_path: Path, execution_id: str | None) -> dict[str, Any] | None:
+    """Same selection as :func:`_select_entry` via the history index; None if unavailable."""
+    store = HistoryStore.open(history_path)
+    if store is None:
+        return None
+    try:
+        if execution_id:
+            entry = store.latest(execution_id=execution_id)
+            if entry is None:
+                raise ValueError(f"execution_id {execution_id} not found in history")
+            return entry
+        entry = store.latest(status=("success", "cache_hit")) or store.latest()
+    except sqlite3.Error:
+        return None
+    finally:
+        store.close()
+    if entry is None:
+        raise ValueError("history file is empty")
+    return entry
+
+
 def _load_manifest(entry: dict[str, Any]) -> dict[str, Any]:
     manifest_path = entry.get("cache_manifest")
     artifacts = entry.get("artifacts") or {}
@@ -154,8 +177,11 @@ def optimize_execution(
     history_path: str | None = None,
 ) -> dict[str, Any]:
     path = Path(history_path).expanduser() if history_path else resolve_history_path()
-    entries = _read_history_entries(path)
-    entry = _select_entry(entries, execution_id)
+    if not path.exists():
+        raise FileNotFoundError(f"history file not found: {path}")
+    entry = _select_indexed_entry(path, execution_id)
+    if entry is None:
+        entry = _select_entry(_read_history_entries(path), execution_id)
     manifest = _load_manifest(entry)
     sql = _load_sql_text(entry)
     findings = _detect_findings(sql, manifest, entry)
@@ -0,0 +1,354 @@
+"""Spilled query results served page by page behind opaque handles.
+
+``execute_query`` with ``output_format="paged"`` streams every row into a
+:class:`PagedResultWriter`, which appends them to a columnar file (see
+:mod:`igloo_mcp.cache.columnar`) instead of an export file. The response carries
+the first page and a ``result_handle``; ``fetch_query_page`` then reads any
+later page through :meth:`ResultStore.read_page`, which maps the offset to its
+row group via the file footer and decodes only that group.
+
+Each handle is a directory under ``<artifact_root>/scratchpad/result_pages``
+holding ``rows.col`` and a ``meta.json`` written once the result is complete.
+Handles expire after ``IGLOO_MCP_RESULT_PAGE_TTL_SECONDS`` and the oldest ones
+are evicted once the store exceeds ``IGLOO_MCP_RESULT_PAGE_MAX_MB``.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import contextlib
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from igloo_mcp.cache.columnar import ColumnarFormatError, ColumnarReader, ColumnarWriter
+from igloo_mcp.env_utils import read_int_env
+from igloo_mcp.post_query_insights import MAX_SAMPLE_ROWS
+from igloo_mcp.query_export import QueryExportError, QueryExportWriter
+
+logger = logging.getLogger(__name__)
+
+PAGED_FORMAT = "paged"
+ROWS_FILENAME = "rows.col"
+META_FILENAME = "meta.json"
+RESULT_PAGES_SUBDIR = "result_pages"
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+RESULT_PAGE_TTL_ENV = "IGLOO_MCP_RESULT_PAGE_TTL_SECONDS"
+RESULT_PAGE_MAX_MB_ENV = "IGLOO_MCP_RESULT_PAGE_MAX_MB"
+DEFAULT_RESULT_PAGE_TTL_SECONDS = 3600
+DEFAULT_RESULT_PAGE_MAX_MB = 2048
+
+# Open readers kept mapped so consecutive pages skip re-reading the footer.
+_READER_CACHE_SIZE = 8
+_HANDLE_RE = re.compile(r"^[0-9a-f]{32}$")
+
+
+def _iso(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, UTC).isoformat()
+
+
+_HANDLE_ERROR_MESSAGES = {
+    "invalid_format": "is not a valid result handle",
+    "not_found": "was not found",
+    "expired": "has expired",
+}
+
+
+class ResultHandleError(LookupError):
+    """A result handle is malformed (``invalid_format``), unknown (``not_found``) or ``expired``."""
+
+    def __init__(self, handle: str, reason: str) -> None:
+        super().__init__(f"Result handle {handle!r} {_HANDLE_ERROR_MESSAGES[reason]}")
+        self.handle = handle
+        self.reason = reason
+
+
+def encode_token(handle: str, offset: int, limit: int) -> str:
+    """Opaque continuation token for the page starting at ``offset``."""
+    raw = json.dumps({"h": handle, "o": offset, "l": limit}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_token(token: str) -> tuple[str, int, int]:
+    """Return ``(handle, offset, limit)``; raises ``ValueError`` for a malformed token."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("Malformed continuation token") from exc
+    if not isinstance(payload, dict):
+        raise ValueError("Malformed continuation token")
+    handle, offset, limit = payload.get("h"), payload.get("o"), payload.get("l")
+    if not isinstance(handle, str) or not isinstance(offset, int) or not isinstance(limit, int):
+        raise ValueError("Malformed continuation token")
+    return handle, offset, limit
+
+
+class PagedResultWriter(QueryExportWriter):
+    """Export writer that spills rows into a result store handle instead of a file."""
+
+    formats = (PAGED_FORMAT,)
+
+    def __init__(self, directory: Path, *, sample_limit: int = MAX_SAMPLE_ROWS, retain_limit: int = 0) -> None:
+        super().__init__(directory / ROWS_FILENAME, PAGED_FORMAT, sample_limit=sample_limit, retain_limit=retain_limit)
+        self.directory = directory
+        self._columnar: ColumnarWriter | None = None
+
+    @property
+    def handle(self) -> str:
+        return self.directory.name
+
+    def open(self, columns: Sequence[str]) -> None:
+        with self._lock:
+            self._check_not_aborted()
+            self._discard_columnar()
+            self.columns = list(columns)
+            self._reset_rows()
+            try:
+                self._columnar = ColumnarWriter(self.path, self.columns)
+            except OSError as exc:
+                raise QueryExportError(f"Cannot write result pages {self.path}: {exc}") from exc
+
+    def write_rows(self, rows: Iterable[Any]) -> None:
+        with self._lock:
+            self._check_not_aborted()
+            if self._columnar is None:
+                raise QueryExportError("Result pages are not open")
+            batch = [row if isinstance(row, dict) else self._csv_record(row) for row in rows]
+            try:
+                self._columnar.write_rows(batch)
+            except (OSError, TypeError, ValueError) as exc:
+                raise QueryExportError(f"Cannot write result pages {self.path}: {exc}") from exc
+            room = self.sample_limit - len(self.sample)
+            if room > 0:
+                self.sample.extend(batch[:room])
+            self.rowcount += len(batch)
+            self._retain(batch)
+
+    def close(self) -> int:
+        """Write the footer and return the file size in bytes."""
+        with self._lock:
+            self._check_not_aborted()
+            try:
+                if self._columnar is None:
+                    # A statement without a result set still gets an (empty) handle.
+                    self._columnar = ColumnarWriter(self.path, self.columns)
+                columnar, self._columnar = self._columnar, None
+                return columnar.close().file_bytes
+            except (OSError, TypeError, ValueError) as exc:
+                raise QueryExportError(f"Cannot write result pages {self.path}: {exc}") from exc
+
+    def abort(self) -> None:
+        """Stop writing and remove the handle directory."""
+        with self._lock:
+            self._aborted = True
+            self._discard_columnar()
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _discard_columnar(self) -> None:
+        columnar, self._columnar = self._columnar, None
+        if columnar is not None:
+            with contextlib.suppress(OSError):
+                columnar.abort()
+
+
+class ResultStore:
+    """Directory of spilled results, each addressed by a random hex handle."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        ttl_seconds: int = DEFAULT_RESULT_PAGE_TTL_SECONDS,
+        max_bytes: int = DEFAULT_RESULT_PAGE_MAX_MB * 1024 * 1024,
+    ) -> None:
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._readers: OrderedDict[str, tuple[dict[str, Any], ColumnarReader]] = OrderedDict()
+
+    @classmethod
+    def from_env(cls, *, artifact_root: Path | None) -> ResultStore:
+        base = artifact_root if artifact_root is not None else Path.home() / ".igloo_mcp"
+        return cls(
+            (base / "scratchpad" / RESULT_PAGES_SUBDIR).resolve(),
+            ttl_seconds=read_int_env(RESULT_PAGE_TTL_ENV, DEFAULT_RESULT_PAGE_TTL_SECONDS),
+            max_bytes=read_int_env(RESULT_PAGE_MAX_MB_ENV, DEFAULT_RESULT_PAGE_MAX_MB) * 1024 * 1024,
+        )
+
+    def open_writer(self, *, retain_limit: int = 0) -> PagedResultWriter:
+        self.root.mkdir(parents=True, exist_ok=True)
+        directory = self.root / uuid.uuid4().hex
+        directory.mkdir()
+        return PagedResultWriter(directory, retain_limit=retain_limit)
+
+    def commit(
+        self,
+        handle: str,
+        *,
+        rowcount: int,
+        columns: list[str],
+        size_bytes: int,
+        metadata: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Publish a closed writer's rows under ``handle`` and return the handle metadata."""
+        directory = self.root / handle
+        now = time.time()
+        meta = {
+            **metadata,
+            "handle": handle,
+            "created_at": now,
+            "expires_at": now + self.ttl_seconds,
+            "rowcount": rowcount,
+            "columns": list(columns),
+            "size_bytes": size_bytes,
+        }
+        tmp_path = directory / f"{META_FILENAME}.tmp"
+        tmp_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, directory / META_FILENAME)
+        self.prune(keep=handle)
+        return meta
+
+    def spill(self, rows: list[Any], columns: list[str], *, metadata: dict[str, Any]) -> dict[str, Any]:
+        """Store already materialized rows (cache hits) under a new handle."""
+        writer = self.open_writer()
+        try:
+            writer.open(columns)
+            writer.write_rows(rows)
+            size_bytes = writer.close()
+            return self.commit(
+                writer.handle,
+                rowcount=writer.rowcount,
+                columns=writer.columns,
+                size_bytes=size_bytes,
+                metadata=metadata,
+            )
+        except BaseException:
+            writer.abort()
+            raise
+
+    def read_page(
+        self,
+        handle: str,
+        *,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+        columns: Iterable[str] | None = None,
+    ) -> dict[str, Any]:
+        """Return ``limit`` rows from ``offset`` plus what is needed to fetch the next page."""
+        selected = list(columns) if columns is not None else None
+        with self._lock:
+            meta, reader = self._reader(handle)
+            try:
+                rows = reader.read_rows(offset=offset, limit=limit, columns=selected)
+            except ColumnarFormatError as exc:
+                self._remove_locked(handle)
+                raise ResultHandleError(handle, "not_found") from exc
+        total = int(meta["rowcount"])
+        end = offset + len(rows)
+        has_more = end < total
+        return {
+            "result_handle": handle,
+            "rows": rows,
+            "columns": [column for column in meta["columns"] if selected is None or column in selected],
+            "offset": offset,
+            "limit": limit,
+            "returned": len(rows),
+            "total_rows": total,
+            "has_more": has_more,
+            "next_token": encode_token(handle, end, limit) if has_more else None,
+            "expires_at": _iso(meta["expires_at"]),
+        }
+
+    def _reader(self, handle: str) -> tuple[dict[str, Any], ColumnarReader]:
+        if not _HANDLE_RE.match(handle):
+            raise ResultHandleError(handle, "invalid_format")
+        cached = self._readers.get(handle)
+        if cached is None:
+            directory = self.root / handle
+            meta = self._read_meta(directory)
+            if meta is None:
+                raise ResultHandleError(handle, "not_found")
+            try:
+                reader = ColumnarReader(directory / ROWS_FILENAME)
+            except (OSError, ColumnarFormatError) as exc:
+                raise ResultHandleError(handle, "not_found") from exc
+            cached = (meta, reader)
+            self._readers[handle] = cached
+            while len(self._readers) > _READER_CACHE_SIZE:
+                _, (_, evicted) = self._readers.popitem(last=False)
+                evicted.close()
+        self._readers.move_to_end(handle)
+        if cached[0]["expires_at"] <= time.time():
+            self._remove_locked(handle)
+            raise ResultHandleError(handle, "expired")
+        return cached
+
+    @staticmethod
+    def _read_meta(directory: Path) -> dict[str, Any] | None:
+        try:
+            meta = json.loads((directory / META_FILENAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return meta if isinstance(meta, dict) else None
+
+    def _remove_locked(self, handle: str) -> None:
+        cached = self._readers.pop(handle, None)
+        if cached is not None:
+            cached[1].close()
+        shutil.rmtree(self.root / handle, ignore_errors=True)
+
+    def prune(self, *, keep: str | None = None) -> int:
+        """Drop expired handles, then the oldest ones until the store fits its byte budget.
+
+        ``keep`` (the handle just committed) is never evicted for size. Returns the
+        number of handles removed.
+        """
+        if not self.root.is_dir():
+            return 0
+        now = time.time()
+        live: list[tuple[float, str, int]] = []
+        removed = 0
+        with self._lock:
+            for directory in self.root.iterdir():
+                if not directory.is_dir() or not _HANDLE_RE.match(directory.name):
+                    continue
+                meta = self._read_meta(directory)
+                if meta is None:
+                    # Still being written, or abandoned by a process that died mid-query.
+                    with contextlib.suppress(OSError):
+                        if now - directory.stat().st_mtime > self.ttl_seconds:
+                            self._remove_locked(directory.name)
+                            removed += 1
+                    continue
+                if meta.get("expires_at", 0) <= now and directory.name != keep:
+                    self._remove_locked(directory.name)
+                    removed += 1
+                    continue
+                live.append((float(meta.get("created_at", 0)), directory.name, int(meta.get("size_bytes", 0))))
+
+            total = sum(size for _, _, size in live)
+            for _, handle, size in sorted(live):
+                if total <= self.max_bytes:
+                    break
+                if handle == keep:
+                    continue
+                self._remove_locked(handle)
+                total -= size
+                removed += 1
+        return removed
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import re
 import threading
+import weakref
 from collections.abc import Mapping
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import asdict, dataclass
 from types import TracebackType
 from typing import Any, Protocol
 
 _LOCK_ATTR = "_snowcli_session_lock"
+_REGISTRY_ATTR = "_igloo_session_state_registry"
+_CONTEXT_FIELDS = ("role", "warehouse", "database", "schema")
+# Statements that only read data cannot change the session's role/warehouse/database/schema.
+_SESSION_NEUTRAL_PREFIX = re.compile(r"^\s*(?:\(\s*)*(SELECT|WITH|SHOW|DESCRIBE|DESC|EXPLAIN|LIST|LS)\b", re.IGNORECASE)
+_LEADING_COMMENTS = re.compile(r"^\s*(?:--[^\n]*\n|/\*.*?\*/\s*)*", re.DOTALL)
 
 
 class SnowflakeServiceProtocol(Protocol):
@@ -85,6 +93,18 @@ def ensure_session_lock(service: SnowflakeServiceProtocol) -> SessionLockProtoco
         raise ValueError(f"Unexpected error creating session lock: {e}") from e
 
 
+def session_guard(service: SnowflakeServiceProtocol) -> AbstractContextManager[Any]:
+    """Return the context manager that serialises session use for ``service``.
+
+    Services that hand out an independent pooled session per ``get_connection()``
+    call advertise ``supports_concurrent_sessions`` and need no global lock; all
+    others share the per-service RLock from :func:`ensure_session_lock`.
+    """
+    if getattr(service, "supports_concurrent_sessions", False) is True:
+        return nullcontext()
+    return ensure_session_lock(service)
+
+
 def validate_session_lock(service: SnowflakeServiceProtocol) -> bool:
     """Validate that a session lock exists and is functional.
 
@@ -172,3 +192,178 @@ def restore_session_context(
         cursor.execute(f"USE DATABASE {quote_identifier(target.database)}")
     if target.schema:
         cursor.execute(f"USE SCHEMA {quote_identifier(target.schema)}")
+
+
+def statement_may_change_session(statement: str) -> bool:
+    """Return True unless ``statement`` is a read-only query that cannot switch session context."""
+    body = _LEADING_COMMENTS.sub("", statement, count=1)
+    return _SESSION_NEUTRAL_PREFIX.match(body) is None
+
+
+class SessionState:
+    """Client-side model of one connector session's context and parameters.
+
+    Tracks the role/warehouse/database/schema and the session parameters igloo
+    sets (QUERY_TAG, STATEMENT_TIMEOUT_IN_SECONDS) so callers can skip the
+    ``USE``/``ALTER SESSION`` statements that would not change anything. A
+    missing key means "unknown"; :meth:`invalidate` forgets everything after an
+    error leaves the real session in doubt.
+    """
+
+    def __init__(self, context: SessionContext | None = None) -> None:
+        self.context: dict[str, str | None] = {}
+        self.parameters: dict[str, str | None] = {}
+        if context is not None:
+            self.record_snapshot(context)
+
+    @property
+    def context_known(self) -> bool:
+        return all(key in self.context for key in _CONTEXT_FIELDS)
+
+    def record_snapshot(self, snapshot: SessionContext) -> None:
+        self.context = {key: getattr(snapshot, key) for key in _CONTEXT_FIELDS}
+
+    def invalidate(self) -> None:
+        self.context.clear()
+        self.parameters.clear()
+
+    def to_mapping(self) -> dict[str, str | None]:
+        return {key: value for key, value in self.context.items() if value is not None}
+
+    def apply_context(self, cursor: CursorProtocol, desired: Mapping[str, str | None]) -> tuple[int, int]:
+        """Issue ``USE`` only for fields whose desired value differs from the tracked one.
+
+        A desired database whose schema is explicitly None asks for that
+        database's default schema, so ``USE DATABASE`` is re-issued when the
+        session may still sit in a schema chosen earlier.
+
+        Returns ``(issued, skipped)`` statement counts.
+        """
+        issued = skipped = 0
+        statements = {
+            "role": "USE ROLE",
+            "warehouse": "USE WAREHOUSE",
+            "database": "USE DATABASE",
+            "schema": "USE SCHEMA",
+        }
+        for key in _CONTEXT_FIELDS:
+            value = desired.get(key)
+            if not value:
+                continue
+            default_schema_wanted = key == "database" and "schema" in desired and not desired["schema"]
+            if (
+                key in self.context
+                and _same_identifier(self.context[key], value)
+                and not (default_schema_wanted and self.context.get("schema") is not None)
+            ):
+                skipped += 1
+                continue
+            try:
+                cursor.execute(f"{statements[key]} {quote_identifier(value)}")
+            except Exception:
+                self.invalidate()
+                raise
+            issued += 1
+            self.context[key] = value
+            if key == "database":
+                # USE DATABASE resets the current schema server-side.
+                self.context.pop("schema", None)
+        return issued, skipped
+
+    def parameter_matches(self, name: str, value: Any) -> bool:
+        key = name.upper()
+        return key in self.parameters and self.parameters[key] == _parameter_text(value)
+
+    def record_parameter(self, name: str, value: Any) -> None:
+        self.parameters[name.upper()] = _parameter_text(value)
+
+
+def _same_identifier(current: str | None, desired: str) -> bool:
+    if current is None:
+        return False
+    # CURRENT_*() returns unquoted identifiers upper-cased; USE quotes the requested value verbatim.
+    return current == desired or current == desired.strip('"')
+
+
+def _parameter_text(value: Any) -> str | None:
+    if value is None or value == "":
+        return None
+    return str(value)
+
+
+class SessionStateRegistry:
+    """Per-service registry of :class:`SessionState` objects keyed by connection.
+
+    Also remembers the *home* context every fresh connection starts in, so
+    cache-key resolution does not need a ``CURRENT_*()`` round trip per query.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._states: weakref.WeakKeyDictionary[Any, SessionState] = weakref.WeakKeyDictionary()
+        self.home: SessionSnapshot | None = None
+        self.statements_issued = 0
+        self.statements_skipped = 0
+
+    def state_for(self, connection: Any) -> SessionState | None:
+        """Return the tracked state for ``connection`` (None when it cannot be tracked)."""
+        if connection is None:
+            return None
+        with self._lock:
+            try:
+                state = self._states.get(connection)
+            except TypeError:
+                return None
+            if state is None:
+                # Fresh connections share the same connect parameters, hence the same defaults.
+                state = SessionState(self.home)
+                try:
+                    self._states[connection] = state
+                except TypeError:
+                    return None
+            return state
+
+    def record_home(self, snapshot: SessionSnapshot) -> None:
+        with self._lock:
+            if self.home is None:
+                self.home = snapshot
+
+    def desired_context(self, overrides: Mapping[str, str | None]) -> dict[str, str | None]:
+        """Home context overlaid with per-query overrides.
+
+        The home schema only applies inside the home database: overriding just
+        the database leaves the schema to whatever ``USE DATABASE`` selects,
+        as an untracked session would.
+        """
+        home = self.home.to_mapping() if self.home is not None else {}
+        desired: dict[str, str | None] = {key: home.get(key) for key in _CONTEXT_FIELDS}
+        for key in _CONTEXT_FIELDS:
+            if overrides.get(key):
+                desired[key] = overrides[key]
+        database = overrides.get("database")
+        if database and not overrides.get("schema") and not _same_identifier(home.get("database"), database):
+            desired["schema"] = None
+        return desired
+
+    def record_round_trips(self, issued: int, skipped: int) -> None:
+        with self._lock:
+            self.statements_issued += issued
+            self.statements_skipped += skipped
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "tracked_sessions": len(self._states),
+                "home_context_known": self.home is not None,
+                "statements_issued": self.statements_issued,
+                "statements_skipped": self.statements_skipped,
+            }
+
+
+def get_session_registry(service: SnowflakeServiceProtocol) -> SessionStateRegistry:
+    """Get or create the :class:`SessionStateRegistry` attached to ``service``."""
+    registry = getattr(service, _REGISTRY_ATTR, None)
+    if not isinstance(registry, SessionStateRegistry):
+        registry = SessionStateRegistry()
+        setattr(service, _REGISTRY_ATTR, registry)
+    return registry
@@ -0,0 +1,116 @@
+"""Coalesce identical concurrent calls into one in-flight execution.
+
+``SingleFlight.run`` executes ``func`` for the first caller of a key (the
+leader). Callers arriving with the same key while it runs (followers) wait for
+the leader and receive its result or exception instead of doing the work again.
+A flight only lives while it runs; completed results are not remembered, which
+is the query result cache's job.
+
+If the leader is cancelled, waiting followers do not inherit the cancellation:
+the next one to wake up runs ``func`` itself as the new leader.
+
+Flights are tracked per instance and must be driven from a single event loop.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+import anyio
+
+
+@dataclass(frozen=True)
+class FlightOutcome[V]:
+    """What one caller of ``SingleFlight.run`` got back."""
+
+    value: V
+    leader: bool
+    # Followers that received the leader's outcome (excluding the leader).
+    followers: int
+
+    @property
+    def coalesced(self) -> bool:
+        return self.followers > 0
+
+
+class _Flight:
+    __slots__ = ("cancelled", "done", "error", "followers", "value")
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+        self.cancelled = False
+        self.followers = 0
+
+
+class SingleFlight[K: Hashable, V]:
+    """Share one execution of ``func`` among concurrent callers with the same key."""
+
+    def __init__(self) -> None:
+        self._flights: dict[K, _Flight] = {}
+        self._leaders = 0
+        self._coalesced = 0
+
+    async def run(
+        self,
+        key: K,
+        func: Callable[[], Awaitable[V]],
+        *,
+        share: Callable[[V], V] | None = None,
+        wait_timeout: float | None = None,
+    ) -> FlightOutcome[V]:
+        """Run ``func`` or join the in-flight call for ``key``.
+
+        ``share`` is applied to the value for every caller, the leader included,
+        so callers that mutate their result never see each other's changes. A
+        follower raises ``TimeoutError`` after waiting ``wait_timeout`` seconds;
+        the leader is bounded only by ``func`` itself.
+        """
+        while True:
+            flight = self._flights.get(key)
+            if flight is None:
+                return await self._lead(key, func, share)
+            flight.followers += 1
+            try:
+                with anyio.fail_after(wait_timeout):
+                    await flight.done.wait()
+            except BaseException:
+                flight.followers -= 1
+                raise
+            if flight.cancelled:
+                flight.followers -= 1
+                continue
+            self._coalesced += 1
+            if flight.error is not None:
+                raise flight.error
+            value = share(flight.value) if share else flight.value
+            return FlightOutcome(value=value, leader=False, followers=flight.followers)
+
+    async def _lead(self, key: K, func: Callable[[], Awaitable[V]], share: Callable[[V], V] | None) -> FlightOutcome[V]:
+        flight = _Flight()
+        self._flights[key] = flight
+        self._leaders += 1
+        try:
+            flight.value = await func()
+        except anyio.get_cancelled_exc_class():
+            flight.cancelled = True
+            raise
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            # Late arrivals start a new flight rather than joining a finished one.
+            del self._flights[key]
+            flight.done.set()
+        value = share(flight.value) if share else flight.value
+        return FlightOutcome(value=value, leader=True, followers=flight.followers)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "leaders": self._leaders,
+            "coalesced": self._coalesced,
+            "in_flight": len(self._flights),
+        }
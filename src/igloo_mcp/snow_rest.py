@@ -75,8 +75,9 @@ class SnowRestClient:
         self._token: str | None = None
         self._token_expiry: float = 0.0
         self._token_lock = threading.Lock()
-        host = config.host_override or f"{config.account}.snowflakecomputing.com"
-        self.base_url = f"https://{host.strip()}"
+        host = (config.host_override or f"{config.account}.snowflakecomputing.com").strip()
+        # An explicit scheme (e.g. a local mock server) is kept; hosts default to HTTPS.
+        self.base_url = host.rstrip("/") if "://" in host else f"https://{host}"
 
     @classmethod
     def from_env(
@@ -110,6 +111,30 @@ class SnowRestClient:
         ctx_overrides: dict[str, str | None] | None = None,
         timeout: int | None = None,
     ) -> QueryOutput:
+        payload = self._statement_payload(query, ctx_overrides=ctx_overrides, timeout=timeout)
+        response = self._request("POST", self.STATEMENTS_PATH, payload)
+        handle = response.get("statementHandle")
+        if not handle:
+            raise SnowRestError("Missing statement handle in REST response")
+        status = response.get("status")
+        data = response
+        while status in {"RUNNING", "PENDING"}:
+            time.sleep(self.poll_interval)
+            data = self._request("GET", f"{self.STATEMENTS_PATH}/{handle}")
+            status = data.get("status")
+
+        self._raise_for_status(data)
+
+        rows, columns = self._collect_rows(data)
+        return self._query_output(data, handle, rows, columns)
+
+    def _statement_payload(
+        self,
+        query: str,
+        *,
+        ctx_overrides: dict[str, str | None] | None,
+        timeout: int | None,
+    ) -> dict[str, Any]:
         payload: dict[str, Any] = {"statement": query}
         if timeout:
             payload["timeout"] = timeout
@@ -121,34 +146,31 @@ class SnowRestClient:
         payload.setdefault("database", self.config.database)
         payload.setdefault("schema", self.config.schema)
         payload.setdefault("role", self.config.role)
+        return payload
 
-        response = self._request("POST", self.STATEMENTS_PATH, payload)
-        handle = response.get("statementHandle")
-        if not handle:
-            raise SnowRestError("Missing statement handle in REST response")
-        status = response.get("status")
-        data = response
-        while status in {"RUNNING", "PENDING"}:
-            time.sleep(self.poll_interval)
-            data = self._request("GET", f"{self.STATEMENTS_PATH}/{handle}")
-            status = data.get("status")
-
-        if status != "SUCCESS":
+    @staticmethod
+    def _raise_for_status(data: dict[str, Any]) -> None:
+        if data.get("status") != "SUCCESS":
             message = data.get("message") or data.get("errorMessage") or "Query failed"
             raise SnowRestError(message)
 
-        rows, columns = self._collect_rows(data)
+    @staticmethod
+    def _query_output(
+        data: dict[str, Any],
+        handle: str,
+        rows: list[dict[str, Any]],
+        columns: list[str],
+    ) -> QueryOutput:
         profile = {
             "statementHandle": handle,
             "queryId": data.get("queryId"),
-            "status": status,
+            "status": data.get("status"),
             "resultSetMetaData": data.get("resultSetMetaData"),
             "database": data.get("database"),
             "schema": data.get("schema"),
             "warehouse": data.get("warehouse"),
             "role": data.get("role"),
         }
-
         return QueryOutput(
             raw_stdout=json.dumps(data),
             raw_stderr="",
@@ -164,10 +186,14 @@ class SnowRestClient:
             combined.update(overrides)
         return combined
 
-    def _collect_rows(self, response: dict[str, Any]) -> tuple[list[dict[str, Any]], list[str]]:
+    @staticmethod
+    def _columns(response: dict[str, Any]) -> list[str]:
         meta = response.get("resultSetMetaData") or {}
         row_types: Iterable[dict[str, Any]] = meta.get("rowType") or []
-        columns = [rt.get("name") or f"column_{idx}" for idx, rt in enumerate(row_types)]
+        return [rt.get("name") or f"column_{idx}" for idx, rt in enumerate(row_types)]
+
+    def _collect_rows(self, response: dict[str, Any]) -> tuple[list[dict[str, Any]], list[str]]:
+        columns = self._columns(response)
         rows = list(self._rows_from_response(response, columns))
 
         for url in response.get("resultSetUrls") or []:
@@ -200,10 +226,11 @@ class SnowRestClient:
                     record[key] = value
                 yield record
 
+    def _absolute_url(self, url: str) -> str:
+        return url if urllib.parse.urlparse(url).scheme else f"{self.base_url}{url}"
+
     def _request_url(self, url: str) -> dict[str, Any]:
-        parsed = urllib.parse.urlparse(url)
-        path = url if parsed.scheme else f"{self.base_url}{url}"
-        return self._request("GET", path, absolute=True)
+        return self._request("GET", self._absolute_url(url), absolute=True)
 
     def _request(
         self,
@@ -215,12 +242,7 @@ class SnowRestClient:
     ) -> dict[str, Any]:
         url = path if absolute else f"{self.base_url}{path}"
         data = json.dumps(payload).encode("utf-8") if payload is not None else None
-        headers = {
-            "Authorization": f"Bearer {self._get_token()}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "X-Snowflake-Authorization-Token-Type": "KEYPAIR_JWT",
-        }
+        headers = self._headers()
         request = urllib.request.Request(url, data=data, method=method.upper())  # noqa: S310 - URL from validated Snowflake config
         for key, value in headers.items():
             request.add_header(key, value)
@@ -235,6 +257,14 @@ class SnowRestClient:
         except urllib.error.URLError as exc:  # pragma: no cover
             raise SnowRestError(str(exc)) from exc
 
+    def _headers(self) -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self._get_token()}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "X-Snowflake-Authorization-Token-Type": "KEYPAIR_JWT",
+        }
+
     _TOKEN_REFRESH_BUFFER_SECONDS = 60
 
     def _get_token(self) -> str:
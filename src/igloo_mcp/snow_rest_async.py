@@ -0,0 +1,349 @@
+"""Asyncio driver for the Snowflake SQL REST API.
+
+``AsyncSnowRestClient`` returns the same ``QueryOutput`` as
+``SnowRestClient.run_query`` without blocking the event loop:
+
+- HTTP requests reuse keep-alive connections from a bounded per-host pool and
+  run on the client's worker threads (``IGLOO_MCP_REST_MAX_CONNECTIONS``).
+- Status polling starts at 50 ms and backs off exponentially up to
+  ``IGLOO_MCP_REST_POLL_MAX_INTERVAL`` seconds, so short queries return quickly
+  and long ones do not hammer the API.
+- Result partitions are requested gzip-compressed and downloaded concurrently,
+  at most ``IGLOO_MCP_REST_PARTITION_CONCURRENCY`` at a time, while still being
+  yielded in order by ``stream_query``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import gzip
+import http.client
+import json
+import logging
+import ssl
+import threading
+import urllib.parse
+import uuid
+from collections import deque
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .env_utils import read_float_env, read_int_env
+from .snow_cli import QueryOutput
+from .snow_rest import SnowRestClient, SnowRestConfig, SnowRestError
+
+logger = logging.getLogger(__name__)
+
+REST_MAX_CONNECTIONS_ENV = "IGLOO_MCP_REST_MAX_CONNECTIONS"
+REST_PARTITION_CONCURRENCY_ENV = "IGLOO_MCP_REST_PARTITION_CONCURRENCY"
+REST_POLL_MAX_INTERVAL_ENV = "IGLOO_MCP_REST_POLL_MAX_INTERVAL"
+DEFAULT_REST_MAX_CONNECTIONS = 8
+DEFAULT_REST_PARTITION_CONCURRENCY = 4
+DEFAULT_REST_POLL_MAX_INTERVAL = 2.0
+POLL_INITIAL_INTERVAL_SECONDS = 0.05
+POLL_BACKOFF_MULTIPLIER = 2.0
+
+# Errors meaning an idle keep-alive connection was closed by the server.
+_STALE_CONNECTION_ERRORS = (ConnectionError, http.client.BadStatusLine)
+
+
+def _decode_body(body: bytes, content_encoding: str | None) -> dict[str, Any]:
+    # Partition downloads may be gzip-compressed with or without a Content-Encoding header.
+    if (content_encoding or "").lower() == "gzip" or body[:2] == b"\x1f\x8b":
+        body = gzip.decompress(body)
+    text = body.decode("utf-8")
+    return json.loads(text) if text else {}
+
+
+class HTTPConnectionPool:
+    """Keep-alive HTTP(S) connections to one origin, shared by worker threads."""
+
+    def __init__(self, base_url: str, *, max_connections: int, timeout: float) -> None:
+        parsed = urllib.parse.urlparse(base_url)
+        self.scheme = parsed.scheme
+        self.netloc = parsed.netloc
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._ssl_context = ssl.create_default_context() if self.scheme == "https" else None
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._idle: list[http.client.HTTPConnection] = []
+        self._created = 0
+        self._reused = 0
+
+    def _connect(self) -> http.client.HTTPConnection:
+        with self._lock:
+            self._created += 1
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.netloc, timeout=self.timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(self.netloc, timeout=self.timeout)
+
+    def _checkout(self) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                self._reused += 1
+                return self._idle.pop(), True
+        return self._connect(), False
+
+    @staticmethod
+    def _send(
+        conn: http.client.HTTPConnection,
+        method: str,
+        target: str,
+        body: bytes | None,
+        headers: dict[str, str],
+    ) -> tuple[int, str | None, bytes, bool]:
+        conn.request(method, target, body=body, headers=headers)
+        response = conn.getresponse()
+        data = response.read()
+        return response.status, response.getheader("Content-Encoding"), data, not response.will_close
+
+    def request(
+        self,
+        method: str,
+        target: str,
+        *,
+        body: bytes | None = None,
+        headers: dict[str, str],
+        retry_target: str | None = None,
+    ) -> tuple[int, str | None, bytes]:
+        """Send one request; a reused connection found closed is retried once on a new one.
+
+        ``target`` is the path and query string. ``retry_target`` replaces it for
+        the retry, so non-idempotent requests can mark themselves as resubmitted.
+        """
+        with self._slots:
+            conn, reused = self._checkout()
+            try:
+                try:
+                    status, encoding, data, keep_alive = self._send(conn, method, target, body, headers)
+                except _STALE_CONNECTION_ERRORS:
+                    if not reused:
+                        raise
+                    conn.close()
+                    conn = self._connect()
+                    status, encoding, data, keep_alive = self._send(conn, method, retry_target or target, body, headers)
+            except BaseException:
+                conn.close()
+                raise
+            if keep_alive:
+                with self._lock:
+                    self._idle.append(conn)
+            else:
+                conn.close()
+            return status, encoding, data
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "max_connections": self.max_connections,
+                "created": self._created,
+                "reused": self._reused,
+                "idle": len(self._idle),
+            }
+
+
+class RestResultStream:
+    """A finished statement whose rows are fetched partition by partition.
+
+    Iterating with ``async for`` yields each non-empty partition as a list of
+    row dicts, in result order. Up to ``partition_concurrency`` partitions are
+    downloaded ahead of the consumer.
+    """
+
+    def __init__(self, client: AsyncSnowRestClient, data: dict[str, Any], handle: str) -> None:
+        self._client = client
+        self.data = data
+        self.handle = handle
+        self.columns = client._columns(data)
+
+    def __aiter__(self) -> AsyncIterator[list[dict[str, Any]]]:
+        return self.partitions()
+
+    def _rows(self, block: dict[str, Any]) -> list[dict[str, Any]]:
+        return list(self._client._rows_from_response(block, self.columns))
+
+    async def partitions(self) -> AsyncIterator[list[dict[str, Any]]]:
+        first = self._rows(self.data)
+        if first:
+            yield first
+
+        urls = list(self.data.get("resultSetUrls") or [])
+        pending: deque[asyncio.Task[dict[str, Any]]] = deque()
+        next_index = 0
+        try:
+            while next_index < len(urls) or pending:
+                while next_index < len(urls) and len(pending) < self._client.partition_concurrency:
+                    url = self._client._absolute_url(urls[next_index])
+                    pending.append(asyncio.ensure_future(self._client._call("GET", url)))
+                    next_index += 1
+                rows = self._rows(await pending.popleft())
+                if rows:
+                    yield rows
+        finally:
+            # The consumer stopped early or a download failed: drop the prefetched partitions.
+            for task in pending:
+                task.cancel()
+
+        # Each continuation block names the next one, so these are fetched in sequence.
+        next_url = self.data.get("nextResultUrl")
+        while next_url:
+            block = await self._client._call("GET", self._client._absolute_url(next_url))
+            rows = self._rows(block)
+            if rows:
+                yield rows
+            next_url = block.get("nextResultUrl")
+
+    async def collect(self) -> QueryOutput:
+        """Download every partition and return the same output as ``SnowRestClient.run_query``."""
+        rows: list[dict[str, Any]] = []
+        async for partition in self.partitions():
+            rows.extend(partition)
+        return self._client._query_output(self.data, self.handle, rows, self.columns)
+
+
+class AsyncSnowRestClient(SnowRestClient):
+    """Non-blocking ``SnowRestClient`` for use from the event loop."""
+
+    def __init__(
+        self,
+        config: SnowRestConfig,
+        *,
+        default_context: dict[str, str | None] | None = None,
+        request_timeout: int = 120,
+        poll_interval: float | None = None,
+        max_poll_interval: float | None = None,
+        max_connections: int | None = None,
+        partition_concurrency: int | None = None,
+    ) -> None:
+        super().__init__(
+            config,
+            default_context=default_context,
+            request_timeout=request_timeout,
+            poll_interval=poll_interval,
+        )
+        self.max_poll_interval = max_poll_interval or read_float_env(
+            REST_POLL_MAX_INTERVAL_ENV, DEFAULT_REST_POLL_MAX_INTERVAL, minimum=POLL_INITIAL_INTERVAL_SECONDS
+        )
+        connections = max_connections or read_int_env(REST_MAX_CONNECTIONS_ENV, DEFAULT_REST_MAX_CONNECTIONS)
+        self.partition_concurrency = partition_concurrency or read_int_env(
+            REST_PARTITION_CONCURRENCY_ENV, DEFAULT_REST_PARTITION_CONCURRENCY
+        )
+        self._pool = HTTPConnectionPool(self.base_url, max_connections=connections, timeout=request_timeout)
+        self._executor = ThreadPoolExecutor(max_workers=connections, thread_name_prefix="igloo-rest")
+
+    async def __aenter__(self) -> AsyncSnowRestClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker threads and close idle connections."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._pool.close()
+
+    def pool_stats(self) -> dict[str, int]:
+        return self._pool.stats()
+
+    async def run_query_async(
+        self,
+        query: str,
+        *,
+        ctx_overrides: dict[str, str | None] | None = None,
+        timeout: int | None = None,
+    ) -> QueryOutput:
+        """Async counterpart of ``run_query``: same payload, same ``QueryOutput``."""
+        stream = await self.stream_query(query, ctx_overrides=ctx_overrides, timeout=timeout)
+        return await stream.collect()
+
+    async def stream_query(
+        self,
+        query: str,
+        *,
+        ctx_overrides: dict[str, str | None] | None = None,
+        timeout: int | None = None,
+    ) -> RestResultStream:
+        """Submit ``query`` and wait for it to finish; rows are fetched as the stream is iterated."""
+        payload = self._statement_payload(query, ctx_overrides=ctx_overrides, timeout=timeout)
+        # requestId lets Snowflake recognise a resubmission after a dropped connection.
+        request_id = uuid.uuid4().hex
+        path = f"{self.STATEMENTS_PATH}?requestId={request_id}"
+        response = await self._call(
+            "POST", f"{self.base_url}{path}", payload, retry_url=f"{self.base_url}{path}&retry=true"
+        )
+        handle = response.get("statementHandle")
+        if not handle:
+            raise SnowRestError("Missing statement handle in REST response")
+
+        data = response
+        delay = POLL_INITIAL_INTERVAL_SECONDS
+        while data.get("status") in {"RUNNING", "PENDING"}:
+            await asyncio.sleep(delay)
+            delay = min(delay * POLL_BACKOFF_MULTIPLIER, self.max_poll_interval)
+            data = await self._call("GET", f"{self.base_url}{self.STATEMENTS_PATH}/{handle}")
+
+        self._raise_for_status(data)
+        return RestResultStream(self, data, handle)
+
+    async def _call(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | None = None,
+        *,
+        retry_url: str | None = None,
+    ) -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(self._pooled_request, method, url, payload, retry_url=retry_url),
+        )
+
+    def _pooled_request(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | None,
+        *,
+        retry_url: str | None = None,
+    ) -> dict[str, Any]:
+        parsed = urllib.parse.urlparse(url)
+        if (parsed.scheme, parsed.netloc) != (self._pool.scheme, self._pool.netloc):
+            # Result URLs on another host cannot use the pooled connections.
+            return self._request(method, url, payload, absolute=True)
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {**self._headers(), "Accept-Encoding": "gzip"}
+        try:
+            status, encoding, data = self._pool.request(
+                method.upper(),
+                _target(parsed),
+                body=body,
+                headers=headers,
+                retry_target=_target(urllib.parse.urlparse(retry_url)) if retry_url else None,
+            )
+        except (OSError, http.client.HTTPException) as exc:
+            raise SnowRestError(str(exc) or type(exc).__name__) from exc
+        if status >= 400:
+            try:
+                message = gzip.decompress(data) if data[:2] == b"\x1f\x8b" else data
+                text = message.decode("utf-8", errors="replace")
+            except (OSError, EOFError):
+                text = ""
+            raise SnowRestError(text or f"HTTP {status}")
+        try:
+            return _decode_body(data, encoding)
+        except (OSError, EOFError, UnicodeDecodeError, ValueError) as exc:
+            raise SnowRestError(f"Invalid REST response body: {exc}") from exc
+
+
+def _target(parsed: urllib.parse.ParseResult) -> str:
+    return f"{parsed.path or '/'}?{parsed.query}" if parsed.query else parsed.path or "/"
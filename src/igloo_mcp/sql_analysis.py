@@ -0,0 +1,128 @@
+"""Parse-once SQL analysis shared by execute_query's validation and bookkeeping.
+
+``analyze_statement`` parses a statement once and memoizes the result per
+``sql_sha256`` in a bounded LRU. Permission checks, SELECT-likeness, multi
+statement detection and referenced-object extraction all read the same
+``AnalyzedStatement`` instead of each re-parsing the SQL, and repeated or
+retried queries skip parsing entirely.
+
+The statement type used for permission decisions is still the upstream
+``get_statement_type`` classification (sqlglot's default dialect); it is
+computed once alongside the Snowflake-dialect AST rather than per check.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import cast
+
+import sqlglot
+from mcp_server_snowflake.query_manager.tools import get_statement_type
+from sqlglot import exp
+
+from igloo_mcp.sql_objects import objects_from_expressions
+from igloo_mcp.sql_validation import validate_sql_statement
+
+ANALYSIS_CACHE_SIZE = 256
+
+PermissionVerdict = tuple[str, bool, str | None]
+
+
+@dataclass(eq=False)
+class AnalyzedStatement:
+    """Everything derived from one SQL text; shared between callers, so treat it as read-only."""
+
+    statement: str
+    sql_sha256: str
+    # Snowflake-dialect parse; empty when sqlglot cannot parse the statement.
+    expressions: tuple[exp.Expression, ...]
+    # Upstream classification (e.g. "Select", "Command"); None when it raised.
+    upstream_type: str | None
+    upstream_error: Exception | None = None
+    _objects: tuple[dict[str, str | None], ...] | None = field(default=None, repr=False)
+    _verdicts: dict[tuple[tuple[str, ...], tuple[str, ...]], PermissionVerdict] = field(
+        default_factory=dict, repr=False
+    )
+
+    def statement_type(self) -> str:
+        """The upstream statement type, re-raising the parse failure it hit (if any)."""
+        if self.upstream_error is not None:
+            raise self.upstream_error
+        return cast(str, self.upstream_type)
+
+    @property
+    def referenced_objects(self) -> list[dict[str, str | None]]:
+        """Tables and views referenced by the statement (fresh copies per call)."""
+        if self._objects is None:
+            self._objects = tuple(objects_from_expressions(self.expressions))
+        return [dict(obj) for obj in self._objects]
+
+    def permission(self, allow_list: Sequence[str], disallow_list: Sequence[str]) -> PermissionVerdict:
+        """``validate_sql_statement`` for this statement, memoized per permission lists."""
+        key = (tuple(allow_list), tuple(disallow_list))
+        verdict = self._verdicts.get(key)
+        if verdict is None:
+            verdict = validate_sql_statement(self.statement, list(allow_list), list(disallow_list), analysis=self)
+            self._verdicts[key] = verdict
+        return verdict
+
+
+_cache: OrderedDict[str, AnalyzedStatement] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _parse(statement: str, sql_sha256: str) -> AnalyzedStatement:
+    try:
+        expressions = tuple(
+            cast(exp.Expression, expression)
+            for expression in sqlglot.parse(statement, dialect="snowflake")
+            if expression is not None
+        )
+    except Exception:  # noqa: BLE001 - sqlglot raises ParseError, TokenError and internal errors
+        expressions = ()
+
+    upstream_type: str | None = None
+    upstream_error: Exception | None = None
+    try:
+        upstream_type = get_statement_type(statement)
+    except Exception as exc:  # noqa: BLE001 - re-raised by statement_type()
+        upstream_error = exc
+
+    return AnalyzedStatement(
+        statement=statement,
+        sql_sha256=sql_sha256,
+        expressions=expressions,
+        upstream_type=upstream_type,
+        upstream_error=upstream_error,
+    )
+
+
+def analyze_statement(statement: str) -> AnalyzedStatement:
+    """Return the (memoized) analysis of ``statement``."""
+    key = hashlib.sha256(statement.encode("utf-8")).hexdigest()
+    with _cache_lock:
+        analysis = _cache.get(key)
+        if analysis is not None:
+            _cache.move_to_end(key)
+            return analysis
+
+    analysis = _parse(statement, key)
+    if analysis.upstream_error is not None:
+        # Unparseable statements are rejected anyway; keep the cache for valid SQL.
+        return analysis
+
+    with _cache_lock:
+        _cache[key] = analysis
+        _cache.move_to_end(key)
+        while len(_cache) > ANALYSIS_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return analysis
+
+
+def clear_analysis_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
@@ -40,20 +40,12 @@ def _iter_tables(expression: exp.Expression | None) -> Iterable[exp.Table]:
         yield table
 
 
-def extract_query_objects(sql: str) -> list[dict[str, str | None]]:
-    """Parse SQL and return referenced Snowflake objects.
-
-    Falls back to an empty list if parsing fails.
-    """
+def objects_from_expressions(expressions: Iterable[exp.Expression | None]) -> list[dict[str, str | None]]:
+    """Return the Snowflake objects referenced by already-parsed statements."""
 
     objects: list[dict[str, str | None]] = []
     seen: set[tuple[str | None, str | None, str]] = set()
-    try:
-        parsed = sqlglot.parse(sql, read="snowflake")
-    except (ValueError, TypeError, AttributeError, SyntaxError, KeyError):
-        return objects
-
-    for raw_expression in parsed:
+    for raw_expression in expressions:
         expression = cast(exp.Expression | None, raw_expression)
         for table in _iter_tables(expression):
             name = table.name
@@ -85,3 +77,16 @@ def extract_query_objects(sql: str) -> list[dict[str, str | None]]:
             objects.append(obj.as_dict())
 
     return objects
+
+
+def extract_query_objects(sql: str) -> list[dict[str, str | None]]:
+    """Parse SQL and return referenced Snowflake objects.
+
+    Falls back to an empty list if parsing fails.
+    """
+
+    try:
+        parsed = sqlglot.parse(sql, read="snowflake")
+    except (ValueError, TypeError, AttributeError, SyntaxError, KeyError):
+        return []
+    return objects_from_expressions(cast("list[exp.Expression | None]", parsed))
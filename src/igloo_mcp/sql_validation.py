@@ -7,7 +7,7 @@ for blocked operations like DELETE, DROP, and TRUNCATE.
 from __future__ import annotations
 
 import time
-from typing import cast
+from typing import TYPE_CHECKING, Any, cast
 
 # Import upstream validation from snowflake-labs-mcp
 from mcp_server_snowflake.query_manager.tools import (
@@ -23,6 +23,9 @@ try:
 except ImportError:  # pragma: no cover
     HAS_SQLGLOT = False
 
+if TYPE_CHECKING:
+    from igloo_mcp.sql_analysis import AnalyzedStatement
+
 
 # Template-based safe alternatives for blocked SQL operations
 SAFE_ALTERNATIVES: dict[str, dict[str, str]] = {
@@ -213,10 +216,21 @@ def _strip_leading_comments_and_whitespace(statement: str) -> str:
     return statement[idx:]
 
 
+def _statement_type_allowed(statement_type: str, allow_list: list[str], disallow_list: list[str]) -> bool:
+    """Upstream ``validate_sql_type``'s allow/disallow decision for an already-classified statement."""
+    if "all" in allow_list:
+        return True
+    if statement_type.lower() in disallow_list:
+        return False
+    return statement_type.lower() in allow_list or "unknown" in allow_list
+
+
 def validate_sql_statement(
     statement: str,
     allow_list: list[str],
     disallow_list: list[str],
+    *,
+    analysis: AnalyzedStatement | None = None,
 ) -> tuple[str, bool, str | None]:
     """Validate SQL statement against permission lists.
 
@@ -224,6 +238,8 @@ def validate_sql_statement(
         statement: SQL statement to validate
         allow_list: List of allowed statement types (e.g., ["Select", "Insert"])
         disallow_list: List of disallowed statement types (e.g., ["Delete", "Drop"])
+        analysis: Pre-parsed ``statement`` from ``sql_analysis.analyze_statement``;
+            when given, neither sqlglot nor the upstream classifier is re-run.
 
     Returns:
         Tuple of (statement_type, is_valid, error_message)
@@ -259,7 +275,9 @@ def validate_sql_statement(
     multi_statement_detected = False
     parsed_expressions: list[exp.Expression] = []
 
-    if HAS_SQLGLOT:
+    if analysis is not None:
+        parsed_expressions = list(analysis.expressions)
+    elif HAS_SQLGLOT:
         try:
             parsed_expressions = [
                 cast(exp.Expression, expression)
@@ -288,7 +306,11 @@ def validate_sql_statement(
     # CRITICAL FIX: Use lowercase lists for upstream validation (it's case-sensitive)
     lowercase_disallow_list = [item.lower() for item in disallow_list]
     try:
-        stmt_type, is_valid = validate_sql_type(statement, effective_allow_list, lowercase_disallow_list)
+        if analysis is not None:
+            stmt_type = analysis.statement_type()
+            is_valid = _statement_type_allowed(stmt_type, effective_allow_list, lowercase_disallow_list)
+        else:
+            stmt_type, is_valid = validate_sql_type(statement, effective_allow_list, lowercase_disallow_list)
     except (ValueError, TypeError):
         # Re-raise expected validation errors as-is
         raise
@@ -330,7 +352,7 @@ def validate_sql_statement(
     canonical_stmt = _canonicalize_statement_type(stmt_type)
 
     if canonical_stmt.startswith("with"):
-        underlying_type = get_statement_type(statement)
+        underlying_type = analysis.statement_type() if analysis is not None else get_statement_type(statement)
         canonical_underlying = _canonicalize_statement_type(underlying_type)
         stmt_type = underlying_type or stmt_type
 
@@ -383,17 +405,18 @@ def validate_sql_statement(
     alternatives = generate_sql_alternatives(statement, stmt_type)
 
     # Enhanced structured error messages
-    structured_error = {
+    suggestions: list[str] = []
+    structured_error: dict[str, Any] = {
         "code": "SQL_TYPE_NOT_ALLOWED",
         "statement_type": stmt_type,
         "allowed_types": [t.capitalize() for t in allow_list] if allow_list else [],
-        "suggestions": [],
+        "suggestions": suggestions,
     }
 
     if alternatives:
         alt_text = "\n".join(alternatives)
         error_msg = f"SQL statement type '{stmt_type}' is not permitted.\n\nSafe alternatives:\n{alt_text}"
-        structured_error["suggestions"] = ["Use safe alternatives provided above"]
+        suggestions.append("Use safe alternatives provided above")
     else:
         # Capitalize allow_list for display (they're lowercase for validation)
         display_allowed = [t.capitalize() for t in allow_list]
@@ -414,22 +437,18 @@ def validate_sql_statement(
             if "LATERAL" in statement.upper():
                 details.append("\n💡 This query contains LATERAL operations.")
                 details.append("   If this is a SELECT query, LATERAL should be supported.")
-                structured_error["suggestions"].append(
-                    "Check if this is actually a SELECT query with LATERAL operations"
-                )
+                suggestions.append("Check if this is actually a SELECT query with LATERAL operations")
             elif "WITH" in statement.upper():
                 details.append("\n💡 This query starts WITH (CTE pattern).")
                 details.append("   If this is a SELECT with CTE, it should be supported.")
-                structured_error["suggestions"].append("Verify this is a SELECT statement with Common Table Expression")
+                suggestions.append("Verify this is a SELECT statement with Common Table Expression")
 
             # Add sqlglot fallback information if available
             if fallback_stmt_type and fallback_stmt_type != "UNKNOWN":
                 details.append(f"\n🔍 sqlglot detected this as: {fallback_stmt_type}")
                 if fallback_stmt_type in ["SELECT", "WITH"] and "select" in allow_set:
                     details.append("   This appears to be a SELECT query that should be allowed.")
-                    structured_error["suggestions"].append(
-                        "Consider enabling SELECT statements if this is a data query"
-                    )
+                    suggestions.append("Consider enabling SELECT statements if this is a data query")
 
         if display_allowed:
             details.append(f"\nAllowed types: {', '.join(display_allowed)}")
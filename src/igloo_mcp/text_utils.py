@@ -0,0 +1,15 @@
+"""Text helpers shared by the SQLite search indexes."""
+
+from __future__ import annotations
+
+
+def trigrams(text: str) -> set[str]:
+    """Distinct three-character substrings of ``text``.
+
+    The search indexes post values under their trigrams so a substring filter
+    only has to verify rows that contain every trigram of the needle.
+    """
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+__all__ = ["trigrams"]
@@ -159,6 +159,8 @@ def generate_cache_fixture(output_dir: Path) -> dict[str, Path]:
         _patched_time(time_sequence),
         patch("uuid.uuid4", side_effect=uuid_values),
         patch.object(QueryResultCache, "_iso_now", side_effect=cache_isos),
+        # Keep the fixture's 2024 cache entry within its TTL when it is read back.
+        patch.object(QueryResultCache, "_now", return_value=1704067500.0),
     ):
         asyncio.run(_run())
 
@@ -177,8 +179,7 @@ def generate_cache_fixture(output_dir: Path) -> dict[str, Path]:
     return {
         "history": history_path,
         "manifest": manifest_path,
-        "rows_jsonl": cache_dir / "rows.jsonl",
-        "rows_csv": cache_dir / "rows.csv",
+        "rows": cache_dir / "rows.col",
         "sql": sql_files[0],
     }
 
@@ -0,0 +1,149 @@
+"""Tests for the O_APPEND group-commit writer behind audit.jsonl."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from igloo_mcp.living_reports import audit_log
+from igloo_mcp.living_reports.audit_log import (
+    AUDIT_DURABILITY_ENV,
+    AUDIT_FSYNC_INTERVAL_ENV,
+    AuditLogWriter,
+    audit_log_writer,
+    sync_audit_logs,
+)
+from igloo_mcp.living_reports.service import ReportService
+from igloo_mcp.living_reports.storage import StorageError
+
+
+def _count_fsyncs(monkeypatch) -> list[int]:
+    synced: list[int] = []
+    real_fsync = audit_log.os.fsync
+
+    def counting_fsync(fd):
+        synced.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(audit_log.os, "fsync", counting_fsync)
+    return synced
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_audit_event_costs_one_write_and_one_fsync(tmp_path, monkeypatch):
+    monkeypatch.delenv(AUDIT_DURABILITY_ENV, raising=False)
+    service = ReportService(reports_root=tmp_path / "reports")
+    report_id = service.create_report("Audited")
+    storage = service.global_storage.get_report_storage(report_id)
+    event = storage.load_audit_events()[0]
+    writes: list[int] = []
+    real_write = audit_log.os.write
+    monkeypatch.setattr(audit_log.os, "write", lambda fd, data: writes.append(len(data)) or real_write(fd, data))
+    synced = _count_fsyncs(monkeypatch)
+
+    storage.append_audit_event(event)
+
+    # One append to the existing file: no temp file, no directory fsync.
+    assert len(writes) == 1
+    assert len(synced) == 1
+    assert not list(storage.report_dir.glob("*.tmp"))
+    assert len(storage.load_audit_events()) == 2
+
+
+def test_concurrent_appends_share_one_commit(tmp_path, monkeypatch):
+    writer = AuditLogWriter(tmp_path / "audit.jsonl")
+    started, release = threading.Event(), threading.Event()
+    batches: list[int] = []
+    real_write = writer._write
+
+    def slow_first_write(payload):
+        batches.append(payload.count(b"\n"))
+        if len(batches) == 1:
+            started.set()
+            release.wait(5)
+        real_write(payload)
+
+    monkeypatch.setattr(writer, "_write", slow_first_write)
+    leader = threading.Thread(target=writer.append, args=('{"n": "leader"}\n',))
+    leader.start()
+    assert started.wait(5)
+    followers = [threading.Thread(target=writer.append, args=(f'{{"n": {idx}}}\n',)) for idx in range(5)]
+    for thread in followers:
+        thread.start()
+    assert _wait_for(lambda: writer._committer.pending == 5)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert batches == [1, 5]
+    assert len((tmp_path / "audit.jsonl").read_text(encoding="utf-8").splitlines()) == 6
+
+
+def test_failed_commit_surfaces_as_storage_error(tmp_path, monkeypatch):
+    writer = AuditLogWriter(tmp_path / "missing" / "audit.jsonl")
+
+    with pytest.raises(OSError):
+        writer.append("{}\n")
+
+    service = ReportService(reports_root=tmp_path / "reports")
+    report_id = service.create_report("Broken")
+    storage = service.global_storage.get_report_storage(report_id)
+    monkeypatch.setattr(storage.audit_log, "_write", lambda payload: (_ for _ in ()).throw(OSError("disk full")))
+    with pytest.raises(StorageError, match="disk full"):
+        storage.append_audit_event(storage.load_audit_events()[0])
+
+
+def test_group_mode_shares_background_fsyncs(tmp_path, monkeypatch):
+    synced = _count_fsyncs(monkeypatch)
+    monkeypatch.setattr(audit_log, "_fsync_dir", lambda path: None)
+    writers = [
+        AuditLogWriter(tmp_path / f"audit-{idx}.jsonl", durability="group", fsync_interval_seconds=60)
+        for idx in range(2)
+    ]
+
+    for idx in range(10):
+        writers[idx % 2].append(json.dumps({"n": idx}) + "\n")
+
+    # Lines are readable immediately; nothing is fsync'd until the syncer runs.
+    assert [len(w.path.read_text(encoding="utf-8").splitlines()) for w in writers] == [5, 5]
+    assert synced == []
+    sync_audit_logs()
+    # One fsync per file, however many events it received.
+    assert len(synced) == 2
+
+
+def test_buffered_mode_never_fsyncs(tmp_path, monkeypatch):
+    synced = _count_fsyncs(monkeypatch)
+    writer = AuditLogWriter(tmp_path / "audit.jsonl", durability="buffered")
+
+    writer.append("{}\n")
+    writer.append("{}\n")
+
+    sync_audit_logs()
+    assert synced == []
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("group", "group"), ("BUFFERED", "buffered"), ("eventually", "fsync")],
+)
+def test_writer_reads_durability_from_env(tmp_path, monkeypatch, raw, expected):
+    monkeypatch.setenv(AUDIT_DURABILITY_ENV, raw)
+    monkeypatch.setenv(AUDIT_FSYNC_INTERVAL_ENV, "50")
+
+    writer = audit_log_writer(tmp_path / "audit.jsonl")
+
+    assert writer.durability == expected
+    assert writer.fsync_interval_seconds == 0.05
+    assert audit_log_writer(tmp_path / "audit.jsonl") is writer
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import threading
+import time
 from unittest.mock import Mock
 
 import pytest
@@ -11,14 +13,16 @@ from igloo_mcp.auth.providers import (
     AUTH_MODE_KEYPAIR,
     AUTH_MODE_SNOWFLAKE_LABS,
     AuthProviderSpec,
+    ConnectionPoolExhaustedError,
     KeyPairSnowflakeService,
+    SnowflakeConnectionPool,
     _build_keypair_connection_params,
     attach_provider_runtime_metadata,
     get_auth_provider_spec,
     get_service_provider_spec,
     resolve_effective_auth_mode,
 )
-from igloo_mcp.session_utils import ensure_session_lock
+from igloo_mcp.session_utils import ensure_session_lock, session_guard
 
 
 def _args(**overrides):
@@ -183,3 +187,207 @@ def test_keypair_service_get_connection_respects_shared_session_lock():
 
     assert completed.is_set() is True
     assert worker.is_alive() is False
+
+
+class _PoolConnection:
+    def __init__(self, name: str):
+        self.name = name
+        self.closed = False
+        self.cursor_instance = Mock()
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    def close(self) -> None:
+        self.closed = True
+
+    def cursor(self, *args, **kwargs):
+        return self.cursor_instance
+
+
+def _pool_factory():
+    created: list[_PoolConnection] = []
+
+    def factory() -> _PoolConnection:
+        conn = _PoolConnection(f"conn-{len(created)}")
+        created.append(conn)
+        return conn
+
+    return factory, created
+
+
+def test_connection_pool_reuses_idle_connections_and_bounds_size():
+    factory, created = _pool_factory()
+    pool = SnowflakeConnectionPool(factory, max_size=2, acquire_timeout=0.5)
+
+    first = pool.acquire()
+    second = pool.acquire()
+    assert first.connection is not second.connection
+    pool.release(first)
+    third = pool.acquire()
+
+    assert third.connection is first.connection
+    assert len(created) == 2
+    stats = pool.stats()
+    assert stats["size"] == 2
+    assert stats["in_use"] == 2
+    assert stats["utilization"] == 1.0
+
+
+def test_connection_pool_exhaustion_raises_retryable_error():
+    factory, _ = _pool_factory()
+    pool = SnowflakeConnectionPool(factory, max_size=1, acquire_timeout=0.05)
+    pool.acquire()
+
+    with pytest.raises(ConnectionPoolExhaustedError, match="please retry"):
+        pool.acquire()
+
+    assert pool.stats()["acquire_timeouts"] == 1
+
+
+def test_connection_pool_runs_queries_concurrently_up_to_max_size():
+    factory, created = _pool_factory()
+    pool = SnowflakeConnectionPool(factory, max_size=3, acquire_timeout=2.0)
+    barrier = threading.Barrier(3, timeout=2)
+    errors: list[threading.BrokenBarrierError] = []
+
+    def worker() -> None:
+        try:
+            with pool.connection():
+                barrier.wait()
+        except threading.BrokenBarrierError as exc:  # pragma: no cover - surfaced via assertion
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=3)
+
+    assert errors == []
+    assert len(created) == 3
+    assert pool.stats()["idle"] == 3
+
+
+def test_connection_pool_waiter_gets_released_connection():
+    factory, _ = _pool_factory()
+    pool = SnowflakeConnectionPool(factory, max_size=1, acquire_timeout=2.0)
+    held = pool.acquire()
+    acquired: list[object] = []
+
+    def waiter() -> None:
+        pooled = pool.acquire()
+        acquired.append(pooled.connection)
+        pool.release(pooled)
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    time.sleep(0.05)
+    assert pool.stats()["queue_depth"] == 1
+    pool.release(held)
+    thread.join(timeout=2)
+
+    assert acquired == [held.connection]
+    assert pool.stats()["max_queue_depth"] == 1
+
+
+def test_connection_pool_replaces_connections_failing_health_check():
+    factory, created = _pool_factory()
+    probe_results = iter([False])
+    pool = SnowflakeConnectionPool(
+        factory,
+        max_size=1,
+        health_check_interval=0.0,
+        health_probe=lambda _conn: next(probe_results, True),
+    )
+    pooled = pool.acquire()
+    pool.release(pooled)
+
+    replacement = pool.acquire()
+
+    assert replacement.connection is not pooled.connection
+    assert created[0].closed is True
+    assert pool.stats()["health_check_failures"] == 1
+
+
+def test_connection_pool_discards_connection_after_timeout():
+    factory, created = _pool_factory()
+    pool = SnowflakeConnectionPool(factory, max_size=1)
+
+    with pytest.raises(TimeoutError), pool.connection():
+        raise TimeoutError("query timed out")
+
+    assert created[0].closed is True
+    assert pool.stats()["size"] == 0
+
+
+def test_connection_pool_invalidate_retires_checked_out_connections():
+    factory, created = _pool_factory()
+    pool = SnowflakeConnectionPool(factory, max_size=2)
+    idle = pool.acquire()
+    busy = pool.acquire()
+    pool.release(idle)
+
+    pool.invalidate()
+    assert created[0].closed is True
+    assert created[1].closed is False
+
+    pool.release(busy)
+    assert created[1].closed is True
+    assert pool.stats()["size"] == 0
+
+
+def test_keypair_service_pools_connections_without_session_lock(monkeypatch):
+    factory, created = _pool_factory()
+    monkeypatch.setenv("IGLOO_MCP_POOL_SIZE", "2")
+    monkeypatch.setattr(
+        "igloo_mcp.auth.providers.KeyPairSnowflakeService._get_persistent_connection",
+        lambda self, session_parameters=None: factory(),
+    )
+
+    service = KeyPairSnowflakeService({"account": "acct", "user": "user"})
+    assert service.supports_concurrent_sessions is True
+    assert isinstance(session_guard(service), contextlib.nullcontext)
+
+    with service.get_connection() as (first, _), service.get_connection() as (second, _):
+        assert first is not second
+        assert service.get_pool_stats()["in_use"] == 2
+
+    # The startup connection seeds the pool instead of being thrown away.
+    assert created[0] in (first, second)
+    assert len(created) == 2
+    service.close()
+    assert all(conn.closed for conn in created)
+
+
+def test_keypair_service_pool_size_one_keeps_single_locked_session(monkeypatch):
+    factory, created = _pool_factory()
+    monkeypatch.setenv("IGLOO_MCP_POOL_SIZE", "1")
+    monkeypatch.setattr(
+        "igloo_mcp.auth.providers.KeyPairSnowflakeService._get_persistent_connection",
+        lambda self, session_parameters=None: factory(),
+    )
+
+    service = KeyPairSnowflakeService({"account": "acct", "user": "user"})
+
+    assert service.supports_concurrent_sessions is False
+    assert service.get_pool_stats() == {"enabled": False, "max_size": 1}
+    assert session_guard(service) is ensure_session_lock(service)
+    assert len(created) == 1
+
+
+def test_keypair_service_ignores_invalid_pool_settings(monkeypatch):
+    factory, _ = _pool_factory()
+    monkeypatch.setenv("IGLOO_MCP_POOL_SIZE", "0")
+    monkeypatch.setenv("IGLOO_MCP_POOL_ACQUIRE_TIMEOUT_SECONDS", "-5")
+    monkeypatch.setenv("IGLOO_MCP_POOL_HEALTH_CHECK_INTERVAL_SECONDS", "often")
+    monkeypatch.setattr(
+        "igloo_mcp.auth.providers.KeyPairSnowflakeService._get_persistent_connection",
+        lambda self, session_parameters=None: factory(),
+    )
+
+    service = KeyPairSnowflakeService({"account": "acct", "user": "user"})
+
+    pool = service._pool
+    assert (pool.max_size, pool.acquire_timeout, pool.health_check_interval) == (4, 30.0, 60.0)
+    service.close()
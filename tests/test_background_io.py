@@ -0,0 +1,196 @@
+"""Tests for the off-loop I/O lane, background writers and event-loop lag sampling."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import anyio
+import pytest
+
+from igloo_mcp import background_io
+from igloo_mcp.background_io import BackgroundWriter, EventLoopLagMonitor, GroupCommitter, run_io
+from igloo_mcp.config import Config, SnowflakeConfig
+from igloo_mcp.living_reports.history_index import HistoryIndex
+from igloo_mcp.living_reports.models import DatasetSource
+from igloo_mcp.mcp.tools.execute_query import ExecuteQueryTool
+from igloo_mcp.service_layer.query_service import QueryService
+from tests.helpers.fake_snowflake_connector import FakeQueryPlan, FakeSnowflakeService
+
+
+@pytest.mark.asyncio
+async def test_run_io_runs_off_the_event_loop_thread():
+    loop_thread = threading.get_ident()
+
+    worker_thread = await run_io(threading.get_ident)
+
+    assert worker_thread != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_writer_runs_jobs_in_order_and_counts_failures():
+    writer = BackgroundWriter("test", max_pending=8)
+    seen: list[int] = []
+
+    def failing() -> None:
+        raise OSError("disk full")
+
+    await writer.submit(lambda: seen.append(1))
+    await writer.submit(failing)
+    await writer.submit(lambda: seen.append(2))
+
+    assert writer.flush(timeout=5)
+    assert seen == [1, 2]
+    stats = writer.stats()
+    assert stats["submitted"] == 3
+    assert stats["completed"] == 2
+    assert stats["failed"] == 1
+    assert stats["last_error"] == "disk full"
+    assert stats["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_full_writer_queue_applies_backpressure():
+    writer = BackgroundWriter("slow-disk", max_pending=1)
+    started = threading.Event()
+    release = threading.Event()
+    seen: list[str] = []
+
+    def blocked() -> None:
+        started.set()
+        release.wait(5)
+        seen.append("blocked")
+
+    await writer.submit(blocked)
+    assert await run_io(started.wait, 5)
+    await writer.submit(lambda: seen.append("queued"))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(writer.submit, lambda: seen.append("waited"))
+        await anyio.sleep(0.05)
+        # The third write is waiting for room without blocking the loop.
+        assert writer.stats()["backpressure_waits"] == 1
+        assert seen == []
+        release.set()
+
+    assert writer.flush(timeout=5)
+    assert seen == ["blocked", "queued", "waited"]
+
+
+@pytest.mark.asyncio
+async def test_lag_monitor_reports_blocked_loop():
+    monitor = EventLoopLagMonitor(interval_seconds=0.01)
+    monitor.ensure_started()
+    monitor.ensure_started()  # idempotent for the same loop
+
+    await anyio.sleep(0.03)
+    time.sleep(0.1)  # stall the loop
+    await anyio.sleep(0.03)
+
+    stats = monitor.stats()
+    assert stats["sampling"] is True
+    assert stats["samples"] >= 2
+    assert stats["max_ms"] >= 50
+
+
+def test_lag_monitor_outside_event_loop_is_idle():
+    monitor = EventLoopLagMonitor()
+    monitor.ensure_started()
+
+    assert monitor.stats() == {
+        "sampling": False,
+        "interval_ms": 500.0,
+        "samples": 0,
+        "last_ms": None,
+        "p95_ms": None,
+        "max_ms": 0.0,
+    }
+
+
+def test_group_committer_raises_commit_failures_and_flushes_deferred_items():
+    committed: list[list[int]] = []
+
+    def commit(items):
+        if 0 in items:
+            raise OSError("disk full")
+        committed.append(list(items))
+
+    committer = GroupCommitter("test", commit)
+    with pytest.raises(OSError, match="disk full"):
+        committer.submit(0)
+
+    deferred = GroupCommitter("test-deferred", commit, deferred=True, flush_interval_seconds=60)
+    for item in (1, 2, 3):
+        deferred.submit(item)
+    assert committed == []
+    assert deferred.pending == 3
+    background_io.flush_group_commits()
+    assert committed == [[1, 2, 3]]
+
+
+def _tool(tmp_path, monkeypatch, plans: list[FakeQueryPlan]) -> ExecuteQueryTool:
+    monkeypatch.setenv("IGLOO_MCP_QUERY_HISTORY", str(tmp_path / "history.jsonl"))
+    monkeypatch.setenv("IGLOO_MCP_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("IGLOO_MCP_CACHE_ROOT", str(tmp_path / "cache"))
+    return ExecuteQueryTool(
+        Config(snowflake=SnowflakeConfig(profile="test")),
+        FakeSnowflakeService(plans),
+        QueryService(context=None),
+    )
+
+
+@pytest.mark.asyncio
+async def test_execute_query_does_cache_io_off_the_loop(tmp_path, monkeypatch):
+    statement = "SELECT 1 AS one"
+    tool = _tool(tmp_path, monkeypatch, [FakeQueryPlan(statement=statement, rows=[{"ONE": 1}])])
+    loop_thread = threading.get_ident()
+    io_threads: list[int] = []
+    real_lookup, real_store = tool.cache.lookup, tool.cache.store
+
+    def lookup(*args, **kwargs):
+        io_threads.append(threading.get_ident())
+        return real_lookup(*args, **kwargs)
+
+    def store(*args, **kwargs):
+        io_threads.append(threading.get_ident())
+        return real_store(*args, **kwargs)
+
+    monkeypatch.setattr(tool.cache, "lookup", lookup)
+    monkeypatch.setattr(tool.cache, "store", store)
+
+    result = await tool.execute(statement=statement, reason="Off-loop cache I/O", response_mode="full")
+
+    assert result["cache"]["manifest_path"]
+    assert len(io_threads) == 2
+    assert loop_thread not in io_threads
+
+
+@pytest.mark.asyncio
+async def test_background_writes_queue_cache_and_history(tmp_path, monkeypatch):
+    monkeypatch.setenv(background_io.BACKGROUND_WRITES_ENV, "true")
+    statement = "SELECT 1 AS one"
+    tool = _tool(tmp_path, monkeypatch, [FakeQueryPlan(statement=statement, rows=[{"ONE": 1}])])
+
+    first = await tool.execute(statement=statement, reason="Queued writes", response_mode="full")
+    assert background_io.flush_background_writes(timeout=5)
+    second = await tool.execute(statement=statement, reason="Queued writes", response_mode="full")
+    assert background_io.flush_background_writes(timeout=5)
+
+    # The manifest did not exist yet when the first response was built.
+    assert first["cache"] == {"hit": False, "cache_key": first["cache"]["cache_key"]}
+    assert second["cache"]["hit"] is True
+    history = [json.loads(line) for line in (tmp_path / "history.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [event["status"] for event in history] == ["success", "cache_hit"]
+    # History still names the manifest the queued store wrote, so the execution can back a dataset.
+    assert history[0]["cache_manifest"] == second["cache"]["manifest_path"]
+    dataset = HistoryIndex(tmp_path / "history.jsonl").resolve_dataset(
+        "ones", DatasetSource(execution_id=first["audit_info"]["execution_id"]), repo_root=tmp_path
+    )
+    assert dataset.rows == [{"ONE": 1}]
+
+    io_stats = tool.get_io_stats()
+    assert io_stats["background_writes"] is True
+    assert io_stats["writers"]["history"]["completed"] == 2
+    assert io_stats["writers"]["cache"]["completed"] == 1
+    assert io_stats["event_loop_lag"]["sampling"] is True
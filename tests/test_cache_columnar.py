@@ -0,0 +1,102 @@
+"""Tests for the columnar cache container."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from igloo_mcp.cache.columnar import (
+    ColumnarFormatError,
+    ColumnarReader,
+    ColumnarWriter,
+    read_columnar,
+    write_columnar,
+)
+
+
+def test_round_trip_across_row_groups(tmp_path: Path) -> None:
+    path = tmp_path / "rows.col"
+    rows = [{"ID": i, "NAME": f"n{i}", "SCORE": i / 3, "TAGS": ["a", i]} for i in range(25)]
+
+    stats = write_columnar(path, rows, row_group_size=4)
+
+    assert stats.row_count == 25
+    assert stats.file_bytes == path.stat().st_size
+    assert read_columnar(path) == rows
+
+
+def test_limit_and_column_projection(tmp_path: Path) -> None:
+    path = tmp_path / "rows.col"
+    rows = [{"ID": i, "NAME": f"n{i}"} for i in range(10)]
+    write_columnar(path, rows, row_group_size=3)
+
+    with ColumnarReader(path) as reader:
+        assert reader.columns == ["ID", "NAME"]
+        assert reader.row_count == 10
+        assert reader.read_rows(limit=4) == rows[:4]
+        assert reader.read_rows(limit=0) == []
+        assert reader.read_rows(limit=2, columns=["NAME"]) == [{"NAME": "n0"}, {"NAME": "n1"}]
+
+
+def test_offset_reads_start_inside_any_row_group(tmp_path: Path) -> None:
+    path = tmp_path / "rows.col"
+    rows = [{"ID": i} for i in range(10)]
+    write_columnar(path, rows, row_group_size=3)
+
+    with ColumnarReader(path) as reader:
+        assert reader.read_rows(offset=4, limit=4) == rows[4:8]
+        assert reader.read_rows(offset=9, limit=5) == rows[9:]
+        assert reader.read_rows(offset=3) == rows[3:]
+        assert reader.read_rows(offset=10, limit=2) == []
+
+
+def test_streaming_writer_matches_bulk_writer(tmp_path: Path) -> None:
+    rows = [{"ID": i, "NAME": f"n{i}"} for i in range(11)]
+    writer = ColumnarWriter(tmp_path / "streamed.col", ["ID", "NAME"], row_group_size=4)
+    for start in range(0, len(rows), 5):
+        writer.write_rows(rows[start : start + 5])
+
+    stats = writer.close()
+
+    assert stats == write_columnar(tmp_path / "bulk.col", rows, row_group_size=4)
+    assert read_columnar(tmp_path / "streamed.col") == rows
+
+
+def test_preserves_rows_with_missing_keys(tmp_path: Path) -> None:
+    path = tmp_path / "rows.col"
+    rows = [{"A": 1, "B": None}, {"A": 2}, {"C": "only-c"}, {}]
+
+    write_columnar(path, rows)
+
+    assert read_columnar(path) == rows
+
+
+def test_empty_result_and_csv_export(tmp_path: Path) -> None:
+    empty = tmp_path / "empty.col"
+    write_columnar(empty, [])
+    assert read_columnar(empty) == []
+
+    path = tmp_path / "rows.col"
+    write_columnar(path, [{"X": 1, "Y": "a,b"}, {"X": None, "Y": "c"}], row_group_size=1)
+    with ColumnarReader(path) as reader:
+        csv_path = reader.write_csv(tmp_path / "rows.csv", columns=["Y", "X"])
+    assert csv_path.read_text(encoding="utf-8").splitlines() == ["Y,X", '"a,b",1', "c,"]
+
+
+def test_rejects_truncated_or_foreign_files(tmp_path: Path) -> None:
+    path = tmp_path / "rows.col"
+    write_columnar(path, [{"ID": 1}])
+    path.write_bytes(path.read_bytes()[:-4])
+    with pytest.raises(ColumnarFormatError):
+        ColumnarReader(path)
+
+    jsonl = tmp_path / "rows.jsonl"
+    jsonl.write_text('{"ID": 1}\n', encoding="utf-8")
+    with pytest.raises(ColumnarFormatError):
+        ColumnarReader(jsonl)
+
+    empty = tmp_path / "zero.col"
+    empty.write_bytes(b"")
+    with pytest.raises(ColumnarFormatError):
+        ColumnarReader(empty)
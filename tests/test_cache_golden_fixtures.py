@@ -6,6 +6,7 @@ import csv
 import json
 from pathlib import Path
 
+from igloo_mcp.cache.columnar import ColumnarReader, read_columnar
 from tests.helpers.cache_fixture_builder import (
     generate_cache_fixture,
     load_jsonl,
@@ -51,6 +52,10 @@ def _compare_csv(expected_path: Path, actual_path: Path) -> None:
         assert actual_rows == expected_rows
 
 
+def _manifest_columns(generated: dict[str, Path]) -> list[str]:
+    return json.loads(generated["manifest"].read_text(encoding="utf-8"))["columns"]
+
+
 def test_cache_history_golden_fixture(tmp_path):
     assert BASELINE_DIR.exists(), "Golden fixtures are missing from the repository baseline"
 
@@ -63,11 +68,14 @@ def test_cache_history_golden_fixture(tmp_path):
     assert expected_manifest is not None, "Cache artifact baseline is missing from the repository baseline"
     _compare_json(expected_manifest, generated["manifest"])
 
+    # Cached rows are columnar; the readable baselines pin the decoded rows and the on-demand CSV.
     expected_rows_jsonl = expected_manifest.parent / "rows.jsonl"
-    _compare_jsonl(expected_rows_jsonl, generated["rows_jsonl"])
+    assert read_columnar(generated["rows"]) == load_jsonl(expected_rows_jsonl)
 
     expected_rows_csv = expected_manifest.parent / "rows.csv"
-    _compare_csv(expected_rows_csv, generated["rows_csv"])
+    with ColumnarReader(generated["rows"]) as reader:
+        generated_csv = reader.write_csv(tmp_path / "rows.csv", columns=_manifest_columns(generated))
+    _compare_csv(expected_rows_csv, generated_csv)
 
     expected_sql = next(BASELINE_DIR.glob("artifacts/queries/by_sha/*.sql"), None)
     assert expected_sql is not None, "Query artifact baseline is missing from the repository baseline"
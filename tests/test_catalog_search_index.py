@@ -0,0 +1,168 @@
+"""Tests for the pre-built catalog search index behind CatalogIndex.search."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from igloo_mcp.catalog import CatalogIndex, CatalogSearchIndex
+from igloo_mcp.catalog.catalog_service import CatalogService
+from igloo_mcp.catalog.search_index import SEARCH_INDEX_FILENAME, clear_search_index_cache
+from tests.helpers.fixture_snow_cli import FixtureSnowCLI
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "snowflake_cli"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_search_index_cache()
+    yield
+    clear_search_index_cache()
+
+
+def _table(database: str, schema: str, name: str, comment: str | None = None) -> dict:
+    return {"database_name": database, "schema_name": schema, "name": name, "comment": comment}
+
+
+def _column(database: str, schema: str, table: str, column: str) -> dict:
+    return {
+        "database_name": database,
+        "schema_name": schema,
+        "table_name": table,
+        "column_name": column,
+        "data_type": "TEXT",
+    }
+
+
+def _write_catalog(catalog_dir: Path, tables: list[dict], columns: list[dict], views: list[dict] = ()) -> Path:
+    catalog_dir.mkdir(parents=True, exist_ok=True)
+    path = catalog_dir / "catalog.json"
+    catalog = {"metadata": {"database": "ANALYTICS"}, "tables": tables, "views": list(views), "columns": columns}
+    path.write_text(json.dumps(catalog), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def catalog_dir(tmp_path: Path) -> Path:
+    directory = tmp_path / "catalog"
+    _write_catalog(
+        directory,
+        tables=[
+            _table("ANALYTICS", "SALES", "ORDERS", "Customer orders"),
+            _table("ANALYTICS", "SALES", "ORDER_ITEMS"),
+            _table("ANALYTICS", "FINANCE", "REVENUE_DAILY"),
+            _table("OTHER", "SALES", "ORDERS_ARCHIVE"),
+            {"comment": "no name, skipped"},
+        ],
+        views=[_table("ANALYTICS", "SALES", "V_ORDERS")],
+        columns=[
+            _column("ANALYTICS", "SALES", "ORDERS", "ORDER_ID"),
+            _column("ANALYTICS", "SALES", "ORDERS", "CUSTOMER_ID"),
+            _column("ANALYTICS", "SALES", "ORDER_ITEMS", "ORDER_ID"),
+            _column("ANALYTICS", "FINANCE", "REVENUE_DAILY", "NET_REVENUE"),
+        ],
+    )
+    return directory
+
+
+def _names(results) -> list[str]:
+    return [obj.name for obj in results]
+
+
+class TestCatalogSearchIndexQueries:
+    def test_name_filter_uses_substring_semantics(self, catalog_dir):
+        results, total, meta = CatalogIndex(catalog_dir).search(name_contains="order")
+
+        assert _names(results) == ["ORDERS", "ORDER_ITEMS", "ORDERS_ARCHIVE", "V_ORDERS"]
+        assert total == 4
+        assert meta == {"database": "ANALYTICS"}
+        assert (catalog_dir / SEARCH_INDEX_FILENAME).exists()
+
+    def test_short_needles_skip_trigrams(self, catalog_dir):
+        results, total, _ = CatalogIndex(catalog_dir).search(name_contains="_d")
+
+        assert _names(results) == ["REVENUE_DAILY"]
+        assert total == 1
+
+    def test_partition_and_type_filters(self, catalog_dir):
+        index = CatalogIndex(catalog_dir)
+
+        results, _, _ = index.search(database="analytics", schema="sales")
+        assert _names(results) == ["ORDERS", "ORDER_ITEMS", "V_ORDERS"]
+
+        results, _, _ = index.search(object_types=["VIEW"], name_contains="orders")
+        assert [(obj.object_type, obj.name) for obj in results] == [("view", "V_ORDERS")]
+
+    def test_column_filter_and_result_payload(self, catalog_dir):
+        results, total, _ = CatalogIndex(catalog_dir).search(column_contains="order_i")
+
+        assert _names(results) == ["ORDERS", "ORDER_ITEMS"]
+        assert total == 2
+        first = results[0]
+        assert first.comment == "Customer orders"
+        assert [col["name"] for col in first.columns] == ["ORDER_ID", "CUSTOMER_ID"]
+        assert first.raw["name"] == "ORDERS"
+
+    def test_limit_caps_results_but_not_total(self, catalog_dir):
+        results, total, _ = CatalogIndex(catalog_dir).search(name_contains="order", limit=1)
+
+        assert _names(results) == ["ORDERS"]
+        assert total == 4
+        assert CatalogIndex(catalog_dir).search(name_contains="order", limit=0)[:2] == ([], 4)
+
+    def test_no_matches(self, catalog_dir):
+        assert CatalogIndex(catalog_dir).search(name_contains="missing", column_contains="id")[:2] == ([], 0)
+
+    def test_missing_catalog_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            CatalogIndex(tmp_path).search()
+
+
+class TestCatalogSearchIndexCache:
+    def test_cached_index_skips_catalog_parsing(self, catalog_dir, monkeypatch):
+        CatalogIndex(catalog_dir).search()
+
+        def fail(self):
+            raise AssertionError("catalog.json should not be parsed again")
+
+        monkeypatch.setattr(CatalogIndex, "_load_catalog", fail)
+        clear_search_index_cache()  # a new process reuses the index file
+        assert CatalogIndex(catalog_dir).search(name_contains="revenue")[1] == 1
+        assert CatalogIndex(catalog_dir).search(name_contains="orders")[1] == 3
+
+    def test_rewritten_catalog_invalidates_index(self, catalog_dir):
+        CatalogIndex(catalog_dir).search()
+
+        path = _write_catalog(catalog_dir, tables=[_table("ANALYTICS", "SALES", "REFUNDS")], columns=[])
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        results, total, _ = CatalogIndex(catalog_dir).search()
+        assert _names(results) == ["REFUNDS"]
+        assert total == 1
+
+    def test_falls_back_to_memory_when_index_cannot_be_written(self, catalog_dir, monkeypatch):
+        def fail(cls, *args, **kwargs):
+            raise OSError("read-only directory")
+
+        monkeypatch.setattr(CatalogSearchIndex, "write", classmethod(fail))
+
+        results, total, _ = CatalogIndex(catalog_dir).search(column_contains="revenue")
+
+        assert _names(results) == ["REVENUE_DAILY"]
+        assert total == 1
+        assert not (catalog_dir / SEARCH_INDEX_FILENAME).exists()
+
+    def test_build_catalog_writes_index(self, tmp_path, monkeypatch):
+        service = CatalogService(context=None)
+        service.cli = FixtureSnowCLI(FIXTURE_DIR)
+        catalog_dir = tmp_path / "catalog"
+        service.build(output_dir=str(catalog_dir), database="ANALYTICS")
+
+        assert (catalog_dir / SEARCH_INDEX_FILENAME).exists()
+        monkeypatch.setattr(CatalogIndex, "_load_catalog", lambda self: pytest.fail("index should be prebuilt"))
+        results, _, _ = CatalogIndex(catalog_dir).search(name_contains="sales")
+        assert "SALES_FACT" in _names(results)
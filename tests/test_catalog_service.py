@@ -0,0 +1,327 @@
+"""Tests for CatalogService metadata query fan-out."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from igloo_mcp.catalog.catalog_service import CatalogService, _catalog_queries
+from igloo_mcp.mcp.tools.build_catalog import BuildCatalogTool
+from igloo_mcp.snow_cli import SnowCLIError
+
+
+class _FakeCLI:
+    """Answers catalog queries by object type, tracking peak concurrency."""
+
+    def __init__(self, *, fail: dict[str, str] | None = None, delay: float = 0.0):
+        self.fail = fail or {}
+        self.delay = delay
+        self.calls: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _object_type(sql: str) -> str:
+        for query in _catalog_queries("DB", account_scope=False):
+            if query.sql == sql:
+                return query.object_type
+        raise AssertionError(f"unexpected query: {sql}")
+
+    def run_query(self, sql, *, output_format=None, ctx_overrides=None, timeout=None):
+        object_type = self._object_type(sql)
+        with self._lock:
+            self.calls.append(object_type)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if object_type in self.fail:
+                raise SnowCLIError(self.fail[object_type])
+            return SimpleNamespace(rows=[{"name": f"{object_type}-{i}"} for i in range(2)])
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _service(cli: _FakeCLI) -> CatalogService:
+    service = CatalogService()
+    service.cli = cli
+    return service
+
+
+def test_catalog_queries_cover_every_object_type():
+    object_types = [query.object_type for query in _catalog_queries("DB", account_scope=False)]
+
+    assert object_types == [
+        "databases",
+        "schemas",
+        "tables",
+        "views",
+        "materialized_views",
+        "dynamic_tables",
+        "tasks",
+        "functions",
+        "procedures",
+        "columns",
+    ]
+    account = {query.object_type: query.sql for query in _catalog_queries(None, account_scope=True)}
+    assert account["tables"] == "SHOW TABLES"
+    assert "WHERE" not in account["columns"]
+
+
+def test_build_runs_queries_concurrently_and_records_timings(tmp_path):
+    cli = _FakeCLI(delay=0.05)
+
+    result = _service(cli).build(output_dir=str(tmp_path), database="DB", catalog_concurrency=4)
+
+    assert result.success
+    assert result.errors == {}
+    assert result.totals.tables == 2
+    assert result.totals.columns == 2
+    assert sorted(cli.calls) == sorted(q.object_type for q in _catalog_queries("DB", False))
+    assert 1 < cli.peak <= 4
+
+    summary = json.loads((tmp_path / "catalog_summary.json").read_text())
+    assert summary["concurrency"] == 4
+    assert set(summary["queries"]) == set(cli.calls)
+    assert all(entry["status"] == "success" and entry["rows"] == 2 for entry in summary["queries"].values())
+    assert all(entry["duration_ms"] >= 0 for entry in summary["queries"].values())
+
+
+def test_build_respects_serial_concurrency(tmp_path):
+    cli = _FakeCLI()
+
+    _service(cli).build(output_dir=str(tmp_path), database="DB", catalog_concurrency=1)
+
+    assert cli.peak == 1
+
+
+def test_failed_query_is_attributed_to_its_object_type(tmp_path):
+    cli = _FakeCLI(fail={"tasks": "Insufficient privileges to SHOW TASKS"})
+
+    result = _service(cli).build(output_dir=str(tmp_path), database="DB")
+
+    assert result.success
+    assert result.errors == {"tasks": "Insufficient privileges to SHOW TASKS"}
+    assert result.totals.tasks == 0
+    assert result.totals.tables == 2
+
+    catalog = json.loads((tmp_path / "catalog.json").read_text())
+    assert "tasks" not in catalog
+    summary = json.loads((tmp_path / "catalog_summary.json").read_text())
+    assert summary["queries"]["tasks"]["status"] == "error"
+    assert summary["errors"] == {"tasks": "Insufficient privileges to SHOW TASKS"}
+
+
+def test_failed_databases_query_fails_build(tmp_path):
+    cli = _FakeCLI(fail={"databases": "connection refused"})
+
+    result = _service(cli).build(output_dir=str(tmp_path), database="DB")
+
+    assert not result.success
+    assert "connection refused" in result.error
+
+
+@pytest.mark.anyio
+async def test_build_catalog_tool_surfaces_query_errors(base_config, tmp_path):
+    catalog_service = Mock()
+    catalog_service.build.return_value = SimpleNamespace(
+        output_dir=str(tmp_path),
+        totals=SimpleNamespace(
+            databases=1,
+            schemas=1,
+            tables=1,
+            views=0,
+            materialized_views=0,
+            dynamic_tables=0,
+            tasks=0,
+            functions=0,
+            procedures=0,
+            columns=3,
+        ),
+        errors={"tasks": "Insufficient privileges"},
+    )
+    tool = BuildCatalogTool(base_config, catalog_service)
+
+    result = await tool.execute(output_dir="./catalog")
+
+    warning = next(w for w in result["warnings"] if w["code"] == "CATALOG_QUERY_FAILED")
+    assert warning["object_type"] == "tasks"
+    assert "Insufficient privileges" in warning["message"]
+
+
+class _Warehouse:
+    """In-memory stand-in for the metadata queries an incremental refresh issues."""
+
+    def __init__(self):
+        self.relations: dict[tuple[str, str], str] = {}
+        self.columns: dict[tuple[str, str], list[str]] = {}
+        self.changed: set[tuple[str, str]] = set()
+        self.calls: list[str] = []
+        for schema in ("S1", "S2", "S3"):
+            for idx in range(4):
+                self.add(schema, f"T{idx}", ["ID", "VALUE"])
+
+    def add(self, schema, name, columns, object_type="tables"):
+        self.relations[(schema, name)] = object_type
+        self.columns[(schema, name)] = columns
+        self.changed.add((schema, name))
+
+    def _relation_rows(self, object_type, schema=None):
+        return [
+            {"database_name": "DB", "schema_name": s, "name": n}
+            for (s, n), kind in sorted(self.relations.items())
+            if kind == object_type and (schema is None or s == schema)
+        ]
+
+    def run_query(self, sql, *, output_format=None, ctx_overrides=None, timeout=None):
+        self.calls.append(" ".join(sql.split()))
+        rows: list[dict] = []
+        if sql.startswith("SHOW DATABASES"):
+            rows = [{"name": "DB"}]
+        elif sql.startswith("SHOW SCHEMAS"):
+            rows = [{"name": s} for s in sorted({s for s, _ in self.relations})]
+        elif "INFORMATION_SCHEMA.TABLES" in sql:
+            rows = [
+                {"SCHEMA_NAME": s, "TABLE_NAME": n, "TABLE_TYPE": "BASE TABLE", "CHANGED": (s, n) in self.changed}
+                for s, n in sorted(self.relations)
+            ]
+        elif "INFORMATION_SCHEMA.COLUMNS" in sql:
+            selective = "TABLE_NAME IN" in sql
+            rows = [
+                {"DATABASE_NAME": "DB", "SCHEMA_NAME": s, "TABLE_NAME": n, "COLUMN_NAME": column}
+                for (s, n), columns in sorted(self.columns.items())
+                if not selective or (f"'{s}'" in sql and f"'{n}'" in sql)
+                for column in columns
+            ]
+        else:
+            for object_type, keyword in (
+                ("tables", "TABLES"),
+                ("views", "VIEWS"),
+                ("materialized_views", "MATERIALIZED VIEWS"),
+                ("dynamic_tables", "DYNAMIC TABLES"),
+            ):
+                if sql.startswith(f"SHOW {keyword} IN SCHEMA"):
+                    rows = self._relation_rows(object_type, sql.rsplit(".", 1)[1].strip('"'))
+                elif sql.startswith(f"SHOW {keyword} IN DATABASE"):
+                    rows = self._relation_rows(object_type)
+        return SimpleNamespace(rows=rows)
+
+    def sync(self):
+        """Mark everything as unchanged, as after a successful build."""
+        self.changed.clear()
+        self.calls.clear()
+
+
+def _full_then_sync(tmp_path):
+    warehouse = _Warehouse()
+    service = _service(warehouse)
+    assert service.build(output_dir=str(tmp_path), database="DB").refresh_mode == "full"
+    warehouse.sync()
+    return warehouse, service
+
+
+def _catalog(tmp_path):
+    return json.loads((tmp_path / "catalog.json").read_text())
+
+
+def test_incremental_without_previous_build_runs_full(tmp_path):
+    result = _service(_Warehouse()).build(output_dir=str(tmp_path), database="DB", mode="incremental")
+
+    assert result.success
+    assert result.refresh_mode == "full"
+    assert result.refresh_reason == "no previous catalog or metadata"
+    assert result.totals.tables == 12
+
+
+def test_incremental_merges_changed_new_and_dropped_relations(tmp_path):
+    warehouse, service = _full_then_sync(tmp_path)
+    first_metadata = json.loads((tmp_path / "_catalog_metadata.json").read_text())
+    warehouse.add("S1", "T0", ["ID", "VALUE", "ADDED"])
+    warehouse.add("S1", "NEW", ["ID"])
+    del warehouse.relations[("S2", "T3")]
+    del warehouse.columns[("S2", "T3")]
+
+    result = service.build(output_dir=str(tmp_path), database="DB", mode="incremental")
+
+    assert result.success
+    assert result.refresh_mode == "incremental"
+    assert (result.changed_objects, result.dropped_objects) == (2, 1)
+    assert result.totals.tables == 12
+
+    catalog = _catalog(tmp_path)
+    names = {(row["schema_name"], row["name"]) for row in catalog["tables"]}
+    assert ("S1", "NEW") in names
+    assert ("S2", "T3") not in names
+    columns = [(row["SCHEMA_NAME"], row["TABLE_NAME"], row["COLUMN_NAME"]) for row in catalog["columns"]]
+    assert ("S1", "T0", "ADDED") in columns
+    assert ("S3", "T1", "VALUE") in columns
+    assert not any(table == "T3" and schema == "S2" for schema, table, _ in columns)
+    assert columns == sorted(columns, key=lambda c: (c[0], c[1])), "columns keep catalog order"
+    assert catalog["metadata"]["refresh_mode"] == "incremental"
+
+    # Only the affected schemas are re-listed; no database-wide SHOW or column scan.
+    assert not any(call.startswith(("SHOW TABLES IN DATABASE", "SHOW VIEWS IN DATABASE")) for call in warehouse.calls)
+    assert any(call.startswith('SHOW TABLES IN SCHEMA DB."S1"') for call in warehouse.calls)
+    assert not any('"S3"' in call for call in warehouse.calls)
+    assert sum("TABLE_NAME IN" in call for call in warehouse.calls) == 1
+
+    metadata = json.loads((tmp_path / "_catalog_metadata.json").read_text())
+    assert metadata["last_full_refresh"] == first_metadata["last_full_refresh"]
+    assert metadata["last_build"] > first_metadata["last_build"]
+    assert metadata["last_refresh_mode"] == "incremental"
+    summary = json.loads((tmp_path / "catalog_summary.json").read_text())
+    assert summary["refresh"] == {"mode": "incremental", "reason": None, "changed_objects": 2, "dropped_objects": 1}
+
+
+def test_incremental_with_no_changes_only_runs_cheap_queries(tmp_path):
+    warehouse, service = _full_then_sync(tmp_path)
+    before = _catalog(tmp_path)
+
+    result = service.build(output_dir=str(tmp_path), database="DB", mode="incremental")
+
+    assert result.refresh_mode == "incremental"
+    assert result.changed_objects == result.dropped_objects == 0
+    assert not any("IN SCHEMA" in call or "INFORMATION_SCHEMA.COLUMNS" in call for call in warehouse.calls)
+    after = _catalog(tmp_path)
+    assert after["tables"] == before["tables"]
+    assert after["columns"] == before["columns"]
+
+
+def test_incremental_falls_back_when_delta_is_large(tmp_path):
+    warehouse, service = _full_then_sync(tmp_path)
+    for idx in range(4):
+        warehouse.add("S4", f"T{idx}", ["ID"])
+
+    result = service.build(output_dir=str(tmp_path), database="DB", mode="incremental")
+
+    assert result.refresh_mode == "full"
+    assert "relations changed" in result.refresh_reason
+    assert result.totals.tables == 16
+    assert "SHOW TABLES IN DATABASE DB" in warehouse.calls
+
+
+def test_incremental_falls_back_after_stale_full_refresh(tmp_path):
+    _, service = _full_then_sync(tmp_path)
+    metadata_path = tmp_path / "_catalog_metadata.json"
+    metadata = json.loads(metadata_path.read_text())
+    metadata["last_full_refresh"] = "2020-01-01T00:00:00+00:00"
+    metadata_path.write_text(json.dumps(metadata))
+
+    result = service.build(output_dir=str(tmp_path), database="DB", mode="incremental")
+
+    assert result.refresh_mode == "full"
+    assert "older than 7 days" in result.refresh_reason
+
+
+def test_invalid_build_mode_fails(tmp_path):
+    result = _service(_Warehouse()).build(output_dir=str(tmp_path), database="DB", mode="delta")
+
+    assert not result.success
+    assert "Invalid catalog build mode" in result.error
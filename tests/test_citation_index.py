@@ -0,0 +1,138 @@
+"""Tests for the persistent citation index behind search_citations."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import uuid
+
+import pytest
+
+from igloo_mcp.config import get_config
+from igloo_mcp.living_reports.models import Citation, Insight
+from igloo_mcp.living_reports.service import ReportService
+from igloo_mcp.living_reports.storage import ReportStorage
+from igloo_mcp.mcp.tools.search_citations import SearchCitationsTool
+
+
+def _add_insight(service: ReportService, report_id: str, summary: str, *citations: Citation) -> None:
+    outline = service.get_report_outline(report_id)
+    outline.insights.append(
+        Insight(insight_id=str(uuid.uuid4()), importance=7, summary=summary, citations=list(citations))
+    )
+    service.update_report_outline(report_id, outline)
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = ReportService(reports_root=tmp_path / "reports")
+    alpha = service.create_report("Alpha")
+    _add_insight(
+        service,
+        alpha,
+        "Fees doubled",
+        Citation(source="query", provider="snowflake", execution_id="exec-1", description="Daily FEES rollup"),
+        Citation(source="url", url="https://Docs.Monad.xyz/fees", description="Fee schedule"),
+    )
+    beta = service.create_report("Beta")
+    _add_insight(
+        service,
+        beta,
+        "TVL flat",
+        Citation(source="api", provider="defillama", endpoint="/tvl", description="TVL pull"),
+        Citation(source="query", provider="snowflake", execution_id="exec-1"),
+    )
+    return service
+
+
+def _forbid_outline_loads(monkeypatch) -> None:
+    def fail(self):
+        raise AssertionError(f"outline of {self.report_dir.name} was loaded")
+
+    monkeypatch.setattr(ReportStorage, "load_outline", fail)
+
+
+@pytest.mark.asyncio
+async def test_search_answers_from_index_without_loading_outlines(service, monkeypatch):
+    tool = SearchCitationsTool(get_config(), service)
+    service.sync_citation_index()
+    _forbid_outline_loads(monkeypatch)
+
+    by_execution = await tool.execute(execution_id="exec-1", group_by="source")
+    by_url = await tool.execute(url_contains="monad.XYZ")
+    by_description = await tool.execute(description_contains="fe")
+
+    assert by_execution["matches_found"] == 2
+    assert by_execution["grouped_results"]["summary"] == {"query": 2}
+    assert [hit["report"]["title"] for hit in by_url["citations"]] == ["Alpha"]
+    assert by_url["citations"][0]["insight"]["summary"] == "Fees doubled"
+    assert {hit["citation"]["description"] for hit in by_description["citations"]} == {
+        "Daily FEES rollup",
+        "Fee schedule",
+    }
+
+
+@pytest.mark.asyncio
+async def test_results_keep_report_order_and_limit(service):
+    tool = SearchCitationsTool(get_config(), service)
+
+    result = await tool.execute(provider="snowflake", limit=1)
+
+    assert result["matches_found"] == 2
+    # Most recently updated report first, as with the outline scan.
+    assert [hit["report"]["title"] for hit in result["citations"]] == ["Beta"]
+
+
+@pytest.mark.asyncio
+async def test_hand_edited_outlines_are_reindexed(service, monkeypatch):
+    tool = SearchCitationsTool(get_config(), service)
+    await tool.execute(provider="defillama")
+
+    beta = service.resolve_report_selector("Beta")
+    outline_path = service.reports_root / "by_id" / beta / "outline.json"
+    data = json.loads(outline_path.read_text(encoding="utf-8"))
+    data["insights"][0]["citations"].append({"source": "api", "provider": "coingecko"})
+    outline_path.write_text(json.dumps(data), encoding="utf-8")
+
+    loaded: list[str] = []
+    real_load = ReportStorage.load_outline
+
+    def counting_load(self):
+        loaded.append(self.report_dir.name)
+        return real_load(self)
+
+    monkeypatch.setattr(ReportStorage, "load_outline", counting_load)
+    result = await tool.execute(provider="coingecko")
+
+    assert result["matches_found"] == 1
+    assert loaded == [beta]
+
+
+@pytest.mark.asyncio
+async def test_archived_and_deleted_reports_are_excluded(service):
+    tool = SearchCitationsTool(get_config(), service)
+    alpha = service.resolve_report_selector("Alpha")
+    beta = service.resolve_report_selector("Beta")
+
+    service.archive_report(alpha)
+    archived = await tool.execute(execution_id="exec-1")
+    service.delete_report(beta)
+    deleted = await tool.execute(execution_id="exec-1")
+
+    assert [hit["report"]["report_id"] for hit in archived["citations"]] == [beta]
+    assert deleted["matches_found"] == 0
+    assert beta not in service.citation_index.signatures()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("failing", ["signatures", "search"])
+async def test_sqlite_errors_fall_back_to_outline_scan(service, monkeypatch, failing):
+    tool = SearchCitationsTool(get_config(), service)
+
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(service.citation_index, failing, locked)
+    result = await tool.execute(execution_id="exec-1")
+
+    assert result["matches_found"] == 2
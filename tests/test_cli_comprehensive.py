@@ -387,3 +387,46 @@ class TestCLIIntegration:
 
             # Assert
             assert result == 0
+
+
+class TestCLICacheGC:
+    """Test cache gc CLI command."""
+
+    def test_cache_gc_enforces_quota_and_reports_json(self, tmp_path, capsys, monkeypatch):
+        """cache gc evicts entries beyond --max-mb and prints a JSON summary."""
+        from igloo_mcp.cache import QueryResultCache
+        from igloo_mcp.cli import main
+
+        monkeypatch.setenv("IGLOO_MCP_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+        cache_root = tmp_path / "cache"
+        cache = QueryResultCache(mode="enabled", root=cache_root, max_bytes=0)
+        for key in ("a", "b"):
+            cache.store(key, rows=[{"payload": "x" * 4000}], metadata={"profile": "TEST", "context": {}})
+
+        quota_mb = cache.stats()["disk"]["bytes"] * 0.75 / (1024 * 1024)
+
+        exit_code = main(["cache", "gc", "--root", str(cache_root), "--max-mb", str(quota_mb), "--format", "json"])
+
+        assert exit_code == 0
+        summary = json.loads(capsys.readouterr().out)
+        assert summary["scanned"] == 2
+        assert summary["evicted"] == 1
+        assert summary["bytes_after"] <= quota_mb * 1024 * 1024
+
+    def test_cache_gc_dry_run_text_output(self, tmp_path, capsys, monkeypatch):
+        """cache gc --dry-run leaves entries in place."""
+        from igloo_mcp.cache import QueryResultCache
+        from igloo_mcp.cli import main
+
+        monkeypatch.setenv("IGLOO_MCP_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+        cache_root = tmp_path / "cache"
+        QueryResultCache(mode="enabled", root=cache_root).store(
+            "a", rows=[{"id": 1}], metadata={"profile": "TEST", "context": {}}
+        )
+
+        assert main(["cache", "gc", "--root", str(cache_root), "--dry-run"]) == 0
+
+        output = capsys.readouterr().out
+        assert "[dry run]" in output
+        assert "Entries scanned: 1" in output
+        assert (cache_root / "a").exists()
@@ -0,0 +1,51 @@
+"""Tests for the shared environment setting readers."""
+
+from __future__ import annotations
+
+import pytest
+
+from igloo_mcp.env_utils import read_choice_env, read_float_env, read_int_env
+
+
+@pytest.mark.parametrize(
+    ("raw", "minimum", "expected"),
+    [
+        (None, 1, 7),
+        ("", 1, 7),
+        (" 12 ", 1, 12),
+        ("nope", 1, 7),
+        ("0", 1, 7),
+        ("0", 0, 0),
+        ("-3", None, -3),
+    ],
+)
+def test_read_int_env(monkeypatch, raw, minimum, expected):
+    if raw is None:
+        monkeypatch.delenv("IGLOO_MCP_TEST_INT", raising=False)
+    else:
+        monkeypatch.setenv("IGLOO_MCP_TEST_INT", raw)
+
+    assert read_int_env("IGLOO_MCP_TEST_INT", 7, minimum=minimum) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [(None, 2.5), (" 0.25 ", 0.25), ("0", 0.0), ("-1", 2.5), ("nan", 2.5), ("inf", 2.5), ("soon", 2.5)],
+)
+def test_read_float_env(monkeypatch, raw, expected):
+    if raw is None:
+        monkeypatch.delenv("IGLOO_MCP_TEST_FLOAT", raising=False)
+    else:
+        monkeypatch.setenv("IGLOO_MCP_TEST_FLOAT", raw)
+
+    assert read_float_env("IGLOO_MCP_TEST_FLOAT", 2.5) == expected
+
+
+@pytest.mark.parametrize(("raw", "expected"), [(None, "a"), (" B ", "b"), ("c", "a")])
+def test_read_choice_env(monkeypatch, raw, expected):
+    if raw is None:
+        monkeypatch.delenv("IGLOO_MCP_TEST_CHOICE", raising=False)
+    else:
+        monkeypatch.setenv("IGLOO_MCP_TEST_CHOICE", raw)
+
+    assert read_choice_env("IGLOO_MCP_TEST_CHOICE", ("a", "b"), "a") == expected
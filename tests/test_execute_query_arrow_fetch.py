@@ -0,0 +1,222 @@
+"""Tests for the opt-in Arrow batch fetch engine behind execute_query."""
+
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from igloo_mcp import arrow_fetch
+from igloo_mcp.config import Config, SnowflakeConfig
+from igloo_mcp.mcp.tools import execute_query as execute_query_module
+from igloo_mcp.mcp.tools.execute_query import ExecuteQueryTool
+from igloo_mcp.service_layer.query_service import QueryService
+
+SESSION_ROW = {"ROLE": "ANALYST", "WAREHOUSE": "WH", "DATABASE": "DB", "SCHEMA": "PUBLIC"}
+COLUMNS = ("ID", "AMOUNT", "DAY")
+
+
+def _value_row(i: int) -> tuple[int, Decimal, date]:
+    return (i, Decimal(i * 10), date(2024, 1, 1 + i % 28))
+
+
+class _FakeColumn:
+    def __init__(self, values: list[Any]) -> None:
+        self._values = values
+
+    def to_pylist(self) -> list[Any]:
+        return list(self._values)
+
+
+class _FakeTable:
+    """The slice of the pyarrow.Table API the batch engine relies on."""
+
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self._rows = rows
+
+    @property
+    def num_rows(self) -> int:
+        return len(self._rows)
+
+    @property
+    def num_columns(self) -> int:
+        return len(COLUMNS)
+
+    def column(self, idx: int) -> _FakeColumn:
+        return _FakeColumn([row[idx] for row in self._rows])
+
+    def slice(self, offset: int = 0, length: int | None = None) -> _FakeTable:
+        end = None if length is None else offset + length
+        return _FakeTable(self._rows[offset:end])
+
+
+class _Cursor:
+    """Serves ``total_rows`` rows either as Arrow batches of ``batch_rows`` or through fetchmany."""
+
+    def __init__(self, total_rows: int, *, batch_rows: int = 1_000, arrow: bool = True) -> None:
+        self._rows = [_value_row(i) for i in range(total_rows)]
+        self._batch_rows = batch_rows
+        self._arrow = arrow
+        self._next = 0
+        self._session_rows: list[dict[str, Any]] = []
+        self.description: list[tuple[str]] | None = None
+        self.rowcount = 0
+        self.sfqid = "QID"
+        self.fetchmany_calls = 0
+
+    def execute(self, query: str) -> None:
+        if "CURRENT_ROLE()" in query.upper():
+            self._session_rows = [dict(SESSION_ROW)]
+            self.description = [(key,) for key in SESSION_ROW]
+            return
+        if not query.upper().startswith("SELECT"):
+            self._session_rows, self.description = [], None
+            return
+        self.description = [(name,) for name in COLUMNS]
+
+    def fetchone(self) -> dict[str, Any] | None:
+        return self._session_rows.pop(0) if self._session_rows else None
+
+    def fetchall(self) -> list[Any]:
+        rows, self._session_rows = self._session_rows, []
+        return rows
+
+    def fetchmany(self, size: int) -> list[tuple[Any, ...]]:
+        self.fetchmany_calls += 1
+        chunk = self._rows[self._next : self._next + size]
+        self._next += len(chunk)
+        return chunk
+
+    def fetch_arrow_batches(self):
+        if not self._arrow:
+            raise RuntimeError("NotSupportedError: result is not in Arrow format")
+        return (
+            _FakeTable(self._rows[start : start + self._batch_rows])
+            for start in range(0, len(self._rows), self._batch_rows)
+        )
+
+
+class _Service:
+    def __init__(self, cursor: _Cursor) -> None:
+        self.cursor = cursor
+
+    def get_query_tag_param(self) -> dict[str, Any]:
+        return {}
+
+    @contextmanager
+    def get_connection(self, **_: Any):
+        yield object(), self.cursor
+
+
+@pytest.fixture(autouse=True)
+def _isolated(tmp_path, monkeypatch):
+    monkeypatch.setenv("IGLOO_MCP_QUERY_HISTORY", str(tmp_path / "history.jsonl"))
+    monkeypatch.setenv("IGLOO_MCP_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("IGLOO_MCP_CACHE_MODE", "disabled")
+    monkeypatch.setenv("IGLOO_MCP_QUERY_RETRY_ENABLED", "false")
+    # The fake tables stand in for pyarrow, which is an optional dependency.
+    monkeypatch.setattr(arrow_fetch, "HAS_PYARROW", True)
+
+
+def _tool(cursor: _Cursor, engine: str, monkeypatch) -> ExecuteQueryTool:
+    monkeypatch.setenv(arrow_fetch.FETCH_ENGINE_ENV, engine)
+    config = Config(snowflake=SnowflakeConfig(profile="test"))
+    return ExecuteQueryTool(config, _Service(cursor), QueryService(context=None), health_monitor=None)
+
+
+async def _run(cursor: _Cursor, engine: str, monkeypatch, **kwargs: Any) -> dict[str, Any]:
+    return await _tool(cursor, engine, monkeypatch).execute(
+        statement="SELECT id, amount, day FROM sales",
+        reason="Exercise the fetch engines",
+        response_mode="full",
+        **kwargs,
+    )
+
+
+@pytest.mark.anyio
+async def test_arrow_engine_matches_row_engine(monkeypatch):
+    arrow_cursor = _Cursor(total_rows=1_500)
+    arrow_result = await _run(arrow_cursor, "arrow", monkeypatch)
+    row_result = await _run(_Cursor(total_rows=1_500), "rows", monkeypatch)
+
+    assert arrow_cursor.fetchmany_calls == 0
+    assert arrow_result["rows"][0] == {"ID": 0, "AMOUNT": 0, "DAY": "2024-01-01"}
+    assert arrow_result["rows"] == row_result["rows"]
+    assert arrow_result["rowcount"] == row_result["rowcount"] == 1_500
+
+
+@pytest.mark.anyio
+async def test_arrow_engine_truncates_like_row_engine(monkeypatch):
+    monkeypatch.setattr(execute_query_module, "RESULT_TRUNCATION_THRESHOLD", 10)
+    monkeypatch.setattr(execute_query_module, "RESULT_SIZE_LIMIT_MB", 0)
+    monkeypatch.setattr(execute_query_module, "RESULT_KEEP_FIRST_ROWS", 5)
+    monkeypatch.setattr(execute_query_module, "RESULT_KEEP_LAST_ROWS", 3)
+
+    arrow_result = await _run(_Cursor(total_rows=4_500, batch_rows=700), "arrow", monkeypatch)
+    row_result = await _run(_Cursor(total_rows=4_500), "rows", monkeypatch)
+
+    ids = [row.get("ID") for row in arrow_result["rows"]]
+    assert ids == [0, 1, 2, 3, 4, None, 4_497, 4_498, 4_499]
+    assert arrow_result["rows"] == row_result["rows"]
+    assert arrow_result["truncated"] is True
+    assert arrow_result["original_rowcount"] == 4_500
+    assert arrow_result["truncation_info"] == row_result["truncation_info"]
+
+
+@pytest.mark.anyio
+async def test_arrow_engine_streams_exports(monkeypatch):
+    cursor = _Cursor(total_rows=4_500, batch_rows=3_000)
+
+    result = await _run(cursor, "arrow", monkeypatch, output_format="jsonl")
+
+    assert cursor.fetchmany_calls == 0
+    assert result["rowcount"] == 4_500
+    lines = Path(result["output_file"]).read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 4_500
+    assert json.loads(lines[-1]) == {"ID": 4_499, "AMOUNT": 44_990, "DAY": "2024-01-20"}
+
+
+@pytest.mark.anyio
+async def test_non_arrow_results_fall_back_to_rows(monkeypatch):
+    cursor = _Cursor(total_rows=20, arrow=False)
+
+    result = await _run(cursor, "arrow", monkeypatch)
+
+    assert cursor.fetchmany_calls > 0
+    assert result["rowcount"] == 20
+    assert result["rows"][-1]["ID"] == 19
+
+
+def test_fetch_engine_from_env(monkeypatch):
+    monkeypatch.setenv(arrow_fetch.FETCH_ENGINE_ENV, "Arrow")
+    assert arrow_fetch.fetch_engine_from_env() == "arrow"
+
+    monkeypatch.setenv(arrow_fetch.FETCH_ENGINE_ENV, "pandas")
+    assert arrow_fetch.fetch_engine_from_env() == "rows"
+
+    monkeypatch.setattr(arrow_fetch, "HAS_PYARROW", False)
+    monkeypatch.setenv(arrow_fetch.FETCH_ENGINE_ENV, "arrow")
+    assert arrow_fetch.fetch_engine_from_env() == "rows"
+
+
+def test_table_rows_converts_arrow_columns():
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table(
+        {
+            "ID": pa.array([1, 2], pa.int64()),
+            "BIG": pa.array([Decimal(10) ** 30, Decimal(7)], pa.decimal128(38, 0)),
+            "PRICE": pa.array([Decimal("1.50"), Decimal("2.00")], pa.decimal128(10, 2)),
+            "DAY": pa.array([date(2024, 1, 1), None], pa.date32()),
+            "NAME": pa.array(["a", None]),
+        }
+    )
+
+    assert arrow_fetch.table_rows(table, table.column_names) == [
+        {"ID": 1, "BIG": 10**30, "PRICE": 1.5, "DAY": "2024-01-01", "NAME": "a"},
+        {"ID": 2, "BIG": 7, "PRICE": 2, "DAY": None, "NAME": None},
+    ]
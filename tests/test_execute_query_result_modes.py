@@ -6,8 +6,12 @@ to reduce token usage (inspired by Morph MCP's context pollution prevention).
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
+from igloo_mcp.arrow_fetch import CollectedRows
+from igloo_mcp.config import Config, SnowflakeConfig
 from igloo_mcp.mcp.tools.execute_query import (
     RESULT_MODE_FULL,
     RESULT_MODE_MINIMAL,
@@ -16,8 +20,12 @@ from igloo_mcp.mcp.tools.execute_query import (
     RESULT_MODE_SCHEMA_ONLY,
     RESULT_MODE_SUMMARY,
     RESULT_MODE_SUMMARY_SAMPLE_SIZE,
+    ExecuteQueryTool,
     _apply_result_mode,
+    _estimate_response_tokens,
 )
+from igloo_mcp.service_layer.query_service import QueryService
+from tests.helpers.fake_snowflake_connector import FakeQueryPlan, FakeSnowflakeService
 
 
 class TestApplyResultMode:
@@ -200,6 +208,46 @@ class TestApplyResultMode:
         assert "response_mode='full'" in result["result_mode_info"]["hint"]
 
 
+class TestTokenEstimate:
+    """Token estimates size rows from the fetch-time sample instead of serializing them."""
+
+    def test_known_rows_bytes_match_full_serialization(self) -> None:
+        rows = [{"id": i, "name": f"row_{i:03d}"} for i in range(200)]
+        result = {"statement": "SELECT 1", "rows": rows, "rowcount": 200}
+        rows_bytes = len(json.dumps(rows))
+
+        assert _estimate_response_tokens(result, rows_bytes=rows_bytes) == _estimate_response_tokens(result)
+
+    def test_collected_rows_size_uniform_rows_exactly(self) -> None:
+        rows = [{"id": i, "name": f"row_{i:03d}"} for i in range(100, 300)]
+        collected = CollectedRows(head_rows=rows, row_bytes=len(json.dumps(rows[0])))
+
+        assert collected.rows_bytes(len(rows)) == len(json.dumps(rows))
+        assert collected.rows_bytes(0) == len(json.dumps([]))
+
+    @pytest.mark.asyncio
+    async def test_live_estimate_does_not_serialize_rows(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setenv("IGLOO_MCP_QUERY_HISTORY", str(tmp_path / "history.jsonl"))
+        monkeypatch.setenv("IGLOO_MCP_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+        monkeypatch.setenv("IGLOO_MCP_CACHE_MODE", "disabled")
+        rows = [{"ID": i, "NAME": f"name-{i:04d}"} for i in range(1_000)]
+        service = FakeSnowflakeService([FakeQueryPlan(statement="SELECT MANY", rows=rows, duration=0.01)])
+        tool = ExecuteQueryTool(Config(snowflake=SnowflakeConfig(profile="test")), service, QueryService(context=None))
+
+        real_dumps = json.dumps
+
+        def guarded_dumps(obj, *args, **kwargs):
+            if isinstance(obj, dict) and len(obj.get("rows") or []) > RESULT_MODE_SAMPLE_SIZE:
+                raise AssertionError("token estimates must not serialize every row")
+            return real_dumps(obj, *args, **kwargs)
+
+        monkeypatch.setattr(json, "dumps", guarded_dumps)
+        result = await tool.execute(statement="SELECT MANY", reason="Size the response", response_mode="minimal")
+
+        expected_rows_tokens = len(real_dumps(rows)) // 4
+        assert result["token_estimate"]["savings_vs_full"] == pytest.approx(expected_rows_tokens, rel=0.05)
+
+
 class TestResultModeConstants:
     """Tests for result mode constants."""
 
@@ -0,0 +1,214 @@
+"""Tests for execute_query file exports streamed straight from the cursor."""
+
+from __future__ import annotations
+
+import csv
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from igloo_mcp.config import Config, SnowflakeConfig
+from igloo_mcp.mcp.exceptions import MCPExecutionError
+from igloo_mcp.mcp.tools import execute_query as execute_query_module
+from igloo_mcp.mcp.tools.execute_query import ExecuteQueryTool
+from igloo_mcp.query_export import QueryExportError, QueryExportWriter
+from igloo_mcp.service_layer.query_service import QueryService
+
+SESSION_ROW = {"ROLE": "ANALYST", "WAREHOUSE": "WH", "DATABASE": "DB", "SCHEMA": "PUBLIC"}
+
+
+class _StreamingCursor:
+    """Serves ``total_rows`` (ID, NAME) tuples through fetchmany; fetchall is off limits."""
+
+    def __init__(self, total_rows: int, fail_after: int | None = None) -> None:
+        self._total_rows = total_rows
+        self._fail_after = fail_after
+        self._next = 0
+        self._session_rows: list[dict[str, Any]] = []
+        self.description: list[tuple[str]] | None = None
+        self.rowcount = 0
+        self.sfqid = "QID"
+        self.fetch_sizes: list[int] = []
+
+    def execute(self, query: str) -> None:
+        if "CURRENT_ROLE()" in query.upper():
+            self._session_rows = [dict(SESSION_ROW)]
+            self.description = [(key,) for key in SESSION_ROW]
+            return
+        if not query.upper().startswith("SELECT"):
+            self._session_rows, self.description = [], None
+            return
+        self.description = [("ID",), ("NAME",)]
+
+    def fetchone(self) -> dict[str, Any] | None:
+        return self._session_rows.pop(0) if self._session_rows else None
+
+    def fetchall(self) -> list[Any]:
+        if self.description == [("ID",), ("NAME",)]:
+            raise AssertionError("streamed exports must not fetch the whole result")
+        rows, self._session_rows = self._session_rows, []
+        return rows
+
+    def fetchmany(self, size: int) -> list[tuple[int, str]]:
+        if self._fail_after is not None and self._next >= self._fail_after:
+            raise ConnectionError("connection reset")
+        self.fetch_sizes.append(size)
+        end = min(self._next + size, self._total_rows)
+        rows = [(i, f"name-{i}") for i in range(self._next, end)]
+        self._next = end
+        return rows
+
+
+class _Service:
+    def __init__(self, cursor: _StreamingCursor) -> None:
+        self.cursor = cursor
+
+    def get_query_tag_param(self) -> dict[str, Any]:
+        return {}
+
+    @contextmanager
+    def get_connection(self, **_: Any):
+        yield object(), self.cursor
+
+
+@pytest.fixture(autouse=True)
+def _isolated(tmp_path, monkeypatch):
+    monkeypatch.setenv("IGLOO_MCP_QUERY_HISTORY", str(tmp_path / "history.jsonl"))
+    monkeypatch.setenv("IGLOO_MCP_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("IGLOO_MCP_CACHE_MODE", "disabled")
+    monkeypatch.setenv("IGLOO_MCP_QUERY_RETRY_ENABLED", "false")
+
+
+def _tool(cursor: _StreamingCursor) -> ExecuteQueryTool:
+    config = Config(snowflake=SnowflakeConfig(profile="test"))
+    return ExecuteQueryTool(config, _Service(cursor), QueryService(context=None), health_monitor=None)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("output_format", ["csv", "json", "jsonl"])
+async def test_file_export_streams_every_row_without_truncation(output_format, monkeypatch):
+    # Inline results of this size would be cut to head/tail rows.
+    monkeypatch.setattr(execute_query_module, "RESULT_TRUNCATION_THRESHOLD", 10)
+    monkeypatch.setattr(execute_query_module, "RESULT_SIZE_LIMIT_MB", 0)
+    cursor = _StreamingCursor(total_rows=4_500)
+
+    result = await _tool(cursor).execute(
+        statement="SELECT id, name FROM big_table",
+        reason="Export a large extract",
+        output_format=output_format,
+    )
+
+    assert result["rowcount"] == 4_500
+    assert result["columns"] == ["ID", "NAME"]
+    assert result["result_mode_info"]["streamed"] is True
+    assert result["key_metrics"]["total_rows"] == 4_500
+    assert result["key_metrics"]["sampled_rows"] == 2_000
+    assert len(cursor.fetch_sizes) == 4  # three 2000-row chunks plus the empty terminator
+
+    output_file = Path(result["output_file"])
+    assert result["file_size_bytes"] == output_file.stat().st_size
+    text = output_file.read_text(encoding="utf-8")
+    if output_format == "csv":
+        rows = list(csv.DictReader(text.splitlines()))
+        assert rows[0] == {"ID": "0", "NAME": "name-0"}
+    elif output_format == "json":
+        rows = json.loads(text)
+        assert rows[0] == {"ID": 0, "NAME": "name-0"}
+    else:
+        rows = [json.loads(line) for line in text.splitlines()]
+    assert len(rows) == 4_500
+    assert "__truncated__" not in text
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("output_format", ["csv", "paged"])
+async def test_repeat_export_is_served_from_the_cache(tmp_path, monkeypatch, output_format):
+    monkeypatch.setenv("IGLOO_MCP_CACHE_MODE", "enabled")
+    monkeypatch.setenv("IGLOO_MCP_CACHE_ROOT", str(tmp_path / "cache"))
+    cursor = _StreamingCursor(total_rows=2_500)
+    tool = _tool(cursor)
+
+    def export():
+        return tool.execute(statement="SELECT id, name FROM t", reason="Repeat export", output_format=output_format)
+
+    first = await export()
+    fetches = len(cursor.fetch_sizes)
+    second = await export()
+
+    assert first["cache"]["hit"] is False
+    assert second["cache"]["hit"] is True
+    assert len(cursor.fetch_sizes) == fetches
+    assert second["rowcount"] == 2_500
+    if output_format == "csv":
+        text = Path(second["output_file"]).read_text(encoding="utf-8")
+        assert len(text.splitlines()) == 2_501
+
+
+@pytest.mark.anyio
+async def test_export_larger_than_cache_limit_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("IGLOO_MCP_CACHE_MODE", "enabled")
+    monkeypatch.setenv("IGLOO_MCP_CACHE_ROOT", str(tmp_path / "cache"))
+    monkeypatch.setenv("IGLOO_MCP_CACHE_MAX_ROWS", "1000")
+    cursor = _StreamingCursor(total_rows=2_500)
+
+    result = await _tool(cursor).execute(statement="SELECT id, name FROM t", reason="Big export", output_format="csv")
+
+    assert result["rowcount"] == 2_500
+    assert not list((tmp_path / "cache").glob("*/manifest.json"))
+
+
+@pytest.mark.anyio
+async def test_failed_stream_removes_partial_file(tmp_path):
+    cursor = _StreamingCursor(total_rows=10_000, fail_after=4_000)
+
+    with pytest.raises(MCPExecutionError):
+        await _tool(cursor).execute(
+            statement="SELECT id, name FROM big_table",
+            reason="Export that loses its connection",
+            output_format="jsonl",
+        )
+
+    output_dir = tmp_path / "artifacts" / "scratchpad" / "query_results"
+    assert list(output_dir.glob("*.jsonl")) == []
+
+
+def test_writer_rejects_writes_after_abort(tmp_path):
+    writer = QueryExportWriter(tmp_path / "out.json", "json", sample_limit=1)
+    writer.open(["A"])
+    writer.write_rows([{"A": 1}, {"A": 2}])
+
+    assert writer.sample == [{"A": 1}]
+    writer.abort()
+
+    assert not writer.path.exists()
+    with pytest.raises(QueryExportError):
+        writer.write_rows([{"A": 3}])
+
+
+def test_writer_restarts_file_on_reopen(tmp_path):
+    writer = QueryExportWriter(tmp_path / "out.csv", "csv")
+    writer.open(["A"])
+    writer.write_rows([{"A": 1}])
+    writer.open(["A"])  # a retried attempt starts over
+    writer.write_rows([{"A": 2}])
+    writer.close()
+
+    assert writer.rowcount == 1
+    assert writer.path.read_text(encoding="utf-8").splitlines() == ["A", "2"]
+
+
+def test_writer_retains_rows_up_to_limit(tmp_path):
+    writer = QueryExportWriter(tmp_path / "out.jsonl", "jsonl", retain_limit=3)
+    writer.open(["A"])
+    writer.write_rows([{"A": 1}, {"A": 2}])
+    assert writer.retained == [{"A": 1}, {"A": 2}]
+
+    writer.write_rows([{"A": 3}, {"A": 4}])
+    assert writer.retained is None
+
+    writer.open(["A"])  # a retried attempt starts over
+    writer.write_rows([{"A": 5}])
+    assert writer.retained == [{"A": 5}]
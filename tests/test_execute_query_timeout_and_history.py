@@ -5,7 +5,8 @@ from pathlib import Path
 import pytest
 
 from igloo_mcp.config import Config, SnowflakeConfig
-from igloo_mcp.mcp.exceptions import MCPExecutionError
+from igloo_mcp.mcp.exceptions import MCPExecutionError, MCPValidationError
+from igloo_mcp.mcp.tools import execute_query as execute_query_module
 from igloo_mcp.mcp.tools.execute_query import ExecuteQueryTool
 from igloo_mcp.service_layer.query_service import QueryService
 from tests.helpers.fake_snowflake_connector import (
@@ -238,7 +239,7 @@ async def test_large_result_triggers_truncation(tmp_path, monkeypatch):
 
     manifest_path = Path(result["cache"]["manifest_path"])
     assert manifest_path.exists()
-    rows_path = manifest_path.parent / "rows.jsonl"
+    rows_path = manifest_path.parent / "rows.col"
     assert rows_path.exists()
 
     cached_result = await tool.execute(
@@ -327,3 +328,89 @@ async def test_timeout_error_message_prioritizes_catalog_filtering(tmp_path, mon
 
     if timeout_mention != -1 and clustering_mention != -1:
         assert clustering_mention < timeout_mention, "Clustering guidance should come before timeout increase"
+
+
+@pytest.mark.asyncio
+async def test_cache_ttl_seconds_zero_bypasses_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("IGLOO_MCP_QUERY_HISTORY", str(tmp_path / "history.jsonl"))
+    monkeypatch.setenv("IGLOO_MCP_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("IGLOO_MCP_CACHE_ROOT", str(tmp_path / "cache"))
+
+    cfg = Config(snowflake=SnowflakeConfig(profile="test"))
+    service = FakeSnowflakeService([FakeQueryPlan(statement="SELECT TTL", rows=[{"A": 1}], duration=0.01)])
+    tool = ExecuteQueryTool(cfg, service, QueryService(context=None))
+
+    first = await tool.execute(
+        statement="SELECT TTL", reason="Populate cache", response_mode="full", cache_ttl_seconds=600
+    )
+    manifest = json.loads(Path(first["cache"]["manifest_path"]).read_text(encoding="utf-8"))
+    assert manifest["ttl_seconds"] == 600
+
+    cached = await tool.execute(statement="SELECT TTL", reason="Cache hit expected", response_mode="full")
+    assert cached["cache"]["hit"] is True
+
+    bypassed = await tool.execute(
+        statement="SELECT TTL", reason="Bypass cache", response_mode="full", cache_ttl_seconds=0
+    )
+    assert bypassed["cache"]["hit"] is False
+    assert len([cursor for cursor in service.cursors if cursor._main_executed]) == 2
+
+    with pytest.raises(MCPValidationError):
+        await tool.execute(statement="SELECT TTL", reason="Invalid ttl", cache_ttl_seconds=-1)
+
+
+@pytest.mark.asyncio
+async def test_summary_cache_hit_reads_only_sample_rows(tmp_path, monkeypatch):
+    monkeypatch.setenv("IGLOO_MCP_QUERY_HISTORY", str(tmp_path / "history.jsonl"))
+    monkeypatch.setenv("IGLOO_MCP_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("IGLOO_MCP_CACHE_ROOT", str(tmp_path / "cache"))
+    monkeypatch.setenv("IGLOO_MCP_CACHE_MEMORY_MAX_MB", "0")
+
+    rows = [{"ID": i, "NAME": f"name-{i}"} for i in range(2_000)]
+    cfg = Config(snowflake=SnowflakeConfig(profile="test"))
+    service = FakeSnowflakeService([FakeQueryPlan(statement="SELECT WIDE", rows=rows, duration=0.01)])
+    tool = ExecuteQueryTool(cfg, service, QueryService(context=None))
+
+    first = await tool.execute(statement="SELECT WIDE", reason="Populate cache")
+    assert first["cache"]["hit"] is False
+
+    lookups = []
+    original_lookup = tool.cache.lookup
+
+    def recording_lookup(cache_key, **kwargs):
+        lookups.append(kwargs.get("row_limit"))
+        return original_lookup(cache_key, **kwargs)
+
+    monkeypatch.setattr(tool.cache, "lookup", recording_lookup)
+
+    cached = await tool.execute(statement="SELECT WIDE", reason="Summary from cache")
+    assert cached["cache"]["hit"] is True
+    assert lookups == [5]
+    assert len(cached["rows"]) == 5
+    assert cached["result_mode_info"]["total_rows"] == 2_000
+    assert cached["token_estimate"]["savings_vs_full"] > 10_000
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", [7, None])
+async def test_cache_hit_reuses_stored_profile(tmp_path, monkeypatch, value):
+    monkeypatch.setenv("IGLOO_MCP_QUERY_HISTORY", str(tmp_path / "history.jsonl"))
+    monkeypatch.setenv("IGLOO_MCP_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("IGLOO_MCP_CACHE_ROOT", str(tmp_path / "cache"))
+
+    cfg = Config(snowflake=SnowflakeConfig(profile="test"))
+    rows = [{"A": value}, {"A": value}]
+    service = FakeSnowflakeService([FakeQueryPlan(statement="SELECT PROFILED", rows=rows, duration=0.01)])
+    tool = ExecuteQueryTool(cfg, service, QueryService(context=None))
+
+    first = await tool.execute(statement="SELECT PROFILED", reason="Populate cache", response_mode="full")
+    assert first["cache"]["hit"] is False
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache hits must reuse the stored profile")
+
+    monkeypatch.setattr(execute_query_module, "build_default_insights", fail)
+
+    cached = await tool.execute(statement="SELECT PROFILED", reason="Serve from cache", response_mode="full")
+    assert cached["cache"]["hit"] is True
+    assert cached.get("key_metrics") == first.get("key_metrics")
@@ -354,6 +354,46 @@ async def test_health_check_includes_query_circuit_breaker_status() -> None:
     assert "query_circuit_breaker" in full.get("remediation", {})
 
 
+@pytest.mark.asyncio
+async def test_health_check_includes_connection_pool_stats() -> None:
+    config = Config.from_env()
+    service = StubSnowflakeService()
+    pool_stats = {
+        "enabled": True,
+        "max_size": 4,
+        "size": 4,
+        "idle": 0,
+        "in_use": 4,
+        "queue_depth": 2,
+        "utilization": 1.0,
+        "avg_wait_ms": 12.5,
+        "max_wait_ms": 40.0,
+    }
+    service.get_pool_stats = lambda: pool_stats  # type: ignore[attr-defined]
+
+    tool = HealthCheckTool(config=config, snowflake_service=service)
+
+    minimal = await tool.execute(response_mode="minimal", include_profile=False, include_cortex=False)
+    assert minimal["components"]["connection_pool"] == "saturated"
+
+    full = await tool.execute(response_mode="full", include_profile=False, include_cortex=False)
+    assert full["checks"]["connection_pool"]["queue_depth"] == 2
+    assert full["checks"]["connection_pool"]["utilization"] == 1.0
+    assert full["diagnostics"]["connection_pool"]["state"] == "saturated"
+    assert "IGLOO_MCP_POOL_SIZE" in full["remediation"]["connection_pool"]
+
+
+@pytest.mark.asyncio
+async def test_health_check_omits_connection_pool_for_unpooled_services() -> None:
+    tool = HealthCheckTool(config=Config.from_env(), snowflake_service=StubSnowflakeService())
+
+    minimal = await tool.execute(response_mode="minimal", include_profile=False, include_cortex=False)
+    full = await tool.execute(response_mode="full", include_profile=False, include_cortex=False)
+
+    assert minimal["components"]["connection_pool"] == "unavailable"
+    assert "connection_pool" not in full["checks"]
+
+
 @pytest.mark.asyncio
 async def test_health_check_reports_health_happy_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     config = Config.from_env()
@@ -466,6 +506,8 @@ async def test_health_check_reports_health_detects_storage_issues(
         ),
     ]
     index_path = reports_root / "index.jsonl"
+    # Replace the whole index: drop the change log the service appended to.
+    index_path.with_suffix(".log.jsonl").unlink(missing_ok=True)
     with index_path.open("w", encoding="utf-8") as handle:
         for entry in index_entries:
             handle.write(json.dumps(entry.model_dump()) + "\n")
@@ -550,3 +592,52 @@ async def test_storage_paths_reflect_repo_scope(monkeypatch: pytest.MonkeyPatch)
     assert not storage["base_directory"].startswith(home_igloo), (
         f"Repo scope should not use global base: {storage['base_directory']}"
     )
+
+
+@pytest.mark.asyncio
+async def test_health_check_includes_query_cache_stats() -> None:
+    cache_stats = {
+        "mode": "enabled",
+        "enabled": True,
+        "memory": {"enabled": True, "entries": 3, "hits": 10, "misses": 2, "evictions": 1},
+        "disk": {"hits": 2, "misses": 0},
+    }
+    tool = HealthCheckTool(
+        config=Config.from_env(),
+        snowflake_service=StubSnowflakeService(),
+        query_cache_stats_provider=lambda: cache_stats,
+    )
+
+    minimal = await tool.execute(response_mode="minimal", include_profile=False, include_cortex=False)
+    full = await tool.execute(response_mode="full", include_profile=False, include_cortex=False)
+
+    assert minimal["components"]["query_cache"] == "ok"
+    assert full["checks"]["query_cache"]["memory"]["evictions"] == 1
+    assert full["diagnostics"]["query_cache"]["state"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_health_check_reports_io_lag_and_write_backlog() -> None:
+    io_stats: dict[str, Any] = {
+        "background_writes": True,
+        "event_loop_lag": {"sampling": True, "samples": 40, "p95_ms": 250.0, "max_ms": 900.0},
+        "writers": {"history": {"pending": 3, "max_pending": 256}, "cache": {"pending": 0, "max_pending": 256}},
+    }
+    tool = HealthCheckTool(
+        config=Config.from_env(),
+        snowflake_service=StubSnowflakeService(),
+        io_stats_provider=lambda: io_stats,
+    )
+
+    minimal = await tool.execute(response_mode="minimal", include_profile=False, include_cortex=False)
+    full = await tool.execute(response_mode="full", include_profile=False, include_cortex=False)
+
+    assert minimal["components"]["io"] == "lagging"
+    assert full["checks"]["io"]["event_loop_lag"]["max_ms"] == 900.0
+    assert full["diagnostics"]["io"]["state"] == "lagging"
+    assert "late" in full["remediation"]["io"]
+
+    io_stats["writers"]["cache"]["pending"] = 256
+    backlogged = await tool.execute(response_mode="standard", include_profile=False, include_cortex=False)
+    assert backlogged["checks"]["io"]["state"] == "backlogged"
+    assert "IGLOO_MCP_BACKGROUND_WRITE_QUEUE" in backlogged["remediation"]["io"]
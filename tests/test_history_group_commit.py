@@ -0,0 +1,170 @@
+"""Tests for QueryHistory group commit and durability levels."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from igloo_mcp.logging import query_history
+from igloo_mcp.logging.history_store import HistoryStore
+from igloo_mcp.logging.query_history import QueryHistory, flush_query_histories
+
+
+def _lines(history: QueryHistory) -> list[dict]:
+    assert history.path is not None
+    if not history.path.exists():
+        return []
+    return [json.loads(line) for line in history.path.read_text(encoding="utf-8").splitlines()]
+
+
+def _count_writes(history: QueryHistory, monkeypatch) -> list[int]:
+    batches: list[int] = []
+    real_write = history._committer._commit
+
+    def counting_write(lines):
+        batches.append(len(lines))
+        real_write(lines)
+
+    monkeypatch.setattr(history._committer, "_commit", counting_write)
+    return batches
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_immediate_writes_before_record_returns(tmp_path):
+    history = QueryHistory(tmp_path / "history.jsonl")
+
+    history.record({"execution_id": "a", "status": "success"})
+
+    assert history.durability == "immediate"
+    assert [event["execution_id"] for event in _lines(history)] == ["a"]
+
+
+def test_concurrent_records_share_one_commit(tmp_path, monkeypatch):
+    history = QueryHistory(tmp_path / "history.jsonl")
+    started, release = threading.Event(), threading.Event()
+    batches: list[int] = []
+    real_write = history._committer._commit
+
+    def slow_first_write(lines):
+        batches.append(len(lines))
+        if len(batches) == 1:
+            started.set()
+            release.wait(5)
+        real_write(lines)
+
+    monkeypatch.setattr(history._committer, "_commit", slow_first_write)
+
+    leader = threading.Thread(target=history.record, args=({"execution_id": "leader"},))
+    leader.start()
+    assert started.wait(5)
+    followers = [threading.Thread(target=history.record, args=({"execution_id": f"f{i}"},)) for i in range(5)]
+    for thread in followers:
+        thread.start()
+    assert _wait_for(lambda: history._committer.pending == 5)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    # Everything recorded during the first write went out in one second append.
+    assert batches == [1, 5]
+    assert len(_lines(history)) == 6
+
+
+def test_batched_defers_writes_until_flush(tmp_path, monkeypatch):
+    history = QueryHistory(tmp_path / "history.jsonl", durability="batched", flush_interval_seconds=60)
+    batches = _count_writes(history, monkeypatch)
+
+    for idx in range(10):
+        history.record({"execution_id": f"e{idx}"})
+    assert _lines(history) == []
+
+    history.flush()
+
+    assert batches == [10]
+    assert [event["execution_id"] for event in _lines(history)] == [f"e{idx}" for idx in range(10)]
+
+
+def test_batched_commits_on_interval_and_size(tmp_path, monkeypatch):
+    by_interval = QueryHistory(tmp_path / "interval.jsonl", durability="batched", flush_interval_seconds=0.02)
+    by_interval.record({"execution_id": "late"})
+    assert _wait_for(lambda: len(_lines(by_interval)) == 1)
+
+    by_size = QueryHistory(tmp_path / "size.jsonl", durability="batched", flush_interval_seconds=60, flush_size=3)
+    batches = _count_writes(by_size, monkeypatch)
+    for idx in range(3):
+        by_size.record({"execution_id": f"s{idx}"})
+    assert _wait_for(lambda: batches == [3])
+
+
+def test_batched_buffer_is_bounded(tmp_path, monkeypatch):
+    history = QueryHistory(tmp_path / "history.jsonl", durability="batched", flush_interval_seconds=60, flush_size=4)
+    monkeypatch.setattr(history._committer, "max_buffered", 4)
+    monkeypatch.setattr(history._committer, "_ensure_flusher_locked", lambda: None)  # no background commits
+
+    for idx in range(4):
+        history.record({"execution_id": f"e{idx}"})
+
+    # The fourth record filled the buffer and committed it before returning.
+    assert len(_lines(history)) == 4
+
+
+def test_batched_lines_visible_to_lookups_and_flush_all(tmp_path):
+    history = QueryHistory(tmp_path / "history.jsonl", durability="batched", flush_interval_seconds=60)
+    history.record({"execution_id": "exec-1", "status": "success"})
+
+    assert history.get("exec-1")["status"] == "success"
+
+    history.record({"execution_id": "exec-2", "status": "success"})
+    flush_query_histories()
+    assert len(_lines(history)) == 2
+
+
+def test_fsync_durability_syncs_each_commit(tmp_path, monkeypatch):
+    synced: list[int] = []
+    monkeypatch.setattr(query_history.os, "fsync", synced.append)
+    history = QueryHistory(tmp_path / "history.jsonl", durability="fsync")
+
+    history.record({"execution_id": "a"})
+    history.record({"execution_id": "b"})
+
+    assert len(synced) == 2
+    assert len(_lines(history)) == 2
+
+
+def test_insight_dedupe_is_remembered_in_memory(tmp_path, monkeypatch):
+    monkeypatch.setattr(HistoryStore, "open", classmethod(lambda cls, path, **_: None))
+    history = QueryHistory(tmp_path / "history.jsonl")
+
+    assert history.record_insight("exec-1", "Revenue doubled")["deduped"] is False
+    history.path.write_text("", encoding="utf-8")  # a rescan would find nothing
+
+    assert history.record_insight("exec-1", "Revenue doubled")["deduped"] is True
+    assert history.record_insight("exec-1", "Revenue tripled")["deduped"] is False
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("batched", "batched"), ("FSYNC", "fsync"), ("eventually", "immediate")],
+)
+def test_from_env_reads_commit_settings(tmp_path, monkeypatch, raw, expected):
+    monkeypatch.setenv("IGLOO_MCP_QUERY_HISTORY", str(tmp_path / "history.jsonl"))
+    monkeypatch.setenv(query_history.HISTORY_DURABILITY_ENV, raw)
+    monkeypatch.setenv(query_history.HISTORY_FLUSH_INTERVAL_ENV, "50")
+    monkeypatch.setenv(query_history.HISTORY_FLUSH_SIZE_ENV, "nope")
+
+    history = QueryHistory.from_env()
+
+    assert history.durability == expected
+    assert history._flush_interval_seconds == 0.05
+    assert history._flush_size == query_history.DEFAULT_HISTORY_FLUSH_SIZE
@@ -17,6 +17,7 @@ from igloo_mcp.living_reports.history_index import (
     HistoryIndex,
 )
 from igloo_mcp.living_reports.models import DatasetSource
+from igloo_mcp.logging.history_store import HistoryStore
 
 
 class TestHistoryIndexInitialization:
@@ -64,8 +65,8 @@ class TestHistoryIndexInitialization:
 
         # Assert
         assert len(index.records) == 2
-        assert index._by_execution_id["exec-1"]["sql_sha256"] == "sha-1"
-        assert index._by_sql_sha["sha-2"]["execution_id"] == "exec-2"
+        assert index.get_record_by_execution_id("exec-1")["sql_sha256"] == "sha-1"
+        assert index._resolve_history_record(DatasetSource(sql_sha256="sha-2"))["execution_id"] == "exec-2"
 
     def test_init_handles_corrupted_jsonl(self, tmp_path):
         """Initialize gracefully handles corrupted JSONL."""
@@ -451,6 +452,78 @@ class TestHistoryIndexRecordsProperty:
         assert records1 == records2
 
 
+def _append_records(path, *records):
+    with path.open("a", encoding="utf-8") as fh:
+        for record in records:
+            fh.write(json.dumps(record) + "\n")
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def index_mode(request, monkeypatch):
+    """Run tailing tests against the SQLite store and the in-memory fallback."""
+    if request.param == "memory":
+        monkeypatch.setattr(HistoryStore, "open", classmethod(lambda cls, path, **_: None))
+    return request.param
+
+
+class TestHistoryIndexTailing:
+    """HistoryIndex picks up appended, rotated and truncated history."""
+
+    def test_sees_records_appended_after_construction(self, tmp_path, index_mode):
+        history_path = tmp_path / "history.jsonl"
+        _append_records(history_path, {"execution_id": "exec-1", "sql_sha256": "sha-1"})
+        index = HistoryIndex(history_path)
+        assert index.get_record_by_execution_id("exec-2") is None
+
+        _append_records(history_path, {"execution_id": "exec-2", "sql_sha256": "sha-2"})
+
+        assert index.get_record_by_execution_id("exec-2")["sql_sha256"] == "sha-2"
+        assert set(index.get_records_batch(["exec-1", "exec-2"])) == {"exec-1", "exec-2"}
+        assert len(index.records) == 2
+
+    def test_history_created_after_construction(self, tmp_path, index_mode):
+        history_path = tmp_path / "history.jsonl"
+        index = HistoryIndex(history_path)
+        assert index.records == []
+
+        _append_records(history_path, {"execution_id": "late"})
+
+        assert index.get_record_by_execution_id("late") == {"execution_id": "late"}
+
+    def test_partial_line_is_not_indexed_until_complete(self, tmp_path, index_mode):
+        history_path = tmp_path / "history.jsonl"
+        history_path.write_text('{"execution_id": "a"}\n{"execution_id": ', encoding="utf-8")
+        index = HistoryIndex(history_path)
+        assert len(index.records) == 1
+
+        with history_path.open("a", encoding="utf-8") as fh:
+            fh.write('"b"}\n')
+
+        assert index.get_record_by_execution_id("b") == {"execution_id": "b"}
+
+    def test_rotation_starts_over(self, tmp_path, index_mode):
+        history_path = tmp_path / "history.jsonl"
+        _append_records(history_path, {"execution_id": "old"})
+        index = HistoryIndex(history_path)
+        assert index.get_record_by_execution_id("old") is not None
+
+        history_path.rename(tmp_path / "history.jsonl.1")
+        _append_records(history_path, *({"execution_id": f"new-{i}"} for i in range(5)))
+
+        assert index.get_record_by_execution_id("old") is None
+        assert [r["execution_id"] for r in index.records] == [f"new-{i}" for i in range(5)]
+
+    def test_truncation_starts_over(self, tmp_path, index_mode):
+        history_path = tmp_path / "history.jsonl"
+        _append_records(history_path, {"execution_id": "old-1"}, {"execution_id": "old-2"})
+        index = HistoryIndex(history_path)
+        assert len(index.records) == 2
+
+        history_path.write_text(json.dumps({"execution_id": "fresh"}) + "\n", encoding="utf-8")
+
+        assert [r["execution_id"] for r in index.records] == ["fresh"]
+
+
 class TestHistoryIndexEdgeCases:
     """Test edge cases and error conditions."""
 
@@ -465,8 +538,7 @@ class TestHistoryIndexEdgeCases:
 
         # Assert
         assert len(index.records) == 0
-        assert len(index._by_execution_id) == 0
-        assert len(index._by_sql_sha) == 0
+        assert index.get_records_batch(["anything"]) == {}
 
     def test_history_with_blank_lines(self, tmp_path):
         """Handle blank lines in history file."""
@@ -497,8 +569,8 @@ class TestHistoryIndexEdgeCases:
 
         # Assert
         assert len(index.records) == 1
-        # Should not be in execution_id map
-        assert len(index._by_execution_id) == 0
+        # Should not be resolvable by execution_id
+        assert index.get_records_batch(["", "None"]) == {}
 
     def test_record_without_sql_sha(self, tmp_path):
         """Handle record without sql_sha256."""
@@ -513,8 +585,8 @@ class TestHistoryIndexEdgeCases:
         # Assert
         assert len(index.records) == 1
         # Should be in execution_id map but not sql_sha map
-        assert "test" in index._by_execution_id
-        assert len(index._by_sql_sha) == 0
+        assert index.get_record_by_execution_id("test") == record
+        assert index._resolve_history_record(DatasetSource(sql_sha256="None")) is None
 
 
 class TestDatasetResolutionError:
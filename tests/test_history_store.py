@@ -0,0 +1,194 @@
+"""Tests for the SQLite index over the query history JSONL log."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from igloo_mcp.logging.history_store import HistoryStore, default_db_path
+from igloo_mcp.logging.query_history import QueryHistory
+from igloo_mcp.query_optimizer import optimize_execution
+
+
+def _append(path: Path, *records: dict) -> None:
+    with path.open("a", encoding="utf-8") as fh:
+        for record in records:
+            fh.write(json.dumps(record) + "\n")
+
+
+@pytest.fixture
+def history_path(tmp_path: Path) -> Path:
+    path = tmp_path / "doc.jsonl"
+    _append(
+        path,
+        {"execution_id": "exec-1", "sql_sha256": "sha-a", "status": "success", "ts": 100.0},
+        {"execution_id": "exec-2", "sql_sha256": "sha-b", "status": "error", "ts": 200.0},
+        {"execution_id": "exec-3", "sql_sha256": "sha-a", "status": "cache_hit", "ts": 300.0},
+    )
+    return path
+
+
+class TestHistoryStoreImport:
+    def test_imports_existing_history(self, history_path):
+        store = HistoryStore(history_path)
+
+        assert store.count() == 3
+        assert store.db_path == default_db_path(history_path) == history_path.with_suffix(".sqlite")
+        assert [r["execution_id"] for r in store.find(newest_first=False)] == ["exec-1", "exec-2", "exec-3"]
+
+    def test_sync_imports_only_appended_lines(self, history_path):
+        store = HistoryStore(history_path)
+        assert store.sync() == 3
+        assert store.sync() == 0
+
+        _append(history_path, {"execution_id": "exec-4", "status": "success", "ts": 400.0})
+
+        assert store.sync() == 1
+        assert store.latest()["execution_id"] == "exec-4"
+
+    def test_index_survives_reopen(self, history_path):
+        HistoryStore(history_path).sync()
+        _append(history_path, {"execution_id": "exec-4"})
+
+        reopened = HistoryStore(history_path)
+
+        assert reopened.sync() == 1
+        assert reopened.count() == 4
+
+    def test_skips_blank_and_malformed_lines(self, tmp_path):
+        path = tmp_path / "doc.jsonl"
+        path.write_text('{"execution_id": "a"}\n\nnot json\n[1, 2]\n{"execution_id": "b"}\n', encoding="utf-8")
+
+        store = HistoryStore(path)
+
+        assert [r["execution_id"] for r in store.find(newest_first=False)] == ["a", "b"]
+
+    def test_partial_trailing_line_waits_for_completion(self, tmp_path):
+        path = tmp_path / "doc.jsonl"
+        path.write_text('{"execution_id": "a"}\n{"execution_id": "b', encoding="utf-8")
+        store = HistoryStore(path)
+
+        assert store.sync() == 1
+
+        with path.open("a", encoding="utf-8") as fh:
+            fh.write('"}\n')
+
+        assert store.sync() == 1
+        assert store.latest()["execution_id"] == "b"
+
+    def test_complete_record_without_newline_is_imported(self, tmp_path):
+        path = tmp_path / "doc.jsonl"
+        path.write_text('{"execution_id": "a"}', encoding="utf-8")
+
+        assert HistoryStore(path).count() == 1
+
+    def test_truncated_log_is_reimported(self, history_path):
+        store = HistoryStore(history_path)
+        assert store.count() == 3
+
+        history_path.write_text(json.dumps({"execution_id": "fresh"}) + "\n", encoding="utf-8")
+
+        assert [r["execution_id"] for r in store.find()] == ["fresh"]
+
+    def test_rotated_log_is_reimported(self, history_path):
+        store = HistoryStore(history_path)
+        assert store.count() == 3
+
+        rotated = history_path.with_name("doc.jsonl.1")
+        history_path.rename(rotated)
+        # A replacement file larger than the old offset must still be detected.
+        _append(history_path, *({"execution_id": f"new-{i}", "ts": float(i)} for i in range(10)))
+
+        assert store.count() == 10
+        assert store.first()["execution_id"] == "new-0"
+
+    def test_removed_log_empties_index(self, history_path):
+        store = HistoryStore(history_path)
+        assert store.count() == 3
+
+        history_path.unlink()
+
+        assert store.count() == 0
+        _append(history_path, {"execution_id": "again"})
+        assert [r["execution_id"] for r in store.find()] == ["again"]
+
+
+class TestHistoryStoreQueries:
+    def test_find_filters(self, history_path):
+        store = HistoryStore(history_path)
+
+        assert [r["execution_id"] for r in store.find(sql_sha256="sha-a")] == ["exec-3", "exec-1"]
+        assert [r["execution_id"] for r in store.find(status=("success", "cache_hit"))] == ["exec-3", "exec-1"]
+        assert [r["execution_id"] for r in store.find(status="error")] == ["exec-2"]
+        assert [r["execution_id"] for r in store.find(since=150.0, until=300.0)] == ["exec-2"]
+        assert store.find(execution_id="missing") == []
+        assert len(store.find(limit=2)) == 2
+
+    def test_first_and_latest(self, history_path):
+        _append(history_path, {"execution_id": "exec-1", "status": "insight_recorded", "content_sha256": "c1"})
+        store = HistoryStore(history_path)
+
+        assert store.first(execution_id="exec-1")["status"] == "success"
+        assert store.latest(execution_id="exec-1")["status"] == "insight_recorded"
+        assert store.latest(content_sha256="c1")["execution_id"] == "exec-1"
+
+    def test_first_by_execution_id(self, history_path):
+        store = HistoryStore(history_path)
+
+        found = store.first_by_execution_id(["exec-3", "missing", "exec-1"])
+
+        assert set(found) == {"exec-1", "exec-3"}
+        assert found["exec-3"]["status"] == "cache_hit"
+
+    def test_export_jsonl_round_trips(self, history_path, tmp_path):
+        store = HistoryStore(history_path)
+        destination = tmp_path / "export.jsonl"
+
+        assert store.export_jsonl(destination) == 3
+
+        exported = [json.loads(line) for line in destination.read_text(encoding="utf-8").splitlines()]
+        original = [json.loads(line) for line in history_path.read_text(encoding="utf-8").splitlines()]
+        assert exported == original
+
+    def test_open_returns_none_when_unusable(self, tmp_path):
+        missing_dir = tmp_path / "missing" / "doc.jsonl"
+
+        assert HistoryStore.open(missing_dir) is None
+
+
+class TestHistoryStoreConsumers:
+    def test_record_insight_dedupes_via_index(self, tmp_path):
+        history = QueryHistory(tmp_path / "doc.jsonl")
+        history.record({"execution_id": "exec-1", "status": "success"})
+
+        first = history.record_insight("exec-1", "Revenue doubled")
+        second = history.record_insight("exec-1", "Revenue doubled")
+
+        assert first["deduped"] is False
+        assert second["deduped"] is True
+        assert default_db_path(history.path).exists()
+        assert len(history.find(execution_id="exec-1")) == 2
+        assert history.get("exec-1")["status"] == "insight_recorded"
+
+    def test_record_insight_falls_back_to_scan(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(HistoryStore, "open", classmethod(lambda cls, path, **_: None))
+        history = QueryHistory(tmp_path / "doc.jsonl")
+
+        assert history.record_insight("exec-1", "note")["deduped"] is False
+        assert history.record_insight("exec-1", "note")["deduped"] is True
+        assert history.find() == []
+
+    def test_optimize_execution_uses_index(self, history_path):
+        assert optimize_execution(history_path=str(history_path))["execution_id"] == "exec-3"
+        assert optimize_execution("exec-2", history_path=str(history_path))["status"] == "error"
+        with pytest.raises(ValueError, match="not found"):
+            optimize_execution("missing", history_path=str(history_path))
+
+    def test_optimize_execution_empty_history(self, tmp_path):
+        path = tmp_path / "doc.jsonl"
+        path.touch()
+
+        with pytest.raises(ValueError, match="empty"):
+            optimize_execution(history_path=str(path))
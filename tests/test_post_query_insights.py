@@ -10,6 +10,7 @@ from decimal import Decimal
 
 import pytest
 
+from igloo_mcp import post_query_insights
 from igloo_mcp.post_query_insights import (
     MAX_SAMPLE_ROWS,
     _coerce_datetime,
@@ -17,6 +18,7 @@ from igloo_mcp.post_query_insights import (
     _compose_insights,
     _is_time_hint,
     _normalize_row,
+    _profile_column,
     _stringify,
     _summarize_column,
     build_default_insights,
@@ -274,6 +276,48 @@ class TestSummarizeColumn:
         assert top_values[0]["count"] == 2
 
 
+class TestProfileColumn:
+    """Test per-column type inference and the NumPy / pure-Python numeric paths."""
+
+    @pytest.mark.parametrize("with_numpy", [True, False])
+    def test_numeric_stats_match_without_numpy(self, monkeypatch, with_numpy):
+        if with_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setattr(post_query_insights, "np", None)
+        values = [1, 2.5, Decimal("3.5"), None]
+        summary = _profile_column("amount", values, len(values))
+        assert summary == {
+            "name": "amount",
+            "kind": "numeric",
+            "non_null_ratio": 0.75,
+            "min": 1.0,
+            "max": 3.5,
+            "avg": 2.333333,
+        }
+
+    def test_date_column_is_time(self):
+        summary = _profile_column("day", [date(2024, 1, 2), date(2024, 1, 1)], 2)
+        assert summary["kind"] == "time"
+        assert summary["min_ts"] == "2024-01-01T00:00:00"
+        assert summary["span_ms"] == 86_400_000
+
+    def test_mixed_column_with_time_hint_uses_time_values(self):
+        summary = _profile_column("created_time", [datetime(2024, 1, 1), "unknown", datetime(2024, 1, 3)], 3)
+        assert summary["kind"] == "time"
+        assert summary["max_ts"] == "2024-01-03T00:00:00"
+
+    def test_booleans_are_categorical(self):
+        summary = _profile_column("flag", [True, False, True], 3)
+        assert summary["kind"] == "categorical"
+        assert summary["top_values"][0] == {"value": "True", "count": 2, "ratio": 0.667}
+
+    def test_out_of_float_range_integers_are_categorical(self):
+        summary = _profile_column("big", [10**400, 1], 2)
+        assert summary["kind"] == "categorical"
+        assert summary["distinct_values"] == 2
+
+
 class TestComposeInsights:
     """Test insight composition from key metrics."""
 
@@ -44,8 +44,10 @@ def test_store_and_lookup_round_trip(tmp_path: Path) -> None:
     assert hit.rows == rows
     assert hit.metadata["cache_hit"] is True
     assert hit.metadata["rowcount"] == 2
-    assert hit.result_json_path.exists()
-    assert hit.result_csv_path is not None
+    assert hit.result_path.exists()
+    assert hit.result_path.name == QueryResultCache.ROWS_FILENAME
+    assert hit.result_csv_path is None  # CSV is only generated on demand
+    assert hit.partial is False
     assert hit.manifest_path == manifest_path
     assert cache.pop_warnings() == []
 
@@ -152,7 +154,7 @@ def test_store_rows_write_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatc
     original_open = Path.open
 
     def fake_open(self, mode="r", *args, **kwargs):
-        if self.name == "rows.jsonl" and "w" in mode:
+        if self.name == "rows.col" and "w" in mode:
             raise OSError("rows write failure")
         return original_open(self, mode, *args, **kwargs)
 
@@ -163,13 +165,38 @@ def test_store_rows_write_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatc
     assert any("Failed to persist cached rows" in msg for msg in warnings)
 
 
-def test_store_csv_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+def test_export_csv_on_demand(tmp_path: Path) -> None:
+    cache = QueryResultCache(mode="enabled", root=tmp_path)
+    key = cache.compute_cache_key(sql_sha256="csv", profile="TEST", effective_context={})
+    rows = [{"B": 1, "A": "x"}, {"B": 2, "A": "y"}]
+    manifest_path = cache.store(key, rows=rows, metadata={"columns": ["B", "A"]})
+    assert manifest_path is not None
+    assert not (manifest_path.parent / "rows.csv").exists()
+
+    csv_path = cache.export_csv(key)
+    assert csv_path == manifest_path.parent / "rows.csv"
+    assert csv_path.read_text(encoding="utf-8").splitlines() == ["B,A", "1,x", "2,y"]
+    assert json.loads(manifest_path.read_text(encoding="utf-8"))["result_csv"] == "rows.csv"
+
+    hit = cache.lookup(key)
+    assert hit is not None
+    assert hit.result_csv_path == csv_path
+
+    # Re-storing the key drops the CSV generated for the previous result.
+    cache.store(key, rows=rows[:1], metadata={"columns": ["B", "A"]})
+    assert not csv_path.exists()
+
+
+def test_export_csv_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     cache = QueryResultCache(mode="enabled", root=tmp_path)
     key = cache.compute_cache_key(
         sql_sha256="ghi",
         profile="TEST",
         effective_context={},
     )
+    manifest = cache.store(key, rows=[{"ID": 1}], metadata={})
+    assert manifest is not None
+
     original_open = Path.open
 
     def fake_open(self, mode="r", *args, **kwargs):
@@ -179,10 +206,33 @@ def test_store_csv_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> N
 
     monkeypatch.setattr(Path, "open", fake_open, raising=False)
 
-    manifest = cache.store(key, rows=[{"ID": 1}], metadata={})
-    assert manifest is not None
+    assert cache.export_csv(key) is None
     warnings = cache.pop_warnings()
-    assert any("Failed to persist cached CSV" in msg for msg in warnings)
+    assert any("Failed to export cached CSV" in msg for msg in warnings)
+    assert json.loads(manifest.read_text(encoding="utf-8"))["result_csv"] is None
+
+
+def test_lookup_row_limit_decodes_prefix_only(tmp_path: Path) -> None:
+    cache = QueryResultCache(mode="enabled", root=tmp_path, memory_max_bytes=0)
+    key = cache.compute_cache_key(sql_sha256="big", profile="TEST", effective_context={})
+    rows = [{"ID": i, "NAME": f"row-{i}"} for i in range(12_000)]
+    assert cache.store(key, rows=rows, metadata={"rowcount": len(rows)}) is not None
+
+    sample = cache.lookup(key, row_limit=10)
+    assert sample is not None
+    assert sample.partial is True
+    assert sample.rows == rows[:10]
+    assert sample.metadata["rows_bytes"] > 0
+
+    schema_only = cache.lookup(key, row_limit=0)
+    assert schema_only is not None
+    assert schema_only.rows == []
+    assert schema_only.metadata["columns"] == ["ID", "NAME"]
+
+    full = cache.lookup(key)
+    assert full is not None
+    assert full.partial is False
+    assert full.rows == rows
 
 
 def test_lookup_refresh_mode_and_no_root(tmp_path: Path) -> None:
@@ -349,3 +399,204 @@ def test_store_manifest_write_failure(tmp_path: Path, monkeypatch: pytest.Monkey
     assert result is None
     warnings = cache.pop_warnings()
     assert any("Failed to write cache manifest" in msg for msg in warnings)
+
+
+def test_memory_tier_serves_hits_without_reading_disk(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = QueryResultCache(mode="enabled", root=tmp_path, max_rows=10)
+    rows = [{"id": 1, "value": "alpha"}]
+    cache.store("key", rows=rows, metadata={"profile": "TEST", "context": {}, "rowcount": 1})
+
+    def _fail_read(*_args, **_kwargs):
+        raise AssertionError("memory hit should not read from disk")
+
+    monkeypatch.setattr(Path, "read_text", _fail_read)
+    monkeypatch.setattr(Path, "open", _fail_read)
+
+    hit = cache.lookup("key")
+    assert hit is not None
+    assert hit.rows == rows
+    assert hit.metadata["cache_hit"] is True
+    assert hit.metadata["columns"] == ["id", "value"]
+
+    # Mutating a hit must not leak into the next one.
+    hit.rows[0]["value"] = "mutated"
+    hit.metadata["rowcount"] = 99
+    again = cache.lookup("key")
+    assert again is not None
+    assert again.rows == rows
+    assert again.metadata["rowcount"] == 1
+
+    stats = cache.stats()
+    assert stats["memory"]["hits"] == 2
+    assert stats["disk"]["hits"] == 0
+
+
+def test_memory_tier_populates_from_disk_and_respects_removed_entries(tmp_path: Path) -> None:
+    QueryResultCache(mode="enabled", root=tmp_path).store(
+        "key", rows=[{"id": 1}], metadata={"profile": "TEST", "context": {}}
+    )
+    cache = QueryResultCache(mode="enabled", root=tmp_path)
+
+    assert cache.lookup("key") is not None
+    assert cache.lookup("key") is not None
+    assert cache.stats()["disk"]["hits"] == 1
+    assert cache.stats()["memory"]["hits"] == 1
+
+    (tmp_path / "key" / "manifest.json").unlink()
+    assert cache.lookup("key") is None
+    assert cache.stats()["memory"]["entries"] == 0
+
+
+def test_memory_tier_evicts_least_recently_used_by_bytes(tmp_path: Path) -> None:
+    payload = "x" * 400
+    cache = QueryResultCache(mode="enabled", root=tmp_path, memory_max_bytes=2500)
+    for key in ("a", "b", "c"):
+        cache.store(key, rows=[{"payload": payload}], metadata={"profile": "TEST", "context": {}})
+        cache.lookup("a")  # keep "a" hot
+
+    memory = cache.stats()["memory"]
+    assert memory["evictions"] >= 1
+    assert memory["bytes"] <= memory["max_bytes"]
+    assert cache.memory_tier.get("a") is not None
+    assert cache.memory_tier.get("b") is None
+
+
+def test_memory_tier_disabled_via_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("IGLOO_MCP_CACHE_ROOT", str(tmp_path))
+    monkeypatch.setenv("IGLOO_MCP_CACHE_MEMORY_MAX_MB", "0")
+    cache = QueryResultCache.from_env(artifact_root=tmp_path)
+
+    cache.store("key", rows=[{"id": 1}], metadata={"profile": "TEST", "context": {}})
+    assert cache.lookup("key") is not None
+    assert cache.stats()["memory"]["enabled"] is False
+    assert cache.stats()["disk"]["hits"] == 1
+
+
+def test_from_env_ignores_invalid_limits(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("IGLOO_MCP_CACHE_ROOT", str(tmp_path))
+    monkeypatch.setenv("IGLOO_MCP_CACHE_MEMORY_MAX_MB", "lots")
+    monkeypatch.setenv("IGLOO_MCP_CACHE_MAX_MB", "-1")
+    monkeypatch.setenv("IGLOO_MCP_CACHE_TTL_HOURS", "nan")
+    monkeypatch.setenv("IGLOO_MCP_CACHE_EVICTION_POLICY", " LFU ")
+    cache = QueryResultCache.from_env(artifact_root=tmp_path)
+
+    stats = cache.stats()
+    assert stats["memory"]["max_bytes"] == QueryResultCache.DEFAULT_MEMORY_MAX_MB * 1024 * 1024
+    assert stats["disk"]["max_bytes"] == QueryResultCache.DEFAULT_MAX_MB * 1024 * 1024
+    assert stats["disk"]["eviction_policy"] == "lfu"
+    assert cache._ttl_seconds == QueryResultCache.DEFAULT_TTL_HOURS * 3600
+
+
+def _backdate(cache_root: Path, key: str, *, created_at: str, expires_at: str | None) -> None:
+    manifest_path = cache_root / key / "manifest.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["created_at"] = created_at
+    manifest["expires_at"] = expires_at
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+
+
+def test_store_records_ttl_and_lookup_skips_expired_entries(tmp_path: Path) -> None:
+    cache = QueryResultCache(mode="enabled", root=tmp_path, ttl_seconds=3600, memory_max_bytes=0)
+    cache.store("key", rows=[{"id": 1}], metadata={"profile": "TEST", "context": {}})
+
+    manifest = json.loads((tmp_path / "key" / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["ttl_seconds"] == 3600
+    assert manifest["expires_at"] > manifest["created_at"]
+    assert cache.lookup("key") is not None
+
+    _backdate(tmp_path, "key", created_at="2020-01-01T00:00:00+00:00", expires_at="2020-01-01T01:00:00+00:00")
+    assert cache.lookup("key") is None
+    assert cache.stats()["disk"]["expired"] == 1
+
+
+def test_legacy_manifest_without_expiry_uses_default_ttl(tmp_path: Path) -> None:
+    cache = QueryResultCache(mode="enabled", root=tmp_path, memory_max_bytes=0)
+    cache.store("key", rows=[{"id": 1}], metadata={"profile": "TEST", "context": {}})
+    _backdate(tmp_path, "key", created_at="2020-01-01T00:00:00+00:00", expires_at=None)
+
+    assert cache.lookup("key") is None
+
+
+def test_lookup_max_age_and_statement_class_ttls(tmp_path: Path) -> None:
+    cache = QueryResultCache(mode="enabled", root=tmp_path, ttl_seconds=7200, metadata_ttl_seconds=60)
+    assert cache.ttl_for_statement("Select") == 7200
+    assert cache.ttl_for_statement("Show") == 60
+    assert cache.ttl_for_statement("Describe") == 60
+
+    assert cache.store("skip", rows=[{"id": 1}], metadata={"profile": "TEST", "context": {}}, ttl_seconds=0) is None
+
+    cache.store("key", rows=[{"id": 1}], metadata={"profile": "TEST", "context": {}})
+    assert cache.lookup("key", max_age_seconds=3600) is not None
+    assert cache.lookup("key", max_age_seconds=0) is None  # memory tier honours the bound too
+
+
+def _entry_bytes(tmp_path: Path, payload: str) -> int:
+    probe = QueryResultCache(mode="enabled", root=tmp_path / "probe")
+    probe.store("probe", rows=[{"payload": payload}], metadata={"profile": "TEST", "context": {}})
+    return probe.stats()["disk"]["bytes"]
+
+
+def test_store_enforces_quota_with_lru_eviction(tmp_path: Path) -> None:
+    payload = "x" * 2000
+    quota = int(_entry_bytes(tmp_path, payload) * 3.5)
+    tmp_path = tmp_path / "cache"
+    cache = QueryResultCache(mode="enabled", root=tmp_path, max_bytes=quota)
+    for key in ("a", "b", "c"):
+        cache.store(key, rows=[{"payload": payload}], metadata={"profile": "TEST", "context": {}})
+    cache.lookup("a")  # "b" is now least recently used
+    cache.store("d", rows=[{"payload": payload}], metadata={"profile": "TEST", "context": {}})
+
+    assert not (tmp_path / "b").exists()
+    assert (tmp_path / "a").exists()
+    assert (tmp_path / "d").exists()
+    assert cache.stats()["disk"]["evictions"] >= 1
+    assert cache.stats()["disk"]["bytes"] <= quota
+    assert (tmp_path / "access_index.json").exists()
+
+
+def test_store_enforces_quota_with_lfu_eviction(tmp_path: Path) -> None:
+    payload = "x" * 2000
+    quota = int(_entry_bytes(tmp_path, payload) * 3.5)
+    tmp_path = tmp_path / "cache"
+    cache = QueryResultCache(mode="enabled", root=tmp_path, max_bytes=quota, eviction_policy="lfu")
+    for key in ("a", "b", "c"):
+        cache.store(key, rows=[{"payload": payload}], metadata={"profile": "TEST", "context": {}})
+    for _ in range(3):
+        cache.lookup("a")
+        cache.lookup("c")
+    cache.lookup("b")
+    cache.store("d", rows=[{"payload": payload}], metadata={"profile": "TEST", "context": {}})
+
+    assert not (tmp_path / "b").exists()
+    assert (tmp_path / "a").exists()
+    assert (tmp_path / "c").exists()
+
+
+def test_collect_garbage_removes_expired_and_invalid_entries(tmp_path: Path) -> None:
+    import os
+
+    cache = QueryResultCache(mode="enabled", root=tmp_path)
+    for key in ("fresh", "stale"):
+        cache.store(key, rows=[{"id": 1}], metadata={"profile": "TEST", "context": {}})
+    _backdate(tmp_path, "stale", created_at="2020-01-01T00:00:00+00:00", expires_at="2020-01-02T00:00:00+00:00")
+    orphan = tmp_path / "orphan"
+    orphan.mkdir()
+    (orphan / "rows.jsonl").write_text("{}\n", encoding="utf-8")
+    os.utime(orphan, (0, 0))
+    in_flight = tmp_path / "in_flight"
+    in_flight.mkdir()
+
+    preview = cache.collect_garbage(dry_run=True)
+    assert preview["removed_expired"] == 1
+    assert preview["removed_invalid"] == 1
+    assert (tmp_path / "stale").exists()
+
+    summary = QueryResultCache(mode="enabled", root=tmp_path).collect_garbage()
+    assert summary["scanned"] == 4
+    assert summary["removed_expired"] == 1
+    assert summary["removed_invalid"] == 1
+    assert summary["entries_after"] == 1
+    assert (tmp_path / "fresh").exists()
+    assert in_flight.exists()
+    assert not (tmp_path / "stale").exists()
+    assert not orphan.exists()
@@ -32,7 +32,7 @@ class TestRenderReportTool:
         """Create a mock ReportService."""
         service = MagicMock(spec=ReportService)
         index_mock = MagicMock()
-        index_mock.rebuild_from_filesystem = MagicMock()
+        index_mock.refresh = MagicMock()
         service.index = index_mock
         return service
 
@@ -0,0 +1,143 @@
+"""Tests for the append-only ReportIndex change log and its compaction."""
+
+from __future__ import annotations
+
+import json
+import threading
+import uuid
+
+from igloo_mcp.living_reports.index import ReportIndex
+from igloo_mcp.living_reports.models import IndexEntry
+
+IDS = {name: str(uuid.uuid5(uuid.NAMESPACE_URL, name)) for name in ("a", "b", *map(str, range(80)))}
+
+
+def _entry(key: str, title: str, status: str = "active") -> IndexEntry:
+    report_id = IDS[key]
+    return IndexEntry(
+        report_id=report_id,
+        current_title=title,
+        created_at="2026-01-01T00:00:00+00:00",
+        updated_at="2026-01-01T00:00:00+00:00",
+        tags=[],
+        status=status,
+        path=f"by_id/{report_id}",
+    )
+
+
+def _log_lines(index: ReportIndex) -> list[dict]:
+    if not index.log_path.exists():
+        return []
+    return [json.loads(line) for line in index.log_path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_mutations_append_without_rewriting_snapshot(tmp_path):
+    index = ReportIndex(tmp_path / "index.jsonl", background_compaction=False)
+    index.add_entry(_entry("a", "Alpha"))
+    index.compact()
+    snapshot = index.index_path.read_bytes()
+
+    index.add_entry(_entry("b", "Beta"))
+    index.add_entry(_entry("a", "Alpha v2", status="archived"))
+    index.remove_entry(IDS["b"])
+    index.remove_entry(str(uuid.uuid4()))
+
+    assert index.index_path.read_bytes() == snapshot
+    assert [record["op"] for record in _log_lines(index)] == ["put", "put", "del"]
+    assert index.resolve_title("Alpha") is None
+    assert index.resolve_title("Alpha v2") == IDS["a"]
+
+
+def test_reload_replays_log_last_writer_wins(tmp_path):
+    index = ReportIndex(tmp_path / "index.jsonl", background_compaction=False)
+    index.add_entry(_entry("a", "Alpha"))
+    index.compact()
+    index.add_entry(_entry("b", "Beta"))
+    index.add_entry(_entry("a", "Alpha", status="archived"))
+    index.remove_entry(IDS["b"])
+    with index.log_path.open("a", encoding="utf-8") as f:
+        f.write('{"op": "put", "entry": {"report_id"')  # torn append from a crash
+
+    reopened = ReportIndex(tmp_path / "index.jsonl")
+
+    assert [entry.report_id for entry in reopened.list_entries()] == [IDS["a"]]
+    assert reopened.get_entry(IDS["a"]).status == "archived"
+    assert not (tmp_path / "index.jsonl.corrupted").exists()
+
+
+def test_compaction_folds_log_into_snapshot(tmp_path):
+    index = ReportIndex(tmp_path / "index.jsonl", compact_min_records=4, background_compaction=False)
+    for idx in range(3):
+        index.add_entry(_entry(str(idx), f"Report {idx}"))
+    assert len(_log_lines(index)) == 3
+
+    index.remove_entry(IDS["0"])
+
+    assert not index.log_path.exists()
+    snapshot = [json.loads(line) for line in index.index_path.read_text(encoding="utf-8").splitlines()]
+    expected = sorted([IDS["1"], IDS["2"]])
+    assert sorted(row["report_id"] for row in snapshot) == expected
+    assert sorted(entry.report_id for entry in ReportIndex(tmp_path / "index.jsonl").list_entries()) == expected
+
+
+def test_background_compaction(tmp_path):
+    index = ReportIndex(tmp_path / "index.jsonl", compact_min_records=2)
+    index.add_entry(_entry("a", "Alpha"))
+    index.add_entry(_entry("b", "Beta"))
+    index._compaction_thread.join(timeout=5)
+
+    assert not index.log_path.exists()
+    assert len(index.index_path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+def test_stale_log_after_interrupted_compaction_is_harmless(tmp_path):
+    index = ReportIndex(tmp_path / "index.jsonl", background_compaction=False)
+    index.add_entry(_entry("a", "Alpha"))
+    index.remove_entry(IDS["a"])
+    index.add_entry(_entry("b", "Beta"))
+    stale_log = index.log_path.read_bytes()
+    index.compact()
+    # Simulate a crash after the snapshot was replaced but before the log was removed.
+    index.log_path.write_bytes(stale_log)
+
+    reopened = ReportIndex(tmp_path / "index.jsonl")
+
+    assert [entry.report_id for entry in reopened.list_entries()] == [IDS["b"]]
+
+
+def test_compaction_keeps_records_appended_by_another_writer(tmp_path):
+    first = ReportIndex(tmp_path / "index.jsonl", background_compaction=False)
+    first.add_entry(_entry("a", "Alpha"))
+    second = ReportIndex(tmp_path / "index.jsonl", background_compaction=False)
+    second.add_entry(_entry("b", "Beta"))
+    second.remove_entry(IDS["a"])
+    first.add_entry(_entry("0", "Report 0"))
+
+    # The first writer never saw the second one's records, but compacting must not drop them.
+    first.compact()
+
+    assert not first.log_path.exists()
+    expected = sorted([IDS["b"], IDS["0"]])
+    assert sorted(entry.report_id for entry in first.list_entries()) == expected
+    assert sorted(entry.report_id for entry in ReportIndex(tmp_path / "index.jsonl").list_entries()) == expected
+
+
+def test_concurrent_writers_do_not_lose_records_to_compaction(tmp_path):
+    compacting = ReportIndex(tmp_path / "index.jsonl", compact_min_records=1, background_compaction=False)
+    appending = ReportIndex(tmp_path / "index.jsonl", compact_min_records=10_000, background_compaction=False)
+
+    def write(index: ReportIndex, keys: range) -> None:
+        for idx in keys:
+            index.add_entry(_entry(str(idx), f"Report {idx}"))
+
+    threads = [
+        threading.Thread(target=write, args=(compacting, range(0, 40))),
+        threading.Thread(target=write, args=(appending, range(40, 80))),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+
+    reopened = ReportIndex(tmp_path / "index.jsonl")
+    assert sorted(entry.report_id for entry in reopened.list_entries()) == sorted(IDS[str(idx)] for idx in range(80))
@@ -0,0 +1,118 @@
+"""Tests for incremental ReportIndex.refresh driven by the outline manifest."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from igloo_mcp.living_reports.index import ReportIndex
+from igloo_mcp.living_reports.service import ReportService
+
+
+@pytest.fixture
+def service(tmp_path):
+    return ReportService(reports_root=tmp_path / "reports")
+
+
+def _instrument(index: ReportIndex, monkeypatch) -> tuple[list[str], list[int]]:
+    parsed: list[str] = []
+    writes: list[int] = []
+    real_parse = index._parse_report_dir
+    real_append = index._append_log
+
+    def counting_parse(report_dir):
+        parsed.append(report_dir.name)
+        return real_parse(report_dir)
+
+    def counting_append(records):
+        writes.append(len(records))
+        real_append(records)
+
+    monkeypatch.setattr(index, "_parse_report_dir", counting_parse)
+    monkeypatch.setattr(index, "_append_log", counting_append)
+    return parsed, writes
+
+
+def _rewrite_outline(service: ReportService, report_id: str, **changes) -> None:
+    outline_path = service.reports_root / "by_id" / report_id / "outline.json"
+    data = json.loads(outline_path.read_text(encoding="utf-8"))
+    data.update(changes)
+    outline_path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_refresh_without_changes_parses_and_writes_nothing(service, monkeypatch):
+    ids = [service.create_report(f"Report {idx}") for idx in range(3)]
+    service.index.refresh()  # record signatures for outlines written before the first refresh
+    parsed, writes = _instrument(service.index, monkeypatch)
+
+    assert service.index.refresh() == 0
+    assert parsed == []
+    assert writes == []
+    assert {entry.report_id for entry in service.index.list_entries()} == set(ids)
+
+
+def test_refresh_reparses_only_changed_outlines(service, monkeypatch):
+    first, second = service.create_report("Alpha"), service.create_report("Beta")
+    service.index.refresh()
+    parsed, writes = _instrument(service.index, monkeypatch)
+
+    # An edit from another process, e.g. the CLI.
+    _rewrite_outline(service, second, title="Beta (renamed)")
+
+    assert service.index.refresh() == 1
+    assert parsed == [second]
+    assert writes == [1]
+    assert service.index.resolve_title("Beta (renamed)") == second
+    assert service.index.get_entry(first).current_title == "Alpha"
+
+
+def test_refresh_picks_up_new_and_deleted_reports(service, tmp_path):
+    kept = service.create_report("Kept")
+    removed = service.create_report("Removed")
+    service.index.refresh()
+
+    other_process = ReportService(reports_root=tmp_path / "reports")
+    added = other_process.create_report("Added elsewhere")
+    other_process.delete_report(removed, actor="cli")
+
+    service.index.refresh()
+
+    assert {entry.report_id for entry in service.index.list_entries()} == {kept, added}
+
+
+def test_manifest_survives_restart(service, tmp_path, monkeypatch):
+    for idx in range(3):
+        service.create_report(f"Report {idx}")
+    service.index.refresh()
+
+    reopened = ReportIndex(tmp_path / "reports" / "index.jsonl")
+    parsed, writes = _instrument(reopened, monkeypatch)
+
+    assert reopened.refresh() == 0
+    assert parsed == []
+    assert writes == []
+
+
+def test_invalid_outline_is_dropped_and_not_reparsed(service, monkeypatch):
+    report_id = service.create_report("Soon broken")
+    service.index.refresh()
+    outline_path = service.reports_root / "by_id" / report_id / "outline.json"
+    outline_path.write_text("{not json", encoding="utf-8")
+
+    assert service.index.refresh() == 1
+    assert service.index.get_entry(report_id) is None
+
+    parsed, _ = _instrument(service.index, monkeypatch)
+    assert service.index.refresh() == 0
+    assert parsed == []
+
+
+def test_rebuild_from_filesystem_resets_manifest(service, monkeypatch):
+    service.create_report("Rebuilt")
+    service.index.rebuild_from_filesystem()
+    parsed, _ = _instrument(service.index, monkeypatch)
+
+    assert service.index.refresh() == 0
+    assert parsed == []
+    assert service.index.manifest_path.exists()
@@ -0,0 +1,135 @@
+"""Tests for the content-addressed outline version store behind report backups."""
+
+from __future__ import annotations
+
+import json
+import os
+import uuid
+
+import pytest
+
+from igloo_mcp.living_reports.models import Insight
+from igloo_mcp.living_reports.service import ReportService
+from igloo_mcp.living_reports.versions import MAX_VERSIONS_ENV, OutlineVersionStore
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.delenv(MAX_VERSIONS_ENV, raising=False)
+    return ReportService(reports_root=tmp_path / "reports")
+
+
+def _evolve(service: ReportService, report_id: str, summary: str) -> str:
+    outline = service.get_report_outline(report_id)
+    outline.insights.append(Insight(insight_id=str(uuid.uuid4()), importance=5, summary=summary))
+    service.update_report_outline(report_id, outline)
+    return service.global_storage.get_report_storage(report_id).load_audit_events()[-1].action_id
+
+
+def _blobs(storage) -> list:
+    return list(storage.versions.blobs_dir.glob("*/*.json"))
+
+
+def test_versions_share_unchanged_insights(service):
+    report_id = service.create_report("Evolving")
+    storage = service.global_storage.get_report_storage(report_id)
+    for idx in range(12):
+        _evolve(service, report_id, f"Insight {idx} " + "detail " * 50)
+
+    sections = len(service.get_report_outline(report_id).sections)
+
+    # 12 backups (states with 0..11 insights) need only the 11 distinct insights plus the unchanged sections.
+    assert len(storage.versions.versions()) == 12
+    assert len(_blobs(storage)) == 11 + sections
+    newest = storage.versions.versions()[-1]
+    assert newest.stat().st_size < storage.outline_path.stat().st_size / 2
+
+
+def test_revert_rebuilds_any_earlier_version(service):
+    report_id = service.create_report("Evolving")
+    actions = [_evolve(service, report_id, f"Insight {idx}") for idx in range(5)]
+
+    service.revert_report(report_id, actions[2])
+
+    # A backup holds the state before its action: two insights.
+    assert [insight.summary for insight in service.get_report_outline(report_id).insights] == [
+        "Insight 0",
+        "Insight 1",
+    ]
+
+    service.revert_report(report_id, actions[4])
+    assert len(service.get_report_outline(report_id).insights) == 4
+
+
+def test_legacy_full_copy_backups_revert_and_compact(service):
+    report_id = service.create_report("Legacy")
+    action_id = _evolve(service, report_id, "First")
+    _evolve(service, report_id, "Second")
+    storage = service.global_storage.get_report_storage(report_id)
+
+    # Rewrite every backup as a pre-version-store full copy.
+    legacy_paths = storage.versions.versions()
+    for path in legacy_paths:
+        data = storage.versions.read(path.name)
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.utime(path, (1_600_000_000, 1_600_000_000))
+    for blob in _blobs(storage):
+        blob.unlink()
+
+    stats = service.compact_report_versions(report_id)
+
+    assert stats["converted"] == 2
+    assert all(path.stat().st_mtime == 1_600_000_000 for path in legacy_paths)
+    service.revert_report(report_id, action_id)
+    assert service.get_report_outline(report_id).insights == []
+
+
+def test_retention_prunes_versions_and_unreferenced_blobs(service, monkeypatch):
+    report_id = service.create_report("Bounded")
+    first_action = _evolve(service, report_id, "Dropped later")
+    outline = service.get_report_outline(report_id)
+    outline.insights = []
+    service.update_report_outline(report_id, outline)
+
+    monkeypatch.setenv(MAX_VERSIONS_ENV, "2")
+    for idx in range(3):
+        _evolve(service, report_id, f"Kept {idx}")
+    storage = service.global_storage.get_report_storage(report_id)
+
+    sections = len(service.get_report_outline(report_id).sections)
+
+    assert len(storage.versions.versions()) == 2
+    # Only blobs of the two surviving versions (insights "Kept 0" and "Kept 1") remain.
+    assert len(_blobs(storage)) == 2 + sections
+    with pytest.raises(ValueError, match="Backup file missing"):
+        service.revert_report(report_id, first_action)
+
+
+def test_tampered_blob_is_reported_as_corruption(service):
+    report_id = service.create_report("Tampered")
+    _evolve(service, report_id, "One")
+    action_id = _evolve(service, report_id, "Two")
+    storage = service.global_storage.get_report_storage(report_id)
+    _blobs(storage)[0].write_text('{"summary": "forged"}', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="Backup file is corrupted"):
+        service.revert_report(report_id, action_id)
+
+
+def test_store_round_trips_outline_data(tmp_path):
+    store = OutlineVersionStore(tmp_path, max_versions=0)
+    data = {"title": "T", "sections": [{"section_id": "s"}], "insights": [{"a": 1}, {"a": 1}], "metadata": {}}
+
+    store.write("outline.json.20260101T000000_000000.bak", data)
+
+    assert store.read("outline.json.20260101T000000_000000.bak") == data
+    assert len(list(store.blobs_dir.glob("*/*.json"))) == 2
+    with pytest.raises(FileNotFoundError):
+        store.read("../outline.json")
+
+
+@pytest.mark.parametrize(("raw", "expected"), [("5", 5), ("0", 0), ("-1", 0), ("all", 0)])
+def test_max_versions_reads_env(tmp_path, monkeypatch, raw, expected):
+    monkeypatch.setenv(MAX_VERSIONS_ENV, raw)
+
+    assert OutlineVersionStore(tmp_path / "backups").max_versions == expected
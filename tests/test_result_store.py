@@ -0,0 +1,176 @@
+"""Tests for paged query results: the spilled result store and fetch_query_page."""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from igloo_mcp.config import Config, SnowflakeConfig
+from igloo_mcp.mcp.exceptions import MCPSelectorError, MCPValidationError
+from igloo_mcp.mcp.tools.execute_query import ExecuteQueryTool
+from igloo_mcp.mcp.tools.fetch_query_page import FetchQueryPageTool
+from igloo_mcp.result_store import (
+    META_FILENAME,
+    RESULT_PAGE_MAX_MB_ENV,
+    RESULT_PAGE_TTL_ENV,
+    ResultHandleError,
+    ResultStore,
+    decode_token,
+    encode_token,
+)
+from igloo_mcp.service_layer.query_service import QueryService
+from tests.helpers.fake_snowflake_connector import FakeQueryPlan, FakeSnowflakeService
+
+COLUMNS = ["ID", "NAME"]
+
+
+def _rows(count: int) -> list[dict]:
+    return [{"ID": idx, "NAME": f"name-{idx}"} for idx in range(count)]
+
+
+def test_pages_walk_the_whole_result_via_tokens(tmp_path):
+    store = ResultStore(tmp_path)
+    handle = store.spill(_rows(2_500), COLUMNS, metadata={"execution_id": "exec-1"})["handle"]
+
+    seen: list[int] = []
+    page = store.read_page(handle, offset=0, limit=1_000)
+    while True:
+        seen.extend(row["ID"] for row in page["rows"])
+        if not page["has_more"]:
+            break
+        token_handle, offset, limit = decode_token(page["next_token"])
+        page = store.read_page(token_handle, offset=offset, limit=limit)
+
+    assert seen == list(range(2_500))
+    assert page["total_rows"] == 2_500
+    assert page["next_token"] is None
+
+
+def test_offset_page_decodes_selected_columns(tmp_path):
+    store = ResultStore(tmp_path)
+    handle = store.spill(_rows(3_000), COLUMNS, metadata={})["handle"]
+
+    page = store.read_page(handle, offset=2_040, limit=3, columns=["NAME"])
+
+    assert page["rows"] == [{"NAME": "name-2040"}, {"NAME": "name-2041"}, {"NAME": "name-2042"}]
+    assert page["columns"] == ["NAME"]
+    assert page["has_more"] is True
+
+
+def test_unknown_expired_and_malformed_handles(tmp_path):
+    store = ResultStore(tmp_path, ttl_seconds=60)
+    handle = store.spill(_rows(3), COLUMNS, metadata={})["handle"]
+    store.read_page(handle)
+
+    meta_path = tmp_path / handle / META_FILENAME
+    meta_path.write_text(meta_path.read_text().replace('"expires_at": ', '"expires_at": -'), encoding="utf-8")
+    fresh = ResultStore(tmp_path, ttl_seconds=60)
+
+    with pytest.raises(ResultHandleError) as expired:
+        fresh.read_page(handle)
+    assert expired.value.reason == "expired"
+    assert not (tmp_path / handle).exists()
+
+    with pytest.raises(ResultHandleError) as missing:
+        fresh.read_page(handle)
+    assert missing.value.reason == "not_found"
+
+    with pytest.raises(ResultHandleError) as traversal:
+        fresh.read_page("../../etc")
+    assert traversal.value.reason == "invalid_format"
+
+
+def test_prune_evicts_oldest_handles_over_budget(tmp_path):
+    store = ResultStore(tmp_path, max_bytes=1)
+    first = store.spill(_rows(50), COLUMNS, metadata={})["handle"]
+    second = store.spill(_rows(50), COLUMNS, metadata={})["handle"]
+
+    # The just-committed handle survives even though it alone exceeds the budget.
+    assert not (tmp_path / first).exists()
+    assert store.read_page(second, limit=1)["rows"] == [{"ID": 0, "NAME": "name-0"}]
+
+    abandoned = tmp_path / ("0" * 32)
+    abandoned.mkdir()
+    stale = time.time() - store.ttl_seconds - 1
+    os.utime(abandoned, (stale, stale))
+    store.max_bytes = 1024 * 1024
+    assert store.prune() == 1
+    assert not abandoned.exists()
+    assert (tmp_path / second).exists()
+
+
+def test_from_env_reads_limits(tmp_path, monkeypatch):
+    monkeypatch.setenv(RESULT_PAGE_TTL_ENV, "120")
+    monkeypatch.setenv(RESULT_PAGE_MAX_MB_ENV, "nope")
+
+    store = ResultStore.from_env(artifact_root=tmp_path)
+
+    assert store.root == (tmp_path / "scratchpad" / "result_pages").resolve()
+    assert store.ttl_seconds == 120
+    assert store.max_bytes == 2048 * 1024 * 1024
+
+
+def _tool(tmp_path, monkeypatch, rows: list[dict]) -> ExecuteQueryTool:
+    monkeypatch.setenv("IGLOO_MCP_QUERY_HISTORY", str(tmp_path / "history.jsonl"))
+    monkeypatch.setenv("IGLOO_MCP_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("IGLOO_MCP_CACHE_MODE", "disabled")
+    service = FakeSnowflakeService([FakeQueryPlan(statement="SELECT id, name FROM big_table", rows=rows)])
+    return ExecuteQueryTool(Config(snowflake=SnowflakeConfig(profile="test")), service, QueryService(context=None))
+
+
+@pytest.mark.asyncio
+async def test_execute_query_paged_then_fetch_query_page(tmp_path, monkeypatch):
+    tool = _tool(tmp_path, monkeypatch, _rows(250))
+
+    result = await tool.execute(
+        statement="SELECT id, name FROM big_table",
+        reason="Page through a large extract",
+        output_format="paged",
+        page_size=100,
+    )
+
+    assert result["output_format"] == "paged"
+    assert result["rowcount"] == 250
+    assert [row["ID"] for row in result["rows"]] == list(range(100))
+    assert result["page"]["has_more"] is True
+    assert result["result_mode_info"]["inline_rows_returned"] == 100
+
+    fetch = FetchQueryPageTool(tool.config, tool.result_store)
+    second = await fetch.execute(continuation_token=result["page"]["next_token"])
+    last = await fetch.execute(result_handle=result["result_handle"], offset=200, limit=100)
+
+    assert [row["ID"] for row in second["rows"]] == list(range(100, 200))
+    assert [row["ID"] for row in last["rows"]] == list(range(200, 250))
+    assert last["has_more"] is False
+
+
+@pytest.mark.asyncio
+async def test_minimal_paged_response_defers_every_row(tmp_path, monkeypatch):
+    tool = _tool(tmp_path, monkeypatch, _rows(5))
+
+    result = await tool.execute(
+        statement="SELECT id, name FROM big_table",
+        reason="Handle only",
+        output_format="paged",
+        response_mode="minimal",
+        page_size=2,
+    )
+
+    assert result["rows"] == []
+    assert decode_token(result["page"]["next_token"]) == (result["result_handle"], 0, 2)
+
+
+@pytest.mark.asyncio
+async def test_fetch_query_page_errors(tmp_path):
+    fetch = FetchQueryPageTool(Config(snowflake=SnowflakeConfig(profile="test")), ResultStore(tmp_path))
+
+    with pytest.raises(MCPSelectorError):
+        await fetch.execute(result_handle="f" * 32)
+    with pytest.raises(MCPValidationError):
+        await fetch.execute(continuation_token="not-a-token")
+    with pytest.raises(MCPValidationError):
+        await fetch.execute(continuation_token=encode_token("a" * 32, 0, 10), result_handle="b" * 32)
+    with pytest.raises(MCPValidationError):
+        await fetch.execute(result_handle="a" * 32, limit=5_000)
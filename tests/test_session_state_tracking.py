@@ -0,0 +1,268 @@
+"""Tests for client-side session-state tracking that skips redundant session round trips."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Any
+
+import pytest
+
+from igloo_mcp.config import Config, SnowflakeConfig
+from igloo_mcp.mcp.tools.execute_query import ExecuteQueryTool
+from igloo_mcp.service_layer.query_service import QueryService
+from igloo_mcp.session_utils import (
+    SessionSnapshot,
+    SessionState,
+    SessionStateRegistry,
+    get_session_registry,
+    statement_may_change_session,
+)
+
+HOME = SessionSnapshot(role="ANALYST", warehouse="WH", database="DB", schema="PUBLIC")
+
+
+class _RecordingCursor:
+    def __init__(self, log: list[str], session: dict[str, str | None]) -> None:
+        self._log = log
+        self._session = session
+        self._rows: list[dict[str, Any]] = []
+        self.description: list[tuple[str]] | None = None
+        self.rowcount = 0
+        self.sfqid = "QID"
+
+    def execute(self, query: str) -> None:
+        self._log.append(query)
+        upper = query.upper()
+        if "CURRENT_ROLE()" in upper:
+            self._rows = [
+                {
+                    "ROLE": self._session["role"],
+                    "WAREHOUSE": self._session["warehouse"],
+                    "DATABASE": self._session["database"],
+                    "SCHEMA": self._session["schema"],
+                }
+            ]
+            self.description = [("ROLE",), ("WAREHOUSE",), ("DATABASE",), ("SCHEMA",)]
+            return
+        if upper.startswith("USE "):
+            _, kind, value = query.split(" ", 2)
+            self._session[kind.lower()] = value.strip('"')
+            if kind.upper() == "DATABASE":
+                self._session["schema"] = "PUBLIC"
+            self._rows, self.description = [], None
+            return
+        if upper.startswith(("ALTER SESSION", "SHOW PARAMETERS")):
+            self._rows, self.description = [], None
+            return
+        self._rows = [{"A": 1}]
+        self.description = [("A",)]
+        self.rowcount = 1
+
+    def fetchone(self) -> dict[str, Any] | None:
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self) -> list[dict[str, Any]]:
+        rows, self._rows = self._rows, []
+        return rows
+
+
+class _Connection:
+    pass
+
+
+class _KeypairService:
+    """One persistent session, advertised as keypair so tracking is enabled."""
+
+    def __init__(self, auth_mode: str = "keypair") -> None:
+        self.auth_mode = auth_mode
+        self.statements: list[str] = []
+        self.session: dict[str, str | None] = {
+            "role": HOME.role,
+            "warehouse": HOME.warehouse,
+            "database": HOME.database,
+            "schema": HOME.schema,
+        }
+        self.connection = _Connection()
+
+    def get_query_tag_param(self) -> dict[str, Any]:
+        return {}
+
+    @contextmanager
+    def get_connection(self, **_: Any):
+        yield self.connection, _RecordingCursor(self.statements, self.session)
+
+
+def _tool(service: _KeypairService) -> ExecuteQueryTool:
+    return ExecuteQueryTool(Config(snowflake=SnowflakeConfig(profile="test")), service, QueryService(context=None))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_artifacts(tmp_path, monkeypatch):
+    monkeypatch.setenv("IGLOO_MCP_QUERY_HISTORY", str(tmp_path / "history.jsonl"))
+    monkeypatch.setenv("IGLOO_MCP_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("IGLOO_MCP_CACHE_MODE", "disabled")
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        ("SELECT 1", False),
+        ("  with x as (select 1) select * from x", False),
+        ("-- comment\nSHOW TABLES", False),
+        ("/* hint */ (SELECT 1)", False),
+        ("USE DATABASE OTHER", True),
+        ("ALTER SESSION SET TIMEZONE = 'UTC'", True),
+        ("CALL my_proc()", True),
+        ("INSERT INTO t VALUES (1)", True),
+    ],
+)
+def test_statement_may_change_session(statement, expected):
+    assert statement_may_change_session(statement) is expected
+
+
+def test_apply_context_skips_matching_fields_and_resets_schema_after_database():
+    log: list[str] = []
+    cursor = _RecordingCursor(log, {"role": None, "warehouse": None, "database": None, "schema": None})
+    state = SessionState(HOME)
+
+    issued, skipped = state.apply_context(cursor, {"role": "ANALYST", "warehouse": "WH", "database": "OTHER"})
+
+    assert (issued, skipped) == (1, 2)
+    assert log == ['USE DATABASE "OTHER"']
+    assert "schema" not in state.context
+    assert not state.context_known
+
+
+def test_apply_context_invalidates_on_error():
+    class _FailingCursor:
+        def execute(self, query: str) -> None:
+            raise RuntimeError("boom")
+
+    state = SessionState(HOME)
+    state.record_parameter("QUERY_TAG", "x")
+    with pytest.raises(RuntimeError):
+        state.apply_context(_FailingCursor(), {"warehouse": "OTHER"})
+    assert state.context == {}
+    assert state.parameters == {}
+
+
+def test_registry_seeds_new_states_from_home_and_desired_context_overlays_overrides():
+    registry = SessionStateRegistry()
+    assert registry.state_for(None) is None
+
+    registry.record_home(HOME)
+    registry.record_home(SessionSnapshot(role="OTHER"))  # first snapshot wins
+    state = registry.state_for(_Connection())
+
+    assert state is not None
+    assert state.context_known
+    assert registry.desired_context({"warehouse": "BIG_WH"}) == {
+        "role": "ANALYST",
+        "warehouse": "BIG_WH",
+        "database": "DB",
+        "schema": "PUBLIC",
+    }
+
+
+@pytest.mark.asyncio
+async def test_tracked_session_skips_redundant_round_trips():
+    service = _KeypairService()
+    tool = _tool(service)
+
+    await tool.execute(statement="SELECT A FROM T", timeout_seconds=30, reason="first query")
+    first_run = len(service.statements)
+    service.statements.clear()
+
+    result = await tool.execute(
+        statement="SELECT A FROM T", timeout_seconds=30, reason="first query", result_mode="full"
+    )
+
+    # Same context and parameters: only the statement itself goes to Snowflake.
+    assert service.statements == ["SELECT A FROM T"]
+    assert first_run > 1
+    assert result["audit_info"]["session_round_trips"] == {"issued": 0, "skipped": 6}
+    assert not any(stmt.startswith("SHOW PARAMETERS") for stmt in service.statements)
+    stats = get_session_registry(service).stats()
+    assert stats["statements_skipped"] >= 2
+
+
+@pytest.mark.asyncio
+async def test_tracked_session_switches_back_to_home_after_override():
+    service = _KeypairService()
+    tool = _tool(service)
+
+    await tool.execute(statement="SELECT 1", timeout_seconds=30, warehouse="BIG_WH", reason="override warehouse")
+    assert service.session["warehouse"] == "BIG_WH"
+    service.statements.clear()
+
+    await tool.execute(statement="SELECT 1", timeout_seconds=30, reason="override warehouse")
+
+    assert 'USE WAREHOUSE "WH"' in service.statements
+    assert service.session["warehouse"] == "WH"
+
+
+def test_database_override_drops_home_schema_unless_requested():
+    registry = SessionStateRegistry()
+    registry.record_home(HOME)
+
+    assert registry.desired_context({"database": "OTHERDB"})["schema"] is None
+    assert registry.desired_context({"database": "OTHERDB", "schema": "RAW"})["schema"] == "RAW"
+    assert registry.desired_context({"database": "DB"})["schema"] == "PUBLIC"
+
+
+@pytest.mark.asyncio
+async def test_tracked_session_database_only_override_keeps_default_schema():
+    service = _KeypairService()
+    service.session["schema"] = "ANALYTICS"
+    tool = _tool(service)
+
+    def use_statements() -> list[str]:
+        statements = [stmt for stmt in service.statements if stmt.startswith("USE ")]
+        service.statements.clear()
+        return statements
+
+    await tool.execute(statement="SELECT 1", timeout_seconds=30, database="OTHERDB", reason="database override")
+    assert use_statements() == ['USE DATABASE "OTHERDB"']
+    assert service.session["schema"] == "PUBLIC"
+
+    await tool.execute(
+        statement="SELECT 1", timeout_seconds=30, database="OTHERDB", schema="RAW", reason="database override"
+    )
+    assert use_statements() == ['USE SCHEMA "RAW"']
+
+    # Dropping the schema override goes back to the database's default schema.
+    await tool.execute(statement="SELECT 1", timeout_seconds=30, database="OTHERDB", reason="database override")
+    assert use_statements() == ['USE DATABASE "OTHERDB"']
+
+    await tool.execute(statement="SELECT 1", timeout_seconds=30, reason="database override")
+    assert use_statements() == ['USE DATABASE "DB"', 'USE SCHEMA "ANALYTICS"']
+
+
+@pytest.mark.asyncio
+async def test_tracked_session_resnapshots_after_session_changing_statement():
+    service = _KeypairService()
+    tool = _tool(service)
+
+    await tool.execute(statement="SELECT 1", timeout_seconds=30, reason="session changing call")
+    await tool.execute(
+        statement="USE DATABASE MOVED", timeout_seconds=30, reason="session changing call", result_mode="full"
+    )
+    assert service.session["database"] == "MOVED"
+    service.statements.clear()
+
+    await tool.execute(statement="SELECT 1", timeout_seconds=30, reason="session changing call")
+
+    assert 'USE DATABASE "DB"' in service.statements
+
+
+@pytest.mark.asyncio
+async def test_untracked_provider_keeps_snapshot_and_restore():
+    service = _KeypairService(auth_mode="snowflake-labs")
+    tool = _tool(service)
+
+    await tool.execute(statement="SELECT 1", timeout_seconds=30, reason="untracked query")
+    service.statements.clear()
+    result = await tool.execute(statement="SELECT 1", timeout_seconds=30, reason="untracked query", result_mode="full")
+
+    assert any(stmt.startswith("SHOW PARAMETERS") for stmt in service.statements)
+    assert "session_round_trips" not in result["audit_info"]
@@ -0,0 +1,209 @@
+"""Tests for single-flight coalescing of identical concurrent queries."""
+
+from __future__ import annotations
+
+import json
+
+import anyio
+import pytest
+
+from igloo_mcp.config import Config, SnowflakeConfig
+from igloo_mcp.mcp.tools.execute_query import QUERY_COALESCING_ENV, ExecuteQueryTool
+from igloo_mcp.service_layer.query_service import QueryService
+from igloo_mcp.single_flight import SingleFlight
+from tests.helpers.fake_snowflake_connector import FakeQueryPlan, FakeSnowflakeService
+
+
+async def _gather(*calls):
+    results: list = [None] * len(calls)
+
+    async def run(index, call):
+        results[index] = await call()
+
+    async with anyio.create_task_group() as tg:
+        for index, call in enumerate(calls):
+            tg.start_soon(run, index, call)
+    return results
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_execution():
+    flights: SingleFlight[str, list[int]] = SingleFlight()
+    calls = 0
+
+    async def work() -> list[int]:
+        nonlocal calls
+        calls += 1
+        await anyio.sleep(0.05)
+        return [1, 2]
+
+    outcomes = await _gather(*[lambda: flights.run("k", work, share=list) for _ in range(3)])
+
+    assert calls == 1
+    assert [outcome.leader for outcome in outcomes] == [True, False, False]
+    assert all(outcome.followers == 2 and outcome.coalesced for outcome in outcomes)
+    outcomes[0].value.append(3)
+    assert outcomes[1].value == [1, 2]
+    assert flights.stats() == {"leaders": 1, "coalesced": 2, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_sequential_and_distinct_keys_do_not_coalesce():
+    flights: SingleFlight[str, str] = SingleFlight()
+
+    async def work() -> str:
+        await anyio.sleep(0.01)
+        return "done"
+
+    first = await flights.run("a", work)
+    second = await flights.run("a", work)
+    distinct = await _gather(lambda: flights.run("a", work), lambda: flights.run("b", work))
+
+    assert not first.coalesced
+    assert not second.coalesced
+    assert all(outcome.leader and not outcome.coalesced for outcome in distinct)
+    assert flights.stats()["leaders"] == 4
+
+
+@pytest.mark.asyncio
+async def test_followers_share_the_leaders_error():
+    flights: SingleFlight[str, None] = SingleFlight()
+
+    async def fail() -> None:
+        await anyio.sleep(0.02)
+        raise RuntimeError("warehouse suspended")
+
+    async def call() -> str:
+        with pytest.raises(RuntimeError, match="warehouse suspended"):
+            await flights.run("k", fail)
+        return "raised"
+
+    assert await _gather(call, call) == ["raised", "raised"]
+    assert flights.stats()["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_follower_takes_over_when_leader_is_cancelled():
+    flights: SingleFlight[str, str] = SingleFlight()
+    runs = 0
+
+    async def work() -> str:
+        nonlocal runs
+        runs += 1
+        await anyio.sleep(0.05)
+        return f"run-{runs}"
+
+    async with anyio.create_task_group() as tg:
+        leader_scope = anyio.CancelScope()
+
+        async def leader() -> None:
+            with leader_scope:
+                await flights.run("k", work)
+
+        outcome: list = []
+
+        async def follower() -> None:
+            outcome.append(await flights.run("k", work))
+
+        tg.start_soon(leader)
+        await anyio.sleep(0.01)
+        tg.start_soon(follower)
+        await anyio.sleep(0.01)
+        leader_scope.cancel()
+
+    assert runs == 2
+    assert outcome[0].leader
+    assert outcome[0].value == "run-2"
+
+
+@pytest.mark.asyncio
+async def test_follower_wait_is_bounded():
+    flights: SingleFlight[str, str] = SingleFlight()
+
+    async def slow() -> str:
+        await anyio.sleep(0.2)
+        return "late"
+
+    async def impatient() -> str:
+        await anyio.sleep(0.01)
+        with pytest.raises(TimeoutError):
+            await flights.run("k", slow, wait_timeout=0.02)
+        return "timed out"
+
+    results = await _gather(lambda: flights.run("k", slow), impatient)
+
+    assert results[0].value == "late"
+    assert not results[0].coalesced
+    assert results[1] == "timed out"
+
+
+def _tool(tmp_path, monkeypatch, plans: list[FakeQueryPlan]) -> tuple[ExecuteQueryTool, FakeSnowflakeService]:
+    monkeypatch.setenv("IGLOO_MCP_QUERY_HISTORY", str(tmp_path / "history.jsonl"))
+    monkeypatch.setenv("IGLOO_MCP_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("IGLOO_MCP_CACHE_MODE", "disabled")
+    service = FakeSnowflakeService(plans)
+    tool = ExecuteQueryTool(Config(snowflake=SnowflakeConfig(profile="test")), service, QueryService(context=None))
+    return tool, service
+
+
+@pytest.mark.asyncio
+async def test_execute_query_coalesces_identical_reads(tmp_path, monkeypatch):
+    statement = "SELECT region, revenue FROM sales"
+    plans = [FakeQueryPlan(statement=statement, rows=[{"REGION": "EU", "REVENUE": 10}], duration=0.1)]
+    tool, service = _tool(tmp_path, monkeypatch, plans * 2)
+
+    def run(reason: str):
+        return lambda: tool.execute(statement=statement, reason=reason, response_mode="full")
+
+    first, second = await _gather(run("Dashboard A"), run("Dashboard B"))
+
+    assert first["rows"] == second["rows"] == [{"REGION": "EU", "REVENUE": 10}]
+    assert first["query_id"] == second["query_id"]
+    assert sum(cursor._main_executed for cursor in service.cursors) == 1
+    # Either call may lead, depending on which reaches Snowflake first.
+    roles = {result["audit_info"]["coalesced"]["role"]: result for result in (first, second)}
+    assert set(roles) == {"leader", "follower"}
+    assert roles["follower"]["audit_info"]["coalesced"]["shared_with"] == 1
+    assert tool.get_cache_stats()["coalescing"] == {"enabled": True, "leaders": 1, "coalesced": 1, "in_flight": 0}
+
+    history = [json.loads(line) for line in (tmp_path / "history.jsonl").read_text(encoding="utf-8").splitlines()]
+    coalesced_ids = [event["execution_id"] for event in history if event.get("coalesced")]
+    assert coalesced_ids == [roles["follower"]["audit_info"]["execution_id"]]
+
+
+@pytest.mark.asyncio
+async def test_execute_query_does_not_share_a_shorter_timeout(tmp_path, monkeypatch):
+    statement = "SELECT region FROM slow_sales"
+    plans = [FakeQueryPlan(statement=statement, rows=[{"REGION": "EU"}], duration=1.5) for _ in range(2)]
+    tool, service = _tool(tmp_path, monkeypatch, plans)
+
+    async def impatient():
+        with pytest.raises(Exception, match="Query timeout") as exc_info:
+            await tool.execute(statement=statement, reason="Short timeout", timeout_seconds=1)
+        return exc_info.value
+
+    async def patient():
+        await anyio.sleep(0.1)
+        return await tool.execute(statement=statement, reason="Long timeout", timeout_seconds=30, response_mode="full")
+
+    _, result = await _gather(impatient, patient)
+
+    assert result["rows"] == [{"REGION": "EU"}]
+    assert "coalesced" not in result["audit_info"]
+    assert sum(cursor._main_executed for cursor in service.cursors) == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_query_coalescing_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv(QUERY_COALESCING_ENV, "false")
+    statement = "SELECT 1 AS one"
+    plans = [FakeQueryPlan(statement=statement, rows=[{"ONE": 1}], duration=0.05) for _ in range(2)]
+    tool, service = _tool(tmp_path, monkeypatch, plans)
+
+    def run():
+        return tool.execute(statement=statement, reason="Uncoalesced", response_mode="full")
+
+    results = await _gather(run, run)
+
+    assert sum(cursor._main_executed for cursor in service.cursors) == 2
+    assert all("coalesced" not in result["audit_info"] for result in results)
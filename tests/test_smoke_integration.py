@@ -180,7 +180,7 @@ class TestSmokeIntegration:
 
                 manifest_path = Path(result["cache"]["manifest_path"])
                 assert manifest_path.exists()
-                assert (manifest_path.parent / "rows.jsonl").exists()
+                assert (manifest_path.parent / "rows.col").exists()
 
                 assert history_file.exists()
                 lines = history_file.read_text().strip().splitlines()
@@ -0,0 +1,223 @@
+"""Tests for the asyncio Snowflake SQL REST driver against a local mock server."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from igloo_mcp import snow_rest_async
+from igloo_mcp.snow_rest import SnowRestClient, SnowRestConfig, SnowRestError
+from igloo_mcp.snow_rest_async import AsyncSnowRestClient
+
+COLUMNS = [{"name": "ID"}, {"name": "NAME"}]
+
+
+class MockSnowflake:
+    """Serves the statements API with polling, gzip partitions and keep-alive."""
+
+    def __init__(self, *, running_polls: int = 0, partitions: int = 3, partition_delay: float = 0.0) -> None:
+        self.running_polls = running_polls
+        self.partitions = partitions
+        self.partition_delay = partition_delay
+        self.status = "SUCCESS"
+        self.requests: list[str] = []
+        self.connections: set[tuple[str, int]] = set()
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._polls = 0
+
+    def handle(self, handler: BaseHTTPRequestHandler) -> tuple[int, dict]:
+        with self._lock:
+            self.requests.append(f"{handler.command} {handler.path}")
+            self.connections.add(handler.client_address)
+        if handler.command == "POST":
+            length = int(handler.headers.get("Content-Length") or 0)
+            payload = json.loads(handler.rfile.read(length))
+            if payload["statement"] == "SELECT broken":
+                return 422, {"message": "SQL compilation error"}
+            return 202, {"statementHandle": "h-1", "status": "RUNNING"}
+        if handler.path.startswith("/api/v2/statements/h-1"):
+            with self._lock:
+                self._polls += 1
+                running = self._polls <= self.running_polls
+            if running:
+                return 202, {"statementHandle": "h-1", "status": "RUNNING"}
+            if self.status != "SUCCESS":
+                return 200, {"statementHandle": "h-1", "status": self.status, "message": "Warehouse suspended"}
+            return 200, {
+                "statementHandle": "h-1",
+                "status": "SUCCESS",
+                "queryId": "q-1",
+                "resultSetMetaData": {"rowType": COLUMNS},
+                "data": [[0, "row-0"]],
+                "resultSetUrls": [f"/partitions/{idx}" for idx in range(1, self.partitions + 1)],
+            }
+        if handler.path.startswith("/partitions/"):
+            idx = int(handler.path.rsplit("/", 1)[1])
+            with self._lock:
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            try:
+                time.sleep(self.partition_delay)
+            finally:
+                with self._lock:
+                    self.active -= 1
+            return 200, {"data": [[idx * 10 + offset, f"row-{idx}-{offset}"] for offset in range(2)]}
+        return 404, {"message": "not found"}
+
+
+@pytest.fixture
+def mock_snowflake():
+    servers: list[ThreadingHTTPServer] = []
+
+    def start(**kwargs) -> tuple[MockSnowflake, str]:
+        state = MockSnowflake(**kwargs)
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self) -> None:
+                status, body = state.handle(self)
+                raw = json.dumps(body).encode("utf-8")
+                gzipped = "gzip" in (self.headers.get("Accept-Encoding") or "")
+                if gzipped:
+                    raw = gzip.compress(raw)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                if gzipped:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            do_GET = _respond
+            do_POST = _respond
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return state, f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(scope="module")
+def private_key_path(tmp_path_factory):
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    path = tmp_path_factory.mktemp("keys") / "rsa_key.p8"
+    path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return path
+
+
+def _config(private_key_path, base_url: str) -> SnowRestConfig:
+    return SnowRestConfig(
+        account="acct",
+        user="svc",
+        private_key_path=private_key_path,
+        warehouse="WH",
+        host_override=base_url,
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_output_matches_sync_client(mock_snowflake, private_key_path):
+    _, base_url = mock_snowflake(running_polls=1)
+    sync = SnowRestClient(_config(private_key_path, base_url), poll_interval=0.01).run_query("SELECT 1")
+
+    _, base_url = mock_snowflake(running_polls=1)
+    async with AsyncSnowRestClient(_config(private_key_path, base_url)) as client:
+        result = await client.run_query_async("SELECT 1")
+
+    assert result.rows == sync.rows
+    assert result.columns == sync.columns == ["ID", "NAME"]
+    assert result.metadata == sync.metadata
+    assert result.rows[:3] == [
+        {"ID": 0, "NAME": "row-0"},
+        {"ID": 10, "NAME": "row-1-0"},
+        {"ID": 11, "NAME": "row-1-1"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_partitions_stream_in_order_with_bounded_parallelism(mock_snowflake, private_key_path):
+    state, base_url = mock_snowflake(partitions=6, partition_delay=0.05)
+    async with AsyncSnowRestClient(_config(private_key_path, base_url), partition_concurrency=3) as client:
+        stream = await client.stream_query("SELECT 1")
+        batches = [batch async for batch in stream]
+
+    assert [batch[0]["NAME"] for batch in batches] == ["row-0", *[f"row-{idx}-0" for idx in range(1, 7)]]
+    assert state.max_active == 3
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_keep_alive_connections(mock_snowflake, private_key_path):
+    state, base_url = mock_snowflake(running_polls=3, partitions=2)
+    async with AsyncSnowRestClient(
+        _config(private_key_path, base_url), max_connections=2, partition_concurrency=1
+    ) as client:
+        await client.run_query_async("SELECT 1")
+        stats = client.pool_stats()
+
+    assert len(state.requests) == 7  # submit, 4 polls, 2 partitions
+    assert len(state.connections) == stats["created"] == 1
+    assert stats["reused"] == 6
+
+
+@pytest.mark.asyncio
+async def test_polling_backs_off_exponentially(mock_snowflake, private_key_path, monkeypatch):
+    _, base_url = mock_snowflake(running_polls=4, partitions=0)
+    delays: list[float] = []
+    real_sleep = snow_rest_async.asyncio.sleep
+
+    async def record_sleep(delay):
+        delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(snow_rest_async.asyncio, "sleep", record_sleep)
+    async with AsyncSnowRestClient(_config(private_key_path, base_url), max_poll_interval=0.3) as client:
+        await client.run_query_async("SELECT 1")
+
+    assert delays == [0.05, 0.1, 0.2, 0.3, 0.3]
+
+
+@pytest.mark.asyncio
+async def test_failures_raise_snow_rest_error(mock_snowflake, private_key_path):
+    state, base_url = mock_snowflake()
+    async with AsyncSnowRestClient(_config(private_key_path, base_url)) as client:
+        with pytest.raises(SnowRestError, match="SQL compilation error"):
+            await client.run_query_async("SELECT broken")
+
+        state.status = "FAILED"
+        with pytest.raises(SnowRestError, match="Warehouse suspended"):
+            await client.run_query_async("SELECT 1")
+
+
+@pytest.mark.parametrize(("raw", "expected"), [("0.5", 0.5), ("0.01", 2.0), ("later", 2.0)])
+def test_max_poll_interval_reads_env(private_key_path, monkeypatch, raw, expected):
+    monkeypatch.setenv(snow_rest_async.REST_POLL_MAX_INTERVAL_ENV, raw)
+
+    client = AsyncSnowRestClient(_config(private_key_path, "http://127.0.0.1:9"))
+
+    assert client.max_poll_interval == expected
+    client.close()
@@ -0,0 +1,119 @@
+"""Tests for the parse-once SQL analysis shared by execute_query."""
+
+from __future__ import annotations
+
+import pytest
+
+from igloo_mcp import sql_analysis
+from igloo_mcp.config import Config, SnowflakeConfig
+from igloo_mcp.mcp.tools.execute_query import ExecuteQueryTool
+from igloo_mcp.service_layer.query_service import QueryService
+from igloo_mcp.sql_analysis import analyze_statement, clear_analysis_cache
+from igloo_mcp.sql_objects import extract_query_objects
+from igloo_mcp.sql_validation import validate_sql_statement
+from tests.helpers.fake_snowflake_connector import FakeQueryPlan, FakeSnowflakeService
+
+ALLOW = ["select", "show", "describe", "use"]
+DISALLOW = ["delete", "drop", "insert", "update", "truncate"]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_analysis_cache()
+    yield
+    clear_analysis_cache()
+
+
+@pytest.fixture
+def parse_counter(monkeypatch) -> dict[str, int]:
+    counts = {"sqlglot": 0, "upstream": 0}
+    real_parse = sql_analysis.sqlglot.parse
+    real_type = sql_analysis.get_statement_type
+
+    def counting_parse(*args, **kwargs):
+        counts["sqlglot"] += 1
+        return real_parse(*args, **kwargs)
+
+    def counting_type(statement):
+        counts["upstream"] += 1
+        return real_type(statement)
+
+    monkeypatch.setattr(sql_analysis.sqlglot, "parse", counting_parse)
+    monkeypatch.setattr(sql_analysis, "get_statement_type", counting_type)
+    return counts
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "SELECT * FROM db.sch.orders",
+        "WITH recent AS (SELECT * FROM orders) SELECT * FROM recent",
+        "SELECT a FROM t1 UNION ALL SELECT a FROM t2",
+        "DELETE FROM orders WHERE id = 1",
+        "SHOW TABLES IN SCHEMA analytics.public",
+        "DESCRIBE TABLE orders",
+        "SELECT 1; DROP TABLE orders",
+        "SELECT value FROM events, LATERAL FLATTEN(input => payload)",
+    ],
+)
+def test_permission_matches_validate_sql_statement(statement):
+    assert analyze_statement(statement).permission(ALLOW, DISALLOW) == validate_sql_statement(
+        statement, ALLOW, DISALLOW
+    )
+
+
+def test_statement_is_parsed_once(parse_counter):
+    statement = "SELECT o.id FROM sales.public.orders o JOIN sales.public.customers c ON o.cid = c.id"
+
+    first = analyze_statement(statement)
+    first.permission(ALLOW, DISALLOW)
+    objects = first.referenced_objects
+    second = analyze_statement(statement)
+    second.permission(ALLOW, DISALLOW)
+
+    assert second is first
+    assert parse_counter == {"sqlglot": 1, "upstream": 1}
+    assert second.referenced_objects == objects == extract_query_objects(statement)
+
+
+def test_referenced_objects_are_copies():
+    analysis = analyze_statement("SELECT * FROM orders")
+    analysis.referenced_objects[0]["name"] = "mutated"
+
+    assert analysis.referenced_objects[0]["name"] == "orders"
+
+
+def test_cache_is_bounded(monkeypatch, parse_counter):
+    monkeypatch.setattr(sql_analysis, "ANALYSIS_CACHE_SIZE", 2)
+
+    for statement in ("SELECT 1", "SELECT 2", "SELECT 3", "SELECT 1"):
+        analyze_statement(statement)
+
+    assert parse_counter["sqlglot"] == 4  # SELECT 1 was evicted by SELECT 3
+
+
+def test_unparseable_statement_raises_on_every_check():
+    statement = "SELECT 'unterminated"
+
+    with pytest.raises(ValueError, match="Invalid SQL syntax"):
+        analyze_statement(statement).permission(ALLOW, DISALLOW)
+    with pytest.raises(ValueError, match="Invalid SQL syntax"):
+        analyze_statement(statement).permission(ALLOW, DISALLOW)
+
+
+@pytest.mark.asyncio
+async def test_execute_query_reuses_analysis(tmp_path, monkeypatch, parse_counter):
+    monkeypatch.setenv("IGLOO_MCP_QUERY_HISTORY", str(tmp_path / "history.jsonl"))
+    monkeypatch.setenv("IGLOO_MCP_ARTIFACT_ROOT", str(tmp_path / "artifacts"))
+    monkeypatch.setenv("IGLOO_MCP_CACHE_MODE", "disabled")
+    statement = "SELECT id FROM analytics.public.orders"
+    service = FakeSnowflakeService(
+        [FakeQueryPlan(statement=statement, rows=[{"ID": 1}], duration=0.01) for _ in range(2)]
+    )
+    tool = ExecuteQueryTool(Config(snowflake=SnowflakeConfig(profile="test")), service, QueryService(context=None))
+
+    for _ in range(2):
+        result = await tool.execute(statement=statement, reason="Parse once", response_mode="full")
+        assert result["rowcount"] == 1
+
+    assert parse_counter == {"sqlglot": 1, "upstream": 1}
@@ -72,7 +72,7 @@ def test_execute_query_schema(base_config: Config) -> None:
 
     output_format = props["output_format"]
     assert output_format["default"] == "inline"
-    assert output_format["enum"] == ["inline", "csv", "json", "jsonl"]
+    assert output_format["enum"] == ["inline", "csv", "json", "jsonl", "paged"]
 
     response_mode = props["response_mode"]
     assert response_mode["default"] == "summary"